@@ -2,7 +2,7 @@
 Module Name: manual_download_api.py
 Author: TheDragonShaman
 Created: June 22, 2025
-Last Modified: December 23, 2025
+Last Modified: October 16, 2026
 Description:
     Manual Download and Search REST API. Provides manual and automatic search
     controls, queue operations, ownership checks, and metadata normalization to
@@ -383,13 +383,18 @@ def interactive_search_book(book_id):
             if candidate != fallback_title:
                 _add_attempt(search_attempts, seen_attempts, candidate, fallback_author)
 
+        # refresh bypasses cached indexer results; the body is optional here
+        data = request.get_json(silent=True) or {}
+        refresh = bool(data.get('refresh'))
+
         raw_results: List[Dict[str, Any]] = []
         effective_query = {'title': title, 'author': author or ""}
         for attempt_title, attempt_author in search_attempts:
             raw_results = manual_search_service.search_all_indexers(
                 title=attempt_title,
                 author=attempt_author,
-                manual_search=True
+                manual_search=True,
+                refresh=refresh
             )
             if raw_results:
                 effective_query = {'title': attempt_title, 'author': attempt_author}
@@ -2,7 +2,7 @@
 Module Name: search_api.py
 Author: TheDragonShaman
 Created: July 9, 2025
-Last Modified: December 23, 2025
+Last Modified: October 16, 2026
 Description:
     Audiobook Search REST API powered by SearchEngineService and IndexerServiceManager.
     Supports manual and direct provider searches plus legacy endpoints used by
@@ -101,7 +101,9 @@ def manual_search():
             )
             status_id = event['id']
         try:
-            result = search_engine_service.search_for_audiobook(title=title, author=author, manual_search=True)
+            result = search_engine_service.search_for_audiobook(
+                title=title, author=author, manual_search=True, refresh=bool(data.get('refresh'))
+            )
             if status_id:
                 count = _result_count(result)
                 tracker.complete_event(status_id, message=f"{count if count is not None else 'Results'} ready")
@@ -360,7 +362,9 @@ def manual_search_legacy():
             )
             status_id = event['id']
         try:
-            result = search_engine_service.search_for_audiobook(title=title, author=author, manual_search=True)
+            result = search_engine_service.search_for_audiobook(
+                title=title, author=author, manual_search=True, refresh=bool(data.get('refresh'))
+            )
             if status_id:
                 count = _result_count(result)
                 tracker.complete_event(status_id, message=f"{count if count is not None else 'Results'} ready")
@@ -2,7 +2,7 @@
 Module Name: authors.py
 Author: TheDragonShaman
 Created: July 15, 2025
-Last Modified: December 23, 2025
+Last Modified: October 16, 2026
 Description:
     Route handlers for author dashboards, metadata enrichment, and catalog imports.
 Location:
@@ -722,8 +722,9 @@ def authors_page():
         
         # Format authors for template
         authors_data = []
+        books_by_author = db_service.get_books_by_authors(all_authors)
         for author in all_authors:
-            books = db_service.get_books_by_author(author)
+            books = books_by_author.get(author, [])
             
             # Apply filter if specified
             if filter_by:
@@ -821,6 +822,15 @@ def author_detail_page(author_name):
         except Exception as catalog_exc:
             catalog_error = str(catalog_exc)
             logger.warning(f"Hybrid catalogue lookup failed for {author_name}: {catalog_exc}")
+
+        # Catalogue titles credited to another author name may still be in the
+        # library; resolve the rest of the page with one bulk lookup
+        catalog_library_status = {}
+        if hybrid_catalog:
+            catalog_library_status = db_service.get_library_status_by_asins([
+                catalog_book.get('ASIN') for catalog_book in hybrid_catalog
+                if catalog_book.get('ASIN') and catalog_book.get('ASIN') not in library_asins
+            ])
         
         catalog_books = []
         missing_books = []
@@ -850,8 +860,8 @@ def author_detail_page(author_name):
         if hybrid_catalog:
             for catalog_book in hybrid_catalog:
                 asin = catalog_book.get('ASIN') or ''
-                in_library = asin in library_asins if asin else False
-                library_info = library_book_map.get(asin, {}) if asin else {}
+                in_library = (asin in library_asins or asin in catalog_library_status) if asin else False
+                library_info = (library_book_map.get(asin) or catalog_library_status.get(asin, {})) if asin else {}
                 status = library_info.get('Status') or ('Owned' if in_library else 'Missing')
                 language_value = (
                     catalog_book.get('Language')
@@ -1244,11 +1254,12 @@ def get_author_recommendations(target_author: str, target_data: Dict) -> List[Di
         
         recommendations = []
         
+        books_by_author = db_service.get_books_by_authors(all_authors)
         for author in all_authors:
             if author == target_author:
                 continue
             
-            books = db_service.get_books_by_author(author)
+            books = books_by_author.get(author, [])
             if len(books) < 2:  # Skip authors with very few books
                 continue
             
@@ -1307,15 +1318,13 @@ def api_get_authors():
         limit = request.args.get('limit', type=int)
         search = request.args.get('search', '').strip()
         
-        all_authors = db_service.get_all_authors()
+        # Apply search filter through the full-text index
+        all_authors = db_service.search_authors(search) if search else db_service.get_all_authors()
         authors_data = []
         
+        books_by_author = db_service.get_books_by_authors(all_authors)
         for author in all_authors:
-            # Apply search filter
-            if search and search.lower() not in author.lower():
-                continue
-            
-            books = db_service.get_books_by_author(author)
+            books = books_by_author.get(author, [])
             
             if include_stats:
                 author_info = format_author_for_template(author, books)
@@ -1363,8 +1372,9 @@ def api_get_top_authors():
         limit = request.args.get('limit', 10, type=int)
         
         author_data = []
+        books_by_author = db_service.get_books_by_authors(all_authors)
         for author in all_authors:
-            books = db_service.get_books_by_author(author)
+            books = books_by_author.get(author, [])
             if len(books) < 2:  # Skip authors with very few books
                 continue
             
@@ -1481,10 +1491,12 @@ def api_add_missing_books(author_name):
             'details': []
         }
         
+        existing_asins = set(db_service.get_library_status_by_asins(book_asins))
+        
         for asin in book_asins:
             try:
                 # Check if book already exists
-                if db_service.check_book_exists(asin):
+                if asin in existing_asins:
                     results['skipped'] += 1
                     results['details'].append({
                         'asin': asin,
@@ -1520,6 +1532,7 @@ def api_add_missing_books(author_name):
                 # Add to library
                 if db_service.add_book(book_data, status="Wanted"):
                     results['successful'] += 1
+                    existing_asins.add(asin)
                     results['details'].append({
                         'asin': asin,
                         'title': book_data.get('Title', ''),
@@ -1569,8 +1582,9 @@ def api_get_authors_analytics():
         
         # Collect comprehensive data
         all_author_data = []
+        books_by_author = db_service.get_books_by_authors(all_authors)
         for author in all_authors:
-            books = db_service.get_books_by_author(author)
+            books = books_by_author.get(author, [])
             author_data = format_author_for_template(author, books)
             all_author_data.append(author_data)
         
@@ -1643,8 +1657,9 @@ def api_export_authors():
         all_authors = db_service.get_all_authors()
         export_data = []
         
+        books_by_author = db_service.get_books_by_authors(all_authors)
         for author in all_authors:
-            books = db_service.get_books_by_author(author)
+            books = books_by_author.get(author, [])
             
             if include_stats:
                 author_data = format_author_for_template(author, books)
@@ -1981,12 +1996,14 @@ def api_search_authors():
         limit = request.args.get('limit', 20, type=int)
         
         db_service = get_database_service()
-        all_authors = db_service.get_all_authors()
+        # Any-token candidates from the full-text index; scored below
+        all_authors = db_service.search_authors(query, match_any=True)
         
         # Enhanced search with scoring
         matching_authors = []
         query_lower = query.lower()
         
+        books_by_author = db_service.get_books_by_authors(all_authors)
         for author in all_authors:
             author_lower = author.lower()
             
@@ -2003,7 +2020,7 @@ def api_search_authors():
             else:
                 continue  # No match
             
-            books = db_service.get_books_by_author(author)
+            books = books_by_author.get(author, [])
             if include_stats:
                 author_info = format_author_for_template(author, books)
             else:
@@ -36,11 +36,12 @@ def downloads_page():
     def _recent_completed(max_items: int = 5):
         statuses = ['IMPORTED', 'SEEDING', 'SEEDING_COMPLETE']
         collected = []
-        for status in statuses:
-            try:
-                collected.extend(dm_service.get_queue(status_filter=status))
-            except Exception as exc:  # fallback if any status fetch fails
-                logger.warning("Failed to fetch recent items for status %s: %s", status, exc)
+        try:
+            snapshot = dm_service.get_queue_snapshot(statuses)
+            for status in statuses:
+                collected.extend(snapshot.get(status, []))
+        except Exception as exc:
+            logger.warning("Failed to fetch recent items for statuses %s: %s", statuses, exc)
         # Sort by most recent completion/update/queue time
         collected.sort(
             key=lambda item: (
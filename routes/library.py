@@ -2,7 +2,7 @@
 Module Name: library.py
 Author: TheDragonShaman
 Created: July 22, 2025
-Last Modified: December 23, 2025
+Last Modified: October 16, 2026
 Description:
     Library routes for book views, detail APIs, metadata refresh, and ABS sync.
 Location:
@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional
 from flask import Blueprint, flash, jsonify, redirect, render_template, request, session, url_for
 from flask_login import login_required
 
+from services.database.library_listing import DEFAULT_GENRE, GENRE_KEYWORDS, UNKNOWN_GENRE
 from services.image_cache import cache_book_cover, get_cached_book_cover_url
 from services.service_manager import (
     get_audiobookshelf_service,
@@ -27,6 +28,9 @@ from utils.logger import get_module_logger
 library_bp = Blueprint('library', __name__)
 logger = get_module_logger("Routes.Library")
 
+LIBRARY_PAGE_SIZE = 48
+OWNED_STATUS_KEYS = ('owned', 'audible_library')
+
 def format_book_for_template(book):
     """Format book data for MediaVault template with cached cover images."""
     
@@ -71,7 +75,7 @@ def format_book_for_template(book):
         'ownership_status': ownership_status,  # Raw status for logic
         'source': source,  # Include source field
         'progress': calculate_progress(book),
-        'genre': get_genre_from_summary(book.get('Summary', '')),
+        'genre': book.get('genre') or get_genre_from_summary(book.get('Summary', '')),
         'series': book.get('Series', 'N/A'),
         'sequence': book.get('Sequence', ''),
         'runtime': book.get('Runtime', '0 hrs 0 mins'),
@@ -102,84 +106,98 @@ def calculate_progress(book):
 def get_genre_from_summary(summary):
     """Extract genre from book summary."""
     if not summary:
-        return 'unknown'
+        return UNKNOWN_GENRE
     
     summary_lower = summary.lower()
     
-    # Basic genre detection
-    if any(word in summary_lower for word in ['science', 'physics', 'biology', 'chemistry']):
-        return 'science'
-    elif any(word in summary_lower for word in ['history', 'historical', 'ancient', 'medieval']):
-        return 'history'
-    elif any(word in summary_lower for word in ['biography', 'memoir', 'life of']):
-        return 'biography'
-    elif any(word in summary_lower for word in ['self-help', 'productivity', 'habits', 'success']):
-        return 'self-help'
-    elif any(word in summary_lower for word in ['novel', 'story', 'tale', 'adventure']):
-        return 'fiction'
-    else:
-        return 'non-fiction'
+    # Basic keyword genre detection (mirrored in SQL by library_listing.genre_sql)
+    for genre, words in GENRE_KEYWORDS:
+        if any(word in summary_lower for word in words):
+            return genre
+    return DEFAULT_GENRE
+
+def _library_page_args(args) -> Dict[str, Any]:
+    """Read listing sort/filter/cursor parameters from a request's query string."""
+    return {
+        'limit': args.get('limit', LIBRARY_PAGE_SIZE, type=int),
+        'cursor': args.get('cursor') or None,
+        'sort': args.get('sort') or None,
+        'direction': args.get('direction') or None,
+        'status': args.get('status') or None,
+        'search': (args.get('q') or '').strip() or None,
+        'genre': args.get('genre') or None,
+        'projection': args.get('fields') or 'grid',
+    }
+
+
+def _format_library_page(page: Dict[str, Any]) -> Dict[str, Any]:
+    """Format one listing page for the grid and the JSON endpoint."""
+    return {
+        'books': [format_book_for_template(book) for book in page.get('books', [])],
+        'next_cursor': page.get('next_cursor'),
+        'has_more': page.get('has_more', False),
+        'total': page.get('total'),
+        'sort': page.get('sort'),
+        'direction': page.get('direction'),
+    }
+
+
+def _library_header_stats(db_service) -> Dict[str, int]:
+    """Header totals from SQL aggregates (no per-book work)."""
+    overview = db_service.get_library_overview()
+    by_status = overview.get('by_status', {})
+    return {
+        'total_books': overview.get('total_books', 0),
+        'owned_books': sum(by_status.get(key, 0) for key in OWNED_STATUS_KEYS),
+        'wanted_books': by_status.get('wanted', 0),
+        'downloading_count': by_status.get('downloading', 0),
+        'total_hours': int(overview.get('total_runtime_minutes', 0) / 60),
+    }
+
 
 @library_bp.route('/')
 @login_required
 def library_page():
-    """Display the library page with MediaVault design."""
+    """Display the library page with MediaVault design (first page only)."""
     try:
         db_service = get_database_service()
-        all_books = db_service.get_all_books()
+        page = db_service.get_books_page(limit=LIBRARY_PAGE_SIZE, include_total=True)
         # Fetch authors for sidebar stats parity
         try:
             all_authors = db_service.get_all_authors()
         except Exception:
             all_authors = []
-        
-        # Format books for template
-        books_data = []
-        for book in all_books:
-            formatted_book = format_book_for_template(book)
-            books_data.append(formatted_book)
-        
-        # Calculate library stats
-        total_books = len(books_data)
-        owned_books = len([b for b in books_data if b['status'] == 'owned'])
-        wanted_books = len([b for b in books_data if b['status'] == 'wanted'])
-        downloading_count = len([b for b in books_data if b['status'] == 'downloading'])
-
-        # Aggregate hours (approx) from runtime strings
-        total_hours = 0
-        for b in books_data:
-            rt = b.get('runtime', '')
-            try:
-                if 'hrs' in rt:
-                    hrs_part = int(rt.split(' hrs')[0])
-                    mins_part = 0
-                    if ' hrs ' in rt and ' mins' in rt:
-                        mins_part = int(rt.split(' hrs ')[1].split(' mins')[0])
-                    total_hours += hrs_part + mins_part/60
-            except Exception:
-                continue
 
         return render_template('library.html',
                                title='Library',
-                               books=books_data,
-                               total_books=total_books,
-                               owned_books=owned_books,
-                               wanted_books=wanted_books,
+                               library_page=_format_library_page(page),
                                total_authors=len(all_authors),
-                               total_hours=int(total_hours),
-                               downloading_count=downloading_count)
+                               **_library_header_stats(db_service))
     
     except Exception as e:
         logger.error("Error loading library page: %s", e)
     return render_template('library.html',
                    title='Library',
-                   books=[],
+                   library_page={'books': [], 'next_cursor': None, 'has_more': False, 'total': 0},
                    total_books=0,
                    owned_books=0,
                    wanted_books=0,
                    total_authors=0,
                    total_hours=0,
                    downloading_count=0)
+
+
+@library_bp.route('/api/books')
+def api_library_books():
+    """Keyset-paginated library listing (sort, status, genre, q, cursor, limit, fields)."""
+    try:
+        db_service = get_database_service()
+        args = _library_page_args(request.args)
+        page = db_service.get_books_page(include_total=not args['cursor'], **args)
+        return jsonify({'success': True, **_format_library_page(page)})
+    except Exception as e:
+        logger.error("Error listing library books: %s", e)
+        return jsonify({'success': False, 'error': 'Failed to list books'}), 500
     
 
 @library_bp.route('/book/<string:asin>')
@@ -614,60 +632,21 @@ def get_library_stats():
     """Get comprehensive library statistics using all services."""
     try:
         db_service = get_database_service()
-        books = db_service.get_all_books()
+        library_stats = db_service.get_library_stats()
+        if 'error' in library_stats:
+            raise RuntimeError(library_stats['error'])
         
         stats = {
-            'total_books': len(books),
-            'by_status': {},
-            'by_genre': {},
-            'by_language': {},
-            'total_runtime_hours': 0,
-            'authors_count': 0,
-            'series_count': 0,
-            'missing_metadata_count': 0
+            'total_books': library_stats.get('total_books', 0),
+            'by_status': library_stats.get('by_status', {}),
+            'by_genre': library_stats.get('by_genre', {}),
+            'by_language': library_stats.get('by_language', {}),
+            'total_runtime_hours': library_stats.get('total_runtime_hours', 0),
+            'authors_count': library_stats.get('total_authors', 0),
+            'series_count': library_stats.get('total_series', 0),
+            'missing_metadata_count': library_stats.get('missing_metadata_count', 0)
         }
         
-        authors = set()
-        series = set()
-        
-        for book in books:
-            # Count by status
-            status = book.get('Status', 'Unknown')
-            stats['by_status'][status] = stats['by_status'].get(status, 0) + 1
-            
-            # Count by genre
-            genre = get_genre_from_summary(book.get('Summary', ''))
-            stats['by_genre'][genre] = stats['by_genre'].get(genre, 0) + 1
-            
-            # Count by language
-            language = book.get('Language', 'Unknown')
-            stats['by_language'][language] = stats['by_language'].get(language, 0) + 1
-            
-            # Track authors
-            if book.get('Author'):
-                authors.add(book['Author'])
-            
-            # Track series
-            if book.get('Series') and book.get('Series') != 'N/A':
-                series.add(book['Series'])
-            
-            # Check for missing metadata
-            if not book.get('Summary') or not book.get('Cover Image') or not book.get('ASIN'):
-                stats['missing_metadata_count'] += 1
-            
-            # Calculate total runtime
-            runtime = book.get('Runtime', '0 hrs 0 mins')
-            try:
-                if 'hrs' in runtime:
-                    hours = int(runtime.split(' hrs')[0])
-                    minutes = int(runtime.split(' hrs ')[1].split(' mins')[0]) if ' mins' in runtime else 0
-                    stats['total_runtime_hours'] += hours + (minutes / 60)
-            except:
-                pass
-        
-        stats['authors_count'] = len(authors)
-        stats['series_count'] = len(series)
-        
         return jsonify({'success': True, 'stats': stats})
     
     except Exception as e:
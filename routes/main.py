@@ -2,7 +2,7 @@
 Module Name: main.py
 Author: TheDragonShaman
 Created: July 23, 2025
-Last Modified: December 23, 2025
+Last Modified: October 16, 2026
 Description:
     Dashboard routes for landing page, library stats API, and download snapshots.
 Location:
@@ -80,30 +80,14 @@ def api_library_stats():
     """API endpoint for library statistics used by MediaVault JS."""
     try:
         db_service = get_database_service()
-        books = db_service.get_all_books()
-        
-        # Calculate stats
-        authors = set()
-        total_hours = 0
-        
-        for book in books:
-            if book.get('Author'):
-                authors.add(book['Author'])
-            
-            # Calculate total hours
-            runtime = book.get('Runtime', '0 hrs 0 mins')
-            try:
-                if 'hrs' in runtime:
-                    hours = int(runtime.split(' hrs')[0])
-                    minutes = int(runtime.split(' hrs ')[1].split(' mins')[0]) if ' mins' in runtime else 0
-                    total_hours += hours + (minutes / 60)
-            except:
-                pass
+        library_stats = db_service.get_library_stats()
+        if 'error' in library_stats:
+            raise RuntimeError(library_stats['error'])
         
         return jsonify({
-            'totalBooks': len(books),
-            'totalAuthors': len(authors),
-            'totalHours': int(total_hours)
+            'totalBooks': library_stats.get('total_books', 0),
+            'totalAuthors': library_stats.get('total_authors', 0),
+            'totalHours': int(library_stats.get('total_runtime_minutes', 0) / 60)
         })
     
     except Exception as e:
@@ -2,7 +2,7 @@
 Module Name: search.py
 Author: TheDragonShaman
 Created: July 24, 2025
-Last Modified: December 23, 2025
+Last Modified: October 16, 2026
 Description:
     Catalog search routes and supporting APIs for Audible queries and download readiness.
 Location:
@@ -181,8 +181,7 @@ def determine_library_status(
     book_record = None
     if record_cache is not None and asin in record_cache:
         book_record = record_cache[asin]
-
-    if book_record is None:
+    else:
         try:
             book_record = db_service.get_book_by_asin(asin)
         except Exception as exc:
@@ -195,6 +194,34 @@ def determine_library_status(
     cache_store[asin] = status
     return status
 
+
+def prefetch_library_status(
+    asins: List[Optional[str]],
+    db_service,
+    cache: Optional[Dict[str, Tuple[str, bool]]] = None,
+    record_cache: Optional[Dict[str, Optional[Dict[str, Any]]]] = None,
+) -> None:
+    """Resolve a page of ASINs with one bulk lookup and seed the per-request caches."""
+    pending = [
+        asin for asin in dict.fromkeys(asins)
+        if asin and (record_cache is None or asin not in record_cache)
+    ]
+    if not pending:
+        return
+
+    try:
+        records = db_service.get_library_status_by_asins(pending)
+    except Exception as exc:
+        logger.debug(f"Bulk library status lookup failed: {exc}")
+        return
+
+    for asin in pending:
+        book_record = records.get(asin)
+        if record_cache is not None:
+            record_cache[asin] = book_record
+        if cache is not None:
+            cache[asin] = resolve_status_from_book_record(book_record)
+
 # ============================================================================
 # MAIN SEARCH ROUTES - ENHANCED
 # ============================================================================
@@ -228,6 +255,12 @@ def search_page():
             else:
                 # Basic Audible search with enhancements
                 raw_results = audible_service.search_books(query)
+                prefetch_library_status(
+                    [book.get('ASIN') for book in raw_results],
+                    db_service,
+                    library_status_cache,
+                    library_book_cache,
+                )
                 
                 # Check library status and enhance results
                 for book in raw_results:
@@ -286,7 +319,6 @@ def perform_download_search(query: str) -> Tuple[List[Dict], Dict]:
         db_service = get_database_service()
         library_status_cache: Dict[str, Tuple[str, bool]] = {}
         library_book_cache: Dict[str, Optional[Dict[str, Any]]] = {}
-        library_book_cache: Dict[str, Optional[Dict[str, Any]]] = {}
         
         # Download search is disabled until the provider is reintroduced
         download_results = []
@@ -356,6 +388,7 @@ def perform_advanced_search(query: str) -> Tuple[List[Dict], Dict]:
         audible_service = get_audible_service()
         db_service = get_database_service()
         library_status_cache: Dict[str, Tuple[str, bool]] = {}
+        library_book_cache: Dict[str, Optional[Dict[str, Any]]] = {}
         
         # Search Audible
         audible_results = audible_service.search_books(query)
@@ -375,6 +408,12 @@ def perform_advanced_search(query: str) -> Tuple[List[Dict], Dict]:
         
         # Enhance with download availability
         enhanced_results = enhance_search_results(combined_results)
+        prefetch_library_status(
+            [book.get('ASIN') or book.get('asin') for book in enhanced_results],
+            db_service,
+            library_status_cache,
+            library_book_cache,
+        )
 
         formatted_results: List[Dict[str, Any]] = []
         for book in enhanced_results:
@@ -445,6 +484,12 @@ def api_search():
             results = []
             library_status_cache: Dict[str, Tuple[str, bool]] = {}
             library_book_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+            prefetch_library_status(
+                [book.get('ASIN') for book in raw_results],
+                db_service,
+                library_status_cache,
+                library_book_cache,
+            )
             for book in raw_results:
                 asin = book.get('ASIN')
                 library_status, in_library = determine_library_status(
@@ -505,6 +550,12 @@ def search_audible():
         results = []
         library_status_cache: Dict[str, Tuple[str, bool]] = {}
         library_book_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        prefetch_library_status(
+            [book.get('ASIN') for book in raw_results],
+            db_service,
+            library_status_cache,
+            library_book_cache,
+        )
         for book in raw_results:
             asin = book.get('ASIN')
             library_status, in_library = determine_library_status(
@@ -691,17 +742,15 @@ def get_book_details(asin):
         book_details = {}
         
         # Check if book is in library first
-        if db_service.check_book_exists(asin):
-            books = db_service.get_all_books()
-            book = next((b for b in books if b.get('ASIN') == asin), None)
-            if book:
-                library_status, in_library = resolve_status_from_book_record(book)
-                book_details = format_search_result(
-                    book,
-                    in_library=in_library,
-                    library_status=library_status
-                )
-                book_details['source'] = 'library'
+        book = db_service.get_book_by_asin(asin)
+        if book:
+            library_status, in_library = resolve_status_from_book_record(book)
+            book_details = format_search_result(
+                book,
+                in_library=in_library,
+                library_status=library_status
+            )
+            book_details['source'] = 'library'
         
         # If not in library or library data is incomplete, search external sources
         if not book_details or not book_details.get('summary'):
@@ -756,17 +805,15 @@ def get_book_info(asin):
         book_details = {}
         
         # Check if book is in library first
-        if db_service.check_book_exists(asin):
-            books = db_service.get_all_books()
-            book = next((b for b in books if b.get('ASIN') == asin), None)
-            if book:
-                library_status, in_library = resolve_status_from_book_record(book)
-                book_details = format_search_result(
-                    book,
-                    in_library=in_library,
-                    library_status=library_status
-                )
-                book_details['source'] = 'library'
+        book = db_service.get_book_by_asin(asin)
+        if book:
+            library_status, in_library = resolve_status_from_book_record(book)
+            book_details = format_search_result(
+                book,
+                in_library=in_library,
+                library_status=library_status
+            )
+            book_details['source'] = 'library'
         
         # If not in library or library data is incomplete, search external sources
         if not book_details or not book_details.get('summary'):
@@ -1031,6 +1078,12 @@ def api_advanced_search():
                 filtered_results = apply_filters_to_books(raw_results, filters)
                 library_status_cache: Dict[str, Tuple[str, bool]] = {}
                 library_book_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+                prefetch_library_status(
+                    [book.get('ASIN') for book in filtered_results],
+                    db_service,
+                    library_status_cache,
+                    library_book_cache,
+                )
                 
                 for book in filtered_results:
                     asin = book.get('ASIN')
@@ -1242,6 +1295,10 @@ def api_batch_add_books():
             'details': []
         }
         
+        existing_asins = set(db_service.get_library_status_by_asins(
+            [book_data.get('ASIN') or book_data.get('asin') for book_data in books]
+        ))
+        
         for book_data in books:
             try:
                 asin = book_data.get('ASIN') or book_data.get('asin')
@@ -1256,7 +1313,7 @@ def api_batch_add_books():
                     })
                     continue
                 
-                if db_service.check_book_exists(asin):
+                if asin in existing_asins:
                     results['skipped'] += 1
                     results['details'].append({
                         'title': title,
@@ -1285,6 +1342,7 @@ def api_batch_add_books():
                 
                 if db_service.add_book(db_book_data, status="Wanted"):
                     results['successful'] += 1
+                    existing_asins.add(asin)
                     results['details'].append({
                         'title': title,
                         'asin': asin,
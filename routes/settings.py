@@ -2,7 +2,7 @@
 Module Name: settings.py
 Author: TheDragonShaman
 Created: July 26, 2025
-Last Modified: December 23, 2025
+Last Modified: October 16, 2026
 Description:
     Settings dashboard routes with tabbed AJAX views and diagnostics helpers.
 Location:
@@ -230,7 +230,11 @@ from routes.settings_tools.restart_services import handle_restart_services
 from routes.settings_tools.restart_individual_service import handle_restart_individual_service
 # from routes.settings_tools.test_individual_service import handle_test_individual_service  # Missing module
 from routes.settings_tools.get_services_status import handle_get_services_status
-from routes.settings_tools.backup_database import handle_backup_database
+from routes.settings_tools.backup_database import (
+    handle_backup_database,
+    handle_backup_database_status,
+    handle_list_backups,
+)
 from routes.settings_tools.optimize_database import handle_optimize_database
 from routes.settings_tools.repair_database import handle_repair_database
 from routes.settings_tools.get_config import handle_get_config
@@ -1531,6 +1535,8 @@ settings_bp.add_url_rule('/services/status', 'get_services_status', handle_get_s
 
 # Database routes
 settings_bp.add_url_rule('/database/backup', 'backup_database', handle_backup_database, methods=['POST'])
+settings_bp.add_url_rule('/database/backup/<job_id>', 'backup_database_status', handle_backup_database_status, methods=['GET'])
+settings_bp.add_url_rule('/database/backups', 'list_backups', handle_list_backups, methods=['GET'])
 settings_bp.add_url_rule('/database/optimize', 'optimize_database', handle_optimize_database, methods=['POST'])
 settings_bp.add_url_rule('/database/repair', 'repair_database', handle_repair_database, methods=['POST'])
 
@@ -2328,7 +2334,7 @@ def get_search_status():
             }), 503
 
         download_service = get_download_management_service()
-        active_searches = len(download_service.queue_manager.get_queue(status_filter='SEARCHING'))
+        active_searches = download_service.queue_manager.get_status_counts(['SEARCHING'])['SEARCHING']
 
         status = service.get_status()
         metrics = status.get('metrics', {})
@@ -2,92 +2,106 @@
 Module Name: backup_database.py
 Author: TheDragonShaman
 Created: July 27, 2025
-Last Modified: December 23, 2025
+Last Modified: October 16, 2026
 Description:
-    Settings helper for creating database backups with metadata for download.
+    Settings helpers for online database backups. Backups run as background
+    jobs using the SQLite backup API; these handlers start a job, report its
+    progress and list existing backups.
 Location:
     /routes/settings_tools/backup_database.py
 
 """
 
-import os
-import shutil
 from datetime import datetime
 
-from flask import jsonify
+from flask import jsonify, request, url_for
 
-from services.service_manager import get_database_service
+from services.database.backup import DEFAULT_RETENTION, available_compressions, normalize_compression
+from services.service_manager import get_config_service, get_database_service
 from utils.logger import get_module_logger
 
 logger = get_module_logger("Routes.Settings.BackupDatabase")
 
+
+def _backup_options():
+    """Request overrides on top of the [application] backup settings."""
+    try:
+        app_config = get_config_service().get_section('application') or {}
+    except Exception as e:
+        logger.debug(f"Could not read backup settings: {e}")
+        app_config = {}
+
+    data = request.get_json(silent=True) or {}
+    compression = data.get('compression', app_config.get('backup_compression', 'gzip'))
+    retention_raw = data.get('retention', app_config.get('backup_retention', DEFAULT_RETENTION))
+    try:
+        retention = max(0, int(retention_raw))
+    except (TypeError, ValueError):
+        retention = DEFAULT_RETENTION
+    return {
+        'compression': normalize_compression(compression),
+        'retention': retention,
+    }
+
+
 def handle_backup_database():
-    """Create database backup with enhanced metadata."""
+    """Start a background database backup and return the job."""
     try:
-        db_service = get_database_service()
-        
-        # Get database file path
-        if not hasattr(db_service, 'db_file') or not os.path.exists(db_service.db_file):
+        try:
+            options = _backup_options()
+        except ValueError as e:
             return jsonify({
                 'success': False,
-                'error': 'Database file not found'
-            }), 404
-        
-        # Create backup filename with timestamp
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_filename = f'auralarchive_backup_{timestamp}.db'
-        backup_path = os.path.join('backups', backup_filename)
-        
-        # Create backups directory if it doesn't exist
-        os.makedirs('backups', exist_ok=True)
-        
-        # Get original database size
-        original_size = os.path.getsize(db_service.db_file)
-        
-        # Create backup
-        shutil.copy2(db_service.db_file, backup_path)
-        
-        # Verify backup was created
-        if not os.path.exists(backup_path):
-            raise Exception("Backup file was not created")
-        
-        # Get backup size
-        backup_size = os.path.getsize(backup_path)
-        
-        # Verify backup integrity (basic check)
-        if backup_size != original_size:
-            logger.warning(f"Backup size ({backup_size}) differs from original ({original_size})")
-        
-        # Get backup metadata
-        backup_info = {
-            'filename': backup_filename,
-            'path': backup_path,
-            'size': backup_size,
-            'size_mb': round(backup_size / (1024 * 1024), 2),
-            'created': datetime.now().isoformat(),
-            'original_size': original_size,
-            'integrity_check': backup_size == original_size
-        }
-        
-        # Get current books count for metadata
-        try:
-            books = db_service.get_all_books()
-            backup_info['books_count'] = len(books)
-        except Exception as e:
-            logger.warning(f"Could not get books count for backup metadata: {e}")
-            backup_info['books_count'] = 'Unknown'
-        
-        logger.info(f"Database backup created: {backup_filename}")
+                'error': str(e),
+                'available_compressions': available_compressions()
+            }), 400
+
+        db_service = get_database_service()
+        job = db_service.start_backup(**options)
+        logger.info("Database backup started", extra={"job_id": job['job_id'], **options})
+        return jsonify({
+            'success': True,
+            'message': 'Database backup started',
+            'job': job,
+            'status_url': url_for('settings.backup_database_status', job_id=job['job_id']),
+            'timestamp': datetime.now().isoformat()
+        }), 202
+
+    except Exception as e:
+        logger.error(f"Error starting database backup: {e}")
+        return jsonify({
+            'success': False,
+            'error': f'Failed to start database backup: {str(e)}'
+        }), 500
+
+
+def handle_backup_database_status(job_id):
+    """Report progress and result of a backup job."""
+    job = get_database_service().get_backup_job(job_id)
+    if not job:
+        return jsonify({
+            'success': False,
+            'error': 'Backup job not found'
+        }), 404
+    return jsonify({
+        'success': True,
+        'job': job,
+        'timestamp': datetime.now().isoformat()
+    })
+
+
+def handle_list_backups():
+    """List existing database backups, newest first."""
+    try:
         return jsonify({
             'success': True,
-            'message': 'Database backup created successfully',
-            'backup_info': backup_info,
+            'backups': get_database_service().list_backups(),
+            'available_compressions': available_compressions(),
             'timestamp': datetime.now().isoformat()
         })
-    
     except Exception as e:
-        logger.error(f"Error creating database backup: {e}")
+        logger.error(f"Error listing database backups: {e}")
         return jsonify({
             'success': False,
-            'error': f'Failed to create database backup: {str(e)}'
-        }), 500
\ No newline at end of file
+            'error': f'Failed to list database backups: {str(e)}'
+        }), 500
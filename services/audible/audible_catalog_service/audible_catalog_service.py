@@ -2,9 +2,10 @@
 Module Name: audible_catalog_service.py
 Author: TheDragonShaman
 Created: August 14, 2025
-Last Modified: December 23, 2025
+Last Modified: October 16, 2026
 Description:
     Search, fetch, and format Audible catalog data with shared helpers.
+    Raw search and detail responses are kept in the shared response cache.
 Location:
     /services/audible/audible_catalog_service/audible_catalog_service.py
 
@@ -14,12 +15,25 @@ import threading
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from utils.logger import get_module_logger
+from services.http_cache import get_response_cache
 from .catalog_search import AudibleSearch
 from .formatting import AudibleFormatter
 from .cover_utils import CoverImageUtils
 from .error_handling import AudibleErrorHandler
 from .author_scraper import AudibleAuthorScraper
 
+CACHE_NAMESPACE = "audible_catalog"
+
+# Freshness per endpoint (seconds). Validated empty searches / unknown ASINs
+# are cached as negative entries for NEGATIVE_TTL; failed requests (429, 5xx,
+# bad JSON) keep their status and are never cached.
+ENDPOINT_TTLS = {
+    "search": 6 * 3600,
+    "book_details": 24 * 3600,
+}
+STALE_TTL = 7 * 24 * 3600
+NEGATIVE_TTL = 3600
+
 class AudibleService:
     """Enhanced singleton service for Audible API operations with modular components"""
     
@@ -46,6 +60,7 @@ class AudibleService:
                     self.cover_utils = CoverImageUtils()
                     self.error_handler = AudibleErrorHandler()
                     self.author_scraper = AudibleAuthorScraper()
+                    self.response_cache = get_response_cache()
                     
                     self.logger.info("AudibleService initialized", extra={"instance_id": id(self)})
                     AudibleService._initialized = True
@@ -55,8 +70,22 @@ class AudibleService:
         try:
             self.logger.info("Starting book search", extra={"query": query, "region": region, "requested": num_results})
             
-            # Perform search using search module
-            raw_results = self.search.search_books(query, region, num_results)
+            # Perform search using search module (through the response cache)
+            def load():
+                status, products = self.search.search_books_response(query, region, num_results) or (0, None)
+                if status != 200:
+                    return status, None
+                return (200, products) if products else (404, None)
+            
+            _, raw_results = self.response_cache.fetch(
+                CACHE_NAMESPACE,
+                "search",
+                {"query": query, "region": region, "num_results": num_results},
+                load,
+                ttl=ENDPOINT_TTLS["search"],
+                stale_ttl=STALE_TTL,
+                negative_ttl=NEGATIVE_TTL,
+            )
             
             if not raw_results:
                 self.logger.warning("No results found for query", extra={"query": query, "region": region})
@@ -77,8 +106,19 @@ class AudibleService:
         try:
             self.logger.info("Getting book details", extra={"asin": asin, "region": region})
             
-            # Get raw book data
-            raw_book = self.search.get_book_details(asin, region)
+            # Get raw book data (through the response cache)
+            def load():
+                return self.search.get_book_details_response(asin, region) or (0, None)
+            
+            _, raw_book = self.response_cache.fetch(
+                CACHE_NAMESPACE,
+                "book_details",
+                {"asin": asin, "region": region},
+                load,
+                ttl=ENDPOINT_TTLS["book_details"],
+                stale_ttl=STALE_TTL,
+                negative_ttl=NEGATIVE_TTL,
+            )
             
             if not raw_book:
                 self.logger.warning("No book found for ASIN", extra={"asin": asin, "region": region})
@@ -192,7 +232,8 @@ class AudibleService:
                 'initialized': self._initialized,
                 'api_status': api_status,
                 'components': component_status,
-                'base_url': self.search.base_url if self.search else None
+                'base_url': self.search.base_url if self.search else None,
+                'cache': self.response_cache.get_stats(CACHE_NAMESPACE)
             }
             
             # Add performance info if available
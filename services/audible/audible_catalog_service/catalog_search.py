@@ -2,21 +2,26 @@
 Module Name: catalog_search.py
 Author: TheDragonShaman
 Created: August 16, 2025
-Last Modified: December 23, 2025
+Last Modified: October 16, 2026
 Description:
     Perform Audible catalog queries with retry/error handling and shared sessions.
+    The *_response variants also return the upstream status so callers can
+    tell a validated empty answer from a failed request.
 Location:
     /services/audible/audible_catalog_service/catalog_search.py
 
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
 from utils.logger import get_module_logger
 from .error_handling import error_handler
 
+# Reported for a 200 response whose body failed validation
+STATUS_BAD_RESPONSE = 502
+
 
 class AudibleSearch:
     """Handles Audible API search operations and requests."""
@@ -40,27 +45,26 @@ class AudibleSearch:
         )
         return session
 
-    @error_handler.with_retry(max_retries=3, retry_delay=1.0)
     def search_books(self, query: str, region: str = "us", num_results: int = 25) -> List[Dict[str, Any]]:
         """Search for books on Audible by keyword."""
 
+        response = self.search_books_response(query, region, num_results)
+        return response[1] if response else []
+
+    @error_handler.with_retry(max_retries=3, retry_delay=1.0)
+    def search_books_response(
+        self, query: str, region: str = "us", num_results: int = 25
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """Search by keyword; return (status_code, products). Non-200 means the request failed."""
+
         self.logger.info("Searching Audible", extra={"query": query, "region": region, "requested": num_results})
 
         try:
             params = self._build_search_params(query=query, num_results=num_results, region=region)
-            error_handler.log_request_info(self.base_url, params, f"Search books: {query}")
-
-            response = self.session.get(self.base_url, params=params, timeout=30)
-            if not error_handler.validate_response(response, f"Search books: {query}"):
-                return []
-
-            error_handler.handle_api_quota(response)
-
-            api_data = response.json()
-            products = api_data.get("products", [])
-
-            self.logger.info("Search results received", extra={"query": query, "region": region, "count": len(products)})
-            return products
+            status, products = self._get_products(params, f"Search books: {query}")
+            if status == 200:
+                self.logger.info("Search results received", extra={"query": query, "region": region, "count": len(products)})
+            return status, products
 
         except requests.exceptions.RequestException as exc:
             self.logger.error("Request error while searching", extra={"query": query, "region": region, "error": str(exc)})
@@ -69,34 +73,33 @@ class AudibleSearch:
             self.logger.error("Unexpected error while searching", extra={"query": query, "region": region, "error": str(exc)})
             raise
 
-    @error_handler.with_retry(max_retries=3, retry_delay=1.0)
     def get_book_details(self, asin: str, region: str = "us") -> Optional[Dict[str, Any]]:
         """Retrieve detailed information for a specific ASIN."""
 
+        response = self.get_book_details_response(asin, region)
+        return response[1] if response else None
+
+    @error_handler.with_retry(max_retries=3, retry_delay=1.0)
+    def get_book_details_response(self, asin: str, region: str = "us") -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Fetch one ASIN; return (status_code, product), with 404 when Audible has no such product."""
+
         self.logger.info("Retrieving book details", extra={"asin": asin, "region": region})
 
         try:
             params = self._build_details_params(asin=asin, region=region)
-            error_handler.log_request_info(self.base_url, params, f"Get book details: {asin}")
-
-            response = self.session.get(self.base_url, params=params, timeout=30)
-            if not error_handler.validate_response(response, f"Get book details: {asin}"):
-                return None
-
-            error_handler.handle_api_quota(response)
-
-            api_data = response.json()
-            products = api_data.get("products", [])
+            status, products = self._get_products(params, f"Get book details: {asin}")
+            if status != 200:
+                return status, None
             if not products:
                 self.logger.warning("No product returned", extra={"asin": asin, "region": region})
-                return None
+                return 404, None
 
             product = products[0]
             returned_asin = product.get("asin")
             if returned_asin and returned_asin != asin:
                 self.logger.warning("ASIN mismatch", extra={"requested": asin, "received": returned_asin, "region": region})
 
-            return product
+            return 200, product
 
         except requests.exceptions.RequestException as exc:
             self.logger.error("Request error while fetching ASIN", extra={"asin": asin, "region": region, "error": str(exc)})
@@ -105,6 +108,19 @@ class AudibleSearch:
             self.logger.error("Unexpected error while fetching ASIN", extra={"asin": asin, "region": region, "error": str(exc)})
             raise
 
+    def _get_products(self, params: Dict[str, str], operation: str) -> Tuple[int, List[Dict[str, Any]]]:
+        """GET the catalog endpoint; return (200, products) or (failure status, [])."""
+
+        error_handler.log_request_info(self.base_url, params, operation)
+
+        response = self.session.get(self.base_url, params=params, timeout=30)
+        if not error_handler.validate_response(response, operation):
+            status = response.status_code
+            return (STATUS_BAD_RESPONSE if status == 200 else status), []
+
+        error_handler.handle_api_quota(response)
+        return 200, response.json().get("products", [])
+
     def _build_search_params(self, query: str, num_results: int, region: str) -> Dict[str, str]:
         """Build query parameters for keyword search requests."""
 
@@ -2,21 +2,29 @@
 Module Name: audible_series_service.py
 Author: TheDragonShaman
 Created: August 26, 2025
-Last Modified: December 24, 2025
+Last Modified: October 16, 2026
 Description:
     Sync Audible series metadata and books into the database using the shared Audible client.
+    Library-wide syncs run series concurrently on a bounded worker pool that
+    shares one request rate limiter.
 Location:
     /services/audible/audible_series_service/audible_series_service.py
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from utils.logger import get_module_logger
 from .series_relationship_extractor import SeriesRelationshipExtractor
-from .series_data_fetcher import SeriesDataFetcher
+from .series_data_fetcher import SeriesDataFetcher, RequestRateLimiter, DEFAULT_REQUESTS_PER_SECOND
 from .series_book_processor import SeriesBookProcessor
 from .series_database_sync import SeriesDatabaseSync
 
 
+# Series synced concurrently by sync_all_series()
+DEFAULT_SYNC_WORKERS = 4
+
+
 class AudibleSeriesService:
     """
     Main service for Audible series operations
@@ -54,7 +62,7 @@ class AudibleSeriesService:
             audible_client: Authenticated Audible API client
             db_service: DatabaseService instance
         """
-        self.fetcher = SeriesDataFetcher(audible_client)
+        self.fetcher = SeriesDataFetcher(audible_client, rate_limiter=RequestRateLimiter(DEFAULT_REQUESTS_PER_SECOND))
         self.processor = SeriesBookProcessor(db_service)
         self.sync = SeriesDatabaseSync(db_service)
         self.logger.debug(
@@ -84,15 +92,12 @@ class AudibleSeriesService:
             
             series_asin = series_metadata.get('series_asin')
             
-            # Step 2: Fetch complete series data from Audible
-            series_data = self.fetcher.fetch_series_metadata(series_asin)
+            # Step 2-3: Fetch series data and all of its books from Audible
+            series_data, books_data = self.fetcher.fetch_series(series_asin)
             if not series_data:
                 self.logger.error("Failed to fetch series data", extra={"series_asin": series_asin})
                 return {'success': False, 'error': 'Failed to fetch series data'}
             
-            # Step 3: Fetch all books in the series
-            books_data = self.fetcher.fetch_series_books(series_asin)
-            
             # Step 4: Process books (add library status)
             processed_books = self.processor.process_series_books(series_asin, books_data)
             
@@ -182,15 +187,12 @@ class AudibleSeriesService:
         try:
             self.logger.info("Starting direct series sync", extra={"series_asin": series_asin})
             
-            # Step 1: Fetch complete series data from Audible
-            series_data = self.fetcher.fetch_series_metadata(series_asin)
+            # Step 1-2: Fetch series data and all of its books from Audible
+            series_data, books_data = self.fetcher.fetch_series(series_asin)
             if not series_data:
                 self.logger.error("Failed to fetch series data", extra={"series_asin": series_asin})
                 return {'success': False, 'error': 'Failed to fetch series data'}
             
-            # Step 2: Fetch all books in the series
-            books_data = self.fetcher.fetch_series_books(series_asin)
-            
             # Step 3: Process books (add library status)
             processed_books = self.processor.process_series_books(series_asin, books_data)
             
@@ -223,13 +225,17 @@ class AudibleSeriesService:
             )
             return {'success': False, 'error': str(e)}
     
-    def sync_all_series(self, limit=None):
+    def sync_all_series(self, limit=None, max_workers=DEFAULT_SYNC_WORKERS):
         """
         Sync series data for all unique series in the library
         Now that books have series_asin populated during add/import, this is efficient
         
+        Series are synced concurrently on a bounded pool; Audible requests
+        from every worker share the fetcher's rate limiter.
+        
         Args:
             limit: Optional limit on number of series to process
+            max_workers: Maximum number of series synced at once
             
         Returns:
             dict: Summary of sync operation
@@ -237,7 +243,7 @@ class AudibleSeriesService:
         try:
             self.logger.info(
                 "Starting batch series sync for all library series",
-                extra={"limit": limit},
+                extra={"limit": limit, "max_workers": max_workers},
             )
             
             # Get all unique series ASINs from books that have them
@@ -255,50 +261,20 @@ class AudibleSeriesService:
                 }
             
             total_series = len(series_asins)
-            successful = 0
-            failed = 0
-            results = []
-            
             self.logger.info("Found unique series to sync", extra={"count": total_series})
             
-            # Process each series
-            for idx, series_asin in enumerate(series_asins, 1):
-                try:
-                    self.logger.info(
-                        "Syncing series",
-                        extra={"index": idx, "total": total_series, "series_asin": series_asin},
-                    )
-                    # Use direct series sync instead of book-based sync
-                    result = self.sync_series_by_series_asin(series_asin)
-                    
-                    if result.get('success'):
-                        successful += 1
-                        results.append({
-                            'series_asin': series_asin,
-                            'series_title': result.get('series_title', 'Unknown'),
-                            'status': 'success',
-                            'books_synced': result.get('books_synced', 0)
-                        })
-                    else:
-                        failed += 1
-                        results.append({
-                            'series_asin': series_asin,
-                            'status': 'failed',
-                            'error': result.get('error', 'Unknown error')
-                        })
-                        
-                except Exception as e:
-                    self.logger.error(
-                        "Error syncing series in batch",
-                        extra={"series_asin": series_asin, "error": str(e)},
-                        exc_info=True,
-                    )
-                    failed += 1
-                    results.append({
-                        'series_asin': series_asin,
-                        'status': 'failed',
-                        'error': str(e)
-                    })
+            workers = max(1, min(int(max_workers or 1), total_series))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="SeriesSync") as executor:
+                # map() keeps results in library order
+                results = list(executor.map(
+                    self._sync_series_for_batch,
+                    series_asins,
+                    range(1, total_series + 1),
+                    [total_series] * total_series,
+                ))
+            
+            successful = sum(1 for result in results if result['status'] == 'success')
+            failed = total_series - successful
             
             self.logger.info(
                 "Batch series sync complete",
@@ -322,6 +298,41 @@ class AudibleSeriesService:
             )
             return {'success': False, 'error': str(e)}
     
+    def _sync_series_for_batch(self, series_asin, idx, total_series):
+        """Sync one series for sync_all_series() and shape its summary entry."""
+        try:
+            self.logger.info(
+                "Syncing series",
+                extra={"index": idx, "total": total_series, "series_asin": series_asin},
+            )
+            # Use direct series sync instead of book-based sync
+            result = self.sync_series_by_series_asin(series_asin)
+            
+            if result.get('success'):
+                return {
+                    'series_asin': series_asin,
+                    'series_title': result.get('series_title', 'Unknown'),
+                    'status': 'success',
+                    'books_synced': result.get('books_synced', 0)
+                }
+            return {
+                'series_asin': series_asin,
+                'status': 'failed',
+                'error': result.get('error', 'Unknown error')
+            }
+            
+        except Exception as e:
+            self.logger.error(
+                "Error syncing series in batch",
+                extra={"series_asin": series_asin, "error": str(e)},
+                exc_info=True,
+            )
+            return {
+                'series_asin': series_asin,
+                'status': 'failed',
+                'error': str(e)
+            }
+    
     def refresh_series(self, series_asin):
         """
         Refresh data for a specific series
@@ -336,11 +347,10 @@ class AudibleSeriesService:
             self.logger.info("Refreshing series", extra={"series_asin": series_asin})
             
             # Fetch fresh data from Audible
-            series_data = self.fetcher.fetch_series_metadata(series_asin)
+            series_data, books_data = self.fetcher.fetch_series(series_asin)
             if not series_data:
                 return {'success': False, 'error': 'Failed to fetch series data'}
             
-            books_data = self.fetcher.fetch_series_books(series_asin)
             processed_books = self.processor.process_series_books(series_asin, books_data)
             
             # Sync to database
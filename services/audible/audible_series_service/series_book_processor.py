@@ -2,7 +2,7 @@
 Module Name: series_book_processor.py
 Author: TheDragonShaman
 Created: August 26, 2025
-Last Modified: December 23, 2025
+Last Modified: October 16, 2026
 Description:
     Process series book metadata, deduplicate editions, and mark library status before database sync.
 Location:
@@ -12,6 +12,9 @@ Location:
 
 from utils.logger import get_module_logger
 
+# Bound on bound parameters per IN (...) query (SQLite's historical limit is 999)
+_IN_CLAUSE_CHUNK = 500
+
 
 class SeriesBookProcessor:
     """Processes series book data for storage."""
@@ -53,6 +56,9 @@ class SeriesBookProcessor:
             
             processed_books = []
             
+            # One ownership lookup for the whole series instead of a query per book
+            library_status = self._get_library_status([book.get('asin') for book in books_data])
+            
             for book in books_data:
                 if not self._is_buyable(book):
                     self.logger.debug(
@@ -64,7 +70,7 @@ class SeriesBookProcessor:
                 book_asin = book.get('asin')
                 
                 # Check if book is in our library
-                in_library = self._check_in_library(book_asin)
+                in_library = library_status.get(book_asin, False)
                 in_audiobookshelf = self._check_in_audiobookshelf(book_asin)
                 
                 processed_book = {
@@ -311,51 +317,54 @@ class SeriesBookProcessor:
         sorted_books = sorted(candidate_pool, key=score_book, reverse=True)
         return sorted_books[0]
     
-    def _check_in_library(self, book_asin):
-        """Check if book exists in our database"""
+    def _get_library_status(self, book_asins):
+        """
+        Check which books exist in our database with a file on disk
+        
+        Args:
+            book_asins: ASINs to look up
+            
+        Returns:
+            dict: ASIN -> True when the book is in the library
+        """
+        asins = list(dict.fromkeys(asin for asin in book_asins if asin))
+        status = {asin: False for asin in asins}
+        if not asins:
+            return status
+        
+        conn = None
         try:
             conn, cursor = self.db.connect_db()
-            cursor.execute(
-                "SELECT file_path FROM books WHERE asin = ? LIMIT 1",
-                (book_asin,)
-            )
-            result = cursor.fetchone()
-            conn.close()
-            if not result:
-                return False
-            file_path = result[0]
-            if file_path is None:
-                return False
-            return str(file_path).strip() != ''
+            for start in range(0, len(asins), _IN_CLAUSE_CHUNK):
+                chunk = asins[start:start + _IN_CLAUSE_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor.execute(
+                    f"""
+                        SELECT DISTINCT asin FROM books
+                        WHERE asin IN ({placeholders})
+                          AND file_path IS NOT NULL
+                          AND TRIM(file_path) != ''
+                    """,
+                    chunk
+                )
+                for (asin,) in cursor.fetchall():
+                    status[asin] = True
         except Exception as e:
             self.logger.error(
                 "Error checking library status",
-                extra={"book_asin": book_asin, "error": str(e)},
+                extra={"book_count": len(asins), "error": str(e)},
                 exc_info=True,
             )
-            return False
+        finally:
+            if conn:
+                conn.close()
+        return status
     
     def _check_in_audiobookshelf(self, book_asin):
         """Check if book exists in AudiobookShelf"""
-        try:
-            conn, cursor = self.db.connect_db()
-            # Check if the column exists first, or just skip this check for now
-            # The column might not exist in all database schemas
-            cursor.execute(
-                "SELECT 1 FROM books WHERE asin = ? LIMIT 1",
-                (book_asin,)
-            )
-            result = cursor.fetchone()
-            conn.close()
-            # For now, just return False since we don't have this column yet
-            # TODO: Add in_audiobookshelf column check when available
-            return False
-        except Exception as e:
-            self.logger.debug(
-                "AudiobookShelf status check skipped",
-                extra={"book_asin": book_asin, "error": str(e)},
-            )
-            return False
+        # TODO: Add in_audiobookshelf column check when available; there is no
+        # column to read yet, so skip the database round trip entirely.
+        return False
     
     def calculate_series_stats(self, processed_books):
         """
@@ -2,29 +2,117 @@
 Module Name: series_data_fetcher.py
 Author: TheDragonShaman
 Created: August 26, 2025
-Last Modified: December 23, 2025
+Last Modified: October 16, 2026
 Description:
     Fetch complete series metadata and books from Audible using the shared client.
+    Book metadata is requested in batches of ASINs per catalog call, and all
+    calls pass through a shared rate limiter so concurrent series syncs stay
+    within Audible's request budget.
 Location:
     /services/audible/audible_series_service/series_data_fetcher.py
 
 """
 
+import threading
+import time
+
 from utils.logger import get_module_logger
 
+# ASINs per catalog/products request when fetching book metadata in bulk
+CATALOG_BATCH_SIZE = 50
+
+# Default ceiling on Audible catalog calls across all sync threads
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+
+BOOK_RESPONSE_GROUPS = (
+    "product_desc,product_extended_attrs,contributors,media,rating,series,relationships,customer_rights"
+)
+SERIES_RESPONSE_GROUPS = "product_desc,product_extended_attrs,media,relationships,customer_rights"
+
+
+class RequestRateLimiter:
+    """Thread-safe limiter spacing requests at least 1/rate seconds apart."""
+    
+    def __init__(self, requests_per_second=DEFAULT_REQUESTS_PER_SECOND):
+        self.min_interval = 1.0 / requests_per_second if requests_per_second and requests_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def acquire(self):
+        """Block until the caller may issue its next request."""
+        if not self.min_interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
 
 class SeriesDataFetcher:
     """Fetches series data from Audible API."""
     
-    def __init__(self, audible_client, logger=None):
+    def __init__(self, audible_client, logger=None, rate_limiter=None):
         """
         Initialize with Audible API client
         
         Args:
             audible_client: Authenticated Audible API client
+            rate_limiter: Optional shared RequestRateLimiter
         """
         self.logger = logger or get_module_logger("Service.Audible.Series.DataFetcher")
         self.client = audible_client
+        self.rate_limiter = rate_limiter or RequestRateLimiter()
+    
+    def _get(self, path, **kwargs):
+        """Issue a rate-limited GET through the Audible client."""
+        self.rate_limiter.acquire()
+        return self.client.get(path, **kwargs)
+    
+    def _fetch_series_product(self, series_asin):
+        """Fetch the series product (with relationships) in one request."""
+        response = self._get(
+            f"1.0/catalog/products/{series_asin}",
+            response_groups=SERIES_RESPONSE_GROUPS
+        )
+        if not response:
+            return None
+        # Handle both wrapped and unwrapped responses
+        return response.get('product', response)
+    
+    def fetch_series(self, series_asin):
+        """
+        Fetch series metadata and all of its books
+        
+        Reads the series product once and reuses it for both the metadata
+        and the book list.
+        
+        Args:
+            series_asin: The ASIN of the series
+            
+        Returns:
+            tuple: (series metadata dict or None, list of book metadata dicts)
+        """
+        try:
+            self.logger.debug("Fetching series", extra={"series_asin": series_asin})
+            product = self._fetch_series_product(series_asin)
+            if not product:
+                self.logger.warning(
+                    "No response for series ASIN",
+                    extra={"series_asin": series_asin},
+                )
+                return None, []
+            
+            return self._build_series_metadata(series_asin, product), self._books_from_series_product(series_asin, product)
+            
+        except Exception as e:
+            self.logger.error(
+                "Error fetching series",
+                extra={"series_asin": series_asin, "error": str(e)},
+                exc_info=True,
+            )
+            return None, []
     
     def fetch_series_metadata(self, series_asin):
         """
@@ -39,32 +127,15 @@ class SeriesDataFetcher:
         try:
             self.logger.debug("Fetching series metadata", extra={"series_asin": series_asin})
             
-            # Query Audible API for series information
-            # Note: This uses the catalog/products endpoint with the series ASIN
-            response = self.client.get(
-                f"1.0/catalog/products/{series_asin}",
-                response_groups="product_desc,product_extended_attrs,media,relationships,customer_rights"
-            )
-            
-            if not response:
+            product = self._fetch_series_product(series_asin)
+            if not product:
                 self.logger.warning(
                     "No response for series ASIN",
                     extra={"series_asin": series_asin},
                 )
                 return None
             
-            # Handle both wrapped and unwrapped responses
-            product = response.get('product', response)
-            
-            series_data = {
-                'series_asin': series_asin,
-                'series_title': product.get('title'),
-                'series_url': product.get('url'),
-                'sku': product.get('sku'),
-                'description': product.get('publisher_summary', ''),
-                'cover_url': self._extract_cover_url(product),
-                'total_books': self._extract_total_books(product)
-            }
+            series_data = self._build_series_metadata(series_asin, product)
             
             self.logger.info(
                 "Fetched series metadata",
@@ -93,79 +164,11 @@ class SeriesDataFetcher:
         try:
             self.logger.debug("Fetching all books for series", extra={"series_asin": series_asin})
             
-            # Query for series with relationships to get all book ASINs
-            response = self.client.get(
-                f"1.0/catalog/products/{series_asin}",
-                response_groups="relationships,product_desc,customer_rights"
-            )
-            
-            if not response:
+            product = self._fetch_series_product(series_asin)
+            if not product:
                 return []
             
-            # Handle both wrapped and unwrapped responses
-            product = response.get('product', response)
-            relationships = product.get('relationships', [])
-            
-            # Extract all child books from series relationships
-            # Look for relationship_type == 'series' AND relationship_to_product == 'child'
-            book_asins = []
-            for relationship in relationships:
-                if (relationship.get('relationship_type') == 'series' and 
-                    relationship.get('relationship_to_product') == 'child'):
-                    book_asins.append({
-                        'asin': relationship.get('asin'),
-                        'sequence': relationship.get('sequence', ''),
-                        'sort_order': int(relationship.get('sort', 0))
-                    })
-            
-            self.logger.info(
-                "Found books in series; fetching detailed metadata",
-                extra={"series_asin": series_asin, "count": len(book_asins)},
-            )
-            
-            # Now fetch full metadata for each book
-            books = []
-            for book_info in book_asins:
-                book_asin = book_info['asin']
-                try:
-                    # Fetch complete book metadata
-                    book_metadata = self.fetch_book_metadata(book_asin)
-                    if book_metadata:
-                        # Merge sequence info with metadata
-                        book_metadata['sequence'] = book_info['sequence']
-                        book_metadata['sort_order'] = book_info['sort_order']
-                        books.append(book_metadata)
-                    else:
-                        # If we can't fetch metadata, use minimal data
-                        self.logger.warning(
-                            "Could not fetch metadata for book; using minimal data",
-                            extra={"book_asin": book_asin},
-                        )
-                        books.append({
-                            'asin': book_asin,
-                            'title': 'Unknown',
-                            'sequence': book_info['sequence'],
-                            'sort_order': book_info['sort_order']
-                        })
-                except Exception as e:
-                    self.logger.error(
-                        "Error fetching metadata for book",
-                        extra={"book_asin": book_asin, "error": str(e)},
-                        exc_info=True,
-                    )
-                    # Add minimal book data so we don't lose the book entirely
-                    books.append({
-                        'asin': book_asin,
-                        'title': 'Unknown',
-                        'sequence': book_info['sequence'],
-                        'sort_order': book_info['sort_order']
-                    })
-            
-            self.logger.info(
-                "Fetched metadata for series books",
-                extra={"series_asin": series_asin, "count": len(books)},
-            )
-            return books
+            return self._books_from_series_product(series_asin, product)
             
         except Exception as e:
             self.logger.error(
@@ -175,6 +178,115 @@ class SeriesDataFetcher:
             )
             return []
     
+    def _build_series_metadata(self, series_asin, product):
+        """Shape a series product into the series metadata dict."""
+        return {
+            'series_asin': series_asin,
+            'series_title': product.get('title'),
+            'series_url': product.get('url'),
+            'sku': product.get('sku'),
+            'description': product.get('publisher_summary', ''),
+            'cover_url': self._extract_cover_url(product),
+            'total_books': self._extract_total_books(product)
+        }
+    
+    def _books_from_series_product(self, series_asin, product):
+        """Resolve the child books of a series product with bulk metadata fetches."""
+        relationships = product.get('relationships', [])
+        
+        # Extract all child books from series relationships
+        # Look for relationship_type == 'series' AND relationship_to_product == 'child'
+        book_asins = []
+        for relationship in relationships:
+            if (relationship.get('relationship_type') == 'series' and 
+                relationship.get('relationship_to_product') == 'child'):
+                book_asins.append({
+                    'asin': relationship.get('asin'),
+                    'sequence': relationship.get('sequence', ''),
+                    'sort_order': int(relationship.get('sort', 0))
+                })
+        
+        self.logger.info(
+            "Found books in series; fetching detailed metadata",
+            extra={"series_asin": series_asin, "count": len(book_asins)},
+        )
+        
+        metadata_by_asin = self.fetch_books_metadata([book_info['asin'] for book_info in book_asins])
+        
+        books = []
+        for book_info in book_asins:
+            book_asin = book_info['asin']
+            book_metadata = metadata_by_asin.get(book_asin)
+            if book_metadata:
+                # Copy so editions shared between series don't share sequence info
+                book_metadata = dict(book_metadata)
+            else:
+                # If we can't fetch metadata, use minimal data so we don't lose the book entirely
+                self.logger.warning(
+                    "Could not fetch metadata for book; using minimal data",
+                    extra={"book_asin": book_asin},
+                )
+                book_metadata = {'asin': book_asin, 'title': 'Unknown'}
+            # Merge sequence info with metadata
+            book_metadata['sequence'] = book_info['sequence']
+            book_metadata['sort_order'] = book_info['sort_order']
+            books.append(book_metadata)
+        
+        self.logger.info(
+            "Fetched metadata for series books",
+            extra={"series_asin": series_asin, "count": len(books)},
+        )
+        return books
+    
+    def fetch_books_metadata(self, book_asins):
+        """
+        Fetch complete metadata for many books, CATALOG_BATCH_SIZE ASINs per request
+        
+        ASINs missing from a batch response (or from a failed batch) are
+        retried individually via fetch_book_metadata().
+        
+        Args:
+            book_asins: Iterable of book ASINs
+            
+        Returns:
+            dict: Metadata dicts keyed by ASIN (unresolvable ASINs are omitted)
+        """
+        unique_asins = list(dict.fromkeys(asin for asin in book_asins if asin))
+        results = {}
+        
+        for start in range(0, len(unique_asins), CATALOG_BATCH_SIZE):
+            chunk = unique_asins[start:start + CATALOG_BATCH_SIZE]
+            try:
+                response = self._get(
+                    "1.0/catalog/products",
+                    params={
+                        "asins": ",".join(chunk),
+                        "response_groups": BOOK_RESPONSE_GROUPS,
+                        "image_sizes": "500"
+                    }
+                )
+                for product in (response or {}).get('products') or []:
+                    product_asin = product.get('asin')
+                    if product_asin in chunk and product_asin not in results:
+                        results[product_asin] = self._build_book_metadata(product_asin, product)
+            except Exception as e:
+                self.logger.warning(
+                    "Bulk catalog fetch failed; falling back to per-book requests",
+                    extra={"batch_size": len(chunk), "error": str(e)},
+                )
+            
+            for book_asin in chunk:
+                if book_asin not in results:
+                    book_metadata = self.fetch_book_metadata(book_asin)
+                    if book_metadata:
+                        results[book_asin] = book_metadata
+        
+        self.logger.debug(
+            "Fetched bulk book metadata",
+            extra={"requested": len(unique_asins), "resolved": len(results)},
+        )
+        return results
+    
     def fetch_book_metadata(self, book_asin):
         """
         Fetch complete metadata for a single book
@@ -188,11 +300,11 @@ class SeriesDataFetcher:
         try:
             self.logger.info("Fetching metadata for book", extra={"book_asin": book_asin})
             
-            response = self.client.get(
+            response = self._get(
                 f"1.0/catalog/products/{book_asin}",
                 params={
                     # Request series, relationships, and customer rights so downstream extractors can identify series membership
-                    "response_groups": "product_desc,product_extended_attrs,contributors,media,rating,series,relationships,customer_rights",
+                    "response_groups": BOOK_RESPONSE_GROUPS,
                     "image_sizes": "500"
                 }
             )
@@ -218,32 +330,7 @@ class SeriesDataFetcher:
                 extra={"book_asin": book_asin, "title": product.get('title', 'Unknown')},
             )
             
-            # Extract all the metadata we need
-            customer_rights = product.get('customer_rights') or {}
-            metadata = {
-                'asin': book_asin,
-                'title': product.get('title', 'Unknown'),
-                'author': self._extract_authors(product),
-                'narrator': self._extract_narrators(product),
-                'publisher': product.get('publisher_name', 'Unknown'),
-                'release_date': product.get('release_date', ''),
-                'runtime': self._extract_runtime(product),
-                'rating': self._extract_rating(product),
-                'num_ratings': self._extract_num_ratings(product),
-                'summary': product.get('publisher_summary', 'No summary available'),
-                'cover_image': self._extract_cover_url(product),
-                'language': product.get('language', 'en'),
-                'customer_rights': customer_rights,
-                'is_buyable': product.get('is_buyable', customer_rights.get('is_buyable')),
-                'product_state': product.get('product_state', customer_rights.get('product_state')),
-                # Preserve raw product metadata for series extraction logic
-                'product': {
-                    'series': product.get('series', []),
-                    'relationships': product.get('relationships', []),
-                    'title': product.get('title'),
-                    'asin': product.get('asin')
-                }
-            }
+            metadata = self._build_book_metadata(book_asin, product)
             
             self.logger.debug(
                 "Extracted metadata",
@@ -264,6 +351,34 @@ class SeriesDataFetcher:
             )
             return None
     
+    def _build_book_metadata(self, book_asin, product):
+        """Extract the book metadata dict used by the series pipeline from a catalog product."""
+        customer_rights = product.get('customer_rights') or {}
+        return {
+            'asin': book_asin,
+            'title': product.get('title', 'Unknown'),
+            'author': self._extract_authors(product),
+            'narrator': self._extract_narrators(product),
+            'publisher': product.get('publisher_name', 'Unknown'),
+            'release_date': product.get('release_date', ''),
+            'runtime': self._extract_runtime(product),
+            'rating': self._extract_rating(product),
+            'num_ratings': self._extract_num_ratings(product),
+            'summary': product.get('publisher_summary', 'No summary available'),
+            'cover_image': self._extract_cover_url(product),
+            'language': product.get('language', 'en'),
+            'customer_rights': customer_rights,
+            'is_buyable': product.get('is_buyable', customer_rights.get('is_buyable')),
+            'product_state': product.get('product_state', customer_rights.get('product_state')),
+            # Preserve raw product metadata for series extraction logic
+            'product': {
+                'series': product.get('series', []),
+                'relationships': product.get('relationships', []),
+                'title': product.get('title'),
+                'asin': product.get('asin')
+            }
+        }
+    
     def _extract_authors(self, product):
         """Extract author names from product"""
         try:
@@ -2,7 +2,7 @@
 Module Name: audible_wishlist_service.py
 Author: TheDragonShaman
 Created: August 26, 2025
-Last Modified: December 23, 2025
+Last Modified: October 16, 2026
 Description:
     Manage Audible wishlist integration and auto-sync; uses shared AudibleManager for auth and API calls.
 Location:
@@ -408,6 +408,8 @@ class AudibleWishlistService:
             
             conn.commit()
             conn.close()
+            if added or updated:
+                self._invalidate_library_status()
 
             if series_sync_asins:
                 self.logger.info(
@@ -438,6 +440,17 @@ class AudibleWishlistService:
                 'error': str(e)
             }
 
+    def _invalidate_library_status(self):
+        """Drop cached ASIN status lookups after writing books directly."""
+        try:
+            from services.service_manager import get_database_service
+
+            db_service = get_database_service()
+            if db_service:
+                db_service.invalidate_library_status()
+        except Exception as e:
+            self.logger.debug("Unable to invalidate library status cache", extra={"error": str(e)})
+
     def _ensure_series_service_ready(self) -> bool:
         """Initialize the series service once so wishlist imports can sync metadata."""
         if self._series_service_ready:
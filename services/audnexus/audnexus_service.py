@@ -2,9 +2,10 @@
 Module Name: audnexus_service.py
 Author: TheDragonShaman
 Created: August 26, 2025
-Last Modified: December 24, 2025
+Last Modified: October 16, 2026
 Description:
     Access the Audnexus API for author and book metadata with structured logging and fallbacks.
+    Lookups go through the shared persistent response cache.
 Location:
     /services/audnexus/audnexus_service.py
 
@@ -16,6 +17,33 @@ from typing import List, Dict, Optional, Any
 from datetime import datetime
 
 from utils.logger import get_module_logger
+from services.http_cache import get_response_cache
+
+CACHE_NAMESPACE = "audnexus"
+
+# Per-endpoint freshness (seconds); stale entries are served for STALE_TTL
+# longer while a background refresh runs. 404s are cached for NEGATIVE_TTL.
+ENDPOINT_TTLS = {
+    "authors_search": 24 * 3600,
+    "author_details": 7 * 24 * 3600,
+    "book_details": 7 * 24 * 3600,
+    "book_chapters": 30 * 24 * 3600,
+}
+STALE_TTL = 30 * 24 * 3600
+NEGATIVE_TTL = 24 * 3600
+
+
+class _CachedResponse:
+    """Minimal response stand-in (status_code/json()/text) for cached lookups."""
+    
+    def __init__(self, status_code: int, payload: Any):
+        self.status_code = status_code
+        self._payload = payload if status_code == 200 else None
+        self.text = payload if isinstance(payload, str) and status_code != 200 else ''
+    
+    def json(self):
+        return self._payload
+
 
 class AudnexusService:
     """
@@ -43,6 +71,7 @@ class AudnexusService:
                     # Keep connect/read timeouts short so UI doesn't hang on upstream slowness
                     self.request_timeout = (5, 8)  # (connect, read)
                     self.session = self._setup_session()
+                    self.response_cache = get_response_cache()
                     self.logger.success("Audnexus service started successfully")
                     AudnexusService._initialized = True
     
@@ -56,6 +85,33 @@ class AudnexusService:
         })
         return session
     
+    def _cached_get(self, endpoint: str, path: str, params: Dict[str, str]) -> _CachedResponse:
+        """
+        GET an Audnexus path through the response cache
+        
+        The ``update`` parameter is not part of the cache key; update=1 skips
+        the cached copy and stores the fresh response.
+        """
+        key_params = {k: v for k, v in params.items() if k != "update"}
+        
+        def load():
+            response = self.session.get(f"{self.base_url}{path}", params=params, timeout=self.request_timeout)
+            if response.status_code == 200:
+                return 200, response.json()
+            return response.status_code, response.text[:200] if response.text else ''
+        
+        status, payload = self.response_cache.fetch(
+            CACHE_NAMESPACE,
+            endpoint,
+            {"path": path, **key_params},
+            load,
+            ttl=ENDPOINT_TTLS[endpoint],
+            stale_ttl=STALE_TTL,
+            negative_ttl=NEGATIVE_TTL,
+            refresh=params.get("update") == "1",
+        )
+        return _CachedResponse(status, payload)
+    
     def search_authors(self, name: str, region: str = "us", num_results: int = 20) -> List[Dict]:
         """
         Search for authors by name
@@ -76,11 +132,7 @@ class AudnexusService:
                 "region": region
             }
             
-            response = self.session.get(
-                f"{self.base_url}/authors",
-                params=params,
-                timeout=self.request_timeout
-            )
+            response = self._cached_get("authors_search", "/authors", params)
             
             if response.status_code == 200:
                 authors = response.json()
@@ -129,11 +181,7 @@ class AudnexusService:
                 "update": "1" if update else "0"
             }
             
-            response = self.session.get(
-                f"{self.base_url}/authors/{asin}",
-                params=params,
-                timeout=self.request_timeout
-            )
+            response = self._cached_get("author_details", f"/authors/{asin}", params)
             
             if response.status_code == 200:
                 author = response.json()
@@ -183,11 +231,7 @@ class AudnexusService:
                 "update": "1" if update else "0"
             }
             
-            response = self.session.get(
-                f"{self.base_url}/books/{asin}",
-                params=params,
-                timeout=self.request_timeout
-            )
+            response = self._cached_get("book_details", f"/books/{asin}", params)
             
             if response.status_code == 200:
                 book = response.json()
@@ -234,11 +278,7 @@ class AudnexusService:
                 "update": "1" if update else "0"
             }
             
-            response = self.session.get(
-                f"{self.base_url}/books/{asin}/chapters",
-                params=params,
-                timeout=self.request_timeout
-            )
+            response = self._cached_get("book_chapters", f"/books/{asin}/chapters", params)
             
             if response.status_code == 200:
                 chapters = response.json()
@@ -458,6 +498,7 @@ class AudnexusService:
                 'initialized': self._initialized,
                 'connected': is_connected,
                 'status_message': message,
+                'cache': self.response_cache.get_stats(CACHE_NAMESPACE),
                 'endpoints': {
                     'authors_search': f"{self.base_url}/authors",
                     'author_details': f"{self.base_url}/authors/{{asin}}",
@@ -2,15 +2,18 @@
 Module Name: hybrid_service.py
 Author: TheDragonShaman
 Created: August 26, 2025
-Last Modified: December 24, 2025
+Last Modified: October 16, 2026
 Description:
     Combine Audnexus author-centric data with Audible catalog/search capabilities.
+    Audnexus enrichment of result lists fans out over a shared worker pool
+    with a per-host concurrency cap and a total deadline.
 Location:
     /services/audnexus/hybrid_service.py
 
 """
 
 import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import List, Dict, Optional, Any, Tuple
 
 from utils.logger import get_module_logger
@@ -18,12 +21,20 @@ from utils.logger import get_module_logger
 from ..audible.audible_catalog_service.audible_catalog_service import AudibleService
 from .audnexus_service import AudnexusService
 
+# Enrichment fan-out: pool size, concurrent requests allowed against the
+# Audnexus host (shared across concurrent searches), and the time budget for
+# a whole result list before unenriched books are returned as audible_only.
+ENRICHMENT_MAX_WORKERS = 8
+AUDNEXUS_HOST_CONCURRENCY = 6
+ENRICHMENT_DEADLINE_SECONDS = 6.0
+
 class HybridAudiobookService:
     """
     Hybrid service that combines Audnexus and Audible APIs
     - Uses Audnexus for author-centric operations (better data, no rate limits)
     - Uses Audible API for general book search and discovery
     - Provides fallback mechanisms for robust operation
+    - Enriches result lists concurrently within a deadline
     """
     
     _instance: Optional['HybridAudiobookService'] = None
@@ -47,6 +58,10 @@ class HybridAudiobookService:
                     self.audnexus = AudnexusService()
                     self.audible = AudibleService()
                     
+                    # Enrichment pool is created on first use
+                    self._enrichment_executor: Optional[ThreadPoolExecutor] = None
+                    self._audnexus_slots = threading.BoundedSemaphore(AUDNEXUS_HOST_CONCURRENCY)
+                    
                     self.logger.success("Hybrid audiobook service started successfully")
                     HybridAudiobookService._initialized = True
     
@@ -129,32 +144,13 @@ class HybridAudiobookService:
             if limit is not None:
                 audible_books = audible_books[:limit]
             
-            books = []
-            
-            # Enhance each book with Audnexus data if available
-            for book in audible_books:
-                if not enrich_with_audnexus or not book.get('ASIN'):
-                    book.setdefault('enhanced_by', 'audible_only')
-                    books.append(book)
-                    continue
-
-                try:
-                    enhanced_book = self.audnexus.get_book_details(book['ASIN'], region)
-                except Exception as enhancement_error:
-                    self.logger.debug(
-                        "Audnexus enhancement failed",
-                        extra={"book_asin": book.get('ASIN'), "exc": enhancement_error}
-                    )
-                    enhanced_book = None
-                
-                if enhanced_book:
-                    audnexus_formatted = self.audnexus.format_book_for_compatibility(enhanced_book)
-                    book.update({k: v for k, v in audnexus_formatted.items() if v and v != 'N/A'})
-                    book['enhanced_by'] = 'audnexus'
-                else:
-                    book['enhanced_by'] = 'audible_only'
-                
-                books.append(book)
+            if enrich_with_audnexus:
+                # Enhance each book with Audnexus data if available
+                books = self._enrich_books(audible_books, region)
+            else:
+                books = list(audible_books)
+            for book in books:
+                book.setdefault('enhanced_by', 'audible_only')
             
             # Fallback: if Audible returned nothing, try limited Audnexus data
             if not books and enrich_with_audnexus:
@@ -211,20 +207,7 @@ class HybridAudiobookService:
             books = self.audible.search_books(query, region, num_results)
             
             # Enhance results with Audnexus data where possible
-            enhanced_books = []
-            for book in books:
-                if book.get('ASIN'):
-                    # Try to enhance with Audnexus
-                    audnexus_book = self.audnexus.get_book_details(book['ASIN'], region)
-                    if audnexus_book:
-                        audnexus_formatted = self.audnexus.format_book_for_compatibility(audnexus_book)
-                        # Merge better data from Audnexus
-                        book.update({k: v for k, v in audnexus_formatted.items() if v and v != 'N/A'})
-                        book['enhanced_by'] = 'audnexus'
-                    else:
-                        book['enhanced_by'] = 'audible_only'
-                
-                enhanced_books.append(book)
+            enhanced_books = self._enrich_books(books, region)
             
             self.logger.info("Enhanced books from search", extra={"query": query, "count": len(enhanced_books)})
             return enhanced_books
@@ -295,20 +278,7 @@ class HybridAudiobookService:
             books = self.audible.search_by_series(series, region, num_results)
             
             # Enhance with Audnexus data
-            enhanced_books = []
-            for book in books:
-                if book.get('ASIN'):
-                    audnexus_book = self.audnexus.get_book_details(book['ASIN'], region)
-                    if audnexus_book:
-                        audnexus_formatted = self.audnexus.format_book_for_compatibility(audnexus_book)
-                        book.update({k: v for k, v in audnexus_formatted.items() if v and v != 'N/A'})
-                        book['enhanced_by'] = 'audnexus'
-                    else:
-                        book['enhanced_by'] = 'audible_only'
-                
-                enhanced_books.append(book)
-            
-            return enhanced_books
+            return self._enrich_books(books, region)
             
         except Exception as exc:
             self.logger.error(
@@ -317,6 +287,92 @@ class HybridAudiobookService:
             )
             return []
     
+    # ========================================================================
+    # AUDNEXUS ENRICHMENT
+    # ========================================================================
+    
+    def _get_enrichment_executor(self) -> ThreadPoolExecutor:
+        """Return the shared enrichment pool, creating it on first use."""
+        if self._enrichment_executor is None:
+            with self._lock:
+                if self._enrichment_executor is None:
+                    self._enrichment_executor = ThreadPoolExecutor(
+                        max_workers=ENRICHMENT_MAX_WORKERS,
+                        thread_name_prefix="AudnexusEnrich"
+                    )
+        return self._enrichment_executor
+    
+    def _fetch_enrichment(self, asin: str, region: str) -> Optional[Dict]:
+        """Fetch and format Audnexus data for one ASIN within the host concurrency cap."""
+        with self._audnexus_slots:
+            audnexus_book = self.audnexus.get_book_details(asin, region)
+        if not audnexus_book:
+            return None
+        return self.audnexus.format_book_for_compatibility(audnexus_book)
+    
+    def _enrich_books(
+        self,
+        books: List[Dict],
+        region: str,
+        deadline: float = ENRICHMENT_DEADLINE_SECONDS
+    ) -> List[Dict]:
+        """
+        Merge Audnexus data into books concurrently, preserving order
+        
+        Books whose lookup fails or does not finish before the deadline are
+        returned unchanged and marked 'audible_only'; books without an ASIN
+        are returned untouched.
+        
+        Args:
+            books: Audible result dicts (updated in place)
+            region: Region code
+            deadline: Seconds to wait for the whole list
+            
+        Returns:
+            The same books, in their original order
+        """
+        asins = list(dict.fromkeys(book['ASIN'] for book in books if book.get('ASIN')))
+        if not asins:
+            return list(books)
+        
+        executor = self._get_enrichment_executor()
+        futures = {asin: executor.submit(self._fetch_enrichment, asin, region) for asin in asins}
+        done, pending = wait(futures.values(), timeout=deadline)
+        
+        for future in pending:
+            # Queued lookups are dropped; running ones finish in the background
+            future.cancel()
+        if pending:
+            self.logger.info(
+                "Audnexus enrichment deadline reached",
+                extra={"enriched_candidates": len(done), "timed_out": len(pending), "deadline_seconds": deadline}
+            )
+        
+        for book in books:
+            asin = book.get('ASIN')
+            if not asin:
+                continue
+            
+            future = futures[asin]
+            audnexus_formatted = None
+            if future in done:
+                try:
+                    audnexus_formatted = future.result()
+                except Exception as enhancement_error:
+                    self.logger.debug(
+                        "Audnexus enhancement failed",
+                        extra={"book_asin": asin, "exc": enhancement_error}
+                    )
+            
+            if audnexus_formatted:
+                # Merge better data from Audnexus
+                book.update({k: v for k, v in audnexus_formatted.items() if v and v != 'N/A'})
+                book['enhanced_by'] = 'audnexus'
+            else:
+                book['enhanced_by'] = 'audible_only'
+        
+        return list(books)
+    
     # ========================================================================
     # SERVICE MANAGEMENT
     # ========================================================================
@@ -391,6 +447,9 @@ class HybridAudiobookService:
                 self.audible.reset_service()
             except:
                 pass
+            if self._enrichment_executor is not None:
+                self._enrichment_executor.shutdown(wait=False, cancel_futures=True)
+                self._enrichment_executor = None
             self.__class__._initialized = False
             self.__class__._instance = None
             self.logger.info("HybridAudiobookService reset")
@@ -2,7 +2,7 @@
 Module Name: defaults.py
 Author: TheDragonShaman
 Created: August 26, 2025
-Last Modified: December 24, 2025
+Last Modified: October 16, 2026
 Description:
     Generate and persist default configuration for AuralArchive.
 Location:
@@ -135,6 +135,7 @@ class ConfigDefaults:
         """Add import service configuration section."""
         config["import"] = {
             "verify_after_import": "true",
+            "verify_mode": "full",
             "create_backup_on_error": "true",
             "delete_source_after_import": "false",
             "use_hardlinks": "false",
@@ -150,6 +151,10 @@ class ConfigDefaults:
             "seeding_enabled": "false",
             "delete_source_after_import": "false",
             "max_concurrent_downloads": "2",
+            "max_active_searches": "2",
+            "conversion_workers": "",  # empty = one per CPU
+            "import_workers": "2",
+            "progress_flush_hz": "4",  # coalesced progress events per second
             "monitoring_interval": "2",
             "auto_start_monitoring": "true",
             "monitor_seeding": "true",
@@ -163,7 +168,9 @@ class ConfigDefaults:
     def _add_application_config(self, config: configparser.ConfigParser):
         """Add application settings section."""
         config["application"] = {
-            "log_level": "INFO"
+            "log_level": "INFO",
+            "backup_compression": "gzip",  # none, gzip or zstd
+            "backup_retention": "10",  # backups kept; 0 keeps all
         }
     
     def _add_authors_config(self, config: configparser.ConfigParser):
@@ -2,7 +2,7 @@
 Module Name: management.py
 Author: TheDragonShaman
 Created: August 26, 2025
-Last Modified: December 24, 2025
+Last Modified: October 16, 2026
 Description:
     Singleton configuration manager with defaults, validation, and backup helpers.
 Location:
@@ -15,11 +15,13 @@ import json
 import os
 import tempfile
 import threading
+import time
 from typing import Dict, Any, Optional, Set
 
 from .defaults import ConfigDefaults
 from .validation import ConfigValidation
 from .export_import import ConfigExportImport
+from .snapshot import ConfigSnapshot
 from utils.logger import get_module_logger
 from utils.path_resolver import get_path_resolver
 
@@ -36,6 +38,9 @@ class ConfigService:
     _lock = threading.Lock()
     _initialized = False
 
+    # How often read paths re-stat config.txt to detect out-of-band edits.
+    SNAPSHOT_STAT_INTERVAL = 1.0
+
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             with cls._lock:
@@ -69,6 +74,14 @@ class ConfigService:
                     self.validation = validation or ConfigValidation(logger=self.logger)
                     self.export_import = export_import or ConfigExportImport(self.config_file, logger=self.logger)
 
+                    # In-memory parsed snapshot used by every read path
+                    self._snapshot: Optional[ConfigSnapshot] = None
+                    self._snapshot_lock = threading.Lock()
+                    self._snapshot_checked_at = 0.0
+                    self._snapshot_loaded_at: Optional[float] = None
+                    self._snapshot_reloads = 0
+                    self._snapshot_hits = 0
+
                     # Ensure config exists
                     self.defaults.ensure_config_exists()
 
@@ -104,10 +117,45 @@ class ConfigService:
             )
             return parser
     
+    def get_snapshot(self) -> ConfigSnapshot:
+        """Return the parsed configuration held in memory.
+
+        The file is re-stat'ed at most once per ``SNAPSHOT_STAT_INTERVAL`` and
+        only re-parsed when its mtime, inode or size changed, or after a write
+        through this service invalidated the snapshot.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            now = time.monotonic()
+            if now - self._snapshot_checked_at < self.SNAPSHOT_STAT_INTERVAL:
+                self._snapshot_hits += 1
+                return snapshot
+            if self._get_file_signature() == snapshot.file_signature:
+                self._snapshot_checked_at = now
+                self._snapshot_hits += 1
+                return snapshot
+        return self._reload_snapshot()
+
+    def invalidate_snapshot(self) -> None:
+        """Drop the in-memory snapshot so the next read re-parses the file."""
+        self._snapshot = None
+
+    def get_snapshot_stats(self) -> Dict[str, Any]:
+        """Return snapshot reload/hit counters for diagnostics."""
+        snapshot = self._snapshot
+        return {
+            'reloads': self._snapshot_reloads,
+            'hits': self._snapshot_hits,
+            'generation': snapshot.generation if snapshot else None,
+            'file_signature': list(snapshot.file_signature) if snapshot and snapshot.file_signature else None,
+            'loaded_at': self._snapshot_loaded_at,
+            'stat_interval_seconds': self.SNAPSHOT_STAT_INTERVAL,
+        }
+
     def get_config_value(self, section: str, key: str, fallback: str = None) -> Optional[str]:
         """Get a specific configuration value."""
         try:
-            config = self.load_config()
+            config = self.get_snapshot()
             return config.get(section.lower(), key.lower(), fallback=fallback)
         except Exception as exc:
             self.logger.exception(
@@ -213,7 +261,7 @@ class ConfigService:
     def list_config(self) -> Dict[str, Dict[str, str]]:
         """Get all configuration as a dictionary."""
         try:
-            config = self.load_config()
+            config = self.get_snapshot()
             return {section: dict(config.items(section)) for section in config.sections()}
         except Exception as exc:
             self.logger.exception(
@@ -275,7 +323,7 @@ class ConfigService:
 
     def get_audiobookshelf_config(self) -> Dict[str, str]:
         """Get AudioBookShelf specific configuration."""
-        config = self.load_config()
+        config = self.get_snapshot()
         if config.has_section('audiobookshelf'):
             return dict(config.items('audiobookshelf'))
         return {}
@@ -344,7 +392,7 @@ class ConfigService:
     
     def get_download_config(self) -> Dict[str, str]:
         """Get download client configuration (qBittorrent + Jackett)."""
-        config = self.load_config()
+        config = self.get_snapshot()
         download_config = {}
         
         if config.has_section('qbittorrent'):
@@ -363,7 +411,10 @@ class ConfigService:
     
     def import_config(self, config_data: Dict[str, Any]) -> bool:
         """Import configuration from backup/transfer."""
-        return self.export_import.import_config(config_data)
+        try:
+            return self.export_import.import_config(config_data)
+        finally:
+            self.invalidate_snapshot()
     
     def backup_config(self, backup_dir: str = None) -> str:
         """Create a backup of the current configuration."""
@@ -371,11 +422,17 @@ class ConfigService:
     
     def restore_config(self, backup_path: str) -> bool:
         """Restore configuration from backup."""
-        return self.export_import.restore_config(backup_path)
+        try:
+            return self.export_import.restore_config(backup_path)
+        finally:
+            self.invalidate_snapshot()
     
     def reset_to_defaults(self) -> bool:
         """Reset configuration to default values."""
-        return self.export_import.reset_to_defaults(self.defaults)
+        try:
+            return self.export_import.reset_to_defaults(self.defaults)
+        finally:
+            self.invalidate_snapshot()
     
     def validate_config(self) -> Dict[str, bool]:
         """Validate configuration sections and return status."""
@@ -386,7 +443,7 @@ class ConfigService:
     def get(self, key: str, default=None):
         """Get configuration value by key with dot notation support."""
         try:
-            config = self.load_config()
+            config = self.get_snapshot()
             
             # Support dot notation (section.key)
             if '.' in key:
@@ -410,7 +467,7 @@ class ConfigService:
     def list_clients(self) -> list:
         """Return list of configured download clients."""
         try:
-            config = self.load_config()
+            config = self.get_snapshot()
             clients = []
             
             # Check common client sections
@@ -433,7 +490,7 @@ class ConfigService:
     def get_jackett_config(self) -> Dict[str, Any]:
         """Get Jackett indexer configuration."""
         try:
-            config = self.load_config()
+            config = self.get_snapshot()
             if config.has_section('jackett'):
                 return {
                     'enabled': config.getboolean('jackett', 'enabled', fallback=False),
@@ -454,7 +511,7 @@ class ConfigService:
     def get_prowlarr_config(self) -> Dict[str, Any]:
         """Get Prowlarr indexer configuration."""
         try:
-            config = self.load_config()
+            config = self.get_snapshot()
             if config.has_section('prowlarr'):
                 return {
                     'enabled': config.getboolean('prowlarr', 'enabled', fallback=False),
@@ -475,7 +532,7 @@ class ConfigService:
     def get_nzbhydra_config(self) -> Dict[str, Any]:
         """Get NZBHydra2 indexer configuration."""
         try:
-            config = self.load_config()
+            config = self.get_snapshot()
             if config.has_section('nzbhydra2'):
                 return {
                     'enabled': config.getboolean('nzbhydra2', 'enabled', fallback=False),
@@ -496,7 +553,7 @@ class ConfigService:
     def get_librivox_config(self) -> Dict[str, Any]:
         """Get LibriVox indexer configuration."""
         try:
-            config = self.load_config()
+            config = self.get_snapshot()
             if config.has_section('librivox'):
                 return {
                     'enabled': config.getboolean('librivox', 'enabled', fallback=True),
@@ -515,7 +572,7 @@ class ConfigService:
     def get_section(self, section_name: str) -> Dict[str, Any]:
         """Get all configuration values from a specific section."""
         try:
-            config = self.load_config()
+            config = self.get_snapshot()
             if not config.has_section(section_name):
                 return {}
             
@@ -542,7 +599,7 @@ class ConfigService:
     # ------------------------------------------------------------------
     def list_indexers_config(self) -> Dict[str, Dict[str, Any]]:
         """Return all configured indexers keyed by indexer identifier."""
-        config = self.load_config()
+        config = self.get_snapshot()
         indexers = self._extract_indexer_sections(config)
 
         if indexers:
@@ -553,14 +610,14 @@ class ConfigService:
             return {}
 
         if self._migrate_legacy_indexers(legacy_path):
-            config = self.load_config()
+            config = self.get_snapshot()
             return self._extract_indexer_sections(config)
 
         return {}
 
     def get_indexer_config(self, indexer_key: str) -> Dict[str, Any]:
         """Get configuration dictionary for a specific indexer."""
-        config = self.load_config()
+        config = self.get_snapshot()
         section_name = self._get_indexer_section_name(indexer_key)
         if not config.has_section(section_name):
             return {}
@@ -621,7 +678,7 @@ class ConfigService:
     def get_enabled_services(self) -> Dict[str, bool]:
         """Get status of enabled services."""
         services = {}
-        config = self.load_config()
+        config = self.get_snapshot()
         
         # Check common service sections
         service_sections = ['audiobookshelf', 'qbittorrent', 'jackett', 'prowlarr', 'nzbhydra2', 'librivox']
@@ -743,13 +800,50 @@ class ConfigService:
             return False
     
     def reload_config(self) -> bool:
-        """Reload configuration (no-op for file-based config)."""
-        # File-based config is always fresh, so this is a no-op
+        """Force the in-memory snapshot to be rebuilt from disk."""
+        self.invalidate_snapshot()
+        self._reload_snapshot()
         return True
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _get_file_signature(self) -> Optional[tuple]:
+        """Return (mtime_ns, inode, size) for the config file, or None if missing."""
+        try:
+            stat_result = os.stat(self.config_file)
+        except OSError:
+            return None
+        return (stat_result.st_mtime_ns, stat_result.st_ino, stat_result.st_size)
+
+    def _reload_snapshot(self) -> ConfigSnapshot:
+        """Parse the config file into a fresh snapshot."""
+        with self._snapshot_lock:
+            signature = self._get_file_signature()
+            current = self._snapshot
+            if current is not None and signature is not None and current.file_signature == signature:
+                # Another thread reloaded while we waited for the lock.
+                self._snapshot_checked_at = time.monotonic()
+                return current
+
+            # Stat before parsing: a write racing the parse leaves a stale
+            # signature behind, which forces another reload on the next read.
+            parser = self.load_config()
+            self._snapshot_reloads += 1
+            snapshot = ConfigSnapshot.from_parser(
+                parser,
+                file_signature=signature,
+                generation=self._snapshot_reloads,
+            )
+            self._snapshot = snapshot
+            self._snapshot_checked_at = time.monotonic()
+            self._snapshot_loaded_at = time.time()
+            self.logger.debug(
+                "Configuration snapshot reloaded",
+                extra={"config_file": self.config_file, "generation": snapshot.generation},
+            )
+            return snapshot
+
     def _write_config(self, config: configparser.ConfigParser) -> None:
         """Persist the current configuration parser to disk."""
         os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
@@ -777,6 +871,7 @@ class ConfigService:
                     os.remove(temp_path)
                 except OSError:
                     pass
+            self.invalidate_snapshot()
 
     @staticmethod
     def _coerce_value(value: Any) -> str:
@@ -842,6 +937,8 @@ class ConfigService:
             data['categories'] = []
         data['verify_ssl'] = config.getboolean(section, 'verify_ssl', fallback=True)
         data['timeout'] = config.getint(section, 'timeout', fallback=30)
+        data['retries'] = config.getint(section, 'retries', fallback=2)
+        data['retry_backoff'] = config.getfloat(section, 'retry_backoff', fallback=0.5)
 
         rps = items.get('rate_limit_requests_per_second') or items.get('rate_limit.request_per_second')
         max_concurrent = items.get('rate_limit_max_concurrent') or items.get('rate_limit.max_concurrent')
@@ -883,6 +980,8 @@ class ConfigService:
 
         normalized['verify_ssl'] = self._coerce_value(config_data.get('verify_ssl', True))
         normalized['timeout'] = self._coerce_value(config_data.get('timeout', 30))
+        normalized['retries'] = self._coerce_value(config_data.get('retries', 2))
+        normalized['retry_backoff'] = self._coerce_value(config_data.get('retry_backoff', 0.5))
 
         rate_limit = config_data.get('rate_limit') or {}
         normalized['rate_limit_requests_per_second'] = self._coerce_value(rate_limit.get('requests_per_second', 1))
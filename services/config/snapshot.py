@@ -0,0 +1,124 @@
+"""
+Module Name: snapshot.py
+Author: TheDragonShaman
+Created: October 16, 2026
+Last Modified: October 16, 2026
+Description:
+    Immutable, pre-parsed view of config.txt used by ConfigService read paths
+    so hot lookups never re-open or re-parse the file.
+Location:
+    /services/config/snapshot.py
+
+"""
+
+import configparser
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+_UNSET = object()
+
+
+class ConfigSnapshot:
+    """Read-only configuration view exposing the parser calls ConfigService uses.
+
+    ``get``/``getboolean``/``getint``/``items``/``has_section``/``has_option``
+    mirror ``RawConfigParser`` semantics (lower-cased option names, fallback
+    handling, NoSection/NoOption errors) so read helpers can use a snapshot in
+    place of a freshly parsed parser.
+    """
+
+    BOOLEAN_STATES = configparser.RawConfigParser.BOOLEAN_STATES
+
+    __slots__ = ("_sections", "file_signature", "generation")
+
+    def __init__(
+        self,
+        sections: Mapping[str, Mapping[str, str]],
+        *,
+        file_signature: Optional[Tuple[int, int, int]] = None,
+        generation: int = 0,
+    ):
+        frozen = {name: MappingProxyType(dict(values)) for name, values in sections.items()}
+        self._sections: Mapping[str, Mapping[str, str]] = MappingProxyType(frozen)
+        self.file_signature = file_signature
+        self.generation = generation
+
+    @classmethod
+    def from_parser(
+        cls,
+        parser: configparser.RawConfigParser,
+        *,
+        file_signature: Optional[Tuple[int, int, int]] = None,
+        generation: int = 0,
+    ) -> "ConfigSnapshot":
+        sections = {section: dict(parser.items(section)) for section in parser.sections()}
+        return cls(sections, file_signature=file_signature, generation=generation)
+
+    # ------------------------------------------------------------------
+    # RawConfigParser-compatible accessors
+    # ------------------------------------------------------------------
+    def sections(self) -> List[str]:
+        return list(self._sections.keys())
+
+    def has_section(self, section: str) -> bool:
+        return section in self._sections
+
+    def has_option(self, section: str, option: str) -> bool:
+        values = self._sections.get(section)
+        return values is not None and option.lower() in values
+
+    def items(self, section: str) -> List[Tuple[str, str]]:
+        values = self._sections.get(section)
+        if values is None:
+            raise configparser.NoSectionError(section)
+        return list(values.items())
+
+    def get(self, section: str, option: str, *, fallback: Any = _UNSET) -> Any:
+        values = self._sections.get(section)
+        if values is None:
+            if fallback is _UNSET:
+                raise configparser.NoSectionError(section)
+            return fallback
+        key = option.lower()
+        if key not in values:
+            if fallback is _UNSET:
+                raise configparser.NoOptionError(option, section)
+            return fallback
+        return values[key]
+
+    def getint(self, section: str, option: str, *, fallback: Any = _UNSET) -> Any:
+        if fallback is not _UNSET and not self.has_option(section, option):
+            return fallback
+        return int(self.get(section, option))
+
+    def getfloat(self, section: str, option: str, *, fallback: Any = _UNSET) -> Any:
+        if fallback is not _UNSET and not self.has_option(section, option):
+            return fallback
+        return float(self.get(section, option))
+
+    def getboolean(self, section: str, option: str, *, fallback: Any = _UNSET) -> Any:
+        if fallback is not _UNSET and not self.has_option(section, option):
+            return fallback
+        value = self.get(section, option)
+        normalized = value.lower()
+        if normalized not in self.BOOLEAN_STATES:
+            raise ValueError(f"Not a boolean: {value}")
+        return self.BOOLEAN_STATES[normalized]
+
+    # ------------------------------------------------------------------
+    # Convenience helpers
+    # ------------------------------------------------------------------
+    def section_dict(self, section: str) -> Dict[str, str]:
+        """Return a mutable copy of a section, or an empty dict when missing."""
+        values = self._sections.get(section)
+        return dict(values) if values is not None else {}
+
+    def as_dict(self) -> Dict[str, Dict[str, str]]:
+        """Return a mutable deep copy of every section."""
+        return {section: dict(values) for section, values in self._sections.items()}
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sections)
+
+    def __len__(self) -> int:
+        return len(self._sections)
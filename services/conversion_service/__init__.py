@@ -2,7 +2,7 @@
 Module Name: conversion_service/__init__.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Package exports for audiobook conversion services and helper utilities.
 
@@ -11,6 +11,7 @@ Location:
 
 """
 
+from .conversion_scheduler import ConversionScheduler
 from .conversion_service import ConversionService
 from .ffmpeg_handler import FFmpegHandler
 from .format_detector import FormatDetector
@@ -18,6 +19,7 @@ from .metadata_processor import MetadataProcessor
 from .quality_manager import QualityManager
 
 __all__ = [
+    "ConversionScheduler",
     "ConversionService",
     "FFmpegHandler",
     "FormatDetector",
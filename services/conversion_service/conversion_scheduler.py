@@ -0,0 +1,276 @@
+"""
+Module Name: conversion_scheduler.py
+Author: TheDragonShaman
+Created: Oct 16 2026
+Last Modified: Oct 16 2026
+Description:
+    Admission control for concurrent FFmpeg conversions. Stream-copy jobs
+    (I/O-bound) and transcode jobs (CPU-bound) have separate concurrency
+    limits, every running job holds a share of a global ffmpeg thread
+    budget, and waiting jobs are admitted by (priority, submission order).
+    Per-job throughput (MB/s, realtime factor) is tracked for status views.
+
+Location:
+    /services/conversion_service/conversion_scheduler.py
+
+"""
+
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.logger import get_module_logger
+
+_LOGGER = get_module_logger("Service.Conversion.Scheduler")
+
+JOB_COPY = 'copy'
+JOB_TRANSCODE = 'transcode'
+
+# Lower numbers run first, matching download queue / indexer priorities
+DEFAULT_PRIORITY = 5
+DEFAULT_MAX_COPY_JOBS = 4
+RECENT_JOBS_KEPT = 50
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+def classify_command(ffmpeg_cmd: List[str]) -> str:
+    """Return JOB_COPY when every audio stream is stream-copied, else JOB_TRANSCODE."""
+    for index, arg in enumerate(ffmpeg_cmd[:-1]):
+        if arg in ('-c', '-c:a', '-acodec', '-codec', '-codec:a'):
+            return JOB_COPY if ffmpeg_cmd[index + 1] == 'copy' else JOB_TRANSCODE
+    return JOB_TRANSCODE
+
+
+def apply_thread_limit(ffmpeg_cmd: List[str], threads: int) -> List[str]:
+    """Return the command with an output '-threads' option before the output file."""
+    return ffmpeg_cmd[:-1] + ['-threads', str(max(1, int(threads))), ffmpeg_cmd[-1]]
+
+
+class ConversionJob:
+    """One conversion request plus its scheduling state and throughput counters."""
+
+    def __init__(self, job_id: int, kind: str, threads: int, priority: int,
+                 input_file: str, duration: float = 0.0, label: Optional[str] = None):
+        self.job_id = job_id
+        self.kind = kind
+        self.threads = threads
+        self.priority = priority
+        self.input_file = input_file
+        self.label = label or os.path.basename(input_file or '')
+        self.duration = float(duration or 0.0)
+        try:
+            self.input_bytes = os.path.getsize(input_file)
+        except (OSError, TypeError):
+            self.input_bytes = 0
+        self.state = 'waiting'
+        self.submitted_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.processed_seconds = 0.0
+        self.result: Optional[Dict[str, Any]] = None
+
+    def report_position(self, seconds: float):
+        """Record how many seconds of media ffmpeg has written so far."""
+        if seconds > self.processed_seconds:
+            self.processed_seconds = seconds
+
+    def throughput(self) -> Dict[str, float]:
+        """MB/s of input consumed and media-seconds converted per wall second."""
+        if self.started_at is None:
+            return {'mb_per_sec': 0.0, 'realtime_factor': 0.0}
+        elapsed = (self.finished_at or time.monotonic()) - self.started_at
+        if elapsed <= 0:
+            return {'mb_per_sec': 0.0, 'realtime_factor': 0.0}
+
+        completed = self.state == 'completed'
+        processed = self.duration if completed and self.duration > 0 else self.processed_seconds
+        if completed:
+            fraction = 1.0
+        else:
+            fraction = min(1.0, processed / self.duration) if self.duration > 0 else 0.0
+        return {
+            'mb_per_sec': round(self.input_bytes * fraction / _BYTES_PER_MB / elapsed, 2),
+            'realtime_factor': round(processed / elapsed, 1),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        started = self.started_at
+        return {
+            'job_id': self.job_id,
+            'label': self.label,
+            'kind': self.kind,
+            'state': self.state,
+            'priority': self.priority,
+            'threads': self.threads,
+            'input_mb': round(self.input_bytes / _BYTES_PER_MB, 1),
+            'duration_seconds': round(self.duration, 1),
+            'processed_seconds': round(self.processed_seconds, 1),
+            'wait_seconds': round((started or now) - self.submitted_at, 2),
+            'run_seconds': round((self.finished_at or now) - started, 2) if started else 0.0,
+            **self.throughput(),
+        }
+
+
+class ConversionScheduler:
+    """
+    Admission control for ffmpeg conversions.
+
+    Features:
+    - Separate concurrency limits for stream-copy and transcode jobs
+    - Global ffmpeg thread budget (defaults to the CPU count)
+    - Priority then FIFO admission; a job waiting only on thread budget
+      holds back lower-priority jobs so it cannot be starved
+    - Jobs run on the caller's thread once admitted (run())
+    - Per-job throughput and aggregate counters
+    """
+
+    def __init__(self, max_threads: Optional[int] = None, max_copy_jobs: int = DEFAULT_MAX_COPY_JOBS,
+                 max_transcode_jobs: Optional[int] = None, *, logger=None):
+        self.logger = logger or _LOGGER
+        self._condition = threading.Condition()
+        self._sequence = itertools.count(1)
+        self._waiting: List[ConversionJob] = []
+        self._running: Dict[int, ConversionJob] = {}
+        self._recent: "deque[ConversionJob]" = deque(maxlen=RECENT_JOBS_KEPT)
+        self._threads_in_use = 0
+        self._completed = 0
+        self._failed = 0
+        self._bytes_converted = 0
+        self._media_seconds_converted = 0.0
+        self.configure(max_threads, max_copy_jobs, max_transcode_jobs)
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+    def configure(self, max_threads: Optional[int] = None, max_copy_jobs: Optional[int] = None,
+                  max_transcode_jobs: Optional[int] = None):
+        """Update limits; waiting jobs are re-evaluated immediately."""
+        with self._condition:
+            self.max_threads = max(1, int(max_threads or os.cpu_count() or 1))
+            self.max_copy_jobs = max(1, int(max_copy_jobs or DEFAULT_MAX_COPY_JOBS))
+            self.max_transcode_jobs = max(1, int(max_transcode_jobs or max(1, self.max_threads // 2)))
+            # Transcodes split the budget evenly; copies are I/O-bound and need one
+            self.transcode_threads = max(1, self.max_threads // self.max_transcode_jobs)
+            self._condition.notify_all()
+
+    def _limit(self, kind: str) -> int:
+        return self.max_copy_jobs if kind == JOB_COPY else self.max_transcode_jobs
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+    def create_job(self, ffmpeg_cmd: List[str], input_file: str, duration: float = 0.0,
+                   priority: Optional[int] = None, label: Optional[str] = None) -> ConversionJob:
+        """Classify a command and build a job for it (not yet queued)."""
+        kind = classify_command(ffmpeg_cmd)
+        threads = 1 if kind == JOB_COPY else self.transcode_threads
+        return ConversionJob(
+            job_id=next(self._sequence),
+            kind=kind,
+            threads=min(threads, self.max_threads),
+            priority=DEFAULT_PRIORITY if priority is None else int(priority),
+            input_file=input_file,
+            duration=duration,
+            label=label,
+        )
+
+    def run(self, job: ConversionJob, runner: Callable[[ConversionJob], Dict[str, Any]]) -> Dict[str, Any]:
+        """Wait for admission, run ``runner(job)`` on this thread and record the result."""
+        self._acquire(job)
+        result: Dict[str, Any] = {'success': False, 'error': 'Conversion did not run'}
+        try:
+            result = runner(job) or result
+            return result
+        except Exception as exc:
+            result = {'success': False, 'error': str(exc)}
+            raise
+        finally:
+            self._release(job, result)
+
+    # ------------------------------------------------------------------
+    # Admission
+    # ------------------------------------------------------------------
+    def _admissible(self, job: ConversionJob) -> bool:
+        """Whether ``job`` may start once every better-placed admissible job has."""
+        threads = self._threads_in_use
+        counts = {JOB_COPY: 0, JOB_TRANSCODE: 0}
+        for running in self._running.values():
+            counts[running.kind] += 1
+
+        budget_reserved = False
+        for waiting in sorted(self._waiting, key=lambda item: (item.priority, item.job_id)):
+            class_room = counts[waiting.kind] < self._limit(waiting.kind)
+            fits = class_room and not budget_reserved and threads + waiting.threads <= self.max_threads
+            if waiting is job:
+                return fits
+            if fits:
+                counts[waiting.kind] += 1
+                threads += waiting.threads
+            elif class_room:
+                budget_reserved = True
+        return False
+
+    def _acquire(self, job: ConversionJob):
+        with self._condition:
+            self._waiting.append(job)
+            while not self._admissible(job):
+                self._condition.wait()
+            self._waiting.remove(job)
+            self._running[job.job_id] = job
+            self._threads_in_use += job.threads
+            job.state = 'running'
+            job.started_at = time.monotonic()
+        self.logger.debug("Conversion admitted", extra={
+            "job_id": job.job_id,
+            "kind": job.kind,
+            "threads": job.threads,
+            "priority": job.priority,
+            "wait_seconds": round(job.started_at - job.submitted_at, 2),
+        })
+
+    def _release(self, job: ConversionJob, result: Dict[str, Any]):
+        succeeded = bool(result.get('success'))
+        with self._condition:
+            job.finished_at = time.monotonic()
+            job.result = result
+            job.state = 'completed' if succeeded else 'failed'
+            self._running.pop(job.job_id, None)
+            self._threads_in_use -= job.threads
+            self._recent.append(job)
+            if succeeded:
+                self._completed += 1
+                self._bytes_converted += job.input_bytes
+                self._media_seconds_converted += job.duration or job.processed_seconds
+            else:
+                self._failed += 1
+            self._condition.notify_all()
+        self.logger.debug("Conversion finished", extra={"job_id": job.job_id, **job.throughput()})
+
+    # ------------------------------------------------------------------
+    # Diagnostics
+    # ------------------------------------------------------------------
+    def get_stats(self) -> Dict[str, Any]:
+        """Limits, thread usage, per-job throughput and aggregate counters."""
+        with self._condition:
+            running = [job.to_dict() for job in self._running.values()]
+            waiting = [job.to_dict() for job in sorted(self._waiting, key=lambda item: (item.priority, item.job_id))]
+            recent = [job.to_dict() for job in list(self._recent)[-10:]]
+            return {
+                'max_threads': self.max_threads,
+                'threads_in_use': self._threads_in_use,
+                'max_copy_jobs': self.max_copy_jobs,
+                'max_transcode_jobs': self.max_transcode_jobs,
+                'transcode_threads': self.transcode_threads,
+                'running': running,
+                'waiting': waiting,
+                'recent': recent,
+                'completed': self._completed,
+                'failed': self._failed,
+                'total_mb_converted': round(self._bytes_converted / _BYTES_PER_MB, 1),
+                'total_media_hours_converted': round(self._media_seconds_converted / 3600, 2),
+            }
@@ -2,10 +2,10 @@
 Module Name: conversion_service.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     FFmpeg-backed audiobook conversion orchestrator with quality and metadata
-    management.
+    management. Concurrent conversions are admitted by ConversionScheduler.
 
 Location:
     /services/conversion_service/conversion_service.py
@@ -18,12 +18,20 @@ import subprocess
 import tempfile
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 from pathlib import Path
 
 from services.service_manager import service_manager
 from utils.logger import get_module_logger
+from .conversion_scheduler import ConversionScheduler, apply_thread_limit
+
+# Minimum spacing between conversion progress callbacks
+PROGRESS_CALLBACK_INTERVAL_SECONDS = 0.5
+# Trailing ffmpeg stderr lines kept for error reporting
+STDERR_TAIL_LINES = 200
 
 class ConversionService:
     """Main service for audiobook format conversion using FFmpeg"""
@@ -56,6 +64,8 @@ class ConversionService:
                     self.audible_library_service = audible_library_service
                     self.helpers = helpers
 
+                    self._scheduler: Optional[ConversionScheduler] = None
+
                     # Initialize helper modules
                     self._initialize_helpers()
 
@@ -118,6 +128,27 @@ class ConversionService:
             # Fallback to system temp
             return tempfile.gettempdir()
     
+    def get_scheduler(self) -> ConversionScheduler:
+        """Return the conversion scheduler, configured from [conversion] on first use"""
+        if self._scheduler is None:
+            with self._lock:
+                if self._scheduler is None:
+                    limits: Dict[str, Optional[int]] = {}
+                    try:
+                        config = self._get_config_service()
+                        for key in ('max_ffmpeg_threads', 'max_copy_jobs', 'max_transcode_jobs'):
+                            raw_value = config.get(f'conversion.{key}', None)
+                            limits[key] = int(raw_value) if raw_value not in (None, '') else None
+                    except Exception as e:
+                        self.logger.warning("Using default conversion scheduler limits", extra={"error": str(e)})
+                        limits = {}
+                    self._scheduler = ConversionScheduler(
+                        max_threads=limits.get('max_ffmpeg_threads'),
+                        max_copy_jobs=limits.get('max_copy_jobs'),
+                        max_transcode_jobs=limits.get('max_transcode_jobs'),
+                    )
+        return self._scheduler
+
     def get_quality_settings(self) -> Dict[str, Any]:
         """Get current quality settings from config"""
         default_settings = {
@@ -179,17 +210,22 @@ class ConversionService:
         output_file: str = None,
         progress_callback: Callable[[str, int], None] = None,
         metadata: Dict[str, Any] = None,
-        voucher_file: Optional[str] = None
+        voucher_file: Optional[str] = None,
+        priority: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Convert audiobook file to M4B format
         
+        The ffmpeg run waits for a ConversionScheduler slot (copy and
+        transcode jobs are admitted separately within a thread budget).
+        
         Args:
             input_file: Path to input audiobook file
             output_file: Optional output file path (auto-generated if not provided)
             progress_callback: Optional callback for progress updates
             metadata: Optional metadata to embed
             voucher_file: Optional path to AAXC voucher JSON (required for new Audible downloads)
+            priority: Scheduling priority, lower runs first (default 5)
             
         Returns:
             Dict with conversion results and output file path
@@ -220,6 +256,9 @@ class ConversionService:
             
             input_format = self.helpers['format_detector'].detect_format(input_file)
             self.logger.debug("Detected format", extra={"input_format": input_format})
+
+            # One cached ffprobe run supplies the duration for progress
+            duration = self.helpers['ffmpeg'].extract_metadata(input_file).get('duration', 0.0)
             
             # Step 2: Get quality settings
             quality_settings = self.get_quality_settings()
@@ -246,7 +285,11 @@ class ConversionService:
                 output_file = self._generate_output_filename(input_file)
             
             temp_dir = self._get_shared_temp_dir()
-            temp_output = os.path.join(temp_dir, f"temp_{int(time.time())}_{os.path.basename(output_file)}")
+            # Thread id keeps names unique when the conversion pool runs in parallel
+            temp_output = os.path.join(
+                temp_dir,
+                f"temp_{int(time.time())}_{threading.get_ident()}_{os.path.basename(output_file)}"
+            )
             
             # Step 5: Build FFmpeg command
             if progress_callback:
@@ -261,16 +304,33 @@ class ConversionService:
                 voucher_file=voucher_path
             )
             
-            # Step 6: Execute conversion
-            if progress_callback:
-                progress_callback("Converting audiobook...", 20)
-            
-            conversion_result = self._execute_conversion(
-                ffmpeg_cmd, 
-                input_file, 
-                temp_output,
-                progress_callback
+            # Step 6: Execute conversion once the scheduler admits the job
+            scheduler = self.get_scheduler()
+            job = scheduler.create_job(
+                ffmpeg_cmd,
+                input_file,
+                duration=duration,
+                priority=priority,
+                label=(metadata or {}).get('Title')
             )
+            ffmpeg_cmd = apply_thread_limit(ffmpeg_cmd, job.threads)
+            if progress_callback:
+                progress_callback("Waiting for conversion slot...", 18)
+
+            def _run_job(admitted_job):
+                if progress_callback:
+                    progress_callback("Converting audiobook...", 20)
+                return self._execute_conversion(
+                    ffmpeg_cmd, 
+                    input_file, 
+                    temp_output,
+                    progress_callback,
+                    duration=duration,
+                    position_callback=admitted_job.report_position
+                )
+
+            conversion_result = scheduler.run(job, _run_job)
+            conversion_result['job'] = job.to_dict()
             
             if not conversion_result['success']:
                 self.logger.error("FFmpeg conversion failed", extra={"input_file": input_file, "error": conversion_result.get('error'), "stderr": conversion_result.get('stderr')})
@@ -311,7 +371,8 @@ class ConversionService:
                 'format': input_format,
                 'quality_settings': quality_settings,
                 'metadata_processed': metadata_result.get('success', False),
-                'file_size': os.path.getsize(output_file)
+                'file_size': os.path.getsize(output_file),
+                'throughput': conversion_result.get('job', {})
             }
             
         except Exception as e:
@@ -360,14 +421,23 @@ class ConversionService:
         ffmpeg_cmd: List[str], 
         input_file: str, 
         output_file: str,
-        progress_callback: Callable[[str, int], None] = None
+        progress_callback: Callable[[str, int], None] = None,
+        duration: Optional[float] = None,
+        position_callback: Optional[Callable[[float], None]] = None
     ) -> Dict[str, Any]:
-        """Execute FFmpeg conversion command with progress tracking"""
+        """Execute FFmpeg conversion command with progress tracking
+
+        Progress comes from ffmpeg's '-progress pipe:1' key=value output on
+        stdout, read on this thread as it arrives; stderr is drained by a
+        separate thread into a bounded tail buffer so neither pipe can fill
+        up and stall ffmpeg. Callbacks are throttled by elapsed time.
+        """
         try:
             self.logger.debug("Executing FFmpeg command", extra={"command": ' '.join(ffmpeg_cmd)})
             
-            # Get input duration for progress calculation
-            duration = self.helpers['ffmpeg'].get_audio_duration(input_file)
+            # Get input duration for progress calculation (cached probe)
+            if duration is None:
+                duration = self.helpers['ffmpeg'].get_audio_duration(input_file)
             
             process = subprocess.Popen(
                 ffmpeg_cmd,
@@ -377,23 +447,52 @@ class ConversionService:
                 bufsize=1
             )
             
-            # Track progress by monitoring FFmpeg stderr output
+            stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+
+            def _drain_stderr():
+                for stderr_line in process.stderr:
+                    stderr_tail.append(stderr_line.rstrip())
+
+            stderr_reader = threading.Thread(
+                target=_drain_stderr,
+                name="FFmpegStderr",
+                daemon=True
+            )
+            stderr_reader.start()
+
+            ffmpeg = self.helpers['ffmpeg']
             last_progress = 20
-            while process.poll() is None:
-                if process.stderr:
-                    line = process.stderr.readline()
-                    if line and duration > 0:
-                        # Parse FFmpeg progress (time=XX:XX:XX.XX format)
-                        progress = self.helpers['ffmpeg'].parse_progress(line, duration)
-                        if progress > last_progress and progress <= 85:
-                            last_progress = progress
-                            if progress_callback:
-                                progress_callback(f"Converting... {progress}%", progress)
-                
-                time.sleep(0.5)
+            last_emit = 0.0
+            pending_progress = None
+            for line in process.stdout:
+                key, _, value = line.strip().partition('=')
+                if key == 'progress':
+                    # End of one progress block: report if due (or finished)
+                    now = time.monotonic()
+                    if pending_progress is not None and (
+                        value == 'end' or now - last_emit >= PROGRESS_CALLBACK_INTERVAL_SECONDS
+                    ):
+                        last_progress = pending_progress
+                        pending_progress = None
+                        last_emit = now
+                        if progress_callback:
+                            progress_callback(f"Converting... {last_progress}%", last_progress)
+                    continue
+
+                current_seconds = ffmpeg.parse_progress_seconds(key, value)
+                if current_seconds is None:
+                    continue
+                if position_callback:
+                    position_callback(current_seconds)
+                if duration and duration > 0:
+                    progress = ffmpeg.scale_progress(current_seconds, duration)
+                    if progress > last_progress:
+                        pending_progress = progress
             
             # Wait for process to complete
-            stdout, stderr = process.communicate()
+            process.wait()
+            stderr_reader.join(timeout=5)
+            stderr = '\n'.join(stderr_tail)
             
             if process.returncode == 0:
                 if os.path.exists(output_file):
@@ -420,7 +519,6 @@ class ConversionService:
                 return {
                     'success': False,
                     'error': f'FFmpeg conversion failed: {stderr}',
-                    'stdout': stdout,
                     'stderr': stderr
                 }
         
@@ -434,6 +532,26 @@ class ConversionService:
                 'error': f'Conversion execution failed: {str(e)}'
             }
     
+    def convert_batch(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Convert many audiobooks concurrently under the scheduler's limits
+        
+        Args:
+            jobs: convert_audiobook() keyword arguments, one dict per book
+                (set 'priority' to reorder admission)
+            
+        Returns:
+            Results in the same order as ``jobs``
+        """
+        if not jobs:
+            return []
+
+        scheduler = self.get_scheduler()
+        workers = min(len(jobs), scheduler.max_copy_jobs + scheduler.max_transcode_jobs)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ConversionBatch") as executor:
+            futures = [executor.submit(self.convert_audiobook, **job) for job in jobs]
+            return [future.result() for future in futures]
+
     def get_supported_formats(self) -> List[str]:
         """Get list of supported input formats"""
         return ['aax', 'aaxc', 'mp3', 'm4a', 'm4b', 'flac', 'ogg', 'wav']
@@ -465,7 +583,8 @@ class ConversionService:
                 'supported_formats': self.get_supported_formats(),
                 'quality_settings': quality_settings,
                 'helpers_loaded': len(self.helpers) > 0,
-                'activation_bytes_available': self._check_activation_bytes_availability()
+                'activation_bytes_available': self._check_activation_bytes_availability(),
+                'scheduler': self.get_scheduler().get_stats()
             }
             
         except Exception as e:
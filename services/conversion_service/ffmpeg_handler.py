@@ -2,10 +2,11 @@
 Module Name: ffmpeg_handler.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Builds and executes FFmpeg commands for audiobook conversion workflows,
-    including voucher handling for AAX/AAXC formats.
+    including voucher handling for AAX/AAXC formats. ffprobe results are
+    cached per file so duration and metadata share one probe run.
 
 Location:
     /services/conversion_service/ffmpeg_handler.py
@@ -17,6 +18,8 @@ import json
 import os
 import re
 import subprocess
+import threading
+from collections import OrderedDict
 from hashlib import sha256
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -27,12 +30,21 @@ from cryptography.hazmat.backends import default_backend
 
 from utils.logger import get_module_logger
 
+# Probe results kept per (path, size, mtime)
+PROBE_CACHE_MAX_ENTRIES = 64
+
+# Conversion progress is reported inside this band; the rest is pre/post work
+PROGRESS_FLOOR = 20
+PROGRESS_CEILING = 85
+
 
 class FFmpegHandler:
     """Universal Handler for FFmpeg operations supporting AAX and AAXC formats"""
 
     def __init__(self, *, logger=None):
         self.logger = logger or get_module_logger("Service.Conversion.FFmpegHandler")
+        self._probe_cache: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+        self._probe_lock = threading.Lock()
     
     # ============================================================================
     # FORMAT DETECTION AND KEY EXTRACTION
@@ -480,8 +492,9 @@ class FFmpegHandler:
         if output_ext == '.m4b':
             cmd.extend(['-f', 'mp4'])
         
-        # Progress reporting
-        cmd.extend(['-progress', 'pipe:2'])
+        # Machine-readable progress (key=value blocks) on stdout; -nostats
+        # keeps the human-readable status line out of stderr
+        cmd.extend(['-progress', 'pipe:1', '-nostats'])
         
         # Output file
         cmd.append(output_file)
@@ -566,30 +579,54 @@ class FFmpegHandler:
             'synopsis': 'synopsis'
         }
     
-    def get_audio_duration(self, input_file: str) -> float:
-        """Get duration of audio file in seconds"""
+    def probe_file(self, input_file: str) -> Optional[Dict[str, Any]]:
+        """Return ffprobe format/stream data for a file, cached until it changes."""
         try:
-            cmd = [
-                'ffprobe', 
-                '-v', 'quiet',
-                '-show_entries', 'format=duration',
-                '-of', 'csv=p=0',
-                input_file
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                duration_str = result.stdout.strip()
-                return float(duration_str) if duration_str else 0.0
-            else:
-                self.logger.warning("Could not get duration", extra={"input_file": input_file, "stderr": result.stderr})
-                return 0.0
-                
-        except Exception as e:
-            self.logger.exception("Error getting duration", extra={"input_file": input_file, "error": str(e)})
-            return 0.0
+            stat = os.stat(input_file)
+        except OSError:
+            return None
+        key = (os.path.abspath(input_file), stat.st_size, stat.st_mtime_ns)
+
+        with self._probe_lock:
+            cached = self._probe_cache.get(key)
+            if cached is not None:
+                self._probe_cache.move_to_end(key)
+                return cached
+
+        cmd = [
+            'ffprobe',
+            '-v', 'quiet',
+            '-print_format', 'json',
+            '-show_format',
+            '-show_streams',
+            input_file
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        if result.returncode != 0:
+            self.logger.warning("Could not probe file", extra={"input_file": input_file, "stderr": result.stderr})
+            return None
+
+        probe_data = json.loads(result.stdout)
+        with self._probe_lock:
+            self._probe_cache[key] = probe_data
+            self._probe_cache.move_to_end(key)
+            while len(self._probe_cache) > PROBE_CACHE_MAX_ENTRIES:
+                self._probe_cache.popitem(last=False)
+        return probe_data
+
+    def get_audio_duration(self, input_file: str) -> float:
+        """Get duration of audio file in seconds (shares the extract_metadata probe)"""
+        return self.extract_metadata(input_file).get('duration', 0.0)
     
+    @staticmethod
+    def scale_progress(current_seconds: float, total_duration: float) -> int:
+        """Map encoded seconds onto the PROGRESS_FLOOR..PROGRESS_CEILING band."""
+        if total_duration <= 0:
+            return 0
+        progress = (current_seconds / total_duration) * 100
+        span = PROGRESS_CEILING - PROGRESS_FLOOR
+        return max(PROGRESS_FLOOR, min(PROGRESS_CEILING, int(progress * span / 100 + PROGRESS_FLOOR)))
+
     def parse_progress(self, ffmpeg_line: str, total_duration: float) -> int:
         """Parse FFmpeg progress line and return percentage"""
         try:
@@ -602,54 +639,50 @@ class FFmpegHandler:
                 centiseconds = int(time_match.group(4))
                 
                 current_seconds = hours * 3600 + minutes * 60 + seconds + centiseconds / 100
-                
-                if total_duration > 0:
-                    progress = (current_seconds / total_duration) * 100
-                    # Keep progress between 20-85% (leaving room for pre/post processing)
-                    return max(20, min(85, int(progress * 0.65 + 20)))
+                return self.scale_progress(current_seconds, total_duration)
             
             return 0
             
         except Exception as e:
             self.logger.debug("Error parsing progress", extra={"error": str(e)})
             return 0
+
+    @staticmethod
+    def parse_progress_seconds(key: str, value: str) -> Optional[float]:
+        """Encoded position in seconds from one '-progress' key=value pair, if it carries one."""
+        try:
+            if key in ('out_time_us', 'out_time_ms'):
+                # Both keys are microseconds (out_time_ms is misnamed upstream)
+                return int(value) / 1_000_000
+            if key == 'out_time':
+                hours, minutes, seconds = value.split(':')
+                return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+        except ValueError:
+            return None
+        return None
     
     def extract_metadata(self, input_file: str) -> Dict[str, Any]:
         """Extract metadata from input file using FFprobe"""
         try:
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_format',
-                '-show_streams',
-                input_file
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                import json
-                probe_data = json.loads(result.stdout)
-                
-                # Extract format metadata
-                format_tags = probe_data.get('format', {}).get('tags', {})
-                
-                # Normalize tag keys (FFmpeg uses various case formats)
-                normalized_tags = {}
-                for key, value in format_tags.items():
-                    normalized_key = key.lower().replace('-', '_')
-                    normalized_tags[normalized_key] = value
-                
-                return {
-                    'duration': float(probe_data.get('format', {}).get('duration', 0)),
-                    'bitrate': int(probe_data.get('format', {}).get('bit_rate', 0)),
-                    'tags': normalized_tags,
-                    'streams': probe_data.get('streams', [])
-                }
-            else:
-                self.logger.warning("Could not extract metadata", extra={"input_file": input_file, "stderr": result.stderr})
+            probe_data = self.probe_file(input_file)
+            if not probe_data:
                 return {}
+
+            # Extract format metadata
+            format_tags = probe_data.get('format', {}).get('tags', {})
+
+            # Normalize tag keys (FFmpeg uses various case formats)
+            normalized_tags = {}
+            for key, value in format_tags.items():
+                normalized_key = key.lower().replace('-', '_')
+                normalized_tags[normalized_key] = value
+
+            return {
+                'duration': float(probe_data.get('format', {}).get('duration', 0)),
+                'bitrate': int(probe_data.get('format', {}).get('bit_rate', 0)),
+                'tags': normalized_tags,
+                'streams': probe_data.get('streams', [])
+            }
                 
         except Exception as e:
             self.logger.exception("Error extracting metadata", extra={"input_file": input_file, "error": str(e)})
@@ -2,19 +2,37 @@
 Module Name: author_overrides.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Manages canonical author name overrides scoped optionally by ASIN.
+    Every committed write bumps an in-process version so cached override
+    maps (book_authors) reload even when updated_at does not change.
 
 Location:
     /services/database/author_overrides.py
 
 """
 
+import sqlite3
+import threading
 from typing import List, Optional, Dict
 from .error_handling import error_handler
 from utils.logger import get_module_logger
 
+_override_version = 0
+_override_version_lock = threading.Lock()
+
+
+def get_override_version() -> int:
+    """Number of override writes committed by this process."""
+    return _override_version
+
+
+def _bump_override_version():
+    global _override_version
+    with _override_version_lock:
+        _override_version += 1
+
 
 class AuthorOverrideOperations:
     """Manages canonical author name overrides scoped by optional ASIN."""
@@ -161,7 +179,9 @@ class AuthorOverrideOperations:
                 """,
                 (normalized_source, normalized_preferred, normalized_asin, notes),
             )
+            self._queue_book_author_resync(cursor, normalized_source)
             conn.commit()
+            _bump_override_version()
             self.logger.info(
                 "Upserted author override: %s (%s) -> %s",
                 normalized_source,
@@ -177,6 +197,21 @@ class AuthorOverrideOperations:
         finally:
             error_handler.handle_connection_cleanup(conn)
 
+    def _queue_book_author_resync(self, cursor, source_author_name: str):
+        """Queue books stored under this spelling so book_authors picks up the new name."""
+        try:
+            cursor.execute(
+                """
+                INSERT OR IGNORE INTO book_authors_pending (book_id)
+                SELECT book_id FROM book_authors
+                WHERE source_name = ? COLLATE NOCASE
+                """,
+                (source_author_name,)
+            )
+        except sqlite3.OperationalError as exc:
+            # book_authors is created by migrations; nothing to resync before that
+            self.logger.debug(f"Skipping book author resync for '{source_author_name}': {exc}")
+
     def list_overrides(self) -> List[Dict[str, str]]:
         """Return all configured overrides."""
         conn = None
@@ -2,7 +2,7 @@
 Module Name: authors.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Database operations for authors, including overrides and statistics.
 
@@ -11,18 +11,23 @@ Location:
 
 """
 
-import re
-from collections import defaultdict
-from typing import List, Dict, TYPE_CHECKING, Set, DefaultDict
+import sqlite3
+from typing import List, Dict, TYPE_CHECKING, Optional, Sequence
+from .book_authors import BookAuthorOperations, split_author_field
 from .error_handling import error_handler
+from .fulltext import (
+    BOOKS_FTS_TABLE,
+    build_match_expression,
+    has_books_fts,
+    tokenize_query,
+    tokens_match_text,
+)
 from utils.logger import get_module_logger
 
 if TYPE_CHECKING:
     from .connection import DatabaseConnection
 
 
-_AUTHOR_DELIMITER_PATTERN = re.compile(r"\s*(?:,|&|;|\band\b|\bwith\b)\s*", re.IGNORECASE)
-
 BOOK_COLUMN_ORDER = [
     "ID", "Title", "Author", "Series", "Sequence", "Narrator",
     "Runtime", "Release Date", "Language", "Publisher",
@@ -35,102 +40,16 @@ BOOK_COLUMN_ORDER = [
 class AuthorOperations:
     """Handles all author-related database operations"""
 
-    def __init__(self, connection_manager, author_override_operations=None, *, logger=None):
+    def __init__(self, connection_manager, author_override_operations=None, *, logger=None, book_authors=None):
         self.connection_manager = connection_manager
         self.logger = logger or get_module_logger("Service.Database.Authors")
         self.author_override_operations = author_override_operations
+        self.book_authors = book_authors or BookAuthorOperations(connection_manager)
 
-    def _normalize_author_name(self, name: str) -> str:
-        """Trim whitespace and collapse repeated spacing for consistent comparisons."""
-        if not name:
-            return ""
-
-        cleaned = str(name).replace("\u00a0", " ")
-        normalized = " ".join(cleaned.strip().split())
-        return normalized
-
-    def _apply_override_to_name(self, name: str) -> str:
-        if not name or not self.author_override_operations:
-            return name
-        preferred = self.author_override_operations.get_preferred_author_name(name)
-        return preferred or name
-
-    def _apply_override_to_book(self, book: Dict):
-        if not book or not self.author_override_operations:
-            return
-        author_value = book.get("Author")
-        asin_value = book.get("ASIN")
-        preferred = self.author_override_operations.get_preferred_author_name(author_value, asin_value)
-        if preferred and preferred != author_value:
-            book["Author"] = preferred
-            book["author"] = preferred
-
-    def _split_author_field(self, author_value: str) -> List[str]:
-        """Split a stored author string into individual author names."""
-        if not author_value:
-            return []
-
-        if not isinstance(author_value, str):
-            author_value = str(author_value)
-
-        parts = _AUTHOR_DELIMITER_PATTERN.split(author_value)
-        authors: List[str] = []
-        for part in parts:
-            normalized = self._normalize_author_name(part)
-            if normalized:
-                authors.append(self._apply_override_to_name(normalized))
-        return authors
-
-    def _author_field_matches(self, author_field: str, target_author: str) -> bool:
-        """Check whether a stored author field references the requested author."""
-        if not author_field or not target_author:
-            return False
-
-        normalized_target = self._apply_override_to_name(
-            self._normalize_author_name(target_author)
-        ).lower()
-        if not normalized_target:
-            return False
-
-        for name in self._split_author_field(author_field):
-            if name.lower() == normalized_target:
-                return True
-        return False
-
-    def _build_author_search_terms(self, author: str) -> List[str]:
-        terms: List[str] = []
-        normalized = self._normalize_author_name(author)
-        if normalized:
-            terms.append(normalized)
-
-        if self.author_override_operations:
-            aliases = self.author_override_operations.get_aliases_for_preferred(author)
-            for alias in aliases:
-                normalized_alias = self._normalize_author_name(alias)
-                if normalized_alias and normalized_alias not in terms:
-                    terms.append(normalized_alias)
-
-        return terms if terms else [author]
-    
     def get_all_authors(self) -> List[str]:
         """Get all unique authors."""
-        conn = None
         try:
-            conn, cursor = self.connection_manager.connect_db()
-            
-            cursor.execute("""
-                SELECT DISTINCT author 
-                FROM books 
-                WHERE author IS NOT NULL AND author != '' 
-                ORDER BY author COLLATE NOCASE
-            """)
-
-            unique_authors: Set[str] = set()
-            for (author_field,) in cursor.fetchall():
-                for name in self._split_author_field(author_field):
-                    unique_authors.add(name)
-
-            authors_list = sorted(unique_authors, key=lambda value: value.lower())
+            authors_list = self.book_authors.get_author_names()
             self.logger.debug("Retrieved unique authors", extra={
                 "author_count": len(authors_list)
             })
@@ -141,132 +60,122 @@ class AuthorOperations:
                 "error": str(e)
             })
             return []
-        
-        finally:
-            error_handler.handle_connection_cleanup(conn)
     
     def get_books_by_author(self, author: str) -> List[Dict]:
         """Get all books by a specific author."""
-        conn = None
+        return self.get_books_by_authors([author]).get(author, [])
+
+    def get_books_by_authors(self, authors: Optional[Sequence[str]] = None) -> Dict[str, List[Dict]]:
+        """Get books for many authors with one indexed book_authors query.
+
+        Returns a mapping keyed by the requested names; when ``authors`` is
+        None every author in the library is returned.
+        """
         try:
-            conn, cursor = self.connection_manager.connect_db()
-            books: List[Dict] = []
-            seen_ids: Set[int] = set()
-            search_terms = self._build_author_search_terms(author)
-
-            for term in search_terms:
-                search_pattern = f"%{term}%"
-                cursor.execute(
-                    "SELECT * FROM books WHERE author LIKE ? ORDER BY title COLLATE NOCASE",
-                    (search_pattern,)
-                )
-                rows = cursor.fetchall()
-
-                for row in rows:
-                    book_id = row[0]
-                    if book_id in seen_ids:
-                        continue
-
-                    book = dict(zip(BOOK_COLUMN_ORDER, row))
-                    if self._author_field_matches(book.get("Author"), author):
-                        self._apply_override_to_book(book)
-                        books.append(book)
-                        seen_ids.add(book_id)
-
-            self.logger.debug("Retrieved books for author", extra={
-                "author": author,
-                "book_count": len(books),
-                "search_terms": search_terms
+            if authors is None:
+                authors = self.book_authors.get_author_names()
+
+            resolve = self.book_authors.get_override_resolver()
+            requested: Dict[str, List[str]] = {}
+            for author in authors:
+                resolved = resolve(author)
+                if resolved:
+                    requested.setdefault(resolved.lower(), []).append(author)
+
+            rows = self.book_authors.get_book_rows_for_authors(list(requested.keys()))
+
+            results: Dict[str, List[Dict]] = {author: [] for author in authors}
+            for normalized, row in rows:
+                book = dict(zip(BOOK_COLUMN_ORDER, row))
+                preferred = resolve(book.get("Author"), book.get("ASIN"))
+                if preferred and preferred != book.get("Author"):
+                    book["Author"] = preferred
+                    book["author"] = preferred
+
+                for requested_name in requested.get(normalized, []):
+                    results[requested_name].append(book)
+
+            self.logger.debug("Retrieved books for authors", extra={
+                "author_count": len(results),
+                "row_count": len(rows)
             })
-            return books
+            return results
         
         except Exception as e:
-            self.logger.exception("Error getting books for author", extra={
-                "author": author,
+            self.logger.exception("Error getting books for authors", extra={
+                "author_count": len(authors) if authors is not None else None,
                 "error": str(e)
             })
-            return []
-        
-        finally:
-            error_handler.handle_connection_cleanup(conn)
+            return {author: [] for author in (authors or [])}
     
     def get_author_stats(self, author: str) -> Dict:
-        """Get comprehensive statistics for a specific author."""
+        """Get comprehensive statistics for a specific author (aggregate SQL)."""
+        conn = None
         try:
-            books = self.get_books_by_author(author)
-
+            resolved = self.book_authors.resolve_author_name(author)
             stats = {
                 'author': author,
-                'total_books': len(books),
+                'total_books': 0,
                 'series_count': 0,
                 'status_distribution': {},
                 'total_runtime_minutes': 0,
+                'total_runtime_hours': 0,
                 'average_rating': 0,
-                'languages': set(),
-                'publishers': set(),
+                'languages': [],
+                'publishers': [],
                 'date_range': {'earliest': None, 'latest': None}
             }
+            if not resolved:
+                return stats
 
-            total_rating = 0.0
-            rated_books = 0
-            series_set: Set[str] = set()
-
-            for book in books:
-                status_value = book.get('Status') or book.get('ownership_status')
-                if status_value:
-                    stats['status_distribution'][status_value] = stats['status_distribution'].get(status_value, 0) + 1
-
-                series_name = book.get('Series')
-                if series_name and series_name != 'N/A':
-                    series_set.add(series_name)
-
-                runtime = book.get('Runtime')
-                if runtime:
-                    try:
-                        if 'hrs' in runtime:
-                            parts = runtime.split(' hrs')
-                            hours = int(parts[0])
-                            minutes = 0
-                            if len(parts) > 1 and 'mins' in parts[1]:
-                                minutes = int(parts[1].split(' mins')[0].strip())
-                            stats['total_runtime_minutes'] += hours * 60 + minutes
-                    except Exception:
-                        pass
-
-                rating_value = book.get('Overall Rating') or book.get('Rating')
-                if rating_value and rating_value != 'N/A':
-                    try:
-                        total_rating += float(rating_value)
-                        rated_books += 1
-                    except Exception:
-                        pass
-
-                language_value = book.get('Language')
-                if language_value:
-                    stats['languages'].add(language_value)
-
-                publisher_value = book.get('Publisher')
-                if publisher_value:
-                    stats['publishers'].add(publisher_value)
-
-                release_date = book.get('Release Date')
-                if release_date and release_date != 'Unknown':
-                    earliest = stats['date_range']['earliest']
-                    latest = stats['date_range']['latest']
-                    if not earliest or release_date < earliest:
-                        stats['date_range']['earliest'] = release_date
-                    if not latest or release_date > latest:
-                        stats['date_range']['latest'] = release_date
-
-            stats['series_count'] = len(series_set)
-            stats['average_rating'] = round(total_rating / rated_books, 2) if rated_books > 0 else 0
-            stats['total_runtime_hours'] = round(stats['total_runtime_minutes'] / 60, 1)
-            stats['languages'] = list(stats['languages'])
-            stats['publishers'] = list(stats['publishers'])
+            self.book_authors.sync_pending()
+            conn, cursor = self.connection_manager.connect_db()
+            author_books = """
+                FROM book_authors ba
+                JOIN books b ON b.id = ba.book_id
+                WHERE ba.author_name_normalized = ?
+            """
+            key = (resolved.lower(),)
+
+            cursor.execute(f"""
+                SELECT COUNT(*),
+                       COUNT(DISTINCT CASE WHEN b.series != 'N/A' AND b.series != '' THEN b.series END),
+                       COALESCE(SUM(b.runtime_minutes), 0),
+                       AVG(b.rating_value),
+                       MIN(CASE WHEN b.release_year IS NOT NULL THEN b.release_date END),
+                       MAX(CASE WHEN b.release_year IS NOT NULL THEN b.release_date END)
+                {author_books}
+            """, key)
+            total_books, series_count, runtime_minutes, average_rating, earliest, latest = cursor.fetchone()
+
+            cursor.execute(f"""
+                SELECT COALESCE(NULLIF(b.status, ''), b.ownership_status) AS status_value, COUNT(*)
+                {author_books}
+                GROUP BY status_value
+            """, key)
+            status_distribution = {row[0]: row[1] for row in cursor.fetchall() if row[0]}
+
+            cursor.execute(f"SELECT DISTINCT b.language {author_books} AND COALESCE(b.language, '') != ''", key)
+            languages = [row[0] for row in cursor.fetchall()]
+
+            cursor.execute(f"SELECT DISTINCT b.publisher {author_books} AND COALESCE(b.publisher, '') != ''", key)
+            publishers = [row[0] for row in cursor.fetchall()]
+
+            stats.update({
+                'total_books': total_books,
+                'series_count': series_count,
+                'status_distribution': status_distribution,
+                'total_runtime_minutes': runtime_minutes,
+                'total_runtime_hours': round(runtime_minutes / 60, 1),
+                'average_rating': round(average_rating, 2) if average_rating is not None else 0,
+                'languages': languages,
+                'publishers': publishers,
+                'date_range': {'earliest': earliest, 'latest': latest}
+            })
 
             self.logger.debug("Calculated author stats", extra={
                 "author": author,
-                "book_count": stats.get('total_books', 0)
+                "book_count": total_books
             })
             return stats
 
@@ -276,16 +185,59 @@ class AuthorOperations:
                 "error": str(e)
             })
             return {'error': str(e)}
+
+        finally:
+            error_handler.handle_connection_cleanup(conn)
     
-    def search_authors(self, query: str) -> List[str]:
-        """Search authors by name."""
+    def search_authors(self, query: str, match_any: bool = False) -> List[str]:
+        """Search authors by name.
+
+        Candidate author fields come from the books_fts index (prefix match on
+        every query token, or any token when ``match_any`` is set); each field
+        is then split into individual names and filtered the same way.
+        """
+        conn = None
         try:
             normalized_query = (query or "").strip().lower()
             if not normalized_query:
                 return []
 
-            all_authors = self.get_all_authors()
-            matched = [name for name in all_authors if normalized_query in name.lower()]
+            tokens = tokenize_query(normalized_query)
+            match_expression = build_match_expression(normalized_query, columns=('author',), match_any=match_any)
+
+            conn, cursor = self.connection_manager.connect_db()
+            author_fields: Optional[List[str]] = None
+            if match_expression and has_books_fts(cursor):
+                try:
+                    cursor.execute(
+                        f"""
+                            SELECT DISTINCT books.author FROM {BOOKS_FTS_TABLE}
+                            JOIN books ON books.id = {BOOKS_FTS_TABLE}.rowid
+                            WHERE {BOOKS_FTS_TABLE} MATCH ?
+                        """,
+                        (match_expression,)
+                    )
+                    author_fields = [row[0] for row in cursor.fetchall() if row[0]]
+                    author_fields.extend(self._override_source_fields(cursor, tokens, match_any))
+                except sqlite3.OperationalError as fts_error:
+                    self.logger.warning("Author full-text search failed; scanning authors", extra={
+                        "query": query,
+                        "error": str(fts_error)
+                    })
+                    author_fields = None
+            error_handler.handle_connection_cleanup(conn)
+            conn = None
+
+            if author_fields is None:
+                candidates = self.get_all_authors()
+            else:
+                resolve = self.book_authors.get_override_resolver()
+                candidates = {resolve(name) for field in author_fields for name in split_author_field(field)}
+
+            matched = [
+                name for name in candidates
+                if normalized_query in name.lower() or tokens_match_text(tokens, name, match_any=match_any)
+            ]
             matched.sort(key=lambda value: value.lower())
             self.logger.debug("Author search completed", extra={
                 "query": query,
@@ -299,31 +251,37 @@ class AuthorOperations:
                 "error": str(e)
             })
             return []
+
+        finally:
+            error_handler.handle_connection_cleanup(conn)
+
+    def _override_source_fields(self, cursor, tokens: List[str], match_any: bool) -> List[str]:
+        """Return stored author spellings whose preferred override matches the query.
+
+        The index holds the names as stored on each book, so a preferred
+        spelling that differs from the stored one would otherwise be missed.
+        """
+        cursor.execute("SELECT DISTINCT source_author_name, preferred_author_name FROM author_name_overrides")
+        fields: List[str] = []
+        for source_name, preferred_name in cursor.fetchall():
+            if not source_name or not tokens_match_text(tokens, preferred_name, match_any=match_any):
+                continue
+            cursor.execute(
+                "SELECT author FROM books WHERE author LIKE ? LIMIT 1",
+                (f"%{source_name}%",)
+            )
+            row = cursor.fetchone()
+            if row and row[0]:
+                fields.append(row[0])
+        return fields
     
     def get_top_authors_by_book_count(self, limit: int = 10) -> List[Dict]:
         """Get top authors by number of books."""
-        conn = None
         try:
-            conn, cursor = self.connection_manager.connect_db()
-
-            cursor.execute("""
-                SELECT author
-                FROM books
-                WHERE author IS NOT NULL AND author != ''
-            """)
-
-            author_counts: DefaultDict[str, int] = defaultdict(int)
-            for (author_field,) in cursor.fetchall():
-                for name in self._split_author_field(author_field):
-                    author_counts[name] += 1
-
-            sorted_authors = sorted(
-                author_counts.items(),
-                key=lambda item: item[1],
-                reverse=True
-            )[:limit]
-
-            results = [{'author': name, 'book_count': count} for name, count in sorted_authors]
+            results = [
+                {'author': name, 'book_count': count}
+                for name, count in self.book_authors.get_author_book_counts(limit)
+            ]
             self.logger.debug("Retrieved top authors by book count", extra={
                 "limit": limit,
                 "result_count": len(results)
@@ -336,44 +294,31 @@ class AuthorOperations:
                 "error": str(e)
             })
             return []
-
-        finally:
-            error_handler.handle_connection_cleanup(conn)
     
     def get_authors_with_series(self) -> List[Dict]:
         """Get authors who have books in series."""
         conn = None
         try:
+            self.book_authors.sync_pending()
             conn, cursor = self.connection_manager.connect_db()
             
             cursor.execute("""
-                SELECT author, series
-                FROM books
-                WHERE author IS NOT NULL AND author != '' AND series != 'N/A'
+                SELECT MIN(ba.display_name), COUNT(DISTINCT b.series), COUNT(*)
+                FROM book_authors ba
+                JOIN books b ON b.id = ba.book_id
+                WHERE b.series IS NOT NULL AND b.series != '' AND b.series != 'N/A'
+                GROUP BY ba.author_name_normalized
+                ORDER BY COUNT(DISTINCT b.series) DESC, COUNT(*) DESC
             """)
 
-            author_series: DefaultDict[str, Set[str]] = defaultdict(set)
-            author_book_counts: DefaultDict[str, int] = defaultdict(int)
-
-            for author_field, series_name in cursor.fetchall():
-                if not series_name or series_name == 'N/A':
-                    continue
-
-                for name in self._split_author_field(author_field):
-                    author_series[name].add(series_name)
-                    author_book_counts[name] += 1
-
             author_entries = [
                 {
                     'author': name,
-                    'series_count': len(series_set),
-                    'total_books': author_book_counts.get(name, 0)
+                    'series_count': series_count,
+                    'total_books': total_books
                 }
-                for name, series_set in author_series.items()
-                if series_set
+                for name, series_count, total_books in cursor.fetchall()
             ]
-
-            author_entries.sort(key=lambda item: (item['series_count'], item['total_books']), reverse=True)
             self.logger.debug("Retrieved authors with series", extra={
                 "result_count": len(author_entries)
             })
@@ -502,25 +447,21 @@ class AuthorOperations:
         """Get list of authors that need metadata refresh from Audible."""
         conn = None
         try:
+            self.book_authors.sync_pending()
             conn, cursor = self.connection_manager.connect_db()
             
             # Get library authors that either don't have metadata or haven't been refreshed recently
             cursor.execute("""
-                SELECT DISTINCT b.author
-                FROM books b
-                LEFT JOIN authors a ON b.author = a.name
-                WHERE b.author IS NOT NULL AND b.author != ''
-                AND (a.last_fetched_at IS NULL 
-                     OR datetime(a.last_fetched_at) < datetime('now', '-{} hours'))
-                ORDER BY b.author
-            """.format(hours_threshold))
+                SELECT MIN(ba.display_name)
+                FROM book_authors ba
+                LEFT JOIN authors a ON a.name = ba.display_name
+                GROUP BY ba.author_name_normalized
+                HAVING MAX(a.last_fetched_at IS NOT NULL
+                           AND datetime(a.last_fetched_at) >= datetime('now', ?)) = 0
+                ORDER BY MIN(ba.display_name) COLLATE NOCASE
+            """, (f"-{int(hours_threshold)} hours",))
             
-            pending_authors: Set[str] = set()
-            for (author_field,) in cursor.fetchall():
-                for name in self._split_author_field(author_field):
-                    pending_authors.add(name)
-
-            author_list = sorted(pending_authors, key=lambda value: value.lower())
+            author_list = [row[0] for row in cursor.fetchall()]
             self.logger.debug("Found authors needing metadata refresh", extra={
                 "result_count": len(author_list),
                 "hours_threshold": hours_threshold
@@ -0,0 +1,370 @@
+"""
+Module Name: backup.py
+Author: TheDragonShaman
+Created: Oct 16 2026
+Last Modified: Oct 16 2026
+Description:
+    Online database backups through the SQLite backup API. Pages are copied
+    in small steps with a pause between them so writers are not starved,
+    the copy includes committed WAL content, and jobs run on a background
+    thread with progress, optional gzip/zstd compression and retention.
+
+Location:
+    /services/database/backup.py
+
+"""
+
+import gzip
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from utils.logger import get_module_logger
+
+try:  # zstandard is optional; gzip is always available
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+BACKUP_PREFIX = "auralarchive_backup_"
+DEFAULT_BACKUP_DIR = "backups"
+DEFAULT_PAGES_PER_STEP = 256
+DEFAULT_STEP_PAUSE_SECONDS = 0.005
+DEFAULT_RETENTION = 10
+# Stepped copies restart when another connection writes; after this many
+# restarts the remaining copy is done in a single pass
+MAX_STEPPED_RESTARTS = 3
+JOBS_KEPT = 20
+
+COMPRESSION_EXTENSIONS = {
+    "none": "",
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+_COPY_CHUNK_BYTES = 1024 * 1024
+
+
+class _SteppedBackupRestarted(Exception):
+    """Raised from the progress callback to abandon a repeatedly restarted copy."""
+
+
+def available_compressions() -> List[str]:
+    """Compression modes usable in this environment."""
+    return [mode for mode in COMPRESSION_EXTENSIONS if mode != "zstd" or zstandard is not None]
+
+
+def normalize_compression(value: Any) -> str:
+    """Map config/request values ('', 'gz', 'false', ...) to a compression mode."""
+    text = str(value or "none").strip().lower()
+    aliases = {"": "none", "false": "none", "off": "none", "gz": "gzip", "zst": "zstd", "zstandard": "zstd"}
+    mode = aliases.get(text, text)
+    if mode not in COMPRESSION_EXTENSIONS:
+        raise ValueError(f"Unsupported backup compression: {value}")
+    if mode == "zstd" and zstandard is None:
+        raise ValueError("zstd compression requires the 'zstandard' package")
+    return mode
+
+
+class DatabaseBackup:
+    """
+    Background online backups of the library database.
+
+    Features:
+    - sqlite3.Connection.backup() in page steps with a pause between steps
+    - One running job at a time; progress as copied/total pages
+    - Streaming gzip or zstd compression of the finished copy
+    - Retention rotation of older backups
+    - Book count read from the backup itself (SELECT COUNT(*))
+    """
+
+    def __init__(self, connection_manager, *, logger=None, backup_dir: str = DEFAULT_BACKUP_DIR):
+        self.connection_manager = connection_manager
+        self.logger = logger or get_module_logger("Service.Database.Backup")
+        self.backup_dir = backup_dir
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._active_job_id: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+    def start_backup(
+        self,
+        *,
+        compression: Any = "none",
+        retention: Optional[int] = DEFAULT_RETENTION,
+        pages_per_step: int = DEFAULT_PAGES_PER_STEP,
+        step_pause: float = DEFAULT_STEP_PAUSE_SECONDS,
+    ) -> Dict[str, Any]:
+        """Start a backup job (or return the running one) and return its state."""
+        mode = normalize_compression(compression)
+        with self._lock:
+            if self._active_job_id:
+                return dict(self._jobs[self._active_job_id])
+
+            created = datetime.now()
+            job_id = created.strftime("%Y%m%d_%H%M%S_%f")
+            filename = f"{BACKUP_PREFIX}{created.strftime('%Y%m%d_%H%M%S')}.db{COMPRESSION_EXTENSIONS[mode]}"
+            job = {
+                "job_id": job_id,
+                "state": "running",
+                "filename": filename,
+                "path": os.path.join(self.backup_dir, filename),
+                "compression": mode,
+                "progress": 0.0,
+                "pages_total": None,
+                "pages_remaining": None,
+                "started": created.isoformat(),
+                "finished": None,
+                "backup_info": None,
+                "error": None,
+            }
+            self._jobs[job_id] = job
+            while len(self._jobs) > JOBS_KEPT:
+                self._jobs.popitem(last=False)
+            self._active_job_id = job_id
+
+        thread = threading.Thread(
+            target=self._run_job,
+            args=(job_id, retention, pages_per_step, step_pause),
+            name=f"DatabaseBackup-{job_id}",
+            daemon=True,
+        )
+        thread.start()
+        return dict(job)
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(job) for job in reversed(self._jobs.values())]
+
+    def _update_job(self, job_id: str, **updates):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                job.update(updates)
+
+    def _run_job(self, job_id: str, retention: Optional[int], pages_per_step: int, step_pause: float):
+        job = self.get_job(job_id) or {}
+        tracker = self._get_status_service()
+        status_id = None
+        if tracker:
+            status_id = tracker.start_event(
+                category="database",
+                title="Database backup",
+                message="Copying database pages…",
+                source="Database",
+                entity_id=job_id,
+                progress=0.0,
+                metadata={"filename": job.get("filename")},
+            )["id"]
+
+        def on_progress(remaining: int, total: int):
+            progress = round((total - remaining) / total * 100, 1) if total else 100.0
+            self._update_job(job_id, progress=progress, pages_total=total, pages_remaining=remaining)
+            if tracker and status_id:
+                tracker.update_event(status_id, progress=progress)
+
+        try:
+            info = self.create_backup(
+                job["path"],
+                compression=job["compression"],
+                pages_per_step=pages_per_step,
+                step_pause=step_pause,
+                progress=on_progress,
+            )
+            if retention:
+                info["rotated"] = self.rotate_backups(retention)
+            self._update_job(job_id, state="completed", progress=100.0, backup_info=info,
+                             finished=datetime.now().isoformat())
+            if tracker and status_id:
+                tracker.complete_event(status_id, message=f"Backup created: {job['filename']}")
+            self.logger.info("Database backup created", extra={
+                "backup_file": job["filename"],
+                "size_mb": info["size_mb"],
+                "duration_seconds": info["duration_seconds"],
+            })
+        except Exception as exc:
+            self._update_job(job_id, state="failed", error=str(exc), finished=datetime.now().isoformat())
+            if tracker and status_id:
+                tracker.fail_event(status_id, message="Database backup failed", error=str(exc))
+            self.logger.error("Database backup failed", extra={"job_id": job_id, "error": str(exc)})
+        finally:
+            with self._lock:
+                if self._active_job_id == job_id:
+                    self._active_job_id = None
+
+    def _get_status_service(self):
+        try:
+            from services.service_manager import get_status_service
+
+            return get_status_service()
+        except Exception as exc:  # pragma: no cover - defensive
+            self.logger.debug(f"Status service unavailable: {exc}")
+            return None
+
+    # ------------------------------------------------------------------
+    # Engine
+    # ------------------------------------------------------------------
+    def create_backup(
+        self,
+        destination: str,
+        *,
+        compression: str = "none",
+        pages_per_step: int = DEFAULT_PAGES_PER_STEP,
+        step_pause: float = DEFAULT_STEP_PAUSE_SECONDS,
+        progress=None,
+    ) -> Dict[str, Any]:
+        """Copy the live database to ``destination`` and return backup metadata.
+
+        The source read lock is only held while a step copies its pages;
+        ``step_pause`` is slept between steps so writers can commit. A write
+        from another connection restarts a stepped copy, so after
+        MAX_STEPPED_RESTARTS the copy is redone in one pass, which in WAL
+        mode reads a single snapshot without blocking writers.
+        """
+        mode = normalize_compression(compression)
+        db_file = self.connection_manager.db_file
+        started = time.monotonic()
+        os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+        copy_path = destination[: -len(COMPRESSION_EXTENSIONS[mode])] if mode != "none" else destination
+        partial_path = copy_path + ".partial"
+
+        restarts = 0
+        last_remaining = None
+
+        def on_step(_status, remaining, total):
+            nonlocal restarts, last_remaining
+            if last_remaining is not None and remaining > last_remaining:
+                restarts += 1
+                if restarts > MAX_STEPPED_RESTARTS:
+                    raise _SteppedBackupRestarted()
+            last_remaining = remaining
+            if progress:
+                progress(remaining, total)
+            if remaining and step_pause > 0:
+                time.sleep(step_pause)
+
+        source = sqlite3.connect(db_file, timeout=30)
+        try:
+            target = sqlite3.connect(partial_path)
+            try:
+                try:
+                    source.backup(target, pages=max(1, int(pages_per_step)), progress=on_step)
+                except _SteppedBackupRestarted:
+                    self.logger.debug("Stepped backup kept restarting; copying in one pass",
+                                      extra={"restarts": restarts, "database_file": db_file})
+                    source.backup(target, pages=-1)
+                    if progress:
+                        progress(0, last_remaining or 0)
+                integrity = target.execute("PRAGMA quick_check").fetchone()[0]
+                books_count = self._count_books(target)
+            finally:
+                target.close()
+        except Exception:
+            self._remove_quietly(partial_path)
+            raise
+        finally:
+            source.close()
+
+        database_size = os.path.getsize(partial_path)
+        try:
+            if mode == "none":
+                os.replace(partial_path, destination)
+            else:
+                self._compress(partial_path, destination, mode)
+        finally:
+            self._remove_quietly(partial_path)
+
+        backup_size = os.path.getsize(destination)
+        return {
+            "filename": os.path.basename(destination),
+            "path": destination,
+            "compression": mode,
+            "size": backup_size,
+            "size_mb": round(backup_size / (1024 * 1024), 2),
+            "database_size": database_size,
+            "compression_ratio": round(database_size / backup_size, 2) if backup_size else None,
+            "created": datetime.now().isoformat(),
+            "integrity_check": integrity == "ok",
+            "books_count": books_count,
+            "restarts": restarts,
+            "duration_seconds": round(time.monotonic() - started, 2),
+        }
+
+    def _count_books(self, connection: sqlite3.Connection):
+        try:
+            return connection.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+        except sqlite3.Error as exc:
+            self.logger.warning(f"Could not count books in backup: {exc}")
+            return "Unknown"
+
+    def _compress(self, source_path: str, destination: str, mode: str):
+        partial_destination = destination + ".partial"
+        try:
+            with open(source_path, "rb") as source:
+                if mode == "gzip":
+                    with gzip.open(partial_destination, "wb", compresslevel=6) as target:
+                        shutil.copyfileobj(source, target, _COPY_CHUNK_BYTES)
+                else:
+                    compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+                    with open(partial_destination, "wb") as raw_target:
+                        with compressor.stream_writer(raw_target) as target:
+                            shutil.copyfileobj(source, target, _COPY_CHUNK_BYTES)
+            os.replace(partial_destination, destination)
+        except Exception:
+            self._remove_quietly(partial_destination)
+            raise
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+    def list_backups(self) -> List[Dict[str, Any]]:
+        """Finished backups in the backup directory, newest first."""
+        if not os.path.isdir(self.backup_dir):
+            return []
+        backups = []
+        for name in os.listdir(self.backup_dir):
+            if not name.startswith(BACKUP_PREFIX) or name.endswith(".partial"):
+                continue
+            path = os.path.join(self.backup_dir, name)
+            stat = os.stat(path)
+            backups.append({
+                "filename": name,
+                "path": path,
+                "size": stat.st_size,
+                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                "_mtime": stat.st_mtime,
+            })
+        backups.sort(key=lambda item: (item["_mtime"], item["filename"]), reverse=True)
+        for item in backups:
+            item.pop("_mtime")
+        return backups
+
+    def rotate_backups(self, keep: int) -> List[str]:
+        """Delete all but the newest ``keep`` backups; return removed filenames."""
+        removed = []
+        for item in self.list_backups()[max(1, int(keep)):]:
+            try:
+                os.remove(item["path"])
+                removed.append(item["filename"])
+            except OSError as exc:
+                self.logger.warning(f"Could not remove old backup {item['filename']}: {exc}")
+        return removed
+
+    @staticmethod
+    def _remove_quietly(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
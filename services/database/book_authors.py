@@ -0,0 +1,284 @@
+"""
+Module Name: book_authors.py
+Author: TheDragonShaman
+Created: Oct 16 2026
+Last Modified: Oct 16 2026
+Description:
+    Maintains the normalized book_authors table (one row per book/author
+    pair, override-resolved) and serves indexed author lookups from it.
+
+Location:
+    /services/database/book_authors.py
+
+"""
+
+import re
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .author_overrides import get_override_version
+from .error_handling import error_handler
+from utils.logger import get_module_logger
+
+AUTHOR_DELIMITER_PATTERN = re.compile(r"\s*(?:,|&|;|\band\b|\bwith\b)\s*", re.IGNORECASE)
+
+# Books written but not yet (re)split; filled by triggers on books so any
+# writer, including raw SQL elsewhere, is picked up on the next read.
+PENDING_TABLE = "book_authors_pending"
+
+_SYNC_BATCH_SIZE = 500
+_IN_CLAUSE_CHUNK = 500
+
+
+def normalize_author_name(name: Optional[str]) -> str:
+    """Trim whitespace and collapse repeated spacing for consistent comparisons."""
+    if not name:
+        return ""
+    cleaned = str(name).replace("\u00a0", " ")
+    return " ".join(cleaned.strip().split())
+
+
+def split_author_field(author_value: Optional[str]) -> List[str]:
+    """Split a stored author string into individual (un-overridden) names."""
+    if not author_value:
+        return []
+    if not isinstance(author_value, str):
+        author_value = str(author_value)
+
+    names: List[str] = []
+    for part in AUTHOR_DELIMITER_PATTERN.split(author_value):
+        normalized = normalize_author_name(part)
+        if normalized and normalized not in names:
+            names.append(normalized)
+    return names
+
+
+class BookAuthorOperations:
+    """Writes and queries the normalized book_authors table."""
+
+    def __init__(self, connection_manager, *, logger=None):
+        self.connection_manager = connection_manager
+        self.logger = logger or get_module_logger("Service.Database.BookAuthors")
+        self._override_lock = threading.Lock()
+        self._override_signature: Optional[Tuple] = None
+        self._override_map: Dict[str, Dict[str, str]] = {}
+        self._sync_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Override resolution
+    # ------------------------------------------------------------------
+    def _load_overrides(self, cursor) -> Dict[str, Dict[str, str]]:
+        """Return {source_lower: {asin: preferred}}, reloading only on change.
+
+        updated_at has one-second resolution, so the signature also carries
+        the write version bumped by AuthorOverrideOperations.
+        """
+        cursor.execute("SELECT COUNT(*), MAX(updated_at), MAX(id) FROM author_name_overrides")
+        signature = (get_override_version(),) + tuple(cursor.fetchone())
+        with self._override_lock:
+            if signature == self._override_signature:
+                return self._override_map
+
+        cursor.execute("SELECT source_author_name, preferred_author_name, asin FROM author_name_overrides")
+        override_map: Dict[str, Dict[str, str]] = defaultdict(dict)
+        for source_name, preferred_name, asin in cursor.fetchall():
+            source_key = normalize_author_name(source_name).lower()
+            preferred = normalize_author_name(preferred_name) or preferred_name
+            if source_key and preferred:
+                override_map[source_key].setdefault((asin or "").strip().upper(), preferred)
+
+        with self._override_lock:
+            self._override_map = dict(override_map)
+            self._override_signature = signature
+            return self._override_map
+
+    @staticmethod
+    def _resolve_name(overrides: Dict[str, Dict[str, str]], name: str, asin: Optional[str]) -> str:
+        """Mirror AuthorOverrideOperations precedence: ASIN scope, global, any."""
+        scoped = overrides.get(name.lower())
+        if not scoped:
+            return name
+        asin_key = (asin or "").strip().upper()
+        if asin_key and asin_key in scoped:
+            return scoped[asin_key]
+        if "" in scoped:
+            return scoped[""]
+        return next(iter(scoped.values()))
+
+    def resolve_author_name(self, name: str, asin: Optional[str] = None) -> str:
+        """Return the preferred display name for a single author."""
+        normalized = normalize_author_name(name)
+        if not normalized:
+            return ""
+        conn = None
+        try:
+            conn, cursor = self.connection_manager.connect_db()
+            return self._resolve_name(self._load_overrides(cursor), normalized, asin)
+        finally:
+            error_handler.handle_connection_cleanup(conn)
+
+    def get_override_resolver(self) -> Callable[[Optional[str], Optional[str]], Optional[str]]:
+        """Return a ``(name, asin) -> preferred name`` callable over the current overrides.
+
+        Lets callers resolve many names with a single override lookup instead
+        of one query per name.
+        """
+        conn = None
+        try:
+            conn, cursor = self.connection_manager.connect_db()
+            overrides = self._load_overrides(cursor)
+        finally:
+            error_handler.handle_connection_cleanup(conn)
+
+        def resolve(name: Optional[str], asin: Optional[str] = None) -> Optional[str]:
+            normalized = normalize_author_name(name)
+            if not normalized:
+                return name
+            return self._resolve_name(overrides, normalized, asin)
+
+        return resolve
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def sync_books(self, cursor, book_ids: Iterable[int]) -> int:
+        """Rebuild book_authors rows for the given books inside the caller's transaction."""
+        ids = [int(book_id) for book_id in book_ids if book_id is not None]
+        if not ids:
+            return 0
+
+        overrides = self._load_overrides(cursor)
+        written = 0
+        for start in range(0, len(ids), _IN_CLAUSE_CHUNK):
+            chunk = ids[start:start + _IN_CLAUSE_CHUNK]
+            placeholders = ", ".join("?" for _ in chunk)
+            cursor.execute(f"DELETE FROM book_authors WHERE book_id IN ({placeholders})", chunk)
+            cursor.execute(f"DELETE FROM {PENDING_TABLE} WHERE book_id IN ({placeholders})", chunk)
+            cursor.execute(f"SELECT id, author, asin FROM books WHERE id IN ({placeholders})", chunk)
+
+            rows = []
+            for book_id, author_field, asin in cursor.fetchall():
+                seen = set()
+                for position, source_name in enumerate(split_author_field(author_field)):
+                    display_name = self._resolve_name(overrides, source_name, asin)
+                    normalized = display_name.lower()
+                    if normalized in seen:
+                        continue
+                    seen.add(normalized)
+                    rows.append((book_id, normalized, display_name, source_name, position))
+
+            if rows:
+                cursor.executemany(
+                    """
+                        INSERT OR REPLACE INTO book_authors
+                            (book_id, author_name_normalized, display_name, source_name, position)
+                        VALUES (?, ?, ?, ?, ?)
+                    """,
+                    rows
+                )
+                written += len(rows)
+        return written
+
+    def sync_pending(self) -> int:
+        """Split any books queued by the books triggers; cheap when nothing is pending."""
+        conn = None
+        synced = 0
+        try:
+            conn, cursor = self.connection_manager.connect_db()
+            cursor.execute(f"SELECT 1 FROM {PENDING_TABLE} LIMIT 1")
+            if cursor.fetchone() is None:
+                return 0
+
+            with self._sync_lock:
+                while True:
+                    cursor.execute(f"SELECT book_id FROM {PENDING_TABLE} LIMIT ?", (_SYNC_BATCH_SIZE,))
+                    pending_ids = [row[0] for row in cursor.fetchall()]
+                    if not pending_ids:
+                        break
+                    self.sync_books(cursor, pending_ids)
+                    conn.commit()
+                    synced += len(pending_ids)
+
+            if synced:
+                self.logger.debug("Synchronized book authors", extra={"book_count": synced})
+            return synced
+        except Exception as exc:
+            self.logger.warning("Failed to synchronize book authors", extra={"error": str(exc)})
+            return synced
+        finally:
+            error_handler.handle_connection_cleanup(conn)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def get_author_names(self) -> List[str]:
+        """Return every distinct (override-resolved) author name."""
+        self.sync_pending()
+        conn = None
+        try:
+            conn, cursor = self.connection_manager.connect_db()
+            cursor.execute(
+                """
+                    SELECT MIN(display_name)
+                    FROM book_authors
+                    GROUP BY author_name_normalized
+                    ORDER BY MIN(display_name) COLLATE NOCASE
+                """
+            )
+            return [row[0] for row in cursor.fetchall()]
+        finally:
+            error_handler.handle_connection_cleanup(conn)
+
+    def get_author_book_counts(self, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Return (author, book_count) pairs ordered by count descending."""
+        self.sync_pending()
+        conn = None
+        try:
+            conn, cursor = self.connection_manager.connect_db()
+            cursor.execute(
+                """
+                    SELECT MIN(display_name), COUNT(DISTINCT book_id) AS book_count
+                    FROM book_authors
+                    GROUP BY author_name_normalized
+                    ORDER BY book_count DESC, MIN(display_name) COLLATE NOCASE
+                    LIMIT ?
+                """,
+                (int(limit) if limit else -1,)
+            )
+            return [(row[0], row[1]) for row in cursor.fetchall()]
+        finally:
+            error_handler.handle_connection_cleanup(conn)
+
+    def get_book_rows_for_authors(self, authors: Sequence[str]) -> List[Tuple[str, Tuple]]:
+        """Return (normalized_author, books_row) pairs for the requested authors.
+
+        ``authors`` must already be override-resolved names; rows are ordered
+        by title within each IN-list chunk.
+        """
+        keys = list(dict.fromkeys(name.lower() for name in authors if name))
+        if not keys:
+            return []
+
+        self.sync_pending()
+        conn = None
+        try:
+            conn, cursor = self.connection_manager.connect_db()
+            results: List[Tuple[str, Tuple]] = []
+            for start in range(0, len(keys), _IN_CLAUSE_CHUNK):
+                chunk = keys[start:start + _IN_CLAUSE_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor.execute(
+                    f"""
+                        SELECT ba.author_name_normalized, books.*
+                        FROM book_authors ba
+                        JOIN books ON books.id = ba.book_id
+                        WHERE ba.author_name_normalized IN ({placeholders})
+                        ORDER BY books.title COLLATE NOCASE
+                    """,
+                    chunk
+                )
+                results.extend((row[0], tuple(row[1:])) for row in cursor.fetchall())
+            return results
+        finally:
+            error_handler.handle_connection_cleanup(conn)
@@ -0,0 +1,147 @@
+"""
+Module Name: book_metrics.py
+Author: TheDragonShaman
+Created: Oct 16 2026
+Last Modified: Oct 16 2026
+Description:
+    Normalized numeric book columns (runtime_minutes, rating_value,
+    release_year). Python parsers fill them at write time; the matching SQL
+    expressions back the migration backfill and the triggers that cover raw
+    SQL writers.
+
+Location:
+    /services/database/book_metrics.py
+
+"""
+
+import re
+from typing import Any, Dict, Optional
+
+METRIC_COLUMNS = ("runtime_minutes", "rating_value", "release_year")
+
+# Source columns whose changes re-derive the metrics
+METRIC_SOURCE_COLUMNS = ("runtime", "overall_rating", "rating", "release_date")
+
+_DIGITS = re.compile(r"[0-9]+")
+_LEADING_INT = re.compile(r"\s*([+-]?[0-9]+)")
+_LEADING_REAL = re.compile(r"\s*([+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+))")
+_YEAR_PREFIX = re.compile(r"[12][0-9]{3}")
+_YEAR_SUFFIX = re.compile(r".*[^0-9]([12][0-9]{3})")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _leading_int(text: str) -> int:
+    """SQLite CAST(text AS INTEGER) semantics: leading integer or 0."""
+    match = _LEADING_INT.match(text)
+    return int(match.group(1)) if match else 0
+
+
+def parse_runtime_minutes(runtime: Any) -> Optional[int]:
+    """Minutes from a stored runtime (integer minutes, 'X hrs Y mins' or 'Y mins')."""
+    if runtime is None:
+        return None
+    if _is_number(runtime):
+        return int(runtime)
+    text = str(runtime)
+    if not text.strip():
+        return None
+    if _DIGITS.fullmatch(text):
+        return int(text)
+    if not "0" <= text[:1] <= "9":
+        return None
+    hrs = text.find(" hrs")
+    mins = text.find(" mins")
+    if hrs >= 0:
+        minutes = _leading_int(text[hrs + 4:mins].strip()) if mins > hrs else 0
+        return _leading_int(text) * 60 + minutes
+    if mins >= 0:
+        return _leading_int(text)
+    return None
+
+
+def parse_rating_value(overall_rating: Any, rating: Any = None) -> Optional[float]:
+    """Numeric rating from overall_rating, falling back to a numeric rating column."""
+    if _is_number(overall_rating):
+        return float(overall_rating)
+    if overall_rating is not None:
+        text = str(overall_rating).strip()
+        if "0" <= text[:1] <= "9":
+            match = _LEADING_REAL.match(text)
+            if match:
+                return float(match.group(1))
+    if _is_number(rating):
+        return float(rating)
+    return None
+
+
+def parse_release_year(release_date: Any) -> Optional[int]:
+    """Year from 'YYYY-MM-DD'-style or '...YYYY'-suffixed release dates."""
+    if release_date is None:
+        return None
+    text = str(release_date).strip()
+    if _YEAR_PREFIX.match(text[:4]) and len(text) >= 4:
+        return int(text[:4])
+    match = _YEAR_SUFFIX.fullmatch(text)
+    if match:
+        return int(match.group(1))
+    return None
+
+
+def derive_book_metrics(runtime: Any, overall_rating: Any, rating: Any, release_date: Any) -> Dict[str, Any]:
+    """Return the three normalized column values for one book row."""
+    return {
+        "runtime_minutes": parse_runtime_minutes(runtime),
+        "rating_value": parse_rating_value(overall_rating, rating),
+        "release_year": parse_release_year(release_date),
+    }
+
+
+def runtime_minutes_sql(column: str = "runtime") -> str:
+    """SQL equivalent of parse_runtime_minutes()."""
+    hrs = f"instr({column}, ' hrs')"
+    mins = f"instr({column}, ' mins')"
+    return (
+        "CASE "
+        f"WHEN typeof({column}) IN ('integer', 'real') THEN CAST({column} AS INTEGER) "
+        f"WHEN {column} IS NULL OR trim({column}) = '' THEN NULL "
+        f"WHEN {column} NOT GLOB '*[^0-9]*' THEN CAST({column} AS INTEGER) "
+        f"WHEN {column} NOT GLOB '[0-9]*' THEN NULL "
+        f"WHEN {hrs} > 0 THEN CAST({column} AS INTEGER) * 60 + "
+        f"(CASE WHEN {mins} > {hrs} THEN CAST(trim(substr({column}, {hrs} + 4, {mins} - {hrs} - 4)) AS INTEGER) ELSE 0 END) "
+        f"WHEN {mins} > 0 THEN CAST({column} AS INTEGER) "
+        "ELSE NULL END"
+    )
+
+
+def rating_value_sql(overall_column: str = "overall_rating", rating_column: str = "rating") -> str:
+    """SQL equivalent of parse_rating_value()."""
+    return (
+        "CASE "
+        f"WHEN typeof({overall_column}) IN ('integer', 'real') THEN CAST({overall_column} AS REAL) "
+        f"WHEN trim({overall_column}) GLOB '[0-9]*' THEN CAST(trim({overall_column}) AS REAL) "
+        f"WHEN typeof({rating_column}) IN ('integer', 'real') THEN CAST({rating_column} AS REAL) "
+        "ELSE NULL END"
+    )
+
+
+def release_year_sql(column: str = "release_date") -> str:
+    """SQL equivalent of parse_release_year()."""
+    trimmed = f"trim({column})"
+    return (
+        "CASE "
+        f"WHEN substr({trimmed}, 1, 4) GLOB '[12][0-9][0-9][0-9]' THEN CAST(substr({trimmed}, 1, 4) AS INTEGER) "
+        f"WHEN {trimmed} GLOB '*[^0-9][12][0-9][0-9][0-9]' THEN CAST(substr({trimmed}, -4) AS INTEGER) "
+        "ELSE NULL END"
+    )
+
+
+def metrics_assignment_sql(prefix: str = "") -> str:
+    """'runtime_minutes = ..., rating_value = ..., release_year = ...' over prefixed columns."""
+    return ", ".join((
+        f"runtime_minutes = {runtime_minutes_sql(prefix + 'runtime')}",
+        f"rating_value = {rating_value_sql(prefix + 'overall_rating', prefix + 'rating')}",
+        f"release_year = {release_year_sql(prefix + 'release_date')}",
+    ))
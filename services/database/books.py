@@ -2,23 +2,44 @@
 Module Name: books.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Database operations for book records, including bulk import and status updates.
+    Bulk ASIN -> library status lookups are served from a short-lived cache
+    that is invalidated on every book write. Library views read keyset-paginated
+    pages with column projections instead of full-table scans.
 
 Location:
     /services/database/books.py
 
 """
 
+import sqlite3
 import threading
-from typing import List, Dict, Optional, TYPE_CHECKING, Any, Tuple, Set
+import time
+from collections import OrderedDict
+from typing import List, Dict, Optional, TYPE_CHECKING, Any, Tuple, Set, Iterable
+from . import library_listing
+from .book_metrics import derive_book_metrics
 from .error_handling import error_handler
+from .fulltext import (
+    BOOKS_FTS_COLUMNS,
+    BOOKS_FTS_TABLE,
+    bm25_order_clause,
+    build_match_expression,
+    has_books_fts,
+)
 from utils.logger import get_module_logger
 
 if TYPE_CHECKING:
     from .connection import DatabaseConnection
 
+# Library status cache (ASIN -> compact status record, including misses)
+LIBRARY_STATUS_CACHE_TTL_SECONDS = 30.0
+LIBRARY_STATUS_CACHE_MAX_ENTRIES = 5000
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER for IN (...) lookups
+ASIN_LOOKUP_CHUNK_SIZE = 500
+
 class BookOperations:
     """Handles all book-related database operations"""
 
@@ -29,6 +50,15 @@ class BookOperations:
         self._pending_series_sync: Set[str] = set()
         self._series_worker_threads: Set[threading.Thread] = set()
         self.author_override_operations = author_override_operations
+        self._fts_ready = False
+        self._status_cache: "OrderedDict[str, Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+        self._status_cache_lock = threading.Lock()
+
+    def _has_fts_index(self, cursor) -> bool:
+        """Return True once the books_fts index is present."""
+        if not self._fts_ready:
+            self._fts_ready = has_books_fts(cursor)
+        return self._fts_ready
 
     def _normalize_lookup_value(self, value: Optional[str]) -> str:
         return (value or '').strip().lower()
@@ -93,6 +123,9 @@ class BookOperations:
             'ownership_status': book_data.get('ownership_status', 'wanted'),
             'file_path': book_data.get('file_path')
         }
+        db_row.update(derive_book_metrics(
+            db_row['runtime'], db_row['overall_rating'], db_row['rating'], db_row['release_date']
+        ))
 
         return db_row, asin_clean
 
@@ -100,7 +133,8 @@ class BookOperations:
         allowed_columns = [
             'title', 'author', 'series', 'sequence', 'narrator', 'runtime', 'release_date',
             'language', 'publisher', 'overall_rating', 'rating', 'num_ratings', 'status',
-            'asin', 'summary', 'cover_image', 'series_asin', 'source', 'ownership_status', 'file_path'
+            'asin', 'summary', 'cover_image', 'series_asin', 'source', 'ownership_status', 'file_path',
+            'runtime_minutes', 'rating_value', 'release_year'
         ]
 
         set_clauses = []
@@ -193,7 +227,104 @@ class BookOperations:
         
         finally:
             error_handler.handle_connection_cleanup(conn)
-    
+
+    def get_library_status_by_asins(self, asins: Iterable[Optional[str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Resolve many ASINs to their library status with one IN (...) query.
+
+        Returns a mapping of ASIN -> {'ID', 'ASIN', 'Status', 'ownership_status',
+        'file_path', 'in_library'} for ASINs present in the books table; ASINs
+        that are not in the library are omitted. Results (including misses)
+        are cached briefly and dropped whenever a book is written.
+        """
+        requested: List[str] = []
+        seen: Set[str] = set()
+        for asin in asins or []:
+            clean = self._sanitize_asin_value(asin)
+            if clean and clean not in seen:
+                seen.add(clean)
+                requested.append(clean)
+        if not requested:
+            return {}
+
+        resolved: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        now = time.monotonic()
+        with self._status_cache_lock:
+            for asin in requested:
+                cached = self._status_cache.get(asin)
+                if cached is None or now - cached[0] > LIBRARY_STATUS_CACHE_TTL_SECONDS:
+                    missing.append(asin)
+                    continue
+                self._status_cache.move_to_end(asin)
+                if cached[1] is not None:
+                    resolved[asin] = dict(cached[1])
+
+        if not missing:
+            return resolved
+
+        fetched: Dict[str, Optional[Dict[str, Any]]] = {asin: None for asin in missing}
+        conn = None
+        try:
+            conn, cursor = self.connection_manager.connect_db()
+            for start in range(0, len(missing), ASIN_LOOKUP_CHUNK_SIZE):
+                chunk = missing[start:start + ASIN_LOOKUP_CHUNK_SIZE]
+                placeholders = ', '.join('?' for _ in chunk)
+                cursor.execute(
+                    f"SELECT id, asin, status, ownership_status, file_path FROM books "
+                    f"WHERE asin IN ({placeholders})",
+                    chunk
+                )
+                for book_id, asin, status, ownership_status, file_path in cursor.fetchall():
+                    if fetched.get(asin) is not None:
+                        continue
+                    fetched[asin] = {
+                        'ID': book_id,
+                        'ASIN': asin,
+                        'Status': status,
+                        'ownership_status': ownership_status,
+                        'file_path': file_path,
+                        'in_library': bool(str(file_path or '').strip()),
+                    }
+        except Exception as e:
+            self.logger.exception("Error resolving library status by ASIN", extra={
+                "asin_count": len(missing),
+                "error": str(e)
+            })
+            return resolved
+        finally:
+            error_handler.handle_connection_cleanup(conn)
+
+        stored_at = time.monotonic()
+        with self._status_cache_lock:
+            for asin, entry in fetched.items():
+                self._status_cache[asin] = (stored_at, entry)
+                self._status_cache.move_to_end(asin)
+            while len(self._status_cache) > LIBRARY_STATUS_CACHE_MAX_ENTRIES:
+                self._status_cache.popitem(last=False)
+
+        for asin, entry in fetched.items():
+            if entry is not None:
+                resolved[asin] = dict(entry)
+
+        self.logger.debug("Resolved library status in bulk", extra={
+            "requested": len(requested),
+            "queried": len(missing),
+            "found": len(resolved)
+        })
+        return resolved
+
+    def invalidate_library_status(self, asins: Optional[Iterable[Optional[str]]] = None):
+        """Drop cached library status entries (all of them when asins is None)."""
+        with self._status_cache_lock:
+            if asins is None:
+                self._status_cache.clear()
+                return
+            for asin in asins:
+                clean = self._sanitize_asin_value(asin)
+                if clean:
+                    self._status_cache.pop(clean, None)
+
     @error_handler.with_retry(max_retries=3, retry_delay=0.5)
     def add_book(self, book_data: Dict, status: str = "Wanted") -> bool:
         """Add a book to the database."""
@@ -210,6 +341,7 @@ class BookOperations:
                 existing_match = self._find_existing_book_by_title_author(cursor, db_row.get('title'), db_row.get('author'))
                 if existing_match and self._merge_book_record(cursor, existing_match, db_row):
                     conn.commit()
+                    self.invalidate_library_status()
                     return True
             
             # Check for duplicate ASIN before insert
@@ -224,6 +356,7 @@ class BookOperations:
                     existing_record = dict(zip(keys, duplicate))
                     if self._merge_book_record(cursor, existing_record, db_row):
                         conn.commit()
+                        self.invalidate_library_status()
                         return True
                     self.logger.warning("Book already exists, skipping add", extra={
                         "asin": asin_clean,
@@ -242,8 +375,9 @@ class BookOperations:
                     title, author, series, sequence, narrator, runtime, 
                     release_date, language, publisher, overall_rating, 
                     rating, status, asin, summary, cover_image, num_ratings, series_asin,
-                    source, ownership_status, file_path
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    source, ownership_status, file_path,
+                    runtime_minutes, rating_value, release_year
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """
             
             values = (
@@ -266,11 +400,15 @@ class BookOperations:
                 series_asin,
                 db_row.get('source'),
                 db_row.get('ownership_status'),
-                db_row.get('file_path')
+                db_row.get('file_path'),
+                db_row.get('runtime_minutes'),
+                db_row.get('rating_value'),
+                db_row.get('release_year')
             )
             
             cursor.execute(insert_sql, values)
             conn.commit()
+            self.invalidate_library_status()
             
             error_handler.log_operation("Book added", f"'{book_data.get('Title')}' with status '{status}'")
             
@@ -486,6 +624,13 @@ class BookOperations:
                         status_value = 'Owned (Audible)' if ownership_status == 'audible_library' else 'Wanted'
                     db_data['status'] = status_value
 
+                    # Normalized numeric columns (unknown values stay unset)
+                    metrics = derive_book_metrics(
+                        db_data.get('runtime'), db_data.get('overall_rating'),
+                        db_data.get('rating'), db_data.get('release_date')
+                    )
+                    db_data.update({key: value for key, value in metrics.items() if value is not None})
+
                     # Preserve existing series_asin if new payload lacks it
                     series_candidate = False
                     if asin:
@@ -538,6 +683,7 @@ class BookOperations:
                     failed += 1
             
             conn.commit()
+            self.invalidate_library_status()
             conn.close()
             
         except Exception as e:
@@ -714,6 +860,98 @@ class BookOperations:
         finally:
             error_handler.handle_connection_cleanup(conn)
 
+    def get_books_page(self, *, limit: int = library_listing.DEFAULT_PAGE_SIZE, cursor: Optional[str] = None,
+                       sort: Optional[str] = None, direction: Optional[str] = None,
+                       status: Optional[str] = None, search: Optional[str] = None,
+                       genre: Optional[str] = None, projection: str = 'grid',
+                       include_total: bool = False) -> Dict[str, Any]:
+        """
+        Return one keyset-paginated page of books.
+
+        Rows use the get_all_books() keys restricted to the projection
+        ('grid' omits the summary) plus a SQL-derived 'genre'. Pass the
+        returned next_cursor back to continue with the same sort and filters.
+        """
+        page_size = library_listing.clamp_page_size(limit)
+        sort_name, sort_sql, sort_direction = library_listing.resolve_sort(sort, direction)
+        select_list, keys = library_listing.build_select_list(projection)
+        clauses, params = library_listing.build_filters(status=status, search=search, genre=genre)
+        filter_clauses, filter_params = list(clauses), list(params)
+
+        position = library_listing.decode_cursor(cursor, sort_name, sort_direction)
+        if position is not None:
+            sort_value, last_id = position
+            clauses.append(library_listing.keyset_clause(sort_sql, sort_direction))
+            params.extend([sort_value, sort_value, last_id])
+
+        where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = (
+            f"SELECT {select_list}, {sort_sql} AS sort_key FROM books {where_sql} "
+            f"{library_listing.order_clause(sort_sql, sort_direction)} LIMIT ?"
+        )
+
+        conn = None
+        try:
+            conn, cursor_obj = self.connection_manager.connect_db()
+            cursor_obj.execute(query, params + [page_size + 1])
+            rows = cursor_obj.fetchall()
+
+            total = None
+            if include_total:
+                count_where = f"WHERE {' AND '.join(filter_clauses)}" if filter_clauses else ""
+                cursor_obj.execute(f"SELECT COUNT(*) FROM books {count_where}", filter_params)
+                total = cursor_obj.fetchone()[0]
+
+            has_more = len(rows) > page_size
+            rows = rows[:page_size]
+            books = []
+            for row in rows:
+                book = dict(zip(keys, row))
+                self._apply_author_overrides(book)
+                books.append(book)
+
+            next_cursor = None
+            if has_more and rows:
+                last_row = rows[-1]
+                next_cursor = library_listing.encode_cursor(
+                    sort_name, sort_direction, last_row[-1], last_row[0]
+                )
+
+            self.logger.debug("Retrieved library page", extra={
+                "count": len(books),
+                "sort": sort_name,
+                "direction": sort_direction,
+                "has_more": has_more,
+                "continued": position is not None
+            })
+            return {
+                'books': books,
+                'next_cursor': next_cursor,
+                'has_more': has_more,
+                'total': total,
+                'limit': page_size,
+                'sort': sort_name,
+                'direction': sort_direction,
+            }
+
+        except Exception as e:
+            self.logger.exception("Error getting library page", extra={
+                "sort": sort_name,
+                "error": str(e)
+            })
+            return {
+                'books': [],
+                'next_cursor': None,
+                'has_more': False,
+                'total': 0 if include_total else None,
+                'limit': page_size,
+                'sort': sort_name,
+                'direction': sort_direction,
+            }
+
+        finally:
+            error_handler.handle_connection_cleanup(conn)
+
     def get_book_by_asin(self, asin: str) -> Optional[Dict]:
         """Get a specific book by ASIN."""
         if not asin or asin.strip() == '' or asin == 'N/A':
@@ -833,6 +1071,7 @@ class BookOperations:
             """
             cursor.execute(update_sql, (new_status, book_id))
             conn.commit()
+            self.invalidate_library_status()
             
             if cursor.rowcount > 0:
                 error_handler.log_operation("Book status updated", f"ID {book_id} to '{new_status}'")
@@ -854,6 +1093,7 @@ class BookOperations:
             conn, cursor = self.connection_manager.connect_db()
             cursor.execute("DELETE FROM books WHERE id = ?", (book_id,))
             conn.commit()
+            self.invalidate_library_status()
             
             if cursor.rowcount > 0:
                 error_handler.log_operation("Book deleted", f"ID {book_id}")
@@ -874,20 +1114,58 @@ class BookOperations:
         finally:
             error_handler.handle_connection_cleanup(conn)
     
-    def search_books(self, query: str) -> List[Dict]:
-        """Search books by title, author, or series."""
+    def search_books(self, query: str, limit: Optional[int] = None, offset: int = 0,
+                     fields: Optional[Iterable[str]] = None) -> List[Dict]:
+        """Search books by title, author, narrator, series, or summary.
+
+        Uses the books_fts index for ranked token/prefix matching; falls back
+        to a LIKE scan over title/author/series when the index is unavailable
+        or the query has no searchable tokens.
+        """
         conn = None
         try:
             conn, cursor = self.connection_manager.connect_db()
-            search_pattern = f"%{query}%"
-            
-            search_sql = """
-                SELECT * FROM books 
-                WHERE title LIKE ? OR author LIKE ? OR series LIKE ?
-                ORDER BY title COLLATE NOCASE
-            """
-            cursor.execute(search_sql, (search_pattern, search_pattern, search_pattern))
-            rows = cursor.fetchall()
+            page_limit = int(limit) if limit else -1
+            page_offset = max(0, int(offset or 0))
+
+            match_expression = build_match_expression(query, columns=fields)
+            rows = None
+            if match_expression and self._has_fts_index(cursor):
+                try:
+                    cursor.execute(
+                        f"""
+                            SELECT books.* FROM {BOOKS_FTS_TABLE}
+                            JOIN books ON books.id = {BOOKS_FTS_TABLE}.rowid
+                            WHERE {BOOKS_FTS_TABLE} MATCH ?
+                            ORDER BY {bm25_order_clause()}, books.title COLLATE NOCASE
+                            LIMIT ? OFFSET ?
+                        """,
+                        (match_expression, page_limit, page_offset)
+                    )
+                    rows = cursor.fetchall()
+                except sqlite3.OperationalError as fts_error:
+                    self.logger.warning("Full-text search failed; using LIKE fallback", extra={
+                        "query": query,
+                        "error": str(fts_error)
+                    })
+                    rows = None
+
+            if rows is None:
+                search_pattern = f"%{query}%"
+                like_columns = [
+                    column for column in (fields or ('title', 'author', 'series'))
+                    if column in BOOKS_FTS_COLUMNS
+                ] or ['title', 'author', 'series']
+                where_clause = " OR ".join(f"{column} LIKE ?" for column in like_columns)
+                search_sql = f"""
+                    SELECT * FROM books 
+                    WHERE {where_clause}
+                    ORDER BY title COLLATE NOCASE
+                    LIMIT ? OFFSET ?
+                """
+                params = [search_pattern] * len(like_columns) + [page_limit, page_offset]
+                cursor.execute(search_sql, params)
+                rows = cursor.fetchall()
             
             columns = ["ID", "Title", "Author", "Series", "Sequence", "Narrator", 
 
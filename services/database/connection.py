@@ -4,7 +4,9 @@ Author: TheDragonShaman
 Created: Aug 26 2025
 Last Modified: Dec 24 2025
 Description:
-    Manages SQLite connections and applies performance pragmas.
+    Manages pooled SQLite connections and applies performance pragmas once per
+    physical connection. Callers keep the existing connect_db()/close()
+    contract; close() hands the connection back to the pool.
 
 Location:
     /services/database/connection.py
@@ -12,40 +14,313 @@ Location:
 """
 
 import sqlite3
-from typing import Tuple
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
 from utils.logger import get_module_logger
 
 
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection whose close() returns it to the owning pool."""
+
+    def close(self):
+        pool = getattr(self, "_pool", None)
+        if pool is None:
+            super().close()
+            return
+        pool.release(self)
+
+    def close_physical(self):
+        """Really close the underlying SQLite handle."""
+        super().close()
+
+
+class ConnectionPool:
+    """Bounded pool of reusable SQLite connections.
+
+    Idle connections are kept LIFO so the hottest handle (warm page cache) is
+    reused first. When every pooled connection is checked out the caller waits
+    up to ``wait_timeout`` seconds; a thread that already holds a connection
+    never waits (nested helpers would otherwise deadlock) and receives an
+    overflow connection that is closed on release instead of pooled.
+    """
+
+    def __init__(
+        self,
+        db_file: str,
+        configure,
+        *,
+        max_size: int = 10,
+        wait_timeout: float = 5.0,
+        health_check_interval: float = 30.0,
+        logger=None,
+    ):
+        self.db_file = db_file
+        self.max_size = max(1, int(max_size))
+        self.wait_timeout = wait_timeout
+        self.health_check_interval = health_check_interval
+        self.logger = logger or get_module_logger("Service.Database.Pool")
+        self._configure = configure
+
+        self._condition = threading.Condition(threading.Lock())
+        self._idle: Deque[Tuple[PooledConnection, float]] = deque()
+        self._open = 0
+        self._closed = False
+        self._held = threading.local()
+
+        self._stats = {
+            "acquired": 0,
+            "reused": 0,
+            "created": 0,
+            "overflow_created": 0,
+            "closed": 0,
+            "health_check_failures": 0,
+            "waits": 0,
+            "wait_time_total_ms": 0.0,
+            "wait_time_max_ms": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Checkout / return
+    # ------------------------------------------------------------------
+    def acquire(self) -> PooledConnection:
+        """Check a connection out of the pool, creating one if needed."""
+        holding = getattr(self._held, "count", 0)
+        conn: Optional[PooledConnection] = None
+        idle_since = 0.0
+        overflow = False
+        waited = 0.0
+
+        with self._condition:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Connection pool has been closed")
+
+            if not self._idle and self._open >= self.max_size and holding == 0:
+                started = time.monotonic()
+                deadline = started + self.wait_timeout
+                while not self._idle and self._open >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                waited = time.monotonic() - started
+                self._record_wait(waited)
+
+            if self._idle:
+                conn, idle_since = self._idle.pop()
+            else:
+                overflow = self._open >= self.max_size
+                self._open += 1
+                self._stats["created"] += 1
+                if overflow:
+                    self._stats["overflow_created"] += 1
+
+        if conn is not None and not self._is_healthy(conn, idle_since):
+            self._discard(conn)
+            conn = None
+            with self._condition:
+                self._open += 1
+                self._stats["created"] += 1
+
+        if conn is None:
+            try:
+                conn = self._create_connection()
+            except Exception:
+                with self._condition:
+                    self._open -= 1
+                    self._condition.notify()
+                raise
+            conn._pool_overflow = overflow
+        else:
+            with self._condition:
+                self._stats["reused"] += 1
+
+        conn._pool_checked_out = True
+        with self._condition:
+            self._stats["acquired"] += 1
+        self._held.count = holding + 1
+
+        if waited > 0.5:
+            self.logger.debug(
+                "Waited for pooled database connection",
+                extra={"wait_ms": round(waited * 1000, 1), "database_file": self.db_file},
+            )
+        return conn
+
+    def release(self, conn: PooledConnection):
+        """Return a connection to the pool; repeated closes are ignored."""
+        if not getattr(conn, "_pool_checked_out", False):
+            return
+        conn._pool_checked_out = False
+        self._held.count = max(0, getattr(self._held, "count", 1) - 1)
+
+        try:
+            # Match sqlite3 close() semantics: uncommitted work is discarded.
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = sqlite3.Row
+        except Exception as exc:
+            self.logger.warning(
+                "Discarding database connection that failed to reset",
+                extra={"error": str(exc), "database_file": self.db_file},
+            )
+            self._discard(conn)
+            return
+
+        with self._condition:
+            keep = (
+                not self._closed
+                and not getattr(conn, "_pool_overflow", False)
+                and len(self._idle) < self.max_size
+            )
+            if keep:
+                self._idle.append((conn, time.monotonic()))
+                self._condition.notify()
+                return
+
+        self._discard(conn)
+
+    # ------------------------------------------------------------------
+    # Lifecycle helpers
+    # ------------------------------------------------------------------
+    def _create_connection(self) -> PooledConnection:
+        conn = sqlite3.connect(
+            self.db_file,
+            timeout=30.0,
+            factory=PooledConnection,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row  # allow dict-style access to columns
+        self._configure(conn)
+        conn._pool = self
+        conn._pool_checked_out = False
+        conn._pool_overflow = False
+        # A caller that drops a connection without closing it must not leak a slot.
+        conn._pool_finalizer = weakref.finalize(conn, self._forget_slot)
+        self.logger.debug(
+            "Database connection established",
+            extra={"database_file": self.db_file},
+        )
+        return conn
+
+    def _is_healthy(self, conn: PooledConnection, idle_since: float) -> bool:
+        if time.monotonic() - idle_since < self.health_check_interval:
+            return True
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except Exception as exc:
+            with self._condition:
+                self._stats["health_check_failures"] += 1
+            self.logger.warning(
+                "Pooled database connection failed health check",
+                extra={"error": str(exc), "database_file": self.db_file},
+            )
+            return False
+
+    def _discard(self, conn: PooledConnection):
+        finalizer = getattr(conn, "_pool_finalizer", None)
+        if finalizer is not None:
+            finalizer.detach()
+        try:
+            conn.close_physical()
+        except Exception:
+            pass
+        with self._condition:
+            self._open = max(0, self._open - 1)
+            self._stats["closed"] += 1
+            self._condition.notify()
+
+    def _forget_slot(self):
+        with self._condition:
+            self._open = max(0, self._open - 1)
+            self._condition.notify()
+
+    def _record_wait(self, waited: float):
+        waited_ms = waited * 1000
+        self._stats["waits"] += 1
+        self._stats["wait_time_total_ms"] += waited_ms
+        if waited_ms > self._stats["wait_time_max_ms"]:
+            self._stats["wait_time_max_ms"] = waited_ms
+
+    def close_all(self):
+        """Close every idle connection and refuse further checkouts."""
+        with self._condition:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+        for conn in idle:
+            self._discard(conn)
+
+    def get_stats(self) -> Dict:
+        """Return reuse and wait-time counters for diagnostics."""
+        with self._condition:
+            stats = dict(self._stats)
+            idle = len(self._idle)
+            open_connections = self._open
+
+        acquired = stats["acquired"]
+        waits = stats["waits"]
+        stats.update({
+            "max_size": self.max_size,
+            "open": open_connections,
+            "idle": idle,
+            "in_use": max(0, open_connections - idle),
+            "reuse_ratio": round(stats["reused"] / acquired, 4) if acquired else 0.0,
+            "wait_time_avg_ms": round(stats["wait_time_total_ms"] / waits, 2) if waits else 0.0,
+            "wait_time_total_ms": round(stats["wait_time_total_ms"], 2),
+            "wait_time_max_ms": round(stats["wait_time_max_ms"], 2),
+        })
+        return stats
+
+
 class DatabaseConnection:
     """Handles database connection management and optimization."""
 
-    def __init__(self, db_file: str, *, logger=None):
+    def __init__(self, db_file: str, *, logger=None, pool_size: int = 10, pool_wait_timeout: float = 5.0):
         self.db_file = db_file
         self.logger = logger or get_module_logger("Service.Database.Connection")
-    
+        self.pool_size = pool_size
+        self.pool_wait_timeout = pool_wait_timeout
+        self._pool_lock = threading.Lock()
+        self._pool: Optional[ConnectionPool] = None
+
+    def _get_pool(self) -> ConnectionPool:
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ConnectionPool(
+                        self.db_file,
+                        self._configure_connection,
+                        max_size=self.pool_size,
+                        wait_timeout=self.pool_wait_timeout,
+                        logger=self.logger,
+                    )
+        return self._pool
+
     def connect_db(self) -> Tuple[sqlite3.Connection, sqlite3.Cursor]:
-        """Connect to the SQLite database with optimized settings for concurrent access."""
+        """Check out a pooled connection; call ``conn.close()`` to return it."""
         try:
-            conn = sqlite3.connect(self.db_file, timeout=30.0)
-            conn.row_factory = sqlite3.Row  # allow dict-style access to columns
-            cursor = conn.cursor()
-            
-            # Optimize for concurrent access
-            self._apply_optimizations(cursor)
-            
-            self.logger.debug(
-                "Database connection established",
-                extra={"database_file": self.db_file},
-            )
-            return conn, cursor
-        
+            conn = self._get_pool().acquire()
+            return conn, conn.cursor()
+
         except Exception as exc:
             self.logger.exception(
                 "Failed to connect to database",
                 extra={"database_file": self.db_file},
             )
             raise
-    
+
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """Apply per-connection pragmas when a physical connection is opened."""
+        cursor = conn.cursor()
+        try:
+            self._apply_optimizations(cursor)
+        finally:
+            cursor.close()
+
     def _apply_optimizations(self, cursor: sqlite3.Cursor):
         """Apply SQLite optimization settings for better performance"""
         optimizations = [
@@ -68,7 +343,21 @@ class DatabaseConnection:
                     "Failed to apply database optimization",
                     extra={"pragma": pragma, "database_file": self.db_file, "error": str(exc)},
                 )
-    
+
+    def get_pool_stats(self) -> Dict:
+        """Return connection pool reuse and wait statistics."""
+        if self._pool is None:
+            return {"max_size": self.pool_size, "open": 0, "idle": 0, "in_use": 0, "acquired": 0}
+        return self._pool.get_stats()
+
+    def close_pool(self):
+        """Close all pooled connections; the next connect_db() builds a fresh pool."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close_all()
+            self.logger.debug("Database connection pool closed", extra={"database_file": self.db_file})
+
     def test_connection(self) -> bool:
         """Test database connection and return success status"""
         try:
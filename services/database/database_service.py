@@ -2,7 +2,7 @@
 Module Name: database_service.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Singleton coordinator for database connection, migrations, and data access
     modules.
@@ -19,6 +19,8 @@ from typing import List, Dict, Optional
 from .author_overrides import AuthorOverrideOperations
 from .audible_library import AudibleLibraryOperations
 from .authors import AuthorOperations
+from .backup import DatabaseBackup
+from .book_authors import BookAuthorOperations
 from .books import BookOperations
 from .connection import DatabaseConnection
 from .migrations import DatabaseMigrations
@@ -62,9 +64,11 @@ class DatabaseService:
         author_overrides: Optional[AuthorOverrideOperations] = None,
         books: Optional[BookOperations] = None,
         authors: Optional[AuthorOperations] = None,
+        book_authors: Optional[BookAuthorOperations] = None,
         audible_library: Optional[AudibleLibraryOperations] = None,
         stats: Optional[DatabaseStats] = None,
         series: Optional[SeriesOperations] = None,
+        backup: Optional[DatabaseBackup] = None,
         **_kwargs,
     ):
         if not self._initialized:
@@ -79,10 +83,17 @@ class DatabaseService:
                     self.migrations = migrations or DatabaseMigrations(self.connection_manager, logger=self.logger)
                     self.author_overrides = author_overrides or AuthorOverrideOperations(self.connection_manager, logger=self.logger)
                     self.books = books or BookOperations(self.connection_manager, self.author_overrides, logger=self.logger)
-                    self.authors = authors or AuthorOperations(self.connection_manager, self.author_overrides, logger=self.logger)
+                    self.book_authors = book_authors or BookAuthorOperations(self.connection_manager, logger=self.logger)
+                    self.authors = authors or AuthorOperations(
+                        self.connection_manager,
+                        self.author_overrides,
+                        logger=self.logger,
+                        book_authors=self.book_authors,
+                    )
                     self.audible_library = audible_library or AudibleLibraryOperations(self.connection_manager, logger=self.logger)
                     self.stats = stats or DatabaseStats(self.connection_manager, logger=self.logger)
                     self.series = series or SeriesOperations(self.connection_manager, self.author_overrides, logger=self.logger)
+                    self.backup = backup or DatabaseBackup(self.connection_manager, logger=self.logger)
 
                     # Initialize database (migrations currently frozen)
                     self._initialize_service()
@@ -111,6 +122,7 @@ class DatabaseService:
         try:
             self.migrations.initialize_database()
             self.migrations.migrate_database()
+            self.book_authors.sync_pending()
             self.logger.success(
                 "Database ready",
                 extra={"database_file": self.db_file, "migrations": "applied"},
@@ -134,6 +146,19 @@ class DatabaseService:
     def get_database_info(self) -> dict:
         """Get database file information."""
         return self.connection_manager.get_database_info()
+
+    # Backup methods (delegate to backup module)
+    def start_backup(self, **options) -> dict:
+        """Start a background online backup job."""
+        return self.backup.start_backup(**options)
+
+    def get_backup_job(self, job_id: str) -> Optional[dict]:
+        """Get the state of a backup job."""
+        return self.backup.get_job(job_id)
+
+    def list_backups(self) -> List[Dict]:
+        """List finished backup files, newest first."""
+        return self.backup.list_backups()
     
     # Book operation methods (delegate to books module)
     def check_book_exists(self, asin: str) -> bool:
@@ -159,6 +184,14 @@ class DatabaseService:
     def get_recent_books(self, limit: int = 6) -> List[Dict]:
         """Get the most recently updated or added books."""
         return self.books.get_recent_books(limit)
+
+    def get_library_status_by_asins(self, asins: List[str]) -> Dict[str, Dict]:
+        """Resolve many ASINs to status/ownership/in_library in one query (cached)."""
+        return self.books.get_library_status_by_asins(asins)
+
+    def invalidate_library_status(self, asins: Optional[List[str]] = None):
+        """Drop cached library status entries after out-of-band book writes."""
+        self.books.invalidate_library_status(asins)
     
     def update_book_status(self, book_id: int, new_status: str) -> bool:
         """Update a book's status."""
@@ -168,9 +201,22 @@ class DatabaseService:
         """Delete a book from the database."""
         return self.books.delete_book(book_id)
     
-    def search_books(self, query: str) -> List[Dict]:
-        """Search books by title, author, or series."""
-        return self.books.search_books(query)
+    def get_books_page(self, *, limit: int = 48, cursor: Optional[str] = None,
+                       sort: Optional[str] = None, direction: Optional[str] = None,
+                       status: Optional[str] = None, search: Optional[str] = None,
+                       genre: Optional[str] = None, projection: str = 'grid',
+                       include_total: bool = False) -> Dict:
+        """Get one keyset-paginated, projected page of books."""
+        return self.books.get_books_page(
+            limit=limit, cursor=cursor, sort=sort, direction=direction,
+            status=status, search=search, genre=genre,
+            projection=projection, include_total=include_total,
+        )
+    
+    def search_books(self, query: str, limit: Optional[int] = None, offset: int = 0,
+                     fields: Optional[List[str]] = None) -> List[Dict]:
+        """Search books with ranked full-text matching (paged when limit is set)."""
+        return self.books.search_books(query, limit=limit, offset=offset, fields=fields)
     
     def get_books_by_status(self, status: str) -> List[Dict]:
         """Get all books with a specific status."""
@@ -185,13 +231,17 @@ class DatabaseService:
         """Get all books by a specific author."""
         return self.authors.get_books_by_author(author)
     
+    def get_books_by_authors(self, authors: Optional[List[str]] = None) -> Dict[str, List[Dict]]:
+        """Get books for many authors in one query, keyed by requested name."""
+        return self.authors.get_books_by_authors(authors)
+    
     def get_author_stats(self, author: str) -> Dict:
         """Get comprehensive statistics for a specific author."""
         return self.authors.get_author_stats(author)
     
-    def search_authors(self, query: str) -> List[str]:
+    def search_authors(self, query: str, match_any: bool = False) -> List[str]:
         """Search authors by name."""
-        return self.authors.search_authors(query)
+        return self.authors.search_authors(query, match_any=match_any)
     
     def get_top_authors_by_book_count(self, limit: int = 10) -> List[Dict]:
         """Get top authors by number of books."""
@@ -206,6 +256,10 @@ class DatabaseService:
         """Get comprehensive library statistics."""
         return self.stats.get_library_stats()
     
+    def get_library_overview(self) -> Dict:
+        """Get per-status counts and total runtime for library headers."""
+        return self.stats.get_library_overview()
+    
     def get_status_distribution(self) -> Dict[str, int]:
         """Get book count by status."""
         return self.stats.get_status_distribution()
@@ -253,6 +307,7 @@ class DatabaseService:
                 'initialized': self._initialized,
                 'database_file': self.db_file,
                 'connection_test': connection_test,
+                'connection_pool': self.connection_manager.get_pool_stats(),
                 'database_info': db_info,
                 'schema_info': schema_info,
                 'recent_activity': recent_stats,
@@ -277,6 +332,7 @@ class DatabaseService:
     def reset_service(self):
         """Reset the service (for testing or troubleshooting)."""
         with self._lock:
+            self.connection_manager.close_pool()
             self.__class__._initialized = False
             self.__class__._instance = None
             self.logger.info("DatabaseService reset")
@@ -0,0 +1,83 @@
+"""
+Module Name: fulltext.py
+Author: TheDragonShaman
+Created: Oct 16 2026
+Last Modified: Oct 16 2026
+Description:
+    Helpers for the books_fts FTS5 index: schema constants and translation of
+    free-text user queries into safe, prefix-aware MATCH expressions.
+
+Location:
+    /services/database/fulltext.py
+
+"""
+
+import re
+from typing import Iterable, List, Optional
+
+BOOKS_FTS_TABLE = "books_fts"
+
+# Indexed columns, in the order bm25() weights are applied.
+BOOKS_FTS_COLUMNS = ("title", "author", "narrator", "series", "summary")
+BOOKS_FTS_WEIGHTS = (10.0, 6.0, 2.0, 4.0, 1.0)
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize_query(query: Optional[str]) -> List[str]:
+    """Split a user query into lower-cased word tokens understood by FTS5."""
+    if not query:
+        return []
+    return [token.lower() for token in _TOKEN_PATTERN.findall(str(query))]
+
+
+def build_match_expression(
+    query: Optional[str],
+    *,
+    columns: Optional[Iterable[str]] = None,
+    match_any: bool = False,
+    prefix: bool = True,
+) -> Optional[str]:
+    """Build an FTS5 MATCH expression, or None when the query has no tokens.
+
+    Every token is quoted so user input can never inject FTS operators; the
+    trailing ``*`` turns each token into a prefix query ("sand" matches
+    "Sanderson"). Tokens are ANDed unless ``match_any`` is set.
+    """
+    tokens = tokenize_query(query)
+    if not tokens:
+        return None
+
+    suffix = "*" if prefix else ""
+    terms = [f'"{token}"{suffix}' for token in tokens]
+    expression = (" OR " if match_any else " ").join(terms)
+
+    if columns:
+        selected = [column for column in columns if column in BOOKS_FTS_COLUMNS]
+        if selected:
+            expression = "{" + " ".join(selected) + "}: (" + expression + ")"
+    return expression
+
+
+def has_books_fts(cursor) -> bool:
+    """Return True when the books_fts index exists in this database."""
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+        (BOOKS_FTS_TABLE,)
+    )
+    return cursor.fetchone() is not None
+
+
+def tokens_match_text(tokens: List[str], text: Optional[str], *, match_any: bool = False) -> bool:
+    """Apply prefix-token semantics of build_match_expression() to plain text."""
+    if not tokens:
+        return False
+    words = tokenize_query(text)
+    hits = (any(word.startswith(token) for word in words) for token in tokens)
+    return any(hits) if match_any else all(hits)
+
+
+def bm25_order_clause() -> str:
+    """Return the weighted bm25() ranking expression for books_fts."""
+    weights = ", ".join(str(weight) for weight in BOOKS_FTS_WEIGHTS)
+    return f"bm25({BOOKS_FTS_TABLE}, {weights})"
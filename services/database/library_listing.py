@@ -0,0 +1,176 @@
+"""
+Module Name: library_listing.py
+Author: TheDragonShaman
+Created: Oct 16 2026
+Last Modified: Oct 16 2026
+Description:
+    SQL building blocks for the paginated library listing: column
+    projections, keyset sort definitions, opaque page cursors and SQL
+    expressions for derived values (status key, genre).
+
+Location:
+    /services/database/library_listing.py
+
+"""
+
+import base64
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_PAGE_SIZE = 48
+MAX_PAGE_SIZE = 200
+
+# (column SQL, result key) pairs; keys match get_all_books() so the same
+# formatting helpers work on listing rows.
+_BASE_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("id", "ID"),
+    ("title", "Title"),
+    ("author", "Author"),
+    ("series", "Series"),
+    ("sequence", "Sequence"),
+    ("narrator", "Narrator"),
+    ("runtime", "Runtime"),
+    ("release_date", "Release Date"),
+    ("language", "Language"),
+    ("publisher", "Publisher"),
+    ("overall_rating", "Overall Rating"),
+    ("num_ratings", "num_ratings"),
+    ("status", "Status"),
+    ("asin", "ASIN"),
+    ("cover_image", "Cover Image"),
+    ("source", "source"),
+    ("ownership_status", "ownership_status"),
+    ("file_path", "file_path"),
+    ("created_at", "Created At"),
+)
+
+# Grid cards never show the summary, so it is only read for 'full'
+PROJECTIONS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "grid": _BASE_COLUMNS,
+    "full": _BASE_COLUMNS + (("summary", "Summary"),),
+}
+
+# Ordered genre rules (first match wins), shared with routes.library
+GENRE_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("science", ("science", "physics", "biology", "chemistry")),
+    ("history", ("history", "historical", "ancient", "medieval")),
+    ("biography", ("biography", "memoir", "life of")),
+    ("self-help", ("self-help", "productivity", "habits", "success")),
+    ("fiction", ("novel", "story", "tale", "adventure")),
+)
+DEFAULT_GENRE = "non-fiction"
+UNKNOWN_GENRE = "unknown"
+
+STATUS_KEY_SQL = "lower(COALESCE(NULLIF(ownership_status, ''), status, 'unknown'))"
+
+
+def genre_sql(column: str = "summary") -> str:
+    """SQL CASE expression equivalent to routes.library.get_genre_from_summary()."""
+    lowered = f"lower({column})"
+    branches = [f"WHEN COALESCE({column}, '') = '' THEN '{UNKNOWN_GENRE}'"]
+    for genre, words in GENRE_KEYWORDS:
+        tests = " OR ".join(f"instr({lowered}, '{word}') > 0" for word in words)
+        branches.append(f"WHEN {tests} THEN '{genre}'")
+    return "CASE " + " ".join(branches) + f" ELSE '{DEFAULT_GENRE}' END"
+
+
+# sort name -> (SQL expression, default direction); every sort is keyed on
+# (expression, id) so pages are stable across equal values.
+SORTS: Dict[str, Tuple[str, str]] = {
+    "title": ("title COLLATE NOCASE", "asc"),
+    "author": ("COALESCE(author, '') COLLATE NOCASE", "asc"),
+    "rating": ("COALESCE(rating_value, 0.0)", "desc"),
+    "date": ("COALESCE(created_at, '')", "desc"),
+}
+DEFAULT_SORT = "title"
+
+
+def resolve_sort(sort: Optional[str], direction: Optional[str]) -> Tuple[str, str, str]:
+    """Return (sort name, SQL expression, 'asc'|'desc') with fallbacks."""
+    name = (sort or "").strip().lower()
+    if name not in SORTS:
+        name = DEFAULT_SORT
+    expression, default_direction = SORTS[name]
+    chosen = (direction or "").strip().lower()
+    if chosen not in ("asc", "desc"):
+        chosen = default_direction
+    return name, expression, chosen
+
+
+def clamp_page_size(limit: Any) -> int:
+    """Coerce a requested page size into [1, MAX_PAGE_SIZE]."""
+    try:
+        value = int(limit)
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(MAX_PAGE_SIZE, value))
+
+
+def escape_like(term: str) -> str:
+    """Escape LIKE wildcards so user text matches literally (ESCAPE '\\')."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def encode_cursor(sort: str, direction: str, sort_value: Any, row_id: int) -> str:
+    """Pack the last row's sort key into an opaque URL-safe cursor."""
+    payload = json.dumps([sort, direction, sort_value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], sort: str, direction: str) -> Optional[Tuple[Any, int]]:
+    """Unpack a cursor; returns None when missing, malformed or for another sort."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        decoded = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        cursor_sort, cursor_direction, sort_value, row_id = decoded
+    except (ValueError, TypeError):
+        return None
+    if cursor_sort != sort or cursor_direction != direction:
+        return None
+    return sort_value, int(row_id)
+
+
+def build_select_list(projection: Optional[str]) -> Tuple[str, List[str]]:
+    """Return the SELECT column list and result keys for a projection."""
+    columns = PROJECTIONS.get((projection or "grid").lower(), PROJECTIONS["grid"])
+    select = [column for column, _ in columns]
+    keys = [key for _, key in columns]
+    select.append(f"{genre_sql()} AS genre")
+    keys.append("genre")
+    return ", ".join(select), keys
+
+
+def build_filters(status: Optional[str] = None, search: Optional[str] = None,
+                  genre: Optional[str] = None) -> Tuple[List[str], List[Any]]:
+    """Translate listing filters into WHERE clauses and parameters."""
+    clauses: List[str] = []
+    params: List[Any] = []
+    if status:
+        clauses.append(f"{STATUS_KEY_SQL} = ?")
+        params.append(status.strip().lower())
+    if genre:
+        clauses.append(f"({genre_sql()}) = ?")
+        params.append(genre.strip().lower())
+    term = (search or "").strip().lower()
+    if term:
+        pattern = f"%{escape_like(term)}%"
+        clauses.append(
+            "(lower(title) LIKE ? ESCAPE '\\' OR lower(COALESCE(author, '')) LIKE ? ESCAPE '\\' "
+            "OR lower(COALESCE(series, '')) LIKE ? ESCAPE '\\')"
+        )
+        params.extend([pattern, pattern, pattern])
+    return clauses, params
+
+
+def keyset_clause(expression: str, direction: str) -> str:
+    """WHERE fragment selecting rows after the cursor position."""
+    comparison = ">" if direction == "asc" else "<"
+    return f"({expression} {comparison} ? OR ({expression} = ? AND id {comparison} ?))"
+
+
+def order_clause(expression: str, direction: str) -> str:
+    keyword = "ASC" if direction == "asc" else "DESC"
+    return f"ORDER BY {expression} {keyword}, id {keyword}"
+
@@ -2,7 +2,7 @@
 Module Name: migrations.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Initializes and migrates the SQLite schema for AuralArchive.
     Migrations are frozen; initialization is a no-op aside from connectivity
@@ -13,9 +13,12 @@ Location:
 
 """
 
+import sqlite3
 from typing import TYPE_CHECKING
 
 from utils.logger import get_module_logger
+from .book_metrics import METRIC_COLUMNS, METRIC_SOURCE_COLUMNS, metrics_assignment_sql
+from .fulltext import BOOKS_FTS_COLUMNS, BOOKS_FTS_TABLE
 
 if TYPE_CHECKING:
     from .connection import DatabaseConnection
@@ -181,6 +184,7 @@ class DatabaseMigrations:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_download_queue_asin ON download_queue(book_asin)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_download_queue_queued_at ON download_queue(queued_at)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_download_queue_client_id ON download_queue(download_client_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_download_queue_updated_at ON download_queue(updated_at, id)')
         
         self.logger.debug("Download queue table created or verified")
 
@@ -301,6 +305,183 @@ class DatabaseMigrations:
         cursor.execute(create_table_sql)
         self.logger.debug("Audible library table created or verified")
 
+    def _create_books_fts(self, cursor) -> bool:
+        """Create the books_fts FTS5 index and the triggers that keep it in sync.
+
+        The index uses external content (the books table itself), so it stores
+        only the inverted index. Returns True when the index was newly built.
+        """
+        columns = ", ".join(BOOKS_FTS_COLUMNS)
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
+            (BOOKS_FTS_TABLE,)
+        )
+        created = cursor.fetchone() is None
+
+        cursor.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {BOOKS_FTS_TABLE} USING fts5(
+                {columns},
+                content='books',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='2 3'
+            )
+        """)
+
+        new_values = ", ".join(f"new.{column}" for column in BOOKS_FTS_COLUMNS)
+        old_values = ", ".join(f"old.{column}" for column in BOOKS_FTS_COLUMNS)
+
+        # Always drop and recreate triggers to ensure latest logic
+        for trigger in ("books_fts_ai", "books_fts_ad", "books_fts_au"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+        cursor.execute(f"""
+            CREATE TRIGGER books_fts_ai AFTER INSERT ON books BEGIN
+                INSERT INTO {BOOKS_FTS_TABLE}(rowid, {columns})
+                VALUES (new.id, {new_values});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER books_fts_ad AFTER DELETE ON books BEGIN
+                INSERT INTO {BOOKS_FTS_TABLE}({BOOKS_FTS_TABLE}, rowid, {columns})
+                VALUES ('delete', old.id, {old_values});
+            END
+        """)
+        # Only indexed columns re-tokenize; status/progress updates skip the index.
+        cursor.execute(f"""
+            CREATE TRIGGER books_fts_au AFTER UPDATE OF {columns} ON books BEGIN
+                INSERT INTO {BOOKS_FTS_TABLE}({BOOKS_FTS_TABLE}, rowid, {columns})
+                VALUES ('delete', old.id, {old_values});
+                INSERT INTO {BOOKS_FTS_TABLE}(rowid, {columns})
+                VALUES (new.id, {new_values});
+            END
+        """)
+
+        if created:
+            cursor.execute(f"INSERT INTO {BOOKS_FTS_TABLE}({BOOKS_FTS_TABLE}) VALUES ('rebuild')")
+            self.logger.info("Built books full-text search index")
+        else:
+            self.logger.debug("Books full-text search index verified")
+        return created
+
+    def _create_book_authors_table(self, cursor) -> bool:
+        """Create the normalized book_authors table and its sync triggers.
+
+        Rows are written from Python (author splitting and override
+        resolution); triggers on books only queue affected ids in
+        book_authors_pending so every writer is picked up. Returns True when
+        the table was newly created and all books were queued for backfill.
+        """
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='book_authors'")
+        created = cursor.fetchone() is None
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS book_authors (
+                book_id INTEGER NOT NULL,
+                author_name_normalized TEXT NOT NULL,
+                display_name TEXT NOT NULL,
+                source_name TEXT,
+                position INTEGER DEFAULT 0,
+                PRIMARY KEY (book_id, author_name_normalized)
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_book_authors_name
+            ON book_authors(author_name_normalized, book_id)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_book_authors_source_name
+            ON book_authors(source_name COLLATE NOCASE)
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS book_authors_pending (
+                book_id INTEGER PRIMARY KEY
+            )
+        """)
+
+        # Always drop and recreate triggers to ensure latest logic
+        for trigger in ("book_authors_ai", "book_authors_au", "book_authors_ad"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+        cursor.execute("""
+            CREATE TRIGGER book_authors_ai AFTER INSERT ON books BEGIN
+                INSERT OR IGNORE INTO book_authors_pending(book_id) VALUES (new.id);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER book_authors_au AFTER UPDATE OF author, asin ON books BEGIN
+                INSERT OR IGNORE INTO book_authors_pending(book_id) VALUES (new.id);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER book_authors_ad AFTER DELETE ON books BEGIN
+                DELETE FROM book_authors WHERE book_id = old.id;
+                DELETE FROM book_authors_pending WHERE book_id = old.id;
+            END
+        """)
+
+        if created:
+            cursor.execute("INSERT OR IGNORE INTO book_authors_pending(book_id) SELECT id FROM books")
+            self.logger.info("Created book_authors table; queued existing books for backfill")
+        return created
+
+    def _create_book_metrics_columns(self, cursor) -> bool:
+        """Add the normalized runtime/rating/year columns, indexes and triggers.
+
+        Writers going through BookOperations fill the columns directly; the
+        triggers keep raw SQL writers (and source-column updates) consistent.
+        Returns True when columns were added and existing rows backfilled.
+        """
+        cursor.execute("PRAGMA table_info(books)")
+        existing_columns = {column[1] for column in cursor.fetchall()}
+
+        column_types = {
+            'runtime_minutes': 'INTEGER',
+            'rating_value': 'REAL',
+            'release_year': 'INTEGER',
+        }
+        added = 0
+        for column_name in METRIC_COLUMNS:
+            if column_name not in existing_columns:
+                cursor.execute(f"ALTER TABLE books ADD COLUMN {column_name} {column_types[column_name]}")
+                added += 1
+                self.logger.info(f"Added metric column '{column_name}' to books table")
+
+        if added:
+            cursor.execute(f"UPDATE books SET {metrics_assignment_sql()}")
+            self.logger.info(f"Backfilled book metric columns for {cursor.rowcount} books")
+
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_runtime_minutes ON books(runtime_minutes)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_rating_value ON books(rating_value)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_release_year ON books(release_year)")
+        # Keyset index for the rating sort (must match library_listing.SORTS)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_books_rating_sort
+            ON books(COALESCE(rating_value, 0.0), id)
+        """)
+
+        sources = ", ".join(METRIC_SOURCE_COLUMNS)
+        changed = " OR ".join(f"new.{column} IS NOT old.{column}" for column in METRIC_SOURCE_COLUMNS)
+        unset = " AND ".join(f"new.{column} IS NULL" for column in METRIC_COLUMNS)
+
+        # Always drop and recreate triggers to ensure latest logic
+        for trigger in ("books_metrics_ai", "books_metrics_au"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+        cursor.execute(f"""
+            CREATE TRIGGER books_metrics_ai AFTER INSERT ON books
+            WHEN {unset} BEGIN
+                UPDATE books SET {metrics_assignment_sql()} WHERE id = new.id;
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER books_metrics_au AFTER UPDATE OF {sources} ON books
+            WHEN {changed} BEGIN
+                UPDATE books SET {metrics_assignment_sql()} WHERE id = new.id;
+            END
+        """)
+        return added > 0
+
     def _seed_default_author_overrides(self, cursor):
         """Insert curated overrides to keep metadata consistent."""
         defaults = [
@@ -705,6 +886,37 @@ class DatabaseMigrations:
                 ON download_queue(download_type)
             """)
             
+            # Migration 13: Full-text search index over books
+            try:
+                if self._create_books_fts(cursor):
+                    migrations_applied += 1
+            except sqlite3.OperationalError as e:
+                # SQLite builds without FTS5 fall back to LIKE-based search
+                self.logger.warning(f"Could not create books full-text index: {e}")
+            
+            # Migration 14: Normalized book/author pairs for indexed author lookups
+            if self._create_book_authors_table(cursor):
+                migrations_applied += 1
+
+            # Migration 15: Keyset indexes for the paginated library listing
+            # (expressions must match library_listing.SORTS exactly)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_books_title_nocase
+                ON books(title COLLATE NOCASE, id)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_books_author_nocase
+                ON books(COALESCE(author, '') COLLATE NOCASE, id)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_books_created_at
+                ON books(COALESCE(created_at, ''), id)
+            """)
+
+            # Migration 16: Normalized runtime_minutes / rating_value / release_year
+            if self._create_book_metrics_columns(cursor):
+                migrations_applied += 1
+
             if migrations_applied > 0:
                 conn.commit()
                 self.logger.info(f"Applied {migrations_applied} database migrations")
@@ -2,7 +2,7 @@
 Module Name: stats.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Provides analytics and aggregation helpers for the database.
 
@@ -13,6 +13,7 @@ Location:
 
 from typing import Dict, TYPE_CHECKING
 from .error_handling import error_handler
+from .library_listing import STATUS_KEY_SQL, genre_sql
 from utils.logger import get_module_logger
 
 if TYPE_CHECKING:
@@ -27,104 +28,111 @@ class DatabaseStats:
         self.logger = logger or get_module_logger("Service.Database.Stats")
     
     def get_library_stats(self) -> Dict:
-        """Get comprehensive library statistics."""
+        """Get comprehensive library statistics (aggregate SQL over metric columns)."""
         conn = None
         try:
             conn, cursor = self.connection_manager.connect_db()
-            
-            # Get all books for analysis
-            cursor.execute("SELECT * FROM books")
-            books = cursor.fetchall()
-            
+
+            cursor.execute("""
+                SELECT COUNT(*),
+                       COUNT(DISTINCT NULLIF(author, '')),
+                       COUNT(DISTINCT CASE WHEN series != 'N/A' AND series != '' THEN series END),
+                       COALESCE(SUM(runtime_minutes), 0),
+                       AVG(rating_value),
+                       SUM(CASE WHEN COALESCE(summary, '') = '' OR COALESCE(cover_image, '') = ''
+                                  OR COALESCE(asin, '') = '' THEN 1 ELSE 0 END)
+                FROM books
+            """)
+            total_books, total_authors, total_series, runtime_minutes, average_rating, missing_metadata = cursor.fetchone()
+
+            cursor.execute("SELECT COALESCE(NULLIF(status, ''), 'Unknown'), COUNT(*) FROM books GROUP BY 1")
+            by_status = {row[0]: row[1] for row in cursor.fetchall()}
+
+            cursor.execute("SELECT COALESCE(NULLIF(language, ''), 'Unknown'), COUNT(*) FROM books GROUP BY 1")
+            by_language = {row[0]: row[1] for row in cursor.fetchall()}
+
+            cursor.execute(f"SELECT {genre_sql()} AS genre, COUNT(*) FROM books GROUP BY genre")
+            by_genre = {row[0]: row[1] for row in cursor.fetchall()}
+
+            cursor.execute("""
+                SELECT CAST(rating_value AS INTEGER) AS bucket, COUNT(*)
+                FROM books
+                WHERE rating_value IS NOT NULL
+                GROUP BY bucket
+                ORDER BY bucket
+            """)
+            rating_distribution = {f"{bucket}-{bucket + 1}": count for bucket, count in cursor.fetchall()}
+
             stats = {
-                'total_books': len(books),
-                'by_status': {},
-                'by_language': {},
-                'total_runtime_hours': 0,
-                'total_authors': 0,
-                'total_series': 0,
-                'average_rating': 0,
-                'rating_distribution': {},
+                'total_books': total_books,
+                'by_status': by_status,
+                'by_language': by_language,
+                'by_genre': by_genre,
+                'total_runtime_minutes': runtime_minutes,
+                'total_runtime_hours': round(runtime_minutes / 60, 1),
+                'total_authors': total_authors,
+                'total_series': total_series,
+                'average_rating': round(average_rating, 2) if average_rating is not None else 0,
+                'rating_distribution': rating_distribution,
+                'missing_metadata_count': missing_metadata or 0,
                 'recent_additions': 0,
                 'completion_stats': {}
             }
-            
-            # Process each book
-            total_rating = 0
-            rated_books = 0
-            authors = set()
-            series = set()
-            runtime_minutes = 0
-            
-            for book in books:
-                # Status distribution
-                status = book[12] or 'Unknown'  # status column
-                stats['by_status'][status] = stats['by_status'].get(status, 0) + 1
-                
-                # Language distribution
-                language = book[8] or 'Unknown'  # language column
-                stats['by_language'][language] = stats['by_language'].get(language, 0) + 1
-                
-                # Authors tracking
-                if book[2]:  # author column
-                    authors.add(book[2])
-                
-                # Series tracking
-                if book[3] and book[3] != 'N/A':  # series column
-                    series.add(book[3])
-                
-                # Runtime calculation
-                runtime = book[6]  # runtime column
-                if runtime:
-                    try:
-                        if 'hrs' in runtime:
-                            parts = runtime.split(' hrs')
-                            hours = int(parts[0])
-                            minutes = 0
-                            if len(parts) > 1 and 'mins' in parts[1]:
-                                minutes = int(parts[1].split(' mins')[0].strip())
-                            runtime_minutes += hours * 60 + minutes
-                    except:
-                        pass
-                
-                # Rating calculation
-                rating = book[10]  # overall_rating column
-                if rating and rating != 'N/A':
-                    try:
-                        rating_val = float(rating)
-                        total_rating += rating_val
-                        rated_books += 1
-                        
-                        # Rating distribution
-                        rating_range = f"{int(rating_val)}-{int(rating_val)+1}"
-                        stats['rating_distribution'][rating_range] = stats['rating_distribution'].get(rating_range, 0) + 1
-                    except:
-                        pass
-            
-            # Calculate final stats
-            stats['total_authors'] = len(authors)
-            stats['total_series'] = len(series)
-            stats['total_runtime_hours'] = round(runtime_minutes / 60, 1)
-            stats['average_rating'] = round(total_rating / rated_books, 2) if rated_books > 0 else 0
-            
+
             # Calculate completion stats
-            owned_books = stats['by_status'].get('Owned', 0)
-            wanted_books = stats['by_status'].get('Wanted', 0)
-            downloading_books = stats['by_status'].get('Downloading', 0)
-            
+            owned_books = by_status.get('Owned', 0)
+            wanted_books = by_status.get('Wanted', 0)
+            downloading_books = by_status.get('Downloading', 0)
+
             stats['completion_stats'] = {
-                'owned_percentage': round((owned_books / len(books)) * 100, 1) if books else 0,
-                'wanted_percentage': round((wanted_books / len(books)) * 100, 1) if books else 0,
-                'downloading_percentage': round((downloading_books / len(books)) * 100, 1) if books else 0
+                'owned_percentage': round((owned_books / total_books) * 100, 1) if total_books else 0,
+                'wanted_percentage': round((wanted_books / total_books) * 100, 1) if total_books else 0,
+                'downloading_percentage': round((downloading_books / total_books) * 100, 1) if total_books else 0
             }
-            
-            self.logger.debug(f"Calculated library stats: {len(books)} total books")
+
+            self.logger.debug(f"Calculated library stats: {total_books} total books")
             return stats
-        
+
         except Exception as e:
             self.logger.error(f"Error calculating library stats: {e}")
             return {'error': str(e)}
-        
+
+        finally:
+            error_handler.handle_connection_cleanup(conn)
+    
+    def get_library_overview(self) -> Dict:
+        """Header totals for library views: count per status key and total runtime."""
+        conn = None
+        try:
+            conn, cursor = self.connection_manager.connect_db()
+            cursor.execute(f"""
+                SELECT {STATUS_KEY_SQL} AS status_key,
+                       COUNT(*),
+                       SUM(runtime_minutes)
+                FROM books
+                GROUP BY status_key
+            """)
+            by_status = {}
+            total_books = 0
+            total_minutes = 0
+            for status_key, count, minutes in cursor.fetchall():
+                by_status[status_key] = count
+                total_books += count
+                total_minutes += minutes or 0
+
+            overview = {
+                'total_books': total_books,
+                'by_status': by_status,
+                'total_runtime_minutes': total_minutes,
+                'total_runtime_hours': round(total_minutes / 60, 1),
+            }
+            self.logger.debug(f"Library overview: {total_books} books, {total_minutes} minutes")
+            return overview
+
+        except Exception as e:
+            self.logger.error(f"Error getting library overview: {e}")
+            return {'total_books': 0, 'by_status': {}, 'total_runtime_minutes': 0, 'total_runtime_hours': 0}
+
         finally:
             error_handler.handle_connection_cleanup(conn)
     
@@ -148,6 +148,32 @@ class BaseTorrentClient(ABC):
         """
         pass
     
+    def get_statuses(self, torrent_hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get status for many torrents at once.
+        
+        Clients that can query several torrents per request should override
+        this; the default falls back to one get_status() call per hash.
+        
+        Args:
+            torrent_hashes: Hashes of the torrents to poll
+            
+        Returns:
+            Dictionary mapping lower-cased hash to a get_status() record.
+            Torrents the client does not know about are omitted.
+        """
+        statuses: Dict[str, Dict[str, Any]] = {}
+        for torrent_hash in torrent_hashes:
+            if not torrent_hash:
+                continue
+            try:
+                status = self.get_status(torrent_hash)
+            except ValueError:
+                continue
+            if status:
+                statuses[str(torrent_hash).lower()] = status
+        return statuses
+    
     @abstractmethod
     def get_all_torrents(self, filter_state: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -53,6 +53,8 @@ class QBittorrentClient(BaseTorrentClient):
 	LOGIN_CACHE_SECONDS = 30
 	NEW_TORRENT_POLL_ATTEMPTS = 8
 	NEW_TORRENT_POLL_INTERVAL = 1.0
+	# Hashes per torrents/info request; keeps the query string well under URL limits.
+	STATUS_BATCH_SIZE = 200
 
 	STATE_MAP: Dict[str, TorrentState] = {
 		"pausedDL": TorrentState.PAUSED,
@@ -232,6 +234,19 @@ class QBittorrentClient(BaseTorrentClient):
 			raise ValueError(f"Torrent {torrent_hash} not found")
 		return self._build_torrent_record(torrents[0])
 
+	def get_statuses(self, torrent_hashes: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+		"""Poll many torrents with one ``torrents/info`` request per chunk of hashes."""
+		hashes = list(dict.fromkeys(str(value).lower() for value in torrent_hashes if value))
+		statuses: Dict[str, Dict[str, Any]] = {}
+		for start in range(0, len(hashes), self.STATUS_BATCH_SIZE):
+			chunk = hashes[start:start + self.STATUS_BATCH_SIZE]
+			torrents = self._request_json("torrents/info", params={"hashes": "|".join(chunk)}) or []
+			for item in torrents:
+				torrent_hash = str(item.get("hash") or "").lower()
+				if torrent_hash:
+					statuses[torrent_hash] = self._build_torrent_record(item)
+		return statuses
+
 	def get_torrent_info(self, torrent_hash: str) -> Dict[str, Any]:
 		"""Alias used by legacy cleanup/seeding flows."""
 		return self.get_status(torrent_hash)
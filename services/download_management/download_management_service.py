@@ -2,7 +2,7 @@
 Module Name: download_management_service.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Singleton coordinator for the full download pipeline and client orchestration.
     Manages queueing, monitoring, conversion, import, and seeding workflows
@@ -23,6 +23,8 @@ Features:
     - Seeding support for torrent clients
     - Configurable retry logic
     - Real-time progress monitoring
+    - Bounded per-stage worker pools (search, conversion, import)
+    - Coalesced progress events (download:progress_batch)
 
 Download Clients:
     - Currently supported: qBittorrent (torrents/magnets)
@@ -51,8 +53,15 @@ from services.audible.ownership_validator import (
     merge_audible_records,
 )
 
+from .progress_coalescer import DEFAULT_FLUSH_HZ, get_progress_coalescer
+
 _LOGGER = get_module_logger("Service.DownloadManagement.Service")
 
+# Every Nth pipeline sweep re-reads every stage-feeding row; the sweeps in
+# between only read rows written since the change cursor
+PIPELINE_FULL_SWEEP_EVERY = 10
+PIPELINE_STAGE_STATUSES = ('QUEUED', 'FOUND', 'COMPLETE', 'CONVERTED')
+
 
 class DownloadManagementService:
     """
@@ -104,6 +113,7 @@ class DownloadManagementService:
                     from .retry_handler import RetryHandler
                     from .cleanup_manager import CleanupManager
                     from .event_emitter import EventEmitter
+                    from .pipeline_dispatcher import PipelineDispatcher
                     
                     self.queue_manager = QueueManager()
                     self.state_machine = StateMachine()
@@ -115,6 +125,11 @@ class DownloadManagementService:
                     self.event_emitter = EventEmitter()
                     self.event_emitter.attach_lookup(self.queue_manager.get_download)
 
+                    # Stage queues fed by queue status changes (QUEUED → search, ...)
+                    self.pipeline_dispatcher = PipelineDispatcher()
+                    self._register_pipeline_stages()
+                    QueueManager.add_status_listener(self._on_queue_status_changed)
+
                     # Track active Audible downloads for cooperative cancellation
                     self._audible_context_lock = threading.Lock()
                     self._audible_download_context: Dict[int, Dict[str, Any]] = {}
@@ -131,6 +146,9 @@ class DownloadManagementService:
                     
                     # Configuration
                     self.polling_interval = 2  # seconds
+                    self.pipeline_sweep_interval = 60  # seconds between stage queue reconciliations
+                    self._pipeline_cursor = None  # QueueManager change cursor for reconciliation sweeps
+                    self._pipeline_sweeps = 0  # full sweep when a multiple of PIPELINE_FULL_SWEEP_EVERY
                     self.monitor_running = False
                     self.monitor_thread = None
                     self._monitor_lock = threading.Lock()
@@ -173,6 +191,9 @@ class DownloadManagementService:
                     self.auto_process_queue = True
                     self.queue_priority_default = 5
                     self.max_active_searches = 2
+                    self.conversion_workers = os.cpu_count() or 1
+                    self.import_workers = 2
+                    self.progress_flush_hz = DEFAULT_FLUSH_HZ
                     self.temp_failed_path = '/tmp/auralarchive/failed'
                     self.direct_provider_sessions: Dict[str, Dict[str, str]] = {}
                     
@@ -188,6 +209,7 @@ class DownloadManagementService:
             # Load configuration from config.txt
             self._load_configuration()
             self._configure_audible_concurrency()
+            self._configure_stage_pools()
             # Ensure the monitoring loop is running regardless of startup entrypoint
             self._ensure_monitor_running()
             self.logger.debug("Download management service ready")
@@ -228,11 +250,20 @@ class DownloadManagementService:
                 monitoring_raw = dm_config.get('monitoring_interval', dm_config.get('polling_interval_seconds', self.polling_interval))
                 monitoring_value = _coerce_int(monitoring_raw, self.polling_interval)
                 self.polling_interval = max(1, monitoring_value)
+                self.pipeline_sweep_interval = max(5, _coerce_int(dm_config.get('pipeline_sweep_interval', self.pipeline_sweep_interval), self.pipeline_sweep_interval))
                 self.auto_start_monitoring = _coerce_bool(dm_config.get('auto_start_monitoring', self.auto_start_monitoring), self.auto_start_monitoring)
                 self.monitor_seeding_enabled = _coerce_bool(dm_config.get('monitor_seeding', self.monitor_seeding_enabled), self.monitor_seeding_enabled)
                 self.max_concurrent_downloads = _coerce_int(dm_config.get('max_concurrent_downloads', self.max_concurrent_downloads), self.max_concurrent_downloads)
                 self.queue_priority_default = _coerce_int(dm_config.get('queue_priority_default', self.queue_priority_default), self.queue_priority_default)
                 self.max_active_searches = max(1, _coerce_int(dm_config.get('max_active_searches', self.max_active_searches), self.max_active_searches))
+                self.conversion_workers = max(1, _coerce_int(dm_config.get('conversion_workers', self.conversion_workers), self.conversion_workers))
+                self.import_workers = max(1, _coerce_int(dm_config.get('import_workers', self.import_workers), self.import_workers))
+                try:
+                    flush_hz = float(dm_config.get('progress_flush_hz', self.progress_flush_hz))
+                except (TypeError, ValueError):
+                    flush_hz = self.progress_flush_hz
+                get_progress_coalescer().set_flush_rate(flush_hz)
+                self.progress_flush_hz = get_progress_coalescer().flush_hz
 
                 # Configurable paths (user can override auto-detected paths in config.txt)
                 # Priority: config.txt > environment variables > auto-detection
@@ -557,6 +588,7 @@ class DownloadManagementService:
                 self.logger.debug("Reloading download management configuration...")
                 self._load_configuration()
                 self._configure_audible_concurrency()
+                self._configure_stage_pools()
 
                 if self.auto_start_monitoring:
                     self._ensure_monitor_running()
@@ -746,6 +778,27 @@ class DownloadManagementService:
         
         return all_items
 
+    def get_queue_snapshot(self, statuses: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get queue items for several statuses in one query, grouped by status.
+        
+        Args:
+            statuses: Statuses to include; defaults to every non-terminal status
+        
+        Returns:
+            Dictionary of status -> download queue items
+        """
+        snapshot = self.queue_manager.get_queue_snapshot(statuses)
+
+        try:
+            seeding_items = snapshot.get('SEEDING')
+            if seeding_items:
+                self._overlay_seeding_metrics(seeding_items, self.client_selector.get_client)
+        except Exception as overlay_error:
+            self.logger.debug("Unable to overlay seeding metrics: %s", overlay_error)
+
+        return snapshot
+
     @staticmethod
     def _overlay_seeding_metrics(items: List[Dict[str, Any]], resolver) -> List[Dict[str, Any]]:
         """Overlay live seeding metrics from the download client onto queue items.
@@ -1045,6 +1098,8 @@ class DownloadManagementService:
 
             self.logger.debug("Starting download monitor thread...")
             self.monitor_running = True
+            self._pipeline_sweeps = 0
+            self.pipeline_dispatcher.start()
             self.monitor_thread = threading.Thread(
                 target=self._monitor_loop,
                 name="DownloadMonitor",
@@ -1059,6 +1114,7 @@ class DownloadManagementService:
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
             self.monitor_thread = None
+        self.pipeline_dispatcher.stop()
     
     @property
     def monitoring_active(self) -> bool:
@@ -1101,21 +1157,33 @@ class DownloadManagementService:
             self.logger.debug("Audible download %s context cleared", download_id)
 
     def _monitor_loop(self):
-        """Main monitoring loop - runs continuously."""
+        """Main monitoring loop - polls download clients continuously.
+        
+        Stage handoffs (search, download start, conversion, import) are driven
+        by status events through the pipeline dispatcher; this loop only polls
+        external client progress and periodically reconciles the stage queues.
+        """
         import time
         
         self.logger.debug("Download monitor thread started")
+        last_sweep = 0.0
         
         while self.monitor_running:
             try:
-                # Process queue - move QUEUED items to next stage
-                self._process_queue()
+                # Pick up rows changed outside QueueManager or before startup
+                now = time.monotonic()
+                if now - last_sweep >= self.pipeline_sweep_interval:
+                    self._reconcile_pipeline()
+                    last_sweep = now
+                
+                # One queue read per tick for everything the download clients report on
+                snapshot = self.queue_manager.get_queue_snapshot(('DOWNLOADING', 'SEEDING'))
                 
                 # Monitor active downloads
-                self._monitor_downloads()
+                self._monitor_downloads(snapshot['DOWNLOADING'])
                 
-                # Process completed downloads
-                self._process_pipeline()
+                # Monitor or finalize seeding torrents
+                self._monitor_seeding(snapshot['SEEDING'])
                 
                 # Sleep until next poll
                 time.sleep(self.polling_interval)
@@ -1131,195 +1199,265 @@ class DownloadManagementService:
         if not self.monitor_running:
             self.start_monitoring()
 
-    def _is_retry_ready(self, download: Dict[str, Any]) -> bool:
-        """Return True when the download is eligible for another retry attempt."""
+    def _retry_delay_seconds(self, download: Dict[str, Any]) -> float:
+        """Seconds until next_retry_at, or 0 when the download may run now."""
         next_retry_at = download.get('next_retry_at')
         if not next_retry_at:
-            return True
+            return 0.0
 
         try:
             retry_time = datetime.fromisoformat(next_retry_at)
         except ValueError:
-            return True
+            return 0.0
 
-        return retry_time <= datetime.utcnow()
-    
-    def _process_queue(self):
-        """Process queued items - transition QUEUED → SEARCHING/FOUND → DOWNLOADING."""
-        queued_items = self.queue_manager.get_queue(status_filter='QUEUED')
-        active_searches = self._count_active_searches()
+        return max(0.0, (retry_time - datetime.utcnow()).total_seconds())
 
-        for item in queued_items:
-            try:
-                if not self._is_retry_ready(item):
-                    continue
+    # ------------------------------------------------------------------
+    # Event-driven pipeline stages
+    # ------------------------------------------------------------------
 
-                download_type = (item.get('download_type') or '').strip().lower()
+    def _register_pipeline_stages(self):
+        """Map queue statuses to stage handlers.
+        
+        Search, conversion and import each get their own bounded pool so a
+        long ffmpeg run never holds up searches, other imports or the
+        monitor thread. COMPLETE items are routed per download: Audible
+        formats go to conversion, everything else straight to import.
+        """
+        self.pipeline_dispatcher.register_stage('search', self._run_search_stage, {'QUEUED'})
+        self.pipeline_dispatcher.register_stage('download', self._run_download_stage, {'FOUND'})
+        self.pipeline_dispatcher.register_stage('conversion', self._run_conversion_stage)
+        self.pipeline_dispatcher.register_stage('import', self._run_import_stage, {'CONVERTED'})
+        self.pipeline_dispatcher.register_router({'COMPLETE'}, self._route_completed_download)
+
+    def _configure_stage_pools(self):
+        """Apply configured worker counts to the stage pools (live when running)."""
+        pool_sizes = {
+            'search': self.max_active_searches,
+            'conversion': self.conversion_workers,
+            'import': self.import_workers,
+        }
+        for stage, workers in pool_sizes.items():
+            self.pipeline_dispatcher.resize_stage(stage, workers)
+        self.logger.debug("Configured pipeline stage pools", extra=pool_sizes)
 
-                if download_type == 'audible':
-                    self.logger.info(
-                        "Download %s is Audible content; launching dedicated Audible pipeline",
-                        item['id']
-                    )
+    def _on_queue_status_changed(self, download_id: int, status: str):
+        """QueueManager listener: hand the item to the stage its status feeds."""
+        self.pipeline_dispatcher.notify_status(download_id, status)
 
-                    updates: Dict[str, Any] = {}
-                    if not item.get('indexer'):
-                        updates['indexer'] = 'Audible'
-                    if item.get('last_error'):
-                        updates['last_error'] = None
-                    if item.get('next_retry_at'):
-                        updates['next_retry_at'] = None
-
-                    if updates:
-                        self.queue_manager.update_download(item['id'], updates)
-
-                    if self.state_machine.transition(item['id'], 'AUDIBLE_DOWNLOADING'):
-                        self.event_emitter.emit_download_started(item['id'])
-                        refreshed = self.queue_manager.get_download(item['id']) or item
-                        self._schedule_audible_download(item['id'], refreshed)
-                    else:
-                        self.logger.debug(
-                            "Audible download %s already in progress; skipping start",
-                            item['id']
-                        )
-                    continue
-                # If we have search_result_id, skip to FOUND
-                if item.get('search_result_id'):
-                    self.logger.info("Download %s using pre-selected search result; scheduling download", item['id'])
-                    self.state_machine.transition(item['id'], 'FOUND')
-                else:
-                    if active_searches >= self.max_active_searches:
-                        self.logger.debug(
-                            "Reached search concurrency limit (%s); deferring remaining queued items",
-                            self.max_active_searches
-                        )
-                        break
-                    # Need to search
-                    self.logger.info("Download %s entering SEARCHING stage", item['id'])
-                    self.state_machine.transition(item['id'], 'SEARCHING')
-                    self._start_search(item['id'])
-                    active_searches += 1
-                    
-            except Exception as e:
-                self.logger.error(f"Error processing queued item {item['id']}: {e}")
+    def _reconcile_pipeline(self):
+        """Queue items whose status feeds a stage (duplicates are ignored).
         
-        # Process FOUND items - start the actual download
-        found_items = self.queue_manager.get_queue(status_filter='FOUND')
-        
-        for item in found_items:
-            try:
-                if not self._is_retry_ready(item):
-                    continue
+        The first sweep after start and every PIPELINE_FULL_SWEEP_EVERY-th
+        sweep after it read every stage-feeding row. That picks up items whose
+        stage failed without writing a new status, and rows the cursor
+        skipped because they were committed after it moved but with an older
+        updated_at. The sweeps in between only read rows written since the
+        change cursor.
+        """
+        full_sweep = self._pipeline_sweeps % PIPELINE_FULL_SWEEP_EVERY == 0
+        self._pipeline_sweeps += 1
+        if full_sweep:
+            self._pipeline_cursor = self.queue_manager.get_change_cursor()
+            snapshot = self.queue_manager.get_queue_snapshot(PIPELINE_STAGE_STATUSES)
+            items = [item for status_items in snapshot.values() for item in status_items]
+            items.sort(key=lambda item: item.get('queued_at') or '')
+        else:
+            items, self._pipeline_cursor = self.queue_manager.get_changed_since(self._pipeline_cursor)
+
+        for item in items:
+            self.pipeline_dispatcher.notify_status(item['id'], item.get('status'))
+
+    def _load_stage_item(self, download_id: int, stage: str, statuses: set) -> Optional[Dict[str, Any]]:
+        """Fetch a queued item for a stage, skipping stale events and deferring retries."""
+        item = self.queue_manager.get_download(download_id)
+        if not item or item.get('status') not in statuses:
+            return None
+
+        delay = self._retry_delay_seconds(item)
+        if delay > 0:
+            self.pipeline_dispatcher.submit(stage, download_id, delay=delay)
+            return None
+        return item
+
+    def _run_search_stage(self, download_id: int):
+        """QUEUED → SEARCHING/FOUND (or the dedicated Audible pipeline)."""
+        item = self._load_stage_item(download_id, 'search', {'QUEUED'})
+        if not item:
+            return
+
+        try:
+            download_type = (item.get('download_type') or '').strip().lower()
+
+            if download_type == 'audible':
+                self.logger.info(
+                    "Download %s is Audible content; launching dedicated Audible pipeline",
+                    item['id']
+                )
+
+                updates: Dict[str, Any] = {}
+                if not item.get('indexer'):
+                    updates['indexer'] = 'Audible'
+                if item.get('last_error'):
+                    updates['last_error'] = None
+                if item.get('next_retry_at'):
+                    updates['next_retry_at'] = None
 
-                download_type = (item.get('download_type') or '').strip().lower()
-                if download_type == 'audible':
+                if updates:
+                    self.queue_manager.update_download(item['id'], updates)
+
+                if self.state_machine.transition(item['id'], 'AUDIBLE_DOWNLOADING'):
+                    self.event_emitter.emit_download_started(item['id'])
+                    refreshed = self.queue_manager.get_download(item['id']) or item
+                    self._schedule_audible_download(item['id'], refreshed)
+                else:
                     self.logger.debug(
-                        "Found-stage handler skipping Audible download %s; handled via dedicated pipeline",
+                        "Audible download %s already in progress; skipping start",
                         item['id']
                     )
-                    continue
-
-                self.logger.info("Download %s entering DOWNLOADING stage (%s)", item['id'], item.get('book_title', 'Unknown'))
+                return
+            # If we have search_result_id, skip to FOUND
+            if item.get('search_result_id'):
+                self.logger.info("Download %s using pre-selected search result; scheduling download", item['id'])
+                self.state_machine.transition(item['id'], 'FOUND')
+            else:
+                # Need to search
+                self.logger.info("Download %s entering SEARCHING stage", item['id'])
+                self.state_machine.transition(item['id'], 'SEARCHING')
+                self._start_search(item['id'])
                 
-                # Prepare source info from the item
-                source_info = {
-                    'download_url': item.get('download_url'),
-                    'download_type': item.get('download_type', 'torrent'),
-                    'indexer': item.get('indexer'),
-                    'info_hash': item.get('info_hash')
-                }
+        except Exception as e:
+            self.logger.error(f"Error processing queued item {item['id']}: {e}")
+
+    def _run_download_stage(self, download_id: int):
+        """FOUND → start the actual download."""
+        item = self._load_stage_item(download_id, 'download', {'FOUND'})
+        if not item:
+            return
 
-                if item.get('next_retry_at'):
-                    self.queue_manager.update_download(item['id'], {'next_retry_at': None})
-                
-                # Start the actual download
-                self._start_download(item['id'], source_info)
-                    
-            except Exception as e:
-                self.logger.exception("Error starting download for FOUND item %s", item['id'])
-    
-    def _count_active_searches(self) -> int:
         try:
-            searching_items = self.queue_manager.get_queue(status_filter='SEARCHING')
-            return len(searching_items)
-        except Exception as exc:
-            self.logger.debug("Unable to count active searches: %s", exc)
-            return 0
+            download_type = (item.get('download_type') or '').strip().lower()
+            if download_type == 'audible':
+                self.logger.debug(
+                    "Found-stage handler skipping Audible download %s; handled via dedicated pipeline",
+                    item['id']
+                )
+                return
 
-    def _monitor_downloads(self):
-        """Monitor active downloads - poll clients for progress."""
-        active_downloads = self.queue_manager.get_queue(status_filter='DOWNLOADING')
-        
-        for download in active_downloads:
-            try:
-                if (download.get('download_type') or '').strip().lower() == 'audible':
-                    self.logger.debug(
-                        "Skipping monitor poll for Audible download %s; progress handled via API callbacks",
-                        download['id']
-                    )
-                    continue
-                self.download_monitor.update_progress(download['id'])
-            except Exception as e:
-                self.logger.exception("Error monitoring download %s", download['id'])
-    
-    def _process_pipeline(self):
+            self.logger.info("Download %s entering DOWNLOADING stage (%s)", item['id'], item.get('book_title', 'Unknown'))
+            
+            # Prepare source info from the item
+            source_info = {
+                'download_url': item.get('download_url'),
+                'download_type': item.get('download_type', 'torrent'),
+                'indexer': item.get('indexer'),
+                'info_hash': item.get('info_hash')
+            }
+
+            if item.get('next_retry_at'):
+                self.queue_manager.update_download(item['id'], {'next_retry_at': None})
+            
+            # Start the actual download
+            self._start_download(item['id'], source_info)
+                
+        except Exception as e:
+            self.logger.exception("Error starting download for FOUND item %s", item['id'])
+
+    @staticmethod
+    def _needs_conversion(item: Dict[str, Any]) -> bool:
         """
-        Process completed stages - trigger next pipeline stage.
+        Whether a completed download must be converted before import.
         
         Critical: Conversion is ONLY needed for Audible downloads (AAX/AAXC format).
         Torrent/NZB downloads are already in M4B/MP3 format and skip directly to import.
         """
-        # COMPLETE → check if conversion needed
-        complete_items = self.queue_manager.get_queue(status_filter='COMPLETE')
-        for item in complete_items:
-            try:
-                # Determine if conversion is needed based on source
-                raw_download_url = item.get('download_url')
-                download_url = (raw_download_url or '').strip()
-                raw_file_format = item.get('file_format')
-                file_format = (raw_file_format or '').strip().lower()
-                temp_file_path = (item.get('temp_file_path') or '').strip()
-                
-                # Multiple checks to identify Audible downloads that need conversion:
-                # 1. Download URL contains 'audible.com'
-                # 2. File format is explicitly AAX/AAXC
-                # 3. Downloaded file has .aax or .aaxc extension
-                needs_conversion = (
-                    'audible.com' in download_url.lower() or
-                    file_format in ('aax', 'aaxc') or
-                    download_url.endswith('.aax') or
-                    download_url.endswith('.aaxc') or
-                    (temp_file_path and (temp_file_path.endswith('.aax') or temp_file_path.endswith('.aaxc')))
-                )
-                
-                if needs_conversion:
-                    self.logger.info(f"Download {item['id']} is Audible format (AAX/AAXC) - starting FFmpeg conversion to M4B")
-                    self._start_conversion(item['id'])
-                else:
-                    # Torrent/NZB downloads are already in M4B/MP3 - skip to import
-                    self.logger.info(f"Download {item['id']} is torrent/NZB (already M4B/MP3) - skipping conversion, proceeding to AudioBookShelf import")
-                    self._start_import(item['id'])
-                    
-            except Exception as e:
-                self.logger.error(f"Error processing completed item {item['id']}: {e}")
+        download_url = (item.get('download_url') or '').strip()
+        file_format = (item.get('file_format') or '').strip().lower()
+        temp_file_path = (item.get('temp_file_path') or '').strip()
         
-        # CONVERTED → start import
-        converted_items = self.queue_manager.get_queue(status_filter='CONVERTED')
-        for item in converted_items:
-            try:
-                self._start_import(item['id'])
-            except Exception as e:
-                self.logger.error(f"Error starting import for {item['id']}: {e}")
+        # Multiple checks to identify Audible downloads that need conversion:
+        # 1. Download URL contains 'audible.com'
+        # 2. File format is explicitly AAX/AAXC
+        # 3. Downloaded file has .aax or .aaxc extension
+        return bool(
+            'audible.com' in download_url.lower() or
+            file_format in ('aax', 'aaxc') or
+            download_url.endswith('.aax') or
+            download_url.endswith('.aaxc') or
+            (temp_file_path and (temp_file_path.endswith('.aax') or temp_file_path.endswith('.aaxc')))
+        )
+
+    def _route_completed_download(self, download_id: int, status: str) -> Optional[str]:
+        """Dispatcher router: COMPLETE → 'conversion' or 'import'."""
+        item = self.queue_manager.get_download(download_id)
+        if not item or item.get('status') != 'COMPLETE':
+            return None
+        return 'conversion' if self._needs_conversion(item) else 'import'
+
+    def _run_conversion_stage(self, download_id: int):
+        """COMPLETE (AAX/AAXC) → CONVERTING → CONVERTED."""
+        item = self._load_stage_item(download_id, 'conversion', {'COMPLETE'})
+        if not item:
+            return
+
+        try:
+            self.logger.info(f"Download {item['id']} is Audible format (AAX/AAXC) - starting FFmpeg conversion to M4B")
+            self._start_conversion(item['id'])
+        except Exception as e:
+            self.logger.error(f"Error starting conversion for {item['id']}: {e}")
+
+    def _run_import_stage(self, download_id: int):
+        """CONVERTED, or COMPLETE torrent/NZB downloads → IMPORTING → IMPORTED."""
+        item = self._load_stage_item(download_id, 'import', {'COMPLETE', 'CONVERTED'})
+        if not item:
+            return
+
+        try:
+            if item.get('status') == 'COMPLETE':
+                if self._needs_conversion(item):
+                    # Format changed since routing; hand back to conversion
+                    self.pipeline_dispatcher.submit('conversion', item['id'])
+                    return
+                # Torrent/NZB downloads are already in M4B/MP3 - skip to import
+                self.logger.info(f"Download {item['id']} is torrent/NZB (already M4B/MP3) - skipping conversion, proceeding to AudioBookShelf import")
+            self._start_import(item['id'])
+        except Exception as e:
+            self.logger.error(f"Error starting import for {item['id']}: {e}")
+
+    def _monitor_downloads(self, active_downloads: Optional[List[Dict[str, Any]]] = None):
+        """Monitor active downloads - poll clients for progress."""
+        if active_downloads is None:
+            active_downloads = self.queue_manager.get_queue(status_filter='DOWNLOADING')
         
-        # SEEDING → monitor or finalize depending on configuration
-        seeding_items = self.queue_manager.get_queue(status_filter='SEEDING')
+        client_downloads = []
+        for download in active_downloads:
+            if (download.get('download_type') or '').strip().lower() == 'audible':
+                self.logger.debug(
+                    "Skipping monitor poll for Audible download %s; progress handled via API callbacks",
+                    download['id']
+                )
+                continue
+            client_downloads.append(download)
+        
+        if not client_downloads:
+            return
+        try:
+            # One status request per client, one queue write for the whole tick
+            self.download_monitor.update_progress_batch(client_downloads)
+        except Exception:
+            self.logger.exception("Error monitoring %s active downloads", len(client_downloads))
+    
+    def _monitor_seeding(self, seeding_items: Optional[List[Dict[str, Any]]] = None):
+        """SEEDING → monitor or finalize depending on configuration."""
+        if seeding_items is None:
+            seeding_items = self.queue_manager.get_queue(status_filter='SEEDING')
 
         if self.monitor_seeding_enabled:
-            for item in seeding_items:
+            if seeding_items:
                 try:
-                    self.download_monitor.monitor_seeding(item['id'])
+                    self.download_monitor.monitor_seeding_batch(seeding_items)
                 except Exception as e:
-                    self.logger.error(f"Error monitoring seeding for {item['id']}: {e}")
+                    self.logger.error(f"Error monitoring seeding for {len(seeding_items)} downloads: {e}")
         else:
             for item in seeding_items:
                 try:
@@ -1709,6 +1847,7 @@ class DownloadManagementService:
             
             start_time = datetime.now()
             last_logged_pct = {'value': -10.0}
+            last_stored_pct = {'value': -1.0}
 
             # Progress callback for real-time updates
             def on_progress(downloaded_bytes: int, total_bytes: int, message: str):
@@ -1716,10 +1855,13 @@ class DownloadManagementService:
                     return
 
                 progress_pct = (downloaded_bytes / total_bytes) * 100
-                self.queue_manager.update_download(download_id, {
-                    'download_progress': progress_pct,
-                    'updated_at': datetime.now().isoformat()
-                })
+                # Chunk callbacks are frequent; persist whole-percent steps only
+                if progress_pct >= last_stored_pct['value'] + 1.0 or downloaded_bytes >= total_bytes:
+                    self.queue_manager.update_download(download_id, {
+                        'download_progress': progress_pct,
+                        'updated_at': datetime.now().isoformat()
+                    })
+                    last_stored_pct['value'] = progress_pct
                 self.event_emitter.emit_progress(download_id, progress_pct, message)
 
                 if progress_pct >= last_logged_pct['value'] + 10.0 or downloaded_bytes >= total_bytes:
@@ -2404,7 +2546,8 @@ class DownloadManagementService:
                 output_file=output_file,
                 progress_callback=progress_callback,
                 metadata=book_data,
-                voucher_file=voucher_file_path
+                voucher_file=voucher_file_path,
+                priority=download.get('priority')
             )
             
             if not conversion_result.get('success'):
@@ -2433,8 +2576,7 @@ class DownloadManagementService:
                     "Conversion completed successfully",
                     extra={"download_id": download_id, "converted_file": converted_file_path},
                 )
-                # Start import in next cycle
-                self._start_import(download_id)
+                # The CONVERTED status event hands the download to the import pool
             
         except Exception as e:
             self.logger.exception("Error during conversion for download %s", download_id)
@@ -2902,12 +3044,19 @@ class DownloadManagementService:
         """Get service status and statistics."""
         queue_stats = self.queue_manager.get_queue_statistics()
         
-        active_standard = len(self.queue_manager.get_queue(status_filter='DOWNLOADING'))
-        active_audible = len(self.queue_manager.get_queue(status_filter='AUDIBLE_DOWNLOADING'))
+        active_standard = queue_stats.get('DOWNLOADING', 0)
+        active_audible = queue_stats.get('AUDIBLE_DOWNLOADING', 0)
 
         return {
             'monitor_running': self.monitor_running,
             'polling_interval': self.polling_interval,
             'queue_statistics': queue_stats,
-            'active_downloads': active_standard + active_audible
+            'active_downloads': active_standard + active_audible,
+            'pipeline_stages': self.pipeline_dispatcher.get_stats(),
+            'stage_pools': {
+                'search': self.max_active_searches,
+                'conversion': self.conversion_workers,
+                'import': self.import_workers,
+            },
+            'progress_events': get_progress_coalescer().get_stats(),
         }
@@ -14,7 +14,7 @@ Location:
 """
 
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from utils.logger import get_module_logger
 
@@ -25,6 +25,7 @@ class DownloadMonitor:
     
     Features:
     - 2-second polling interval for active downloads
+    - Batched polling: one client request per tick for all active torrents
     - Progress tracking (%)
     - Speed and ETA calculation
     - Completion detection
@@ -166,35 +167,123 @@ class DownloadMonitor:
                 self.logger.warning(f"No status for download {download_id}")
                 return
             
-            # Extract progress data
-            progress = status.get('progress', 0.0)  # 0-100
-            download_speed = status.get('download_speed', 0)  # bytes/sec
-            eta_seconds = status.get('eta', -1)
-            
-            # Update database
-            updates = {
-                'download_progress': progress,
-                'eta_seconds': eta_seconds
-            }
+            updates = self._progress_updates(status)
             queue_manager.update_download(download_id, updates)
+            self._publish_progress(download_id, status)
+            
+        except Exception as e:
+            self.logger.error(f"Error updating progress for download {download_id}: {e}")
+
+    def update_progress_batch(self, downloads: List[Dict[str, Any]]):
+        """
+        Poll clients for many DOWNLOADING items in one pass.
+        
+        Downloads are grouped by client so each client answers a single
+        get_statuses() request per tick. All resulting queue updates are
+        written in one transaction before progress events and completion
+        transitions are emitted.
+        
+        Args:
+            downloads: Queue rows as returned by QueueManager.get_queue()
+        """
+        queue_manager = self._get_queue_manager()
+        client_selector = self._get_client_selector()
+        
+        by_client: Dict[str, List[Dict[str, Any]]] = {}
+        for download in downloads:
+            if download.get('status') != 'DOWNLOADING':
+                continue
+            by_client.setdefault(download.get('download_client'), []).append(download)
+        
+        updates: Dict[int, Dict[str, Any]] = {}
+        polled: List[Tuple[int, Dict[str, Any]]] = []
+        
+        for client_name, client_downloads in by_client.items():
+            client = client_selector.get_client(client_name)
+            if not client:
+                self.logger.error(f"Client {client_name} not available")
+                continue
+            
+            tracked: List[Tuple[int, str]] = []
+            known_torrents: Optional[List[Dict[str, Any]]] = None
+            for download in client_downloads:
+                download_id = download['id']
+                client_id = download.get('download_client_id')
+                if not client_id:
+                    if known_torrents is None:
+                        known_torrents = self._list_client_torrents(client)
+                    client_id = self._discover_torrent_hash(client, download, torrents=known_torrents)
+                    if not client_id:
+                        self.logger.debug(f"Skipping progress update for download {download_id} (torrent hash unavailable)")
+                        continue
+                    updates[download_id] = {'download_client_id': client_id, 'last_error': None}
+                    self.logger.debug(f"Resolved torrent hash for download {download_id}: {client_id}")
+                tracked.append((download_id, client_id))
             
-            # Emit progress event
-            progress_tracker = self._get_progress_tracker()
-            progress_tracker.emit_progress(download_id, progress, download_speed, eta_seconds)
+            if not tracked:
+                continue
             
-            # Check if complete
-            if progress >= 100.0:
-                self.logger.debug(f"Download {download_id} complete")
-                state_machine = self._get_state_machine()
-                state_machine.transition(download_id, 'COMPLETE')
+            try:
+                statuses = client.get_statuses([client_id for _, client_id in tracked])
+            except Exception as e:
+                self.logger.error(f"Error polling {client_name} for {len(tracked)} downloads: {e}")
+                continue
             
+            for download_id, client_id in tracked:
+                status = statuses.get(str(client_id).lower())
+                if not status:
+                    self.logger.warning(f"No status for download {download_id}")
+                    continue
+                updates.setdefault(download_id, {}).update(self._progress_updates(status))
+                polled.append((download_id, status))
+        
+        try:
+            queue_manager.update_downloads(updates)
         except Exception as e:
-            self.logger.error(f"Error updating progress for download {download_id}: {e}")
+            self.logger.error(f"Error saving progress for {len(updates)} downloads: {e}")
+            return
+        
+        for download_id, status in polled:
+            try:
+                self._publish_progress(download_id, status)
+            except Exception as e:
+                self.logger.error(f"Error updating progress for download {download_id}: {e}")
+
+    @staticmethod
+    def _progress_updates(status: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue fields written from a client status record."""
+        return {
+            'download_progress': status.get('progress', 0.0),  # 0-100
+            'eta_seconds': status.get('eta', -1)
+        }
 
-    def _discover_torrent_hash(self, client, download: Dict[str, Any]) -> Optional[str]:
+    def _publish_progress(self, download_id: int, status: Dict[str, Any]):
+        """Emit the progress event and move finished downloads to COMPLETE."""
+        progress = status.get('progress', 0.0)
+        download_speed = status.get('download_speed', 0)  # bytes/sec
+        eta_seconds = status.get('eta', -1)
+        
+        progress_tracker = self._get_progress_tracker()
+        progress_tracker.emit_progress(download_id, progress, download_speed, eta_seconds)
+        
+        if progress >= 100.0:
+            self.logger.debug(f"Download {download_id} complete")
+            state_machine = self._get_state_machine()
+            state_machine.transition(download_id, 'COMPLETE')
+
+    def _list_client_torrents(self, client) -> List[Dict[str, Any]]:
+        try:
+            return client.get_all_torrents() or []
+        except Exception as exc:
+            self.logger.debug(f"Unable to list torrents for hash discovery: {exc}")
+            return []
+
+    def _discover_torrent_hash(self, client, download: Dict[str, Any],
+                               torrents: Optional[List[Dict[str, Any]]] = None) -> Optional[str]:
         """Attempt to resolve torrent hash for downloads missing client ID."""
         try:
-            torrents = client.get_all_torrents()
+            if torrents is None:
+                torrents = client.get_all_torrents()
             if not torrents:
                 return None
 
@@ -295,27 +384,9 @@ class DownloadMonitor:
                 self.logger.warning(f"No status from client for download {download_id}")
                 return
             
-            # Check if torrent is still active/seeding
-            state_value = str(status.get('state') or '').lower()
-            is_seeding = state_value in self.ACTIVE_SEEDING_STATES
-            is_complete = (status.get('progress', 0) or 0) >= 100.0
-            
-            # Get seeding metrics
-            ratio = status.get('ratio', 0.0)
-            seeding_time = status.get('seeding_time', 0)  # seconds
-            
-            # Log seeding progress
-            self.logger.debug(
-                f"Download {download_id} seeding: ratio={ratio:.2f}, "
-                f"time={seeding_time}s, state={status.get('state')}"
-            )
-            
             # Update seeding metrics in database
             try:
-                queue_manager.update_download(download_id, {
-                    'seeding_ratio': ratio,
-                    'seeding_time_seconds': seeding_time
-                })
+                queue_manager.update_download(download_id, self._seeding_updates(status))
             except Exception as update_error:
                 self.logger.debug(
                     "Skipping seeding metric update for download %s: %s",
@@ -323,47 +394,151 @@ class DownloadMonitor:
                     update_error
                 )
             self._cache_download(download_id, download)
-            
-            # Check if client has marked torrent as complete
-            # This happens when client's seeding goals are met (ratio, time, etc.)
-            # Different clients use different fields to indicate completion
-            client_marked_complete = False
-            completion_reason = None
-            if hasattr(client, 'is_seeding_complete'):
-                client_marked_complete = client.is_seeding_complete(status)
-                if client_marked_complete:
-                    completion_reason = 'client'
-            else:
-                if is_complete and not is_seeding:
-                    client_marked_complete = True
-                    completion_reason = 'fallback_state'
-
-            if client_marked_complete:
-                ratio_limit = status.get('seed_ratio_limit')
-                time_limit = status.get('seed_time_limit_seconds')
-                self.logger.info(
-                    "Download %s seeding complete via %s (state=%s, ratio=%.2f/%s, time=%ss/%s, progress=%.2f)",
-                    download_id,
-                    completion_reason or 'unknown',
-                    status.get('state'),
-                    ratio,
-                    self._format_ratio_limit(ratio_limit),
-                    seeding_time,
-                    self._format_time_limit(time_limit),
-                    status.get('progress', 0.0)
-                )
-                self._complete_seeding_transition(
-                    download_id,
-                    download,
-                    ratio=ratio,
-                    seeding_time=seeding_time
-                )
+            self._evaluate_seeding_status(download_id, download, client, status)
             
         except Exception as e:
             self.logger.error(f"Error monitoring seeding for download {download_id}: {e}")
             import traceback
             self.logger.error(traceback.format_exc())
 
+    def monitor_seeding_batch(self, downloads: List[Dict[str, Any]]):
+        """
+        Monitor many SEEDING downloads with one client request per client.
+        
+        Metric updates are written in one transaction; torrents the client no
+        longer reports are treated as finished, as in monitor_seeding().
+        
+        Args:
+            downloads: Queue rows as returned by QueueManager.get_queue()
+        """
+        queue_manager = self._get_queue_manager()
+        client_selector = self._get_client_selector()
+        
+        by_client: Dict[str, List[Dict[str, Any]]] = {}
+        for download in downloads:
+            download_id = download['id']
+            if download.get('status') != 'SEEDING':
+                self.logger.debug(f"Download {download_id} not in SEEDING state, skipping seeding monitor")
+                continue
+            self._cache_download(download_id, download)
+            if not download.get('download_client') or not download.get('download_client_id'):
+                self.logger.error(f"Download {download_id} missing client info for seeding monitor")
+                continue
+            by_client.setdefault(download['download_client'], []).append(download)
+        
+        metric_updates: Dict[int, Dict[str, Any]] = {}
+        reported: List[Tuple[Dict[str, Any], Any, Dict[str, Any]]] = []
+        missing: List[Dict[str, Any]] = []
+        
+        for client_name, client_downloads in by_client.items():
+            client = client_selector.get_client(client_name)
+            if not client:
+                self.logger.error(f"Client {client_name} not available for seeding monitor")
+                continue
+            
+            try:
+                statuses = client.get_statuses([item['download_client_id'] for item in client_downloads])
+            except Exception as e:
+                self.logger.error(f"Error polling {client_name} for {len(client_downloads)} seeding downloads: {e}")
+                continue
+            
+            for download in client_downloads:
+                status = statuses.get(str(download['download_client_id']).lower())
+                if not status:
+                    missing.append(download)
+                    continue
+                metric_updates[download['id']] = self._seeding_updates(status)
+                reported.append((download, client, status))
+        
+        try:
+            queue_manager.update_downloads(metric_updates)
+        except Exception as update_error:
+            self.logger.debug(
+                "Skipping seeding metric update for %s downloads: %s",
+                len(metric_updates),
+                update_error
+            )
+        
+        for download in missing:
+            self.logger.info(
+                "Torrent %s not found while monitoring download %s; assuming seeding finished",
+                download['download_client_id'],
+                download['id']
+            )
+            try:
+                self._complete_seeding_transition(download['id'], download)
+            except Exception as e:
+                self.logger.error(f"Error monitoring seeding for download {download['id']}: {e}")
+        
+        for download, client, status in reported:
+            try:
+                self._evaluate_seeding_status(download['id'], download, client, status)
+            except Exception as e:
+                self.logger.error(f"Error monitoring seeding for download {download['id']}: {e}")
+                import traceback
+                self.logger.error(traceback.format_exc())
+
+    @staticmethod
+    def _seeding_updates(status: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue fields written from a seeding status record."""
+        return {
+            'seeding_ratio': status.get('ratio', 0.0),
+            'seeding_time_seconds': status.get('seeding_time', 0)  # seconds
+        }
+
+    def _evaluate_seeding_status(self, download_id: int, download: Dict[str, Any],
+                                 client, status: Dict[str, Any]):
+        """Finish the seeding workflow once the client reports its goals are met."""
+        # Check if torrent is still active/seeding
+        state_value = str(status.get('state') or '').lower()
+        is_seeding = state_value in self.ACTIVE_SEEDING_STATES
+        is_complete = (status.get('progress', 0) or 0) >= 100.0
+        
+        # Get seeding metrics
+        ratio = status.get('ratio', 0.0)
+        seeding_time = status.get('seeding_time', 0)  # seconds
+        
+        # Log seeding progress
+        self.logger.debug(
+            f"Download {download_id} seeding: ratio={ratio:.2f}, "
+            f"time={seeding_time}s, state={status.get('state')}"
+        )
+        
+        # Check if client has marked torrent as complete
+        # This happens when client's seeding goals are met (ratio, time, etc.)
+        # Different clients use different fields to indicate completion
+        client_marked_complete = False
+        completion_reason = None
+        if hasattr(client, 'is_seeding_complete'):
+            client_marked_complete = client.is_seeding_complete(status)
+            if client_marked_complete:
+                completion_reason = 'client'
+        else:
+            if is_complete and not is_seeding:
+                client_marked_complete = True
+                completion_reason = 'fallback_state'
+
+        if client_marked_complete:
+            ratio_limit = status.get('seed_ratio_limit')
+            time_limit = status.get('seed_time_limit_seconds')
+            self.logger.info(
+                "Download %s seeding complete via %s (state=%s, ratio=%.2f/%s, time=%ss/%s, progress=%.2f)",
+                download_id,
+                completion_reason or 'unknown',
+                status.get('state'),
+                ratio,
+                self._format_ratio_limit(ratio_limit),
+                seeding_time,
+                self._format_time_limit(time_limit),
+                status.get('progress', 0.0)
+            )
+            self._complete_seeding_transition(
+                download_id,
+                download,
+                ratio=ratio,
+                seeding_time=seeding_time
+            )
+
     def _complete_seeding_transition(self, download_id: int, download: Dict[str, Any],
                                      ratio: float = 0.0, seeding_time: int = 0):
         """Shared helper to finish seeding workflow and cleanup."""
@@ -2,10 +2,12 @@
 Module Name: event_emitter.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Emits real-time SocketIO events for download lifecycle and status updates,
     coordinating with the status service for long-running event tracking.
+    Progress goes through the shared ProgressCoalescer; download titles are
+    cached in memory so progress updates do not hit the database.
 
 Location:
     /services/download_management/event_emitter.py
@@ -13,10 +15,12 @@ Location:
 """
 
 from threading import Lock
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from utils.logger import get_module_logger
 
+from .progress_coalescer import get_progress_coalescer
+
 
 class EventEmitter:
     """
@@ -25,7 +29,7 @@ class EventEmitter:
     Events:
     - download:queued
     - download:started
-    - download:progress
+    - download:progress_batch (coalesced, see ProgressCoalescer)
     - download:completed
     - download:failed
     - download:cancelled
@@ -41,6 +45,9 @@ class EventEmitter:
         self._status_lock = Lock()
         self._status_events = {}
         self._download_lookup: Optional[Callable[[int], Optional[dict]]] = None
+        self._titles: Dict[int, str] = {}
+        self._progress_messages: Dict[int, Optional[str]] = {}
+        self._coalescer = None
 
     # ------------------------------------------------------------------
     # Wiring helpers
@@ -70,13 +77,33 @@ class EventEmitter:
             return {}
 
     def _title_for_download(self, download_id: int) -> str:
+        title = self._titles.get(download_id)
+        if title:
+            return title
         details = self._get_download_details(download_id)
-        return (
+        title = (
             details.get('book_title')
             or details.get('title')
             or details.get('book_asin')
-            or f"Download #{download_id}"
         )
+        if not title:
+            # Not cached so a later lookup can still find the real title
+            return f"Download #{download_id}"
+        self._titles[download_id] = title
+        return title
+
+    def _get_coalescer(self):
+        if self._coalescer is None:
+            self._coalescer = get_progress_coalescer()
+            self._coalescer.add_flush_listener(self._apply_progress_batch)
+        return self._coalescer
+
+    def _forget_download(self, download_id: int):
+        """Drop per-download caches once a download reaches a final state."""
+        self._titles.pop(download_id, None)
+        with self._status_lock:
+            self._progress_messages.pop(download_id, None)
+        get_progress_coalescer().discard(download_id)
 
     def _ensure_status_event(self, download_id: int, *, state: str, message: str) -> Optional[int]:
         service = self._get_status_service()
@@ -187,22 +214,34 @@ class EventEmitter:
         )
 
     def emit_progress(self, download_id: int, progress: float, message: Optional[str] = None):
-        """Emit download progress event for UI updates."""
-        payload = {
-            'download_id': download_id,
-            'progress': float(progress)
-        }
+        """Queue a progress update; the coalescer emits it and updates the status event."""
+        payload = {'progress': round(float(progress), 2)}
         if message:
             payload['message'] = message
-        self._emit('download:progress', payload)
-        title = self._title_for_download(download_id)
-        self._update_status_event(
-            download_id,
-            state='downloading',
-            message=message or f'Downloading {title}…',
-            progress=float(progress),
-            metadata={'status': 'DOWNLOADING'}
-        )
+        coalescer = self._get_coalescer()
+        with self._status_lock:
+            self._progress_messages[download_id] = message
+        coalescer.submit(download_id, payload)
+
+    def _apply_progress_batch(self, updates: List[Dict[str, Any]]):
+        """Flush listener: one status update per download per flush."""
+        for update in updates:
+            download_id = update.get('download_id')
+            with self._status_lock:
+                if download_id not in self._progress_messages:
+                    continue  # Progress not reported through this emitter
+                message = self._progress_messages[download_id]
+            progress = update.get('progress')
+            if progress is None:
+                continue
+            title = self._title_for_download(download_id)
+            self._update_status_event(
+                download_id,
+                state='downloading',
+                message=message or f'Downloading {title}…',
+                progress=float(progress),
+                metadata={'status': 'DOWNLOADING'}
+            )
     
     def emit_download_completed(self, download_id: int):
         """Emit download completed event."""
@@ -211,6 +250,7 @@ class EventEmitter:
         })
         title = self._title_for_download(download_id)
         self._complete_status_event(download_id, success=True, message=f'Download complete: {title}')
+        self._forget_download(download_id)
 
     def emit_completed(self, download_id: int, *_args, **_kwargs):
         """Legacy alias for emit_download_completed."""
@@ -228,6 +268,7 @@ class EventEmitter:
         })
         title = self._title_for_download(download_id)
         self._complete_status_event(download_id, success=False, message=f'Download failed: {title}', error=error)
+        self._forget_download(download_id)
     
     def emit_download_cancelled(self, download_id: int):
         """Emit download cancelled event."""
@@ -236,6 +277,7 @@ class EventEmitter:
         })
         title = self._title_for_download(download_id)
         self._complete_status_event(download_id, success=False, message=f'Download cancelled: {title}')
+        self._forget_download(download_id)
     
     def emit_download_paused(self, download_id: int):
         """Emit download paused event."""
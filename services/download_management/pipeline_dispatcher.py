@@ -0,0 +1,308 @@
+"""
+Module Name: pipeline_dispatcher.py
+Author: TheDragonShaman
+Created: Oct 16 2026
+Last Modified: Oct 16 2026
+Description:
+    Event-driven stage queues for the download pipeline. Queue status changes
+    are routed to in-process per-stage work queues, each drained by dedicated
+    worker threads, so a download moves to its next stage as soon as the
+    previous one finishes instead of waiting for the next polling tick.
+    Stage pools are bounded and can be resized while running.
+
+Location:
+    /services/download_management/pipeline_dispatcher.py
+
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Set
+
+from utils.logger import get_module_logger
+
+
+class _Stage:
+    """Work queue, worker threads and counters for one pipeline stage."""
+
+    def __init__(self, name: str, handler: Callable[[int], None], workers: int):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, int(workers))
+        self.queue: "queue.Queue[Optional[int]]" = queue.Queue()
+        self.lock = threading.Lock()
+        self.queued: Set[int] = set()
+        self.active: Set[int] = set()
+        self.rerun: Set[int] = set()
+        self.enqueued_at: Dict[int, float] = {}
+        self.scheduled: Dict[int, threading.Timer] = {}
+        self.threads = []
+        self.processed = 0
+        self.failed = 0
+        self.last_wait_ms = 0.0
+
+
+class PipelineDispatcher:
+    """
+    Routes download status changes to per-stage worker queues.
+
+    Features:
+    - One FIFO work queue per stage with dedicated worker threads
+    - De-duplication: an ID is queued at most once per stage; a submit
+      that arrives while the ID is being handled re-runs it afterwards
+    - Delayed submits for retry backoff (next_retry_at), at most one
+      pending timer per ID and stage
+    - Status routers for statuses that feed different stages per item
+    - Live worker pool resizing per stage
+    - Queue depth, in-flight and handoff latency stats per stage
+    """
+
+    def __init__(self, *, logger=None):
+        """Initialize dispatcher with no registered stages."""
+        self.logger = logger or get_module_logger("Service.DownloadManagement.PipelineDispatcher")
+        self._stages: Dict[str, _Stage] = {}
+        self._status_routes: Dict[str, str] = {}
+        self._status_routers: Dict[str, Callable[[int, str], Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self._running = False
+
+    # ------------------------------------------------------------------
+    # Registration / lifecycle
+    # ------------------------------------------------------------------
+    def register_stage(self, name: str, handler: Callable[[int], None],
+                       statuses: Optional[Set[str]] = None, workers: int = 1):
+        """
+        Register a stage handler and the statuses that feed it.
+
+        Args:
+            name: Stage name (e.g. 'search')
+            handler: Callable receiving a download ID
+            statuses: Queue statuses routed to this stage
+            workers: Number of worker threads draining the stage
+        """
+        with self._lock:
+            if self._running:
+                raise RuntimeError("Cannot register pipeline stages while dispatcher is running")
+            self._stages[name] = _Stage(name, handler, workers)
+            for status in statuses or ():
+                self._status_routes[str(status).upper()] = name
+
+    def register_router(self, statuses: Set[str], router: Callable[[int, str], Optional[str]]):
+        """
+        Route statuses through a callable choosing the stage per download.
+
+        Args:
+            statuses: Queue statuses handled by the router
+            router: Callable receiving (download_id, status) and returning a
+                stage name, or None to leave the download alone
+        """
+        with self._lock:
+            for status in statuses:
+                self._status_routers[str(status).upper()] = router
+
+    def resize_stage(self, name: str, workers: int) -> int:
+        """
+        Change the worker count of a stage, live if the dispatcher is running.
+
+        Extra workers exit after their current item; returns the new size.
+        """
+        workers = max(1, int(workers))
+        with self._lock:
+            stage = self._stages.get(name)
+            if stage is None:
+                raise KeyError(name)
+            previous = stage.workers
+            stage.workers = workers
+            if not self._running or workers == previous:
+                return workers
+            if workers > previous:
+                for index in range(previous, workers):
+                    thread = threading.Thread(
+                        target=self._worker_loop,
+                        args=(stage,),
+                        name=f"Pipeline-{stage.name}-{index + 1}",
+                        daemon=True
+                    )
+                    with stage.lock:
+                        stage.threads.append(thread)
+                    thread.start()
+            else:
+                for _ in range(previous - workers):
+                    stage.queue.put(None)
+
+        self.logger.debug("Resized pipeline stage", extra={
+            "stage": name,
+            "previous_workers": previous,
+            "workers": workers
+        })
+        return workers
+
+    def start(self):
+        """Start worker threads for every registered stage."""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            for stage in self._stages.values():
+                stage.queue = queue.Queue()
+                stage.threads = [
+                    threading.Thread(
+                        target=self._worker_loop,
+                        args=(stage,),
+                        name=f"Pipeline-{stage.name}-{index + 1}",
+                        daemon=True
+                    )
+                    for index in range(stage.workers)
+                ]
+                for thread in stage.threads:
+                    thread.start()
+        self.logger.debug("Pipeline dispatcher started", extra={"stages": list(self._stages)})
+
+    def stop(self, timeout: float = 5.0):
+        """Stop workers after their current item; queued work is dropped."""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            stages = list(self._stages.values())
+
+        stage_threads = []
+        for stage in stages:
+            with stage.lock:
+                stage.queued.clear()
+                stage.rerun.clear()
+                stage.enqueued_at.clear()
+                timers = list(stage.scheduled.values())
+                stage.scheduled.clear()
+                threads = list(stage.threads)
+            for timer in timers:
+                timer.cancel()
+            for _ in threads:
+                stage.queue.put(None)
+            stage_threads.append((stage, threads))
+        for stage, threads in stage_threads:
+            for thread in threads:
+                thread.join(timeout=timeout)
+            with stage.lock:
+                stage.threads = []
+        self.logger.debug("Pipeline dispatcher stopped")
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+    def notify_status(self, download_id: int, status: Optional[str]) -> bool:
+        """Queue a download for the stage its new status feeds, if any."""
+        status_key = str(status or '').upper()
+        router = self._status_routers.get(status_key)
+        stage_name = router(download_id, status_key) if router else self._status_routes.get(status_key)
+        if not stage_name:
+            return False
+        return self.submit(stage_name, download_id)
+
+    def submit(self, stage_name: str, download_id: int, delay: float = 0.0) -> bool:
+        """
+        Queue a download for a stage.
+
+        Args:
+            stage_name: Registered stage name
+            download_id: Download queue ID
+            delay: Seconds to wait before the item becomes visible to workers
+
+        Returns:
+            True if the item was queued (or scheduled), False if it was a
+            duplicate or a delayed submit is already pending for it
+        """
+        stage = self._stages.get(stage_name)
+        if stage is None or not self._running:
+            return False
+
+        if delay and delay > 0:
+            with stage.lock:
+                if download_id in stage.scheduled:
+                    return False
+                timer = threading.Timer(delay, self._submit_scheduled, args=(stage, download_id))
+                timer.daemon = True
+                stage.scheduled[download_id] = timer
+            timer.start()
+            return True
+
+        with stage.lock:
+            if download_id in stage.queued:
+                return False
+            if download_id in stage.active:
+                stage.rerun.add(download_id)
+                return True
+            stage.queued.add(download_id)
+            stage.enqueued_at[download_id] = time.monotonic()
+        stage.queue.put(download_id)
+        return True
+
+    def _submit_scheduled(self, stage: _Stage, download_id: int):
+        """Timer callback: release the pending slot, then queue the item."""
+        with stage.lock:
+            stage.scheduled.pop(download_id, None)
+        self.submit(stage.name, download_id)
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+    def _worker_loop(self, stage: _Stage):
+        while self._running:
+            download_id = stage.queue.get()
+            if download_id is None:
+                break  # stop() or a pool shrink
+
+            with stage.lock:
+                if download_id not in stage.queued:
+                    continue  # dropped by stop()
+                stage.queued.discard(download_id)
+                stage.active.add(download_id)
+                enqueued = stage.enqueued_at.pop(download_id, None)
+                if enqueued is not None:
+                    stage.last_wait_ms = (time.monotonic() - enqueued) * 1000
+
+            try:
+                stage.handler(download_id)
+                with stage.lock:
+                    stage.processed += 1
+            except Exception:
+                with stage.lock:
+                    stage.failed += 1
+                self.logger.exception("Pipeline stage %s failed for download %s", stage.name, download_id)
+            finally:
+                with stage.lock:
+                    stage.active.discard(download_id)
+                    rerun = download_id in stage.rerun
+                    stage.rerun.discard(download_id)
+                if rerun:
+                    self.submit(stage.name, download_id)
+
+        with stage.lock:
+            current = threading.current_thread()
+            if current in stage.threads:
+                stage.threads.remove(current)
+
+    # ------------------------------------------------------------------
+    # Diagnostics
+    # ------------------------------------------------------------------
+    def get_stats(self) -> Dict[str, Any]:
+        """Return per-stage queue depth, in-flight count and counters."""
+        stats: Dict[str, Any] = {}
+        for name, stage in self._stages.items():
+            with stage.lock:
+                stats[name] = {
+                    'workers': stage.workers,
+                    'live_workers': len(stage.threads),
+                    'queued': len(stage.queued),
+                    'scheduled': len(stage.scheduled),
+                    'in_flight': len(stage.active),
+                    'processed': stage.processed,
+                    'failed': stage.failed,
+                    'last_wait_ms': round(stage.last_wait_ms, 2),
+                }
+        return stats
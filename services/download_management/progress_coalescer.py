@@ -0,0 +1,183 @@
+"""
+Module Name: progress_coalescer.py
+Author: TheDragonShaman
+Created: Oct 16 2026
+Last Modified: Oct 16 2026
+Description:
+    Coalesces download progress updates. Only the latest payload per
+    download is kept, unchanged payloads are dropped, and pending updates
+    are flushed at a fixed rate as a single 'download:progress_batch'
+    SocketIO event. Flush listeners receive the same batch so slower sinks
+    (status events) run at the flush rate instead of per update.
+
+Location:
+    /services/download_management/progress_coalescer.py
+
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.logger import get_module_logger
+
+PROGRESS_BATCH_EVENT = 'download:progress_batch'
+DEFAULT_FLUSH_HZ = 4.0
+MAX_FLUSH_HZ = 20.0
+
+
+class ProgressCoalescer:
+    """
+    Latest-value-wins progress buffer with a background flush thread.
+
+    Features:
+    - One pending payload per download_id; newer fields overwrite older ones
+    - Payloads identical to the last flushed one are skipped
+    - Flushes at most ``flush_hz`` times per second, one event per flush
+    - Flush listeners for per-batch side effects
+    """
+
+    def __init__(self, flush_hz: float = DEFAULT_FLUSH_HZ, *,
+                 emit: Optional[Callable[[str, Dict[str, Any]], None]] = None, logger=None):
+        self.logger = logger or get_module_logger("Service.DownloadManagement.ProgressCoalescer")
+        self._emit_callable = emit
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._last_sent: Dict[int, Dict[str, Any]] = {}
+        self._listeners: List[Callable[[List[Dict[str, Any]]], None]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._updates_received = 0
+        self._updates_skipped = 0
+        self._updates_emitted = 0
+        self._batches_emitted = 0
+        self.set_flush_rate(flush_hz)
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+    def set_flush_rate(self, flush_hz: Any):
+        """Set flushes per second (clamped to 0 < hz <= MAX_FLUSH_HZ)."""
+        try:
+            hz = float(flush_hz)
+        except (TypeError, ValueError):
+            hz = DEFAULT_FLUSH_HZ
+        if hz <= 0:
+            hz = DEFAULT_FLUSH_HZ
+        self.flush_hz = min(hz, MAX_FLUSH_HZ)
+        self.flush_interval = 1.0 / self.flush_hz
+
+    def add_flush_listener(self, listener: Callable[[List[Dict[str, Any]]], None]):
+        """Register a callable invoked with every flushed batch."""
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+    def submit(self, download_id: int, payload: Dict[str, Any]):
+        """Record the latest progress fields for a download."""
+        with self._lock:
+            self._updates_received += 1
+            base = self._pending.get(download_id) or self._last_sent.get(download_id) or {}
+            merged = {**base, **payload}
+            if download_id not in self._pending and merged == self._last_sent.get(download_id):
+                self._updates_skipped += 1
+                return
+            self._pending[download_id] = merged
+            self._ensure_thread()
+        self._wake.set()
+
+    def discard(self, download_id: int):
+        """Forget a finished download (pending update and last flushed state)."""
+        with self._lock:
+            self._pending.pop(download_id, None)
+            self._last_sent.pop(download_id, None)
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run,
+                name="ProgressCoalescer",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                self.logger.exception("Progress flush failed")
+            time.sleep(self.flush_interval)
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """Emit every changed pending payload as one batch and return it."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            updates = []
+            for download_id, payload in pending.items():
+                if payload == self._last_sent.get(download_id):
+                    self._updates_skipped += 1
+                    continue
+                self._last_sent[download_id] = payload
+                updates.append({**payload, 'download_id': download_id})
+            listeners = list(self._listeners)
+            if updates:
+                self._batches_emitted += 1
+                self._updates_emitted += len(updates)
+
+        if not updates:
+            return updates
+
+        self._emit(PROGRESS_BATCH_EVENT, {'updates': updates})
+        for listener in listeners:
+            try:
+                listener(updates)
+            except Exception:
+                self.logger.exception("Progress flush listener failed")
+        return updates
+
+    def _emit(self, event: str, data: Dict[str, Any]):
+        try:
+            if self._emit_callable is not None:
+                self._emit_callable(event, data)
+                return
+            from app import socketio  # Local import by design
+            socketio.emit(event, data)
+        except Exception as exc:
+            self.logger.error(f"Error emitting event {event}: {exc}")
+
+    # ------------------------------------------------------------------
+    # Diagnostics
+    # ------------------------------------------------------------------
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'flush_hz': self.flush_hz,
+                'pending': len(self._pending),
+                'tracked_downloads': len(self._last_sent),
+                'updates_received': self._updates_received,
+                'updates_skipped': self._updates_skipped,
+                'updates_emitted': self._updates_emitted,
+                'batches_emitted': self._batches_emitted,
+            }
+
+
+_coalescer: Optional[ProgressCoalescer] = None
+_coalescer_lock = threading.Lock()
+
+
+def get_progress_coalescer() -> ProgressCoalescer:
+    """Process-wide coalescer shared by EventEmitter and ProgressTracker."""
+    global _coalescer
+    with _coalescer_lock:
+        if _coalescer is None:
+            _coalescer = ProgressCoalescer()
+        return _coalescer
@@ -2,11 +2,12 @@
 Module Name: progress_tracker.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Tracks download progress and emits real-time SocketIO events with legacy
     argument handling. Normalizes progress data for UI consumption and logs
-    additional fields when provided.
+    additional fields when provided. Payloads are handed to the shared
+    ProgressCoalescer, which batches them into 'download:progress_batch'.
 
 Location:
     /services/download_management/progress_tracker.py
@@ -17,6 +18,8 @@ from typing import Optional, Dict, Any, List
 
 from utils.logger import get_module_logger
 
+from .progress_coalescer import get_progress_coalescer
+
 
 class ProgressTracker:
     """
@@ -25,7 +28,7 @@ class ProgressTracker:
     Features:
     - Progress percentage tracking
     - Speed / ETA calculation helpers
-    - SocketIO emission with backwards-compatible argument handling
+    - Coalesced SocketIO emission with backwards-compatible argument handling
     """
 
     def __init__(self, *, logger=None):
@@ -34,7 +37,7 @@ class ProgressTracker:
     
     def emit_progress(self, download_id: int, *args: Any, **kwargs: Any):
         """
-        Emit progress update via SocketIO.
+        Queue a progress update for the next coalesced SocketIO batch.
         
         Args:
             download_id: Download queue ID
@@ -46,7 +49,6 @@ class ProgressTracker:
         """
         try:
             normalized = self._normalize_arguments(args, kwargs)
-            socketio = self._resolve_socketio()
             event_data = self._build_payload(
                 download_id=download_id,
                 progress_percentage=normalized.get('progress_percentage'),
@@ -59,7 +61,8 @@ class ProgressTracker:
                 total_bytes=normalized.get('total_bytes'),
                 extra=normalized.get('extra', {})
             )
-            socketio.emit('download:progress', event_data)
+            event_data.pop('download_id', None)
+            get_progress_coalescer().submit(download_id, event_data)
 
         except Exception:
             self.logger.exception("Error emitting progress event")
@@ -91,11 +94,6 @@ class ProgressTracker:
         normalized['extra'] = remaining_kwargs
         return normalized
 
-    def _resolve_socketio(self):
-        """Import SocketIO lazily to avoid circular imports."""
-        from app import socketio  # Local import by design
-        return socketio
-
     def _build_payload(
         self,
         download_id: int,
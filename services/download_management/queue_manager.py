@@ -13,7 +13,8 @@ Location:
 
 """
 
-from typing import Optional, Dict, Any, List
+import threading
+from typing import Callable, Iterable, Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 from utils.logger import get_module_logger
@@ -27,8 +28,15 @@ class QueueManager:
     - Enforces one active download per ASIN
     - Priority-based queue ordering
     - Queue statistics and filtering
+    - Status-change listeners (shared by every QueueManager instance)
+    - Single-query multi-status snapshots, counts and change cursors
     """
     
+    TERMINAL_STATUSES = ('IMPORTED', 'FAILED', 'CANCELLED')
+    
+    _status_listeners: List[Callable[[int, str], None]] = []
+    _listener_lock = threading.Lock()
+    
     def __init__(self, *, logger=None):
         """Initialize queue manager."""
         self.logger = logger or get_module_logger("Service.DownloadManagement.QueueManager")
@@ -42,6 +50,34 @@ class QueueManager:
             self._database_service = get_database_service()
         return self._database_service
     
+    @classmethod
+    def add_status_listener(cls, listener: Callable[[int, str], None]):
+        """Register a callback invoked with (download_id, status) after status writes."""
+        with cls._listener_lock:
+            if listener not in cls._status_listeners:
+                cls._status_listeners.append(listener)
+    
+    @classmethod
+    def remove_status_listener(cls, listener: Callable[[int, str], None]):
+        """Unregister a status-change callback."""
+        with cls._listener_lock:
+            if listener in cls._status_listeners:
+                cls._status_listeners.remove(listener)
+    
+    def _notify_status(self, download_id: int, status: str):
+        """Fan a committed status change out to registered listeners."""
+        with self._listener_lock:
+            listeners = list(self._status_listeners)
+        for listener in listeners:
+            try:
+                listener(download_id, status)
+            except Exception as exc:
+                self.logger.debug("Status listener failed", extra={
+                    "download_id": download_id,
+                    "status": status,
+                    "error": str(exc)
+                })
+    
     def _ensure_table_exists(self):
         """Ensure download_queue table exists (for frozen schema)."""
         if self._table_initialized:
@@ -86,6 +122,7 @@ class QueueManager:
             # Create indexes
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_download_queue_asin ON download_queue(book_asin)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_download_queue_status ON download_queue(status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_download_queue_updated_at ON download_queue(updated_at, id)")
             
             conn.commit()
             self._table_initialized = True
@@ -180,6 +217,9 @@ class QueueManager:
                 if api_name in kwargs and db_name not in insert_data:
                     insert_data[db_name] = kwargs[api_name]
             
+            # Same clock and format as update_download() so change cursors order correctly
+            insert_data['updated_at'] = insert_data['queued_at']
+            
             # Build INSERT query
             columns = ', '.join(insert_data.keys())
             placeholders = ', '.join(['?' for _ in insert_data])
@@ -197,6 +237,7 @@ class QueueManager:
                 "priority": priority
             })
             
+            self._notify_status(download_id, insert_data['status'])
             return download_id
             
         finally:
@@ -322,6 +363,166 @@ class QueueManager:
             if conn:
                 conn.close()
     
+    def get_queue_snapshot(self, statuses: Optional[Iterable[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get queue items for several statuses with a single query.
+        
+        Args:
+            statuses: Statuses to include; defaults to every non-terminal status
+        
+        Returns:
+            Dictionary of status -> download records (queued_at order). Requested
+            statuses with no items map to an empty list.
+        """
+        self._ensure_table_exists()
+        db = self._get_database_service()
+        conn, cursor = db.connection_manager.connect_db()
+        
+        try:
+            requested = [str(status).strip().upper() for status in statuses] if statuses is not None else None
+            if requested is not None:
+                if not requested:
+                    return {}
+                placeholders = ', '.join('?' for _ in requested)
+                cursor.execute(f"""
+                    SELECT * FROM download_queue 
+                    WHERE status IN ({placeholders})
+                    ORDER BY queued_at ASC
+                """, requested)
+            else:
+                placeholders = ', '.join('?' for _ in self.TERMINAL_STATUSES)
+                cursor.execute(f"""
+                    SELECT * FROM download_queue 
+                    WHERE status NOT IN ({placeholders})
+                    ORDER BY queued_at ASC
+                """, self.TERMINAL_STATUSES)
+            
+            columns = [description[0] for description in cursor.description]
+            snapshot: Dict[str, List[Dict[str, Any]]] = {status: [] for status in (requested or [])}
+            for row in cursor.fetchall():
+                item = dict(zip(columns, row))
+                snapshot.setdefault(item.get('status'), []).append(item)
+            return snapshot
+            
+        finally:
+            if cursor:
+                cursor.close()
+            if conn:
+                conn.close()
+    
+    def get_status_counts(self, statuses: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Count queue items per status without materializing rows.
+        
+        Served from idx_download_queue_status; requested statuses with no
+        items are reported as 0.
+        
+        Args:
+            statuses: Statuses to count; defaults to all statuses present
+        
+        Returns:
+            Dictionary of status -> count
+        """
+        self._ensure_table_exists()
+        db = self._get_database_service()
+        conn, cursor = db.connection_manager.connect_db()
+        
+        try:
+            requested = [str(status).strip().upper() for status in statuses] if statuses is not None else None
+            if requested is not None:
+                if not requested:
+                    return {}
+                placeholders = ', '.join('?' for _ in requested)
+                cursor.execute(f"""
+                    SELECT status, COUNT(*) FROM download_queue 
+                    WHERE status IN ({placeholders})
+                    GROUP BY status
+                """, requested)
+            else:
+                cursor.execute("SELECT status, COUNT(*) FROM download_queue GROUP BY status")
+            
+            counts: Dict[str, int] = {status: 0 for status in (requested or [])}
+            for status, count in cursor.fetchall():
+                counts[status] = count
+            return counts
+            
+        finally:
+            if cursor:
+                cursor.close()
+            if conn:
+                conn.close()
+    
+    def get_change_cursor(self) -> Optional[Tuple[str, int]]:
+        """
+        Get a change cursor positioned after the most recent write.
+        
+        Returns:
+            Cursor for get_changed_since(), or None when the queue is empty
+        """
+        self._ensure_table_exists()
+        db = self._get_database_service()
+        conn, cursor = db.connection_manager.connect_db()
+        
+        try:
+            cursor.execute("""
+                SELECT updated_at, id FROM download_queue 
+                WHERE updated_at IS NOT NULL
+                ORDER BY updated_at DESC, id DESC
+                LIMIT 1
+            """)
+            row = cursor.fetchone()
+            return (row[0], row[1]) if row else None
+            
+        finally:
+            if cursor:
+                cursor.close()
+            if conn:
+                conn.close()
+    
+    def get_changed_since(self, since: Optional[Tuple[str, int]] = None) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, int]]]:
+        """
+        Get queue items written after a change cursor.
+        
+        Args:
+            since: Cursor returned by a previous call, or None for every row
+        
+        Returns:
+            (changed download records in update order, cursor for the next call).
+            The cursor is unchanged when nothing new was written.
+        """
+        self._ensure_table_exists()
+        db = self._get_database_service()
+        conn, cursor = db.connection_manager.connect_db()
+        
+        try:
+            if since:
+                updated_at, last_id = since
+                cursor.execute("""
+                    SELECT * FROM download_queue 
+                    WHERE updated_at > ? OR (updated_at = ? AND id > ?)
+                    ORDER BY updated_at ASC, id ASC
+                """, (updated_at, updated_at, last_id))
+            else:
+                cursor.execute("""
+                    SELECT * FROM download_queue 
+                    WHERE updated_at IS NOT NULL
+                    ORDER BY updated_at ASC, id ASC
+                """)
+            
+            columns = [description[0] for description in cursor.description]
+            items = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            if not items:
+                return [], since
+            
+            last = items[-1]
+            return items, (last.get('updated_at'), last.get('id'))
+            
+        finally:
+            if cursor:
+                cursor.close()
+            if conn:
+                conn.close()
+    
     def update_download(self, download_id: int, updates: Dict[str, Any]):
         """
         Update download record.
@@ -351,6 +552,55 @@ class QueueManager:
                 "updated_fields": list(updates.keys())
             })
             
+            if 'status' in updates:
+                self._notify_status(download_id, updates['status'])
+            
+        finally:
+            if cursor:
+                cursor.close()
+            if conn:
+                conn.close()
+    
+    def update_downloads(self, updates_by_id: Dict[int, Dict[str, Any]]):
+        """
+        Update several download records in a single transaction.
+        
+        Args:
+            updates_by_id: Mapping of download queue ID to fields to update
+        """
+        if not updates_by_id:
+            return
+        
+        self._ensure_table_exists()
+        db = self._get_database_service()
+        conn, cursor = db.connection_manager.connect_db()
+        
+        try:
+            updated_at = datetime.now().isoformat()
+            
+            # Group rows sharing the same column set so each shape is one executemany
+            grouped: Dict[tuple, List[List[Any]]] = {}
+            for download_id, updates in updates_by_id.items():
+                if not updates:
+                    continue
+                fields = dict(updates)
+                fields['updated_at'] = updated_at
+                keys = tuple(fields.keys())
+                grouped.setdefault(keys, []).append(list(fields.values()) + [download_id])
+            
+            for keys, rows in grouped.items():
+                set_clause = ', '.join([f"{key}=?" for key in keys])
+                cursor.executemany(f"UPDATE download_queue SET {set_clause} WHERE id=?", rows)
+            conn.commit()
+            
+            self.logger.debug("Updated downloads", extra={
+                "download_count": len(updates_by_id)
+            })
+            
+            for download_id, updates in updates_by_id.items():
+                if updates and 'status' in updates:
+                    self._notify_status(download_id, updates['status'])
+            
         finally:
             if cursor:
                 cursor.close()
@@ -0,0 +1,19 @@
+"""
+Module Name: __init__.py
+Author: TheDragonShaman
+Created: Oct 16 2026
+Last Modified: Oct 16 2026
+Description:
+    Package initializer for the shared persistent HTTP response cache.
+
+Location:
+    /services/http_cache/__init__.py
+
+"""
+
+from .response_cache import ResponseCache, get_response_cache
+
+__all__ = [
+    'ResponseCache',
+    'get_response_cache',
+]
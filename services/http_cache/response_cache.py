@@ -0,0 +1,356 @@
+"""
+Module Name: response_cache.py
+Author: TheDragonShaman
+Created: Oct 16 2026
+Last Modified: Oct 16 2026
+Description:
+    Persistent HTTP response cache shared by metadata services (Audnexus,
+    Audible catalog). Responses are stored in a small SQLite file keyed by
+    namespace, endpoint and request parameters, with per-call TTLs,
+    stale-while-revalidate, negative caching of "not found" answers, an
+    in-memory hot tier and LRU eviction once the entry cap is reached.
+
+Location:
+    /services/http_cache/response_cache.py
+
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils.logger import get_module_logger
+from utils.path_resolver import get_path_resolver
+
+_LOGGER = get_module_logger("Service.HttpCache.ResponseCache")
+
+DEFAULT_CACHE_FILENAME = "http_response_cache.db"
+DEFAULT_MAX_ENTRIES = 20000
+DEFAULT_MEMORY_ENTRIES = 512
+
+# Status codes the cache understands; anything else is passed through uncached
+STATUS_OK = 200
+STATUS_NOT_FOUND = 404
+
+# Loader contract: () -> (status_code, payload). Payloads for 200 are stored;
+# 404 is stored as a negative entry; other statuses are returned, never stored.
+Loader = Callable[[], Tuple[int, Any]]
+
+
+class ResponseCache:
+    """
+    SQLite-backed response cache with an in-memory hot tier.
+
+    Features:
+    - Fresh hits served from memory or disk without touching the network
+    - Stale entries served immediately while one background refresh runs
+    - Stale entries served when the upstream errors (serve-stale-on-error)
+    - Negative entries for 404 so repeated misses stay offline
+    - LRU eviction down to 90% of max_entries
+    - Hit/miss counters per namespace
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        logger=None,
+    ):
+        self.logger = logger or _LOGGER
+        self.db_path = db_path
+        self.max_entries = max(1, int(max_entries))
+        self.memory_entries = max(0, int(memory_entries))
+
+        self._lock = threading.RLock()
+        self._conn = self._open()
+        self._memory: "OrderedDict[str, Tuple[int, Optional[str], float, float]]" = OrderedDict()
+        self._touched: Dict[str, float] = {}
+        self._refreshing = set()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._writes_since_trim = 0
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+    def _open(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+                CREATE TABLE IF NOT EXISTS responses (
+                    cache_key TEXT PRIMARY KEY,
+                    namespace TEXT NOT NULL,
+                    status INTEGER NOT NULL,
+                    body TEXT,
+                    expires_at REAL NOT NULL,
+                    stale_until REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+        return conn
+
+    @staticmethod
+    def make_key(namespace: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build a stable key from namespace, endpoint and (unordered) params."""
+        normalized = sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+        raw = json.dumps([namespace, endpoint, normalized], separators=(",", ":"))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _read(self, key: str) -> Optional[Tuple[int, Any, float, float]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            else:
+                entry = self._conn.execute(
+                    "SELECT status, body, expires_at, stale_until FROM responses WHERE cache_key = ?",
+                    (key,)
+                ).fetchone()
+                if entry is None:
+                    return None
+                entry = tuple(entry)
+                self._remember(key, entry)
+            self._touched[key] = time.time()
+
+        # Bodies are kept serialized so every caller gets its own copy to mutate
+        status, body, expires_at, stale_until = entry
+        return status, json.loads(body) if body is not None else None, expires_at, stale_until
+
+    def _remember(self, key: str, entry: Tuple[int, Optional[str], float, float]):
+        if not self.memory_entries:
+            return
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _write(self, namespace: str, key: str, status: int, payload: Any, ttl: float, stale_ttl: float):
+        now = time.time()
+        expires_at = now + ttl
+        body = json.dumps(payload) if payload is not None else None
+        entry = (status, body, expires_at, expires_at + stale_ttl)
+        with self._lock:
+            self._conn.execute(
+                """
+                    INSERT OR REPLACE INTO responses
+                        (cache_key, namespace, status, body, expires_at, stale_until, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, namespace, status, body, entry[2], entry[3], now)
+            )
+            self._touched.pop(key, None)
+            self._remember(key, entry)
+            self._stats[namespace]["stores"] += 1
+            self._writes_since_trim += 1
+            if self._writes_since_trim >= 100:
+                self._trim()
+
+    def _trim(self):
+        """Flush LRU timestamps and evict least recently used rows above the cap."""
+        with self._lock:
+            self._writes_since_trim = 0
+            if self._touched:
+                self._conn.executemany(
+                    "UPDATE responses SET last_access = ? WHERE cache_key = ?",
+                    [(accessed, key) for key, accessed in self._touched.items()]
+                )
+                self._touched.clear()
+
+            now = time.time()
+            expired = self._conn.execute("DELETE FROM responses WHERE stale_until < ?", (now,)).rowcount
+
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+            evicted = 0
+            if count > self.max_entries:
+                target = int(self.max_entries * 0.9)
+                evicted = self._conn.execute(
+                    """
+                        DELETE FROM responses WHERE cache_key IN (
+                            SELECT cache_key FROM responses ORDER BY last_access LIMIT ?
+                        )
+                    """,
+                    (count - target,)
+                ).rowcount
+            if expired or evicted:
+                self._memory.clear()
+                self._stats["_all"]["evictions"] += evicted + max(expired, 0)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def fetch(
+        self,
+        namespace: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        loader: Loader,
+        *,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        negative_ttl: Optional[float] = None,
+        refresh: bool = False,
+    ) -> Tuple[int, Any]:
+        """
+        Return (status_code, payload) for a request, using the cache when possible.
+
+        Args:
+            namespace: Cache namespace (service name), used for stats
+            endpoint: Endpoint identifier (path template)
+            params: Request parameters that identify the response
+            loader: Callable performing the real request
+            ttl: Seconds a 200 response stays fresh
+            stale_ttl: Extra seconds a stale 200 may be served while refreshing
+            negative_ttl: Seconds a 404 stays cached (defaults to ttl)
+            refresh: Skip the read and always call the loader (result is stored)
+
+        Raises:
+            Whatever loader raises, when there is no stale entry to fall back on
+        """
+        key = self.make_key(namespace, endpoint, params)
+        stats = self._stats[namespace]
+        now = time.time()
+
+        entry = None if refresh else self._read(key)
+        if entry is not None:
+            status, payload, expires_at, stale_until = entry
+            if now < expires_at:
+                stats["negative_hits" if status == STATUS_NOT_FOUND else "hits"] += 1
+                return status, payload
+            if status == STATUS_OK and now < stale_until:
+                stats["stale_hits"] += 1
+                self._refresh_in_background(namespace, key, loader, ttl, stale_ttl, negative_ttl)
+                return status, payload
+
+        stats["misses"] += 1
+        try:
+            status, payload = loader()
+        except Exception:
+            if entry is not None and entry[0] == STATUS_OK:
+                stats["stale_on_error"] += 1
+                return entry[0], entry[1]
+            stats["errors"] += 1
+            raise
+
+        if status not in (STATUS_OK, STATUS_NOT_FOUND) and entry is not None and entry[0] == STATUS_OK:
+            stats["stale_on_error"] += 1
+            return entry[0], entry[1]
+
+        self._store(namespace, key, status, payload, ttl, stale_ttl, negative_ttl)
+        return status, payload
+
+    def _store(self, namespace, key, status, payload, ttl, stale_ttl, negative_ttl):
+        try:
+            if status == STATUS_OK:
+                self._write(namespace, key, status, payload, ttl, stale_ttl)
+            elif status == STATUS_NOT_FOUND:
+                self._write(namespace, key, status, None, ttl if negative_ttl is None else negative_ttl, 0.0)
+        except (sqlite3.Error, TypeError, ValueError) as exc:
+            self._stats[namespace]["errors"] += 1
+            self.logger.debug("Response cache write failed", extra={"namespace": namespace, "error": str(exc)})
+
+    def _refresh_in_background(self, namespace, key, loader, ttl, stale_ttl, negative_ttl):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ResponseCacheRefresh")
+            executor = self._refresh_executor
+
+        def refresh():
+            try:
+                status, payload = loader()
+                if status in (STATUS_OK, STATUS_NOT_FOUND):
+                    self._store(namespace, key, status, payload, ttl, stale_ttl, negative_ttl)
+                    self._stats[namespace]["refreshes"] += 1
+            except Exception as exc:
+                self.logger.debug("Background refresh failed", extra={"namespace": namespace, "error": str(exc)})
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        executor.submit(refresh)
+
+    def invalidate(self, namespace: Optional[str] = None) -> int:
+        """Drop cached entries (all, or one namespace). Returns rows removed."""
+        with self._lock:
+            if namespace:
+                removed = self._conn.execute("DELETE FROM responses WHERE namespace = ?", (namespace,)).rowcount
+            else:
+                removed = self._conn.execute("DELETE FROM responses").rowcount
+            self._memory.clear()
+            self._touched.clear()
+            return removed
+
+    def get_stats(self, namespace: Optional[str] = None) -> Dict[str, Any]:
+        """Return hit/miss counters (one namespace or all) plus size information."""
+        with self._lock:
+            if namespace:
+                counters = dict(self._stats.get(namespace, {}))
+                (entries,) = self._conn.execute(
+                    "SELECT COUNT(*) FROM responses WHERE namespace = ?", (namespace,)
+                ).fetchone()
+            else:
+                counters = defaultdict(int)
+                for name, values in self._stats.items():
+                    for counter, value in values.items():
+                        counters[counter] += value
+                counters = dict(counters)
+                (entries,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+
+        lookups = sum(counters.get(name, 0) for name in ("hits", "negative_hits", "stale_hits", "misses"))
+        served = lookups - counters.get("misses", 0)
+        return {
+            "hits": counters.get("hits", 0),
+            "negative_hits": counters.get("negative_hits", 0),
+            "stale_hits": counters.get("stale_hits", 0),
+            "misses": counters.get("misses", 0),
+            "stale_on_error": counters.get("stale_on_error", 0),
+            "refreshes": counters.get("refreshes", 0),
+            "stores": counters.get("stores", 0),
+            "errors": counters.get("errors", 0),
+            "evictions": counters.get("evictions", 0),
+            "hit_rate": round(served / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "db_path": self.db_path,
+        }
+
+    def close(self):
+        """Flush access times and close the cache file."""
+        with self._lock:
+            try:
+                self._trim()
+            finally:
+                if self._refresh_executor is not None:
+                    self._refresh_executor.shutdown(wait=False, cancel_futures=True)
+                    self._refresh_executor = None
+                self._conn.close()
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache stored in the config directory."""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                db_path = os.path.join(get_path_resolver().get_config_dir(), DEFAULT_CACHE_FILENAME)
+                _response_cache = ResponseCache(db_path)
+    return _response_cache
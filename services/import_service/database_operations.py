@@ -2,7 +2,7 @@
 Module Name: database_operations.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Database helpers for import tracking. Updates book records with library
     paths, formats, quality, and import timestamps, and queries existing
@@ -90,6 +90,7 @@ class ImportDatabaseOperations:
             ))
             
             conn.commit()
+            database_service.invalidate_library_status([asin])
             
             if cursor.rowcount > 0:
                 self.logger.info(f"Updated import info for ASIN: {asin}")
@@ -197,6 +198,7 @@ class ImportDatabaseOperations:
             
             cursor.execute(update_sql, (asin,))
             conn.commit()
+            database_service.invalidate_library_status([asin])
             
             if cursor.rowcount > 0:
                 self.logger.info(f"Cleared import info for ASIN: {asin}")
@@ -2,35 +2,58 @@
 Module Name: file_operations.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Handles atomic file moves and copies with optional checksum verification
-    for the import service. Encapsulates disk checks and cleanup of
-    partially moved files.
+    for the import service. Same-device moves are plain renames; cross-device
+    moves stream through a temporary file that is verified before it is renamed.
+    Encapsulates disk checks and cleanup of partially moved files.
 
 Location:
     /services/import_service/file_operations.py
 
 """
 
+import errno
+import hashlib
 import os
 import shutil
-import hashlib
-from typing import Tuple
+import tempfile
+from typing import Tuple, Union
 
 from utils.logger import get_module_logger
 
 
 _LOGGER = get_module_logger("Service.Import.FileOperations")
 
+# Verification modes for cross-device moves and copies
+VERIFY_FULL = 'full'
+VERIFY_SAMPLED = 'sampled'
+VERIFY_NONE = 'none'
+
+COPY_CHUNK_SIZE = 1024 * 1024
+ZERO_COPY_CHUNK_SIZE = 64 * 1024 * 1024
+SAMPLE_BLOCK_SIZE = 64 * 1024
+SAMPLE_BLOCK_COUNT = 16
+
+# errno values meaning "this kernel/filesystem can't do in-kernel copies here"
+_ZERO_COPY_UNSUPPORTED = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOTSOCK, errno.EBADF,
+}
+
+
+class _VerificationError(Exception):
+    """Raised when a copied file does not match its source."""
+
 
 class FileOperations:
     """
     Handles file system operations for importing.
     
     Features:
-    - Atomic file moves
-    - File verification (checksums)
+    - Atomic file moves (rename on the same filesystem, verified copy across)
+    - File verification (full checksum or sampled blocks)
+    - In-kernel copies via copy_file_range/sendfile when available
     - Directory creation
     - Disk space checks
     """
@@ -38,14 +61,24 @@ class FileOperations:
     def __init__(self, *, logger=None):
         self.logger = logger or _LOGGER
     
-    def move_file_atomic(self, source: str, destination: str, verify: bool = True) -> Tuple[bool, str]:
+    def move_file_atomic(self, source: str, destination: str,
+                         verify: Union[bool, str] = True) -> Tuple[bool, str]:
         """
         Move a file atomically with optional verification.
         
+        Same-device moves are a single rename and are never hashed (a rename
+        cannot alter file contents). Cross-device moves copy into a temporary
+        file next to the destination, verify it, rename it into place and
+        only then remove the source.
+        
         Args:
             source: Source file path
             destination: Destination file path
-            verify: Whether to verify file after move
+            verify: Verification mode for cross-device moves - True/'full'
+                (SHA-256 of the source computed while copying, compared to
+                the SHA-256 of the destination after fsync; the source must
+                not change during the copy), 'sampled' (compare sampled
+                blocks), False/'none' (size check only)
             
         Returns:
             Tuple of (success: bool, message: str)
@@ -55,54 +88,48 @@ class FileOperations:
             if not os.path.exists(source):
                 return False, f"Source file does not exist: {source}"
             
+            dest_dir = os.path.dirname(destination)
+            
+            # Same filesystem: rename is atomic and needs no space or checksum checks
+            if self._same_device(source, dest_dir):
+                try:
+                    os.makedirs(dest_dir, exist_ok=True)
+                    os.replace(source, destination)
+                    self.logger.info("Successfully moved file", extra={"source": source, "destination": destination, "method": "rename"})
+                    return True, "File moved successfully"
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        return False, f"File move failed: {str(e)}"
+                    # Bind mounts can share st_dev yet reject rename; fall back to copying
+            
             # Get source file size for disk space check
             source_size = os.path.getsize(source)
             
             # Check destination disk space
-            dest_dir = os.path.dirname(destination)
             if not self._check_disk_space(dest_dir, source_size):
                 return False, f"Insufficient disk space at destination"
             
             # Create destination directory if needed
             os.makedirs(dest_dir, exist_ok=True)
             
-            # Calculate source checksum if verification requested
-            source_checksum = None
-            if verify:
-                source_checksum = self._calculate_checksum(source)
+            success, message = self._copy_verified(source, destination, self._verify_mode(verify))
+            if not success:
+                return False, message
             
-            # Perform atomic move
-            # On Linux, shutil.move uses os.rename when on same filesystem (atomic)
-            # Otherwise it copies then deletes (not atomic but safe)
             try:
-                shutil.move(source, destination)
-            except Exception as e:
-                return False, f"File move failed: {str(e)}"
-            
-            # Verify the move if requested
-            if verify:
-                if not os.path.exists(destination):
-                    return False, "Destination file does not exist after move"
-                
-                dest_checksum = self._calculate_checksum(destination)
-                if source_checksum != dest_checksum:
-                    # Checksums don't match - corruption during move
-                    self.logger.error(f"Checksum mismatch after move: {source} -> {destination}")
-                    # Attempt to delete corrupted file
-                    try:
-                        os.remove(destination)
-                    except:
-                        pass
-                    return False, "File verification failed - checksums don't match"
-            
-            self.logger.info("Successfully moved file", extra={"source": source, "destination": destination})
+                os.remove(source)
+            except OSError as e:
+                self.logger.warning(f"Moved file but could not remove source {source}: {e}")
+            
+            self.logger.info("Successfully moved file", extra={"source": source, "destination": destination, "method": "copy"})
             return True, "File moved successfully"
             
         except Exception as e:
             self.logger.error(f"Error during file move: {e}")
             return False, f"File move error: {str(e)}"
     
-    def copy_file_atomic(self, source: str, destination: str, verify: bool = True) -> Tuple[bool, str]:
+    def copy_file_atomic(self, source: str, destination: str,
+                         verify: Union[bool, str] = True) -> Tuple[bool, str]:
         """
         Copy a file atomically with verification (for seeding preservation).
         
@@ -113,21 +140,22 @@ class FileOperations:
         Args:
             source: Source file path
             destination: Destination file path
-            verify: Whether to verify file after copy
+            verify: Verification mode (see move_file_atomic)
             
         Returns:
             Tuple of (success: bool, message: str)
         """
         return self.copy_file(source, destination, verify)
     
-    def copy_file(self, source: str, destination: str, verify: bool = True) -> Tuple[bool, str]:
+    def copy_file(self, source: str, destination: str,
+                  verify: Union[bool, str] = True) -> Tuple[bool, str]:
         """
         Copy a file (non-destructive alternative to move).
         
         Args:
             source: Source file path
             destination: Destination file path
-            verify: Whether to verify file after copy
+            verify: Verification mode (see move_file_atomic)
             
         Returns:
             Tuple of (success: bool, message: str)
@@ -148,27 +176,9 @@ class FileOperations:
             # Create destination directory if needed
             os.makedirs(dest_dir, exist_ok=True)
             
-            # Calculate source checksum if verification requested
-            source_checksum = None
-            if verify:
-                source_checksum = self._calculate_checksum(source)
-            
-            # Copy file
-            shutil.copy2(source, destination)  # copy2 preserves metadata
-            
-            # Verify the copy if requested
-            if verify:
-                if not os.path.exists(destination):
-                    return False, "Destination file does not exist after copy"
-                
-                dest_checksum = self._calculate_checksum(destination)
-                if source_checksum != dest_checksum:
-                    self.logger.error(f"Checksum mismatch after copy: {source} -> {destination}")
-                    try:
-                        os.remove(destination)
-                    except:
-                        pass
-                    return False, "File verification failed - checksums don't match"
+            success, message = self._copy_verified(source, destination, self._verify_mode(verify))
+            if not success:
+                return False, message
             
             self.logger.info("Successfully copied file", extra={"source": source, "destination": destination})
             return True, "File copied successfully"
@@ -177,6 +187,163 @@ class FileOperations:
             self.logger.error(f"Error during file copy: {e}")
             return False, f"File copy error: {str(e)}"
     
+    def _copy_verified(self, source: str, destination: str, mode: str) -> Tuple[bool, str]:
+        """
+        Copy source to a temporary file beside destination, verify, then rename into place.
+        
+        Args:
+            source: Source file path
+            destination: Destination file path
+            mode: Normalized verification mode
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        dest_dir = os.path.dirname(destination) or '.'
+        fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(destination)}.", suffix=".partial", dir=dest_dir)
+        try:
+            with open(source, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+                if mode == VERIFY_FULL:
+                    # Hash the source while copying so it is read only once;
+                    # the destination is hashed after fsync and compared
+                    before = os.fstat(src.fileno())
+                    checksum = self._copy_stream_hashed(src, dst)
+                    after = os.fstat(src.fileno())
+                    if (before.st_size, before.st_mtime_ns) != (after.st_size, after.st_mtime_ns):
+                        raise _VerificationError("File verification failed - source changed during copy")
+                else:
+                    self._copy_zero_copy(src, dst)
+                dst.flush()
+                os.fsync(dst.fileno())
+            shutil.copystat(source, temp_path)
+            
+            if os.path.getsize(temp_path) != os.path.getsize(source):
+                raise _VerificationError("File verification failed - sizes don't match")
+            if mode == VERIFY_FULL and self._calculate_checksum(temp_path) != checksum:
+                raise _VerificationError("File verification failed - checksums don't match")
+            if mode == VERIFY_SAMPLED and not self._sampled_blocks_match(source, temp_path):
+                raise _VerificationError("File verification failed - sampled blocks don't match")
+            
+            os.replace(temp_path, destination)
+            return True, "File copied successfully"
+            
+        except _VerificationError as e:
+            self.logger.error(f"{e}: {source} -> {destination}")
+            self._remove_quietly(temp_path)
+            return False, str(e)
+        except Exception as e:
+            self._remove_quietly(temp_path)
+            return False, f"File copy failed: {str(e)}"
+    
+    def _copy_stream_hashed(self, src, dst) -> str:
+        """Copy between open files, hashing each chunk and checking every write."""
+        hash_func = hashlib.sha256()
+        buffer = bytearray(COPY_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            read = src.readinto(buffer)
+            if not read:
+                break
+            chunk = view[:read]
+            hash_func.update(chunk)
+            if dst.write(chunk) != read:
+                raise _VerificationError("File verification failed - short write")
+        return hash_func.hexdigest()
+    
+    def _copy_zero_copy(self, src, dst):
+        """Copy between open files in-kernel (copy_file_range, then sendfile) when supported."""
+        in_fd, out_fd = src.fileno(), dst.fileno()
+        
+        copy_file_range = getattr(os, 'copy_file_range', None)
+        if copy_file_range is not None:
+            try:
+                while copy_file_range(in_fd, out_fd, ZERO_COPY_CHUNK_SIZE):
+                    pass
+                return
+            except OSError as e:
+                if e.errno not in _ZERO_COPY_UNSUPPORTED:
+                    raise
+                self._rewind(src, dst)
+        
+        sendfile = getattr(os, 'sendfile', None)
+        if sendfile is not None:
+            try:
+                offset = 0
+                while True:
+                    sent = sendfile(out_fd, in_fd, offset, ZERO_COPY_CHUNK_SIZE)
+                    if not sent:
+                        break
+                    offset += sent
+                return
+            except OSError as e:
+                if e.errno not in _ZERO_COPY_UNSUPPORTED:
+                    raise
+                self._rewind(src, dst)
+        
+        shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+    
+    @staticmethod
+    def _rewind(src, dst):
+        """Reset both files after a partial in-kernel copy attempt."""
+        src.seek(0)
+        dst.seek(0)
+        dst.truncate()
+    
+    def _sampled_blocks_match(self, source: str, destination: str) -> bool:
+        """
+        Compare the first, last and evenly spaced blocks of two files.
+        
+        Catches truncation and gross corruption for a fixed, small read cost
+        regardless of file size.
+        """
+        size = os.path.getsize(source)
+        if size <= SAMPLE_BLOCK_SIZE * SAMPLE_BLOCK_COUNT:
+            return self._calculate_checksum(source) == self._calculate_checksum(destination)
+        
+        last_offset = size - SAMPLE_BLOCK_SIZE
+        step = last_offset / (SAMPLE_BLOCK_COUNT - 1)
+        offsets = sorted({int(index * step) for index in range(SAMPLE_BLOCK_COUNT)})
+        
+        with open(source, 'rb') as src, open(destination, 'rb') as dst:
+            for offset in offsets:
+                src.seek(offset)
+                dst.seek(offset)
+                if src.read(SAMPLE_BLOCK_SIZE) != dst.read(SAMPLE_BLOCK_SIZE):
+                    return False
+        return True
+    
+    @staticmethod
+    def _verify_mode(verify: Union[bool, str, None]) -> str:
+        """Normalize a verify flag or config string into a VERIFY_* mode."""
+        if isinstance(verify, str):
+            value = verify.strip().lower()
+            if value == VERIFY_SAMPLED:
+                return VERIFY_SAMPLED
+            if value in (VERIFY_NONE, 'false', '0', 'no', 'off', ''):
+                return VERIFY_NONE
+            return VERIFY_FULL
+        return VERIFY_FULL if verify else VERIFY_NONE
+    
+    @staticmethod
+    def _same_device(source: str, dest_dir: str) -> bool:
+        """Return True if source and the destination directory share a filesystem."""
+        probe_path = os.path.abspath(dest_dir or '.')
+        while not os.path.exists(probe_path):
+            parent = os.path.dirname(probe_path)
+            if not parent or parent == probe_path:
+                return False
+            probe_path = parent
+        try:
+            return os.stat(source).st_dev == os.stat(probe_path).st_dev
+        except OSError:
+            return False
+    
+    def _remove_quietly(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
     def _calculate_checksum(self, file_path: str, algorithm: str = 'sha256') -> str:
         """
         Calculate file checksum.
@@ -193,7 +360,7 @@ class FileOperations:
         try:
             with open(file_path, 'rb') as f:
                 # Read in chunks to handle large files
-                for chunk in iter(lambda: f.read(8192), b''):
+                for chunk in iter(lambda: f.read(COPY_CHUNK_SIZE), b''):
                     hash_func.update(chunk)
             
             return hash_func.hexdigest()
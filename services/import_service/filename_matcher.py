@@ -98,16 +98,7 @@ class FilenameMatcher:
             List of matching books
         """
         try:
-            search_lower = search_term.lower()
-            all_books = database_service.get_all_books()
-            
-            matches = []
-            for book in all_books:
-                title = book.get('Title', '')
-                if search_lower in title.lower():
-                    matches.append(book)
-                    if len(matches) >= limit:
-                        break
+            matches = database_service.search_books(search_term, limit=limit, fields=['title'])
             
             self.logger.info(f"Found {len(matches)} books matching '{search_term}'")
             return matches
@@ -2,7 +2,7 @@
 Module Name: import_service.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Manages audiobook importing into the library, coordinating file moves,
     database tracking, validation, and ASIN tagging. Follows the singleton
@@ -122,7 +122,11 @@ class ImportService:
                 
                 # Load import settings
                 import_config = config_service.get_section('import')
-                self.verify_after_import = import_config.get('verify_after_import', True)
+                # verify_mode ('full', 'sampled', 'none') applies to cross-device moves/copies
+                if import_config.get('verify_after_import', True):
+                    self.verify_after_import = import_config.get('verify_mode', 'full')
+                else:
+                    self.verify_after_import = False
                 self.create_backup_on_error = import_config.get('create_backup_on_error', True)
                 self.overwrite_existing_files = import_config.get('overwrite_existing_files', False)
                 
@@ -2,7 +2,7 @@
 Module Name: base_indexer.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Abstract base class for all indexer implementations (Jackett, Prowlarr,
     direct providers). Defines the interface and shared helpers for Torznab
@@ -17,6 +17,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 from enum import Enum
 
+from .http_session import IndexerHttpSession
 from utils.logger import get_module_logger
 
 
@@ -61,6 +62,8 @@ class BaseIndexer(ABC):
                 - categories: List of category IDs to search (optional)
                 - timeout: Request timeout in seconds (optional, default 30)
                 - verify_ssl: Whether to verify SSL certificates (optional, default True)
+                - retries: Retry count for idempotent requests (optional, default 2)
+                - retry_backoff: Retry backoff factor in seconds (optional, default 0.5)
         """
         self.config = config
         self.name = config.get('name', self.__class__.__name__)
@@ -88,6 +91,9 @@ class BaseIndexer(ABC):
 
         # Logger
         self.logger = logger or _LOGGER
+
+        # Keep-alive transport (rebuilt with the indexer on reload)
+        self.http = IndexerHttpSession(config, logger=self.logger)
         
         self.logger.debug(f"Initializing {self.name} indexer at {self.base_url}")
     
@@ -182,6 +188,7 @@ class BaseIndexer(ABC):
                 - consecutive_failures: int - Number of consecutive failures
                 - last_error: str - Last error message
                 - capabilities: dict - Indexer capabilities
+                - http: dict - Connection pool and reuse counters
         """
         return {
             'name': self.name,
@@ -190,8 +197,13 @@ class BaseIndexer(ABC):
             'available': self.available,
             'consecutive_failures': self.consecutive_failures,
             'last_error': self.last_error,
-            'capabilities': self.capabilities
+            'capabilities': self.capabilities,
+            'http': self.http.get_stats()
         }
+
+    def close(self) -> None:
+        """Release pooled HTTP connections held by this indexer."""
+        self.http.close()
     
     def is_available(self) -> bool:
         """
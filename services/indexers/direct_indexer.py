@@ -2,7 +2,7 @@
 Module Name: direct_indexer.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
         Direct indexer that talks to custom provider APIs (non-Torznab) using
         session tokens. Supports provider adapters for JSON and HTML-based
@@ -55,6 +55,7 @@ class DirectIndexer(BaseIndexer):
 
         super().__init__(cfg, logger=logger or _LOGGER)
         self.adapter = resolve_provider_adapter(self.base_url, cfg)
+        self.adapter.bind_session(self.http)
 
     def connect(self) -> bool:
         """Attempt to connect to the provider by running the health check."""
@@ -219,7 +220,7 @@ class DirectIndexer(BaseIndexer):
             headers.update(spec.headers)
         cookies = self._build_cookies()
 
-        response = requests.request(
+        response = self.http.request(
             method,
             url,
             params=spec.params,
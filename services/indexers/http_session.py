@@ -0,0 +1,170 @@
+"""
+Module Name: http_session.py
+Author: TheDragonShaman
+Created: Oct 16 2026
+Last Modified: Oct 16 2026
+Description:
+    Keep-alive HTTP transport owned by each indexer instance. Wraps a pooled
+    requests.Session with retry/backoff for idempotent requests and exposes
+    connection reuse counters for indexer status reporting.
+
+Location:
+    /services/indexers/http_session.py
+
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.logger import get_module_logger
+
+
+_LOGGER = get_module_logger("Service.Indexers.HttpSession")
+
+# Retry defaults for idempotent requests (overridable per indexer config)
+DEFAULT_RETRIES = 2
+DEFAULT_RETRY_BACKOFF = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Extra pooled connections kept per host beyond the indexer's concurrency cap
+# (AudiobookBay fetches detail pages in parallel within one search)
+POOL_HEADROOM = 4
+
+
+class IndexerHttpSession:
+    """
+    Pooled keep-alive session for a single indexer.
+
+    Features:
+    - One requests.Session per indexer so TCP/TLS connections are reused
+      across searches instead of re-handshaking per request
+    - Per-host pool sized from rate_limit.max_concurrent
+    - urllib3 Retry with exponential backoff on connect errors and
+      429/5xx responses for GET/HEAD only (Retry-After is ignored so a
+      retry never outlives the search deadline)
+    - Request and connection counters to show how often sockets are reused
+    """
+
+    def __init__(self, config: Dict[str, Any], *, logger=None):
+        """
+        Build the session from an indexer config dictionary.
+
+        Args:
+            config: Indexer configuration; reads rate_limit.max_concurrent,
+                retries and retry_backoff
+        """
+        self.logger = logger or _LOGGER
+        self.retries = self._coerce_int(config.get('retries'), DEFAULT_RETRIES, minimum=0)
+        self.retry_backoff = self._coerce_float(config.get('retry_backoff'), DEFAULT_RETRY_BACKOFF)
+        rate_limit = config.get('rate_limit') or {}
+        self.pool_size = self._coerce_int(rate_limit.get('max_concurrent'), 1, minimum=1) + POOL_HEADROOM
+
+        self._lock = threading.Lock()
+        self._closed = False
+        self._retired_requests = 0
+        self._retired_connections = 0
+        self._adapter = self._build_adapter()
+        self.session = requests.Session()
+        self.session.mount('http://', self._adapter)
+        self.session.mount('https://', self._adapter)
+
+    def _build_adapter(self) -> HTTPAdapter:
+        retry = Retry(
+            total=self.retries,
+            connect=self.retries,
+            read=self.retries,
+            status=self.retries,
+            backoff_factor=self.retry_backoff,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+            # A server-sent Retry-After can be minutes long and urllib3 would
+            # sleep through the search deadline; use our own backoff instead
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        return HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.pool_size,
+            max_retries=retry,
+            pool_block=False,
+        )
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request on the pooled session (same signature as requests.request)."""
+        if self._closed:
+            raise RuntimeError("Indexer HTTP session has been closed")
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request on the pooled session."""
+        return self.request('GET', url, **kwargs)
+
+    def close(self):
+        """Close pooled connections; counters are kept for the final stats."""
+        with self._lock:
+            if self._closed:
+                return
+            totals = self._pool_totals()
+            self._retired_requests += totals['requests']
+            self._retired_connections += totals['connections']
+            self._closed = True
+        try:
+            self.session.close()
+        except Exception as exc:  # pragma: no cover - defensive
+            self.logger.debug("Error closing indexer session", extra={"error": str(exc)})
+
+    # ------------------------------------------------------------------
+    # Diagnostics
+    # ------------------------------------------------------------------
+    def _pool_totals(self) -> Dict[str, int]:
+        requests_sent = 0
+        connections = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_sent += getattr(pool, 'num_requests', 0)
+            connections += getattr(pool, 'num_connections', 0)
+        return {'requests': requests_sent, 'connections': connections}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return request, connection and reuse counters for this session."""
+        with self._lock:
+            totals = {'requests': 0, 'connections': 0} if self._closed else self._pool_totals()
+            requests_sent = totals['requests'] + self._retired_requests
+            connections = totals['connections'] + self._retired_connections
+        reused = max(0, requests_sent - connections)
+        return {
+            'requests': requests_sent,
+            'connections_opened': connections,
+            'connections_reused': reused,
+            'reuse_rate': round(reused / requests_sent, 3) if requests_sent else 0.0,
+            'pool_size': self.pool_size,
+            'retries': self.retries,
+            'retry_backoff': self.retry_backoff,
+            'closed': self._closed,
+        }
+
+    @staticmethod
+    def _coerce_int(value: Any, default: int, *, minimum: int = 0) -> int:
+        try:
+            return max(minimum, int(value))
+        except (TypeError, ValueError):
+            return default
+
+    @staticmethod
+    def _coerce_float(value: Any, default: float) -> float:
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return default
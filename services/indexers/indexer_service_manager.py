@@ -2,11 +2,13 @@
 Module Name: indexer_service_manager.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Coordinates all indexer instances with priority-based selection and
-    parallel search execution. Implements singleton pattern and integrates
-    with search engine workflows.
+    parallel search execution. Every (query x indexer) request runs on one
+    long-lived executor under a global deadline and per-indexer concurrency
+    caps. Repeat requests are answered from a short-lived result cache.
+    Implements singleton pattern and integrates with search engine workflows.
 
 Location:
     /services/indexers/indexer_service_manager.py
@@ -14,19 +16,28 @@ Location:
 """
 
 import threading
-from typing import Dict, Any, List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 
 from .base_indexer import BaseIndexer, IndexerProtocol
 from .jackett_indexer import JackettIndexer
 from .direct_indexer import DirectIndexer
+from .search_result_cache import IndexerResultCache
 from services.config.management import ConfigService
 from utils.logger import get_module_logger
 
 
 _LOGGER = get_module_logger("Service.Indexers.Manager")
 
+# Shared search executor size and default deadline for one search fan-out
+SEARCH_EXECUTOR_WORKERS = 16
+DEFAULT_SEARCH_DEADLINE = 60.0
+# How often search_many re-checks permits held by other searches
+SLOT_POLL_INTERVAL = 0.1
+
 
 class IndexerServiceManager:
     """
@@ -35,8 +46,10 @@ class IndexerServiceManager:
     Responsibilities:
     - Load and manage multiple indexers from configuration
     - Priority-based indexer selection (1-10, lower = higher priority)
-    - Parallel search execution across all enabled indexers
+    - Parallel search execution across all enabled indexers on a shared
+      executor, capped per indexer by rate_limit.max_concurrent
     - Result aggregation and deduplication
+    - Short-lived per-indexer result cache keyed by normalized search terms
     - Health monitoring and automatic failover
     """
     
@@ -61,6 +74,10 @@ class IndexerServiceManager:
         self.config_service = config_service or ConfigService()
         self.indexers = {}  # name -> indexer instance
         self.indexer_configs = {}  # name -> config dict
+        self._indexer_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._result_cache = IndexerResultCache()
         
         # Load indexers from config
         self._load_indexers()
@@ -124,6 +141,7 @@ class IndexerServiceManager:
                 # Store indexer
                 self.indexers[name] = indexer
                 self.indexer_configs[name] = config
+                self._indexer_slots[name] = threading.BoundedSemaphore(self._max_concurrent_for(config))
                 
                 self.logger.debug(
                     "Loaded indexer",
@@ -138,6 +156,15 @@ class IndexerServiceManager:
                 self.logger.error("Failed to load indexer", extra={"indexer": name, "error": str(e)})
                 continue
     
+    @staticmethod
+    def _max_concurrent_for(config: Dict[str, Any]) -> int:
+        """Return the concurrent request cap configured for an indexer (min 1)."""
+        rate_limit = config.get('rate_limit') or {}
+        try:
+            return max(1, int(rate_limit.get('max_concurrent', 1)))
+        except (TypeError, ValueError):
+            return 1
+    
     def _load_from_config_py(self):
         """Load indexer config from config.py"""
         self.logger.debug("Loading indexers from config.py")
@@ -171,7 +198,8 @@ class IndexerServiceManager:
         author: Optional[str] = None,
         title: Optional[str] = None,
         limit_per_indexer: int = 100,
-        parallel: bool = True
+        parallel: bool = True,
+        refresh: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Search all available indexers for audiobooks.
@@ -182,6 +210,7 @@ class IndexerServiceManager:
             title: Book title (optional)
             limit_per_indexer: Max results per indexer (default: 100)
             parallel: Whether to search indexers in parallel (default: True)
+            refresh: Skip cached results and query every indexer (default: False)
             
         Returns:
             Aggregated list of results from all indexers
@@ -213,17 +242,14 @@ class IndexerServiceManager:
         if parallel and len(available_indexers) > 1:
             # Parallel search
             all_results = self._search_parallel(
-                available_indexers, query, author, title, limit_per_indexer
+                available_indexers, query, author, title, limit_per_indexer, refresh
             )
         else:
             # Sequential search
             for name, indexer in available_indexers:
                 try:
-                    results = indexer.search(
-                        query=query,
-                        author=author,
-                        title=title,
-                        limit=limit_per_indexer
+                    results = self._run_indexer_search(
+                        name, indexer, query, author, title, limit_per_indexer, refresh
                     )
                     self.logger.debug(
                         "Indexer returned results (sequential)",
@@ -237,16 +263,192 @@ class IndexerServiceManager:
         self.logger.info("Total results from all indexers", extra={"result_count": len(all_results)})
         return all_results
     
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared search executor, creating it on first use."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=SEARCH_EXECUTOR_WORKERS,
+                        thread_name_prefix="IndexerSearch"
+                    )
+        return self._executor
+    
+    def _run_indexer_search(
+        self,
+        name: str,
+        indexer: BaseIndexer,
+        query: str,
+        author: Optional[str],
+        title: Optional[str],
+        limit: int,
+        refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Run one indexer request, answering from the result cache when possible."""
+        cache_key = self._result_cache.build_key(name, query, author, title, limit)
+        if not refresh:
+            cached = self._cached_results(name, cache_key)
+            if cached is not None:
+                return cached
+        return self._fetch_indexer_results(indexer, cache_key, query, author, title, limit)
+
+    def _cached_results(self, name: str, cache_key) -> Optional[List[Dict[str, Any]]]:
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug(
+                "Indexer results served from cache",
+                extra={"indexer": name, "result_count": len(cached)},
+            )
+        return cached
+
+    def _fetch_indexer_results(
+        self,
+        indexer: BaseIndexer,
+        cache_key,
+        query: str,
+        author: Optional[str],
+        title: Optional[str],
+        limit: int,
+        slot: Optional[threading.BoundedSemaphore] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query the indexer and cache healthy responses.
+
+        ``slot`` is a concurrency permit the caller already acquired; it is
+        released when the request finishes.
+        """
+        try:
+            results = indexer.search(query=query, author=author, title=title, limit=limit)
+        finally:
+            if slot is not None:
+                slot.release()
+
+        # Indexers swallow errors and return []; only cache responses that
+        # left the indexer healthy so a transient failure is not replayed
+        if indexer.consecutive_failures == 0:
+            self._result_cache.put(cache_key, results or [])
+        return results
+    
+    def search_many(
+        self,
+        requests: Sequence[Tuple[str, Optional[str], Optional[str]]],
+        limit_per_indexer: int = 100,
+        deadline: float = DEFAULT_SEARCH_DEADLINE,
+        indexers: Optional[List[tuple]] = None,
+        refresh: bool = False
+    ) -> Iterator[Tuple[int, str, List[Dict[str, Any]]]]:
+        """
+        Fan out several searches across every available indexer at once.
+        
+        Cached (request x indexer) pairs are answered immediately. The rest
+        wait in a per-indexer backlog and are only submitted to the shared
+        executor once a rate_limit.max_concurrent permit for that indexer is
+        held, so a slow indexer never occupies executor threads that other
+        indexers could use. Results are yielded as each pair finishes. Pairs
+        still waiting or running when the deadline passes are abandoned.
+        
+        Args:
+            requests: (query, author, title) tuples
+            limit_per_indexer: Max results per indexer per request
+            deadline: Seconds allowed for the whole fan-out
+            indexers: Optional (name, indexer) tuples; defaults to all available
+            refresh: Skip cached results and query every indexer
+        
+        Yields:
+            (request_index, indexer_name, results) tuples
+        """
+        available_indexers = indexers if indexers is not None else [
+            (name, indexer) for name, indexer in list(self.indexers.items())
+            if indexer.is_available()
+        ]
+        if not available_indexers or not requests:
+            if not available_indexers:
+                self.logger.warning("No available indexers for search")
+            return
+        
+        deadline_at = time.monotonic() + deadline
+        backlog: Dict[str, deque] = {}
+        for request_index, (query, author, title) in enumerate(requests):
+            for name, indexer in available_indexers:
+                cache_key = self._result_cache.build_key(name, query, author, title, limit_per_indexer)
+                cached = None if refresh else self._cached_results(name, cache_key)
+                if cached is not None:
+                    yield request_index, name, cached
+                    continue
+                backlog.setdefault(name, deque()).append(
+                    (request_index, indexer, cache_key, query, author, title)
+                )
+
+        executor = self._get_executor()
+        running: Dict[Any, Tuple[int, str, Optional[threading.BoundedSemaphore]]] = {}
+
+        def submit_ready():
+            """Submit backlog items for every indexer that has a free permit."""
+            for name in list(backlog):
+                pending = backlog[name]
+                slot = self._indexer_slots.get(name)
+                while pending and (slot is None or slot.acquire(blocking=False)):
+                    request_index, indexer, cache_key, query, author, title = pending.popleft()
+                    future = executor.submit(
+                        self._fetch_indexer_results,
+                        indexer, cache_key, query, author, title, limit_per_indexer, slot
+                    )
+                    running[future] = (request_index, name, slot)
+                if not pending:
+                    del backlog[name]
+
+        try:
+            submit_ready()
+            while running or backlog:
+                remaining = deadline_at - time.monotonic()
+                if remaining <= 0:
+                    break
+                if not running:
+                    # Every permit is held by another search; poll for one
+                    time.sleep(min(SLOT_POLL_INTERVAL, remaining))
+                    submit_ready()
+                    continue
+                done, _ = wait(list(running), timeout=min(SLOT_POLL_INTERVAL, remaining), return_when=FIRST_COMPLETED)
+                for future in done:
+                    request_index, indexer_name, _ = running.pop(future)
+                    try:
+                        results = future.result() or []
+                    except Exception as e:
+                        self.logger.error("Error in parallel search", extra={"indexer": indexer_name, "error": str(e)})
+                        continue
+                    self.logger.debug(
+                        "Indexer returned results (parallel)",
+                        extra={"indexer": indexer_name, "request_index": request_index, "result_count": len(results)},
+                    )
+                    yield request_index, indexer_name, results
+                submit_ready()
+        finally:
+            for future, (_, _, slot) in running.items():
+                # A future cancelled before it started never releases its permit
+                if future.cancel() and slot is not None:
+                    slot.release()
+            abandoned = {name for _, name, _ in running.values()} | set(backlog)
+            if abandoned:
+                self.logger.warning(
+                    "Indexer searches cut off at deadline",
+                    extra={
+                        "deadline_seconds": deadline,
+                        "indexers": sorted(abandoned),
+                        "pending": len(running) + sum(len(pending) for pending in backlog.values()),
+                    },
+                )
+    
     def _search_parallel(
         self,
         indexers: List[tuple],
         query: str,
         author: Optional[str],
         title: Optional[str],
-        limit: int
+        limit: int,
+        refresh: bool = False
     ) -> List[Dict[str, Any]]:
         """
-        Search multiple indexers in parallel using ThreadPoolExecutor.
+        Search multiple indexers in parallel on the shared executor.
         
         Args:
             indexers: List of (name, indexer) tuples
@@ -254,38 +456,16 @@ class IndexerServiceManager:
             author: Author name
             title: Book title
             limit: Results limit per indexer
+            refresh: Skip cached results
             
         Returns:
             Aggregated results from all indexers
         """
         all_results = []
-        
-        with ThreadPoolExecutor(max_workers=min(len(indexers), 5)) as executor:
-            # Submit all search tasks
-            future_to_indexer = {
-                executor.submit(
-                    indexer.search,
-                    query=query,
-                    author=author,
-                    title=title,
-                    limit=limit
-                ): name
-                for name, indexer in indexers
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_indexer):
-                indexer_name = future_to_indexer[future]
-                try:
-                    results = future.result(timeout=60)  # 60 second timeout per indexer
-                    all_results.extend(results)
-                    self.logger.debug(
-                        "Indexer returned results (parallel)",
-                        extra={"indexer": indexer_name, "result_count": len(results)},
-                    )
-                except Exception as e:
-                    self.logger.error("Error in parallel search", extra={"indexer": indexer_name, "error": str(e)})
-        
+        for _, _, results in self.search_many(
+            [(query, author, title)], limit_per_indexer=limit, indexers=indexers, refresh=refresh
+        ):
+            all_results.extend(results)
         return all_results
     
     def get_indexer(self, name: str) -> Optional[BaseIndexer]:
@@ -331,7 +511,9 @@ class IndexerServiceManager:
                 'base_url': info['base_url'],
                 'consecutive_failures': info['consecutive_failures'],
                 'last_error': info['last_error'],
-                'capabilities': info['capabilities']
+                'capabilities': info['capabilities'],
+                'http': info.get('http', {}),
+                'cache': self._result_cache.get_indexer_stats(name)
             })
         
         return status_list
@@ -343,9 +525,17 @@ class IndexerServiceManager:
         """
         self.logger.info("Reloading indexers from configuration...")
         
-        # Clear existing
+        # Clear existing and release their pooled connections; the reloaded
+        # indexers build fresh sessions from the new configuration
+        for name, indexer in list(self.indexers.items()):
+            try:
+                indexer.close()
+            except Exception as exc:
+                self.logger.debug("Failed to close indexer session", extra={"indexer": name, "error": str(exc)})
         self.indexers.clear()
         self.indexer_configs.clear()
+        self._indexer_slots.clear()
+        self._result_cache.clear()
         
         # Reload
         self._load_indexers()
@@ -366,6 +556,7 @@ class IndexerServiceManager:
             'total_indexers': total_indexers,
             'available_indexers': available_indexers,
             'unavailable_indexers': total_indexers - available_indexers,
+            'result_cache': self._result_cache.get_stats(),
             'indexers': self.get_indexer_status()
         }
 
@@ -2,7 +2,7 @@
 Module Name: jackett_indexer.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Torznab (Jackett/Prowlarr) indexer wrapper that filters to direct torrent
     URLs and normalizes results for the search engine.
@@ -171,7 +171,7 @@ class JackettIndexer(BaseIndexer):
 
     def _request(self, params: Dict[str, Any]) -> requests.Response:
         final_params = self._inject_auth(params)
-        response = requests.get(
+        response = self.http.get(
             self.api_endpoint,
             params=final_params,
             timeout=self.timeout,
@@ -2,10 +2,12 @@
 Module Name: audiobookbay.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Direct provider adapter that scrapes AudiobookBay search and detail pages
-    to produce normalized torrent results.
+    to produce normalized torrent results. Detail pages are fetched on a
+    bounded pool alongside search page 2 and parsed results are cached by
+    detail URL.
 
 Location:
     /services/indexers/providers/audiobookbay.py
@@ -14,8 +16,13 @@ Location:
 
 from __future__ import annotations
 
+import copy
 import re
-from typing import Any, Dict, List, Optional, Sequence
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from urllib.parse import quote_plus, urljoin
 
 import requests
@@ -25,6 +32,36 @@ from . import register_provider
 from .base import DirectProviderAdapter, ProviderRequestSpec
 from utils.logger import get_module_logger
 
+try:  # lxml is in requirements; fall back to the stdlib parser if it is missing
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - optional dependency
+    HTML_PARSER = "html.parser"
+
+# Bounded pool shared by all AudiobookBay adapters (one scraped host)
+DETAIL_FETCH_WORKERS = 4
+# Parsed detail pages are reused across searches for this long
+DETAIL_CACHE_TTL_SECONDS = 6 * 60 * 60
+DETAIL_CACHE_MAX_ENTRIES = 2000
+
+_fetch_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_detail_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_detail_cache_lock = threading.Lock()
+
+
+def _get_fetch_executor() -> ThreadPoolExecutor:
+    """Return the shared page fetch pool, creating it on first use."""
+    global _fetch_executor
+    if _fetch_executor is None:
+        with _executor_lock:
+            if _fetch_executor is None:
+                _fetch_executor = ThreadPoolExecutor(
+                    max_workers=DETAIL_FETCH_WORKERS,
+                    thread_name_prefix="AudiobookBayFetch",
+                )
+    return _fetch_executor
+
 
 @register_provider
 class AudiobookBayAdapter(DirectProviderAdapter):
@@ -47,7 +84,8 @@ class AudiobookBayAdapter(DirectProviderAdapter):
         self.timeout = config.get("timeout", 20)
         self.verify_ssl = config.get("verify_ssl", True)
         self.logger = logger or get_module_logger("Service.Indexers.AudiobookBay")
-        self._last_query_params: Dict[str, str] = {}
+        # Searches run concurrently; build/parse of one search share a thread
+        self._query_state = threading.local()
 
     def build_health_request(self) -> ProviderRequestSpec:
         return ProviderRequestSpec(
@@ -83,7 +121,7 @@ class AudiobookBayAdapter(DirectProviderAdapter):
         focus = self._compose_query(query, author, title)
         clean = re.sub(r"[\W]+", " ", focus).strip().lower()
         params = {"s": clean, "tt": "1"}  # tt=1 => title-only search
-        self._last_query_params = dict(params)
+        self._query_state.params = dict(params)
         return ProviderRequestSpec(
             method="GET",
             path=self.SEARCH_PATH,
@@ -93,38 +131,100 @@ class AudiobookBayAdapter(DirectProviderAdapter):
         )
 
     def parse_search_results(self, payload: Any) -> Sequence[Dict[str, Any]]:
-        pages_html: List[str] = []
+        executor = _get_fetch_executor()
         page1 = payload or ""
-        pages_html.append(page1 if isinstance(page1, str) else str(page1))
+        page1 = page1 if isinstance(page1, str) else str(page1)
+
+        # Fetch page 2 like Jackett does (ABB search shows 9 results per page),
+        # in parallel with the page-1 detail fetches
+        page2_future = executor.submit(self._fetch_search_page, 2, dict(getattr(self._query_state, "params", {})))
 
-        # Fetch page 2 like Jackett does (ABB search shows 9 results per page)
+        seen_urls = set()
+        pending: List[Tuple[str, Any]] = []
+        pending.extend(self._submit_detail_fetches(page1, seen_urls, executor))
         try:
-            page2 = self._fetch_search_page(page=2, params=self._last_query_params)
-            if page2:
-                pages_html.append(page2)
+            page2 = page2_future.result()
         except Exception:
-            pass
+            page2 = None
+        if page2:
+            pending.extend(self._submit_detail_fetches(page2, seen_urls, executor))
 
         results: List[Dict[str, Any]] = []
-        seen_urls = set()
-
-        for html in pages_html:
-            soup = BeautifulSoup(html, "html.parser")
-            posts = soup.select("div.post")
-            if not posts:
-                posts = soup.select("div.postTitle")
-
-            for post in posts:
-                detail_url = self._extract_detail_url(post, soup)
-                if not detail_url or detail_url in seen_urls:
-                    continue
-                seen_urls.add(detail_url)
-                title = self._extract_title(post) or None
-                parsed = self._fetch_and_parse_detail(detail_url, title)
-                if parsed:
-                    results.append(parsed)
+        cached = 0
+        for detail_url, entry in pending:
+            if isinstance(entry, Future):
+                try:
+                    parsed = entry.result()
+                except Exception as exc:  # pragma: no cover - network defensive
+                    self.logger.debug("Detail fetch error %s: %s", detail_url, exc)
+                    parsed = None
+            else:
+                parsed = entry
+                cached += 1
+            if parsed:
+                results.append(parsed)
+
+        self.logger.debug(
+            "AudiobookBay search parsed",
+            extra={"detail_pages": len(pending), "cache_hits": cached, "results": len(results)},
+        )
         return results
 
+    def _submit_detail_fetches(
+        self,
+        html: str,
+        seen_urls: set,
+        executor: ThreadPoolExecutor,
+    ) -> List[Tuple[str, Any]]:
+        """Queue detail fetches for the posts on one search page, in page order.
+
+        Each entry is (detail_url, Future) or (detail_url, cached_result).
+        """
+        soup = BeautifulSoup(html or "", HTML_PARSER)
+        posts = soup.select("div.post")
+        if not posts:
+            posts = soup.select("div.postTitle")
+
+        entries: List[Tuple[str, Any]] = []
+        for post in posts:
+            detail_url = self._extract_detail_url(post, soup)
+            if not detail_url or detail_url in seen_urls:
+                continue
+            seen_urls.add(detail_url)
+            cached = self._get_cached_detail(detail_url)
+            if cached is not None:
+                entries.append((detail_url, cached))
+                continue
+            title = self._extract_title(post) or None
+            entries.append((detail_url, executor.submit(self._fetch_and_parse_detail, detail_url, title)))
+        return entries
+
+    # ------------------------------------------------------------------
+    # Detail cache
+    # ------------------------------------------------------------------
+    def _get_cached_detail(self, detail_url: str) -> Optional[Dict[str, Any]]:
+        now = time.monotonic()
+        with _detail_cache_lock:
+            entry = _detail_cache.get(detail_url)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if now - stored_at > DETAIL_CACHE_TTL_SECONDS:
+                del _detail_cache[detail_url]
+                return None
+            _detail_cache.move_to_end(detail_url)
+        hit = copy.deepcopy(result)
+        hit["indexer"] = self.indexer_name
+        return hit
+
+    @staticmethod
+    def _store_cached_detail(detail_url: str, result: Dict[str, Any]) -> None:
+        with _detail_cache_lock:
+            _detail_cache[detail_url] = (time.monotonic(), copy.deepcopy(result))
+            _detail_cache.move_to_end(detail_url)
+            while len(_detail_cache) > DETAIL_CACHE_MAX_ENTRIES:
+                _detail_cache.popitem(last=False)
+
     # ------------------------------------------------------------------
     # Scraping helpers
     # ------------------------------------------------------------------
@@ -152,7 +252,7 @@ class AudiobookBayAdapter(DirectProviderAdapter):
 
     def _fetch_and_parse_detail(self, detail_url: str, fallback_title: Optional[str]) -> Optional[Dict[str, Any]]:
         try:
-            response = requests.get(
+            response = self._get(
                 detail_url,
                 headers={"User-Agent": self._user_agent()},
                 timeout=self.timeout,
@@ -161,11 +261,19 @@ class AudiobookBayAdapter(DirectProviderAdapter):
             if response.status_code >= 400:
                 self.logger.debug("Detail fetch failed %s status=%s", detail_url, response.status_code)
                 return None
-            return self._parse_detail_page(response.text, detail_url, fallback_title)
+            parsed = self._parse_detail_page(response.text, detail_url, fallback_title)
+            self._store_cached_detail(detail_url, parsed)
+            return parsed
         except Exception as exc:  # pragma: no cover - network defensive
             self.logger.debug("Detail fetch error %s: %s", detail_url, exc)
             return None
 
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the indexer's pooled session when bound."""
+        if self.http is not None:
+            return self.http.get(url, **kwargs)
+        return requests.get(url, **kwargs)
+
     def _fetch_search_page(self, page: int, params: Optional[Dict[str, str]]) -> Optional[str]:
         if page < 2:
             return None
@@ -176,7 +284,7 @@ class AudiobookBayAdapter(DirectProviderAdapter):
             query = "?" + urlencode(params)
         url = urljoin(f"{self.base_url}/", f"page/{page}/{query}")
         try:
-            resp = requests.get(
+            resp = self._get(
                 url,
                 headers={"User-Agent": self._user_agent()},
                 timeout=self.timeout,
@@ -189,7 +297,7 @@ class AudiobookBayAdapter(DirectProviderAdapter):
             return None
 
     def _parse_detail_page(self, html: str, detail_url: str, fallback_title: Optional[str]) -> Dict[str, Any]:
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = BeautifulSoup(html or "", HTML_PARSER)
 
         title = fallback_title
         title_el = soup.select_one("div.postTitle h1")
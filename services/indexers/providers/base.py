@@ -2,7 +2,7 @@
 Module Name: base.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Base interfaces and request spec for direct provider adapters used by
     DirectIndexer.
@@ -47,6 +47,11 @@ class DirectProviderAdapter(ABC):
         self.session_id = config.get("session_id", "")
         self.search_path = config.get("search_path")
         self.health_path = config.get("health_path")
+        self.http = None
+
+    def bind_session(self, http) -> None:
+        """Attach the owning indexer's pooled HTTP session for extra requests."""
+        self.http = http
 
     @classmethod
     def matches(cls, base_url: str, config: Dict[str, Any]) -> bool:
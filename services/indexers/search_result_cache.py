@@ -0,0 +1,132 @@
+"""
+Module Name: search_result_cache.py
+Author: TheDragonShaman
+Created: Oct 16 2026
+Last Modified: Oct 16 2026
+Description:
+    Short-lived in-memory cache of per-indexer search results. Keys are built
+    from the exact query, title and author sent to the indexer (case- and
+    whitespace-folded), the indexer name and the result limit so repeat
+    manual and automatic searches skip the network.
+
+Location:
+    /services/indexers/search_result_cache.py
+
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.logger import get_module_logger
+
+
+_LOGGER = get_module_logger("Service.Indexers.ResultCache")
+
+DEFAULT_TTL_SECONDS = 300
+DEFAULT_MAX_ENTRIES = 500
+
+_WHITESPACE = re.compile(r"\s+")
+
+CacheKey = Tuple[str, str, str, str, int]
+
+
+class IndexerResultCache:
+    """
+    TTL + LRU cache of indexer search results.
+
+    Features:
+    - Keys from the request's query/title/author, case- and whitespace-folded
+      only, plus indexer name and limit
+    - Size-bounded LRU eviction and per-entry TTL
+    - Per-indexer hit/miss counters
+    - Callers always receive fresh result dicts
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES, *, logger=None):
+        self.logger = logger or _LOGGER
+        self.ttl = float(ttl)
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[CacheKey, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._evictions = 0
+
+    @staticmethod
+    def build_key(indexer_name: str, query: Optional[str], author: Optional[str],
+                  title: Optional[str], limit: int) -> CacheKey:
+        """Return the cache key for one indexer request.
+
+        Terms are only case- and whitespace-folded: any further normalization
+        (e.g. dropping subtitles) would let different requests share a key.
+        """
+        folded = [_WHITESPACE.sub(" ", part or "").strip().casefold() for part in (query, title, author)]
+        return (indexer_name, folded[0], folded[1], folded[2], int(limit or 0))
+
+    def get(self, key: CacheKey) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for a key, or None on miss/expiry."""
+        indexer_name = key[0]
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses[indexer_name] = self._misses.get(indexer_name, 0) + 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits[indexer_name] = self._hits.get(indexer_name, 0) + 1
+            results = entry[1]
+        return [dict(result) for result in results]
+
+    def put(self, key: CacheKey, results: List[Dict[str, Any]]):
+        """Store results for a key, evicting least recently used entries."""
+        snapshot = [dict(result) for result in results or []]
+        with self._lock:
+            self._entries[key] = (time.monotonic(), snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """Drop every cached entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_indexer_stats(self, indexer_name: str) -> Dict[str, Any]:
+        """Return hit/miss counters for one indexer."""
+        with self._lock:
+            hits = self._hits.get(indexer_name, 0)
+            misses = self._misses.get(indexer_name, 0)
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return overall size, eviction and hit-rate counters."""
+        with self._lock:
+            hits = sum(self._hits.values())
+            misses = sum(self._misses.values())
+            entries = len(self._entries)
+            indexers = sorted(set(self._hits) | set(self._misses))
+        lookups = hits + misses
+        return {
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl,
+            'hits': hits,
+            'misses': misses,
+            'evictions': self._evictions,
+            'hit_rate': round(hits / lookups, 3) if lookups else 0.0,
+            'indexers': {name: self.get_indexer_stats(name) for name in indexers},
+        }
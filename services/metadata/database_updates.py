@@ -2,7 +2,7 @@
 Module Name: database_updates.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Handles database update operations for the metadata service, including
     validation, sanitization, and persistence of refreshed metadata.
@@ -105,6 +105,7 @@ class MetadataDatabaseUpdates:
                 rows_affected = cursor.rowcount
                 
                 conn.commit()
+                self.database_service.invalidate_library_status()
                 
                 if rows_affected > 0:
                     # Process contributor metadata for author updates after successful save
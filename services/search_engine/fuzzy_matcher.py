@@ -2,25 +2,32 @@
 Module Name: fuzzy_matcher.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Enhanced fuzzy string matching combining token-based and character-level
     strategies for audiobook title/author matching. Provides aggressive
-    normalization and multi-strategy scoring for search relevance.
+    normalization and multi-strategy scoring for search relevance. The
+    character-level pass uses bit-parallel (Myers/Hyyro) edit distance with
+    window pruning, and normalization results are memoized per string.
 
 Location:
     /services/search_engine/fuzzy_matcher.py
 
 """
 
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Sequence
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 from utils.logger import get_module_logger
 
 _LOGGER = get_module_logger("Service.SearchEngine.FuzzyMatcher")
 
+# Per-instance memo sizes for normalization and bitap pattern masks
+NORMALIZE_CACHE_SIZE = 4096
+PATTERN_MASK_CACHE_SIZE = 1024
+
 
 @dataclass
 class MatchResult:
@@ -41,9 +48,10 @@ class FuzzyMatcher:
     Features:
     - Aggressive normalization (remove punctuation, spaces, articles)
     - Token set matching (LazyLibrarian style)
-    - Character-level Bitap algorithm (Readarr style)
+    - Character-level Bitap algorithm (Readarr style), bit-parallel
     - Multi-strategy scoring with fallbacks
     - Configurable match thresholds
+    - Memoized normalization and a batch API (fuzzy_match_many)
     """
     
     def __init__(self, *, logger=None):
@@ -58,6 +66,12 @@ class FuzzyMatcher:
         # Compile regex patterns for efficiency
         self._compile_patterns()
         
+        # Memoize per-string work; results and indexer titles repeat heavily
+        self._normalize_title_cached = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(self._normalize_title)
+        self._normalize_author_cached = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(self._normalize_author)
+        self._tokenize_cached = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(self._tokenize)
+        self._pattern_masks = lru_cache(maxsize=PATTERN_MASK_CACHE_SIZE)(self._build_pattern_masks)
+        
         self.initialized = False
         self._initialize()
     
@@ -135,7 +149,10 @@ class FuzzyMatcher:
         """
         if not author:
             return ""
-        
+        return self._normalize_author_cached(author)
+    
+    def _normalize_author(self, author: str) -> str:
+        """Uncached normalize_author body."""
         # Remove ALL non-alphanumeric characters (spaces, punctuation, etc)
         normalized = self.alphanumeric_only.sub('', author.lower())
         
@@ -160,7 +177,10 @@ class FuzzyMatcher:
         """
         if not title:
             return ""
-        
+        return self._normalize_title_cached(title)
+    
+    def _normalize_title(self, title: str) -> str:
+        """Uncached normalize_title body."""
         cleaned = title.lower()
         
         # Remove content in brackets/parens
@@ -195,12 +215,15 @@ class FuzzyMatcher:
         """
         if not text:
             return set()
-        
+        return set(self._tokenize_cached(text))
+    
+    def _tokenize(self, text: str) -> frozenset:
+        """Uncached tokenize body (immutable so the memo can share it)."""
         # Split on whitespace and filter empty strings
         tokens = set(text.lower().split())
         tokens = {t for t in tokens if t}  # Remove empty strings
         
-        return tokens
+        return frozenset(tokens)
     
     def token_set_overlap(self, tokens1: Set[str], tokens2: Set[str]) -> float:
         """
@@ -225,7 +248,7 @@ class FuzzyMatcher:
         
         return len(intersection) / len(union)
     
-    def fuzzy_match(self, text1: str, text2: str) -> MatchResult:
+    def fuzzy_match(self, text1: str, text2: str, min_score: float = 0.0) -> MatchResult:
         """
         Perform fuzzy matching between two strings using multiple strategies.
         
@@ -238,6 +261,8 @@ class FuzzyMatcher:
         Args:
             text1: First string to compare
             text2: Second string to compare
+            min_score: Scores below this are not needed exactly; the bitap
+                pass may stop early and report a lower (non-matching) score
             
         Returns:
             MatchResult with score, match status, and metadata
@@ -271,34 +296,32 @@ class FuzzyMatcher:
             
             # Strategy 3: Token set overlap (word-based matching)
             # This handles word order variations and partial matches
-            tokens1 = self.tokenize(norm1)
-            tokens2 = self.tokenize(norm2)
+            tokens1 = self._tokenize_cached(norm1) if norm1 else frozenset()
+            tokens2 = self._tokenize_cached(norm2) if norm2 else frozenset()
+            overlap = self.token_set_overlap(tokens1, tokens2) if tokens1 and tokens2 else 0.0
             
-            if tokens1 and tokens2:
-                overlap = self.token_set_overlap(tokens1, tokens2)
-                
-                # If high overlap, consider it a match
-                if overlap >= 0.7:  # 70% token overlap
-                    return MatchResult(
-                        score=overlap,
-                        matched=True,
-                        exact=False,
-                        word_boundary=True,
-                        algorithm_used="token_set",
-                        token_overlap=overlap
-                    )
+            # If high overlap, consider it a match
+            if overlap >= 0.7:  # 70% token overlap
+                return MatchResult(
+                    score=overlap,
+                    matched=True,
+                    exact=False,
+                    word_boundary=True,
+                    algorithm_used="token_set",
+                    token_overlap=overlap
+                )
+            
+            # Check for word boundary matches (decides the bonus, and so how
+            # low a bitap score can be while still reaching min_score)
+            word_boundary_match = self._check_word_boundary_match(norm1, norm2)
+            bonus = self.word_boundary_bonus if word_boundary_match else 0.0
             
             # Strategy 4: Bitap algorithm (character-level fuzzy match)
             # Fallback for handling typos and small variations
-            bitap_score = self._bitap_search(norm1, norm2)
-            
-            # Check for word boundary matches
-            word_boundary_match = self._check_word_boundary_match(norm1, norm2)
+            bitap_score = self._bitap_search(norm1, norm2, min_score=max(0.0, min_score - bonus))
             
             # Calculate final score
-            final_score = bitap_score
-            if word_boundary_match:
-                final_score = min(1.0, final_score + self.word_boundary_bonus)
+            final_score = min(1.0, bitap_score + bonus) if bonus else bitap_score
             
             # Determine if it's a match (lower threshold than before)
             is_match = final_score >= 0.6  # Lowered from 0.8
@@ -309,7 +332,7 @@ class FuzzyMatcher:
                 exact=False,
                 word_boundary=word_boundary_match,
                 algorithm_used="bitap",
-                token_overlap=self.token_set_overlap(tokens1, tokens2) if tokens1 and tokens2 else 0.0
+                token_overlap=overlap
             )
             
         except Exception as e:
@@ -320,14 +343,47 @@ class FuzzyMatcher:
             )
             return MatchResult(0.0, False, False, False, "error")
     
-    def _bitap_search(self, pattern: str, text: str) -> float:
+    def fuzzy_match_many(self, query: str, candidates: Sequence[str],
+                         min_score: float = 0.0) -> List[MatchResult]:
+        """
+        Score one query against many candidates.
+        
+        Query normalization, tokens and bitap masks are computed once and
+        reused for every candidate. Equivalent to calling
+        fuzzy_match(candidate, query, min_score) for each candidate.
+        
+        Args:
+            query: String every candidate is compared with
+            candidates: Strings to score
+            min_score: Scores below this may be reported as a lower bound
+            
+        Returns:
+            MatchResult per candidate, in input order
+        """
+        if query:
+            # Warm the memos so each candidate only pays for its own side
+            normalized = self.normalize_title(query)
+            if normalized:
+                self._tokenize_cached(normalized)
+                self._pattern_masks(normalized)
+        return [self.fuzzy_match(candidate, query, min_score) for candidate in candidates]
+    
+    def _bitap_search(self, pattern: str, text: str, min_score: float = 0.0) -> float:
         """
         Implement Bitap algorithm for fuzzy string matching.
         Based on Readarr's implementation with audiobook-specific optimizations.
         
+        Slides a pattern-length window over the text and scores the best
+        window by edit distance. Each window is scored with the bit-parallel
+        Myers/Hyyro recurrence (one word operation per text character);
+        windows whose character histogram already rules out beating the
+        current best, or reaching min_score, are skipped, and a window is
+        abandoned as soon as its distance can no longer improve.
+        
         Args:
             pattern: Pattern to search for
             text: Text to search in
+            min_score: Scores below this need not be exact
             
         Returns:
             Match score between 0.0 and 1.0
@@ -348,24 +404,49 @@ class FuzzyMatcher:
                 # Substring match - score based on length ratio
                 return len(pattern) / len(text)
             
-            # Bitap algorithm implementation
             pattern_length = len(pattern)
-            text_length = len(text)
-            
-            # Calculate edit distance using dynamic programming
-            # (Simplified version of Bitap for readability)
-            best_score = 0.0
+            masks, pattern_counts = self._pattern_masks(pattern)
+            
+            # Distances >= cutoff cannot produce a useful score
+            cutoff = pattern_length + 1
+            if min_score > 0.0:
+                cutoff = min(cutoff, int((1.0 - min_score) * pattern_length + 1e-9) + 1)
+            best_distance = pattern_length
+            
+            # Character histogram difference between pattern and current
+            # window; half of it is a lower bound on the window's distance
+            window_counts: Dict[str, int] = {}
+            for char in text[:pattern_length]:
+                window_counts[char] = window_counts.get(char, 0) + 1
+            histogram_diff = sum(
+                abs(pattern_counts.get(char, 0) - window_counts.get(char, 0))
+                for char in set(pattern_counts) | set(window_counts)
+            )
             
-            for i in range(text_length - pattern_length + 1):
-                substring = text[i:i + pattern_length]
-                distance = self._edit_distance(pattern, substring)
+            for start in range(len(text) - pattern_length + 1):
+                if start:
+                    outgoing = text[start - 1]
+                    incoming = text[start + pattern_length - 1]
+                    if outgoing != incoming:
+                        before = window_counts[outgoing]
+                        histogram_diff += abs(pattern_counts.get(outgoing, 0) - (before - 1)) - abs(pattern_counts.get(outgoing, 0) - before)
+                        window_counts[outgoing] = before - 1
+                        before = window_counts.get(incoming, 0)
+                        histogram_diff += abs(pattern_counts.get(incoming, 0) - (before + 1)) - abs(pattern_counts.get(incoming, 0) - before)
+                        window_counts[incoming] = before + 1
                 
-                # Convert distance to score (lower distance = higher score)
-                max_distance = max(len(pattern), len(substring))
-                score = 1.0 - (distance / max_distance)
-                best_score = max(best_score, score)
+                limit = min(best_distance, cutoff)
+                if histogram_diff // 2 >= limit:
+                    continue
+                
+                distance = self._window_distance(masks, pattern_length, text, start, limit)
+                if distance < best_distance:
+                    best_distance = distance
+                    if best_distance == 0:
+                        break
             
-            return best_score
+            # Convert distance to score (lower distance = higher score)
+            return 1.0 - (best_distance / pattern_length)
             
         except Exception as e:
             self.logger.error(
@@ -375,25 +456,50 @@ class FuzzyMatcher:
             )
             return 0.0
     
-    def _edit_distance(self, s1: str, s2: str) -> int:
-        """Calculate edit distance between two strings."""
-        if len(s1) < len(s2):
-            return self._edit_distance(s2, s1)
-        
-        if len(s2) == 0:
-            return len(s1)
-        
-        previous_row = list(range(len(s2) + 1))
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
+    @staticmethod
+    def _build_pattern_masks(pattern: str) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Return per-character match bitmasks and character counts for a pattern."""
+        masks: Dict[str, int] = {}
+        counts: Dict[str, int] = {}
+        for index, char in enumerate(pattern):
+            masks[char] = masks.get(char, 0) | (1 << index)
+            counts[char] = counts.get(char, 0) + 1
+        return masks, counts
+    
+    @staticmethod
+    def _window_distance(masks: Dict[str, int], pattern_length: int, text: str,
+                         start: int, limit: int) -> int:
+        """
+        Edit distance between the pattern and text[start:start + pattern_length].
         
-        return previous_row[-1]
+        Bit-parallel global distance (Myers 1999, Hyyro's formulation). Stops
+        early and returns `limit` once the distance cannot drop below it.
+        """
+        all_ones = (1 << pattern_length) - 1
+        high_bit = 1 << (pattern_length - 1)
+        positive = all_ones
+        negative = 0
+        distance = pattern_length
+        remaining = pattern_length
+        for char in text[start:start + pattern_length]:
+            equal = masks.get(char, 0)
+            vertical = equal | negative
+            horizontal = (((equal & positive) + positive) ^ positive) | equal
+            h_positive = negative | (~(horizontal | positive) & all_ones)
+            h_negative = positive & horizontal
+            if h_positive & high_bit:
+                distance += 1
+            elif h_negative & high_bit:
+                distance -= 1
+            remaining -= 1
+            # Each remaining column lowers the distance by at most one
+            if distance - remaining >= limit:
+                return limit
+            h_positive = ((h_positive << 1) | 1) & all_ones
+            h_negative = (h_negative << 1) & all_ones
+            positive = h_negative | (~(vertical | h_positive) & all_ones)
+            negative = h_positive & vertical
+        return distance
     
     def _check_word_boundary_match(self, text1: str, text2: str) -> bool:
         """Check if strings match at word boundaries."""
@@ -2,7 +2,7 @@
 Module Name: indexer_operations.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Manage indexer connections, distribute searches, and coordinate health
     monitoring for the search engine. Provides configuration reload, failover,
@@ -13,7 +13,7 @@ Location:
 
 """
 
-from typing import Dict, List, Any
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
 import time
 
 from utils.logger import get_module_logger
@@ -162,8 +162,8 @@ class IndexerOperations:
             }
     
     def search_all_indexers(self, title: str, author: str, 
-                           manual_search: bool = False) -> List[Dict[str, Any]]:
-        """Search all active indexers for audiobook results."""
+                           manual_search: bool = False, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Search all active indexers for audiobook results (refresh bypasses cached indexer results)."""
         try:
             if not self.indexer_service_manager:
                 self.logger.error("IndexerServiceManager not available for search")
@@ -181,7 +181,8 @@ class IndexerOperations:
                 author=author,
                 title=title,
                 limit_per_indexer=50,
-                parallel=True
+                parallel=True,
+                refresh=refresh
             )
             
             self.logger.info(
@@ -198,6 +199,44 @@ class IndexerOperations:
             )
             return []
     
+    def stream_search_variants(self, titles: Sequence[str], author: str,
+                               deadline: float, refresh: bool = False) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Search every title variant on every indexer in one fan-out.
+        
+        Yields (title, results) per indexer response as it arrives; indexers
+        still running at the deadline are cut off. refresh bypasses the
+        indexer result cache.
+        """
+        if not self.indexer_service_manager:
+            self.logger.error("IndexerServiceManager not available for search")
+            return
+        
+        requests = [(f"{title} {author}", author, title) for title in titles]
+        self.logger.info(
+            "Searching indexers",
+            extra={
+                "indexer_count": len(self.indexer_service_manager.indexers),
+                "variant_count": len(requests),
+                "author": author,
+                "deadline_seconds": deadline,
+            },
+        )
+        try:
+            for request_index, _, results in self.indexer_service_manager.search_many(
+                requests,
+                limit_per_indexer=50,
+                deadline=deadline,
+                refresh=refresh
+            ):
+                yield titles[request_index], results
+        except Exception as e:
+            self.logger.error(
+                "Failed to search indexers",
+                extra={"error": str(e)},
+                exc_info=True,
+            )
+    
     def shutdown(self):
         """Shutdown indexer operations."""
         try:
@@ -2,11 +2,12 @@
 Module Name: quality_assessor.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Quality scoring system for audiobook search results. Assesses format
     preferences, bitrate, source reputation, metadata completeness, and
-    relevance to rank search results.
+    relevance to rank search results. Batch ranking computes query-side
+    features once and can return only the top-K results.
 
 Location:
     /services/search_engine/quality_assessor.py
@@ -14,14 +15,16 @@ Location:
 Notes:
     - Follow PEP 8 for code style.
     - Keep descriptions concise but informative.
-    - Bottleneck: heavy relevance scoring and fuzzy matching per result; consider
-      caching normalized tokens or batching.
+    - Batch ranking precomputes query features and per-value component
+      scores; per-result logging is sampled at debug level.
     - Upgrade: tune weights and add telemetry for scoring decisions.
 """
 
 from dataclasses import dataclass
+import heapq
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from utils.logger import get_module_logger
 
@@ -30,6 +33,9 @@ from .fuzzy_matcher import FuzzyMatcher
 
 _LOGGER = get_module_logger("Service.SearchEngine.QualityAssessor")
 
+# During batch ranking only every Nth result is logged (debug level)
+RANK_LOG_SAMPLE_EVERY = 25
+
 
 @dataclass
 class QualityScore:
@@ -44,6 +50,20 @@ class QualityScore:
     breakdown: Dict[str, Any]
 
 
+@dataclass(frozen=True)
+class _QueryFeatures:
+    """Search-side values reused for every result scored against one query."""
+    title: str
+    author: str
+    author_norm: str
+    author_tokens: FrozenSet[str]
+    title_norm: str
+    title_core: str
+    title_tokens: FrozenSet[str]
+    series: Dict[str, Any]
+    numbers: List[str]
+
+
 class QualityAssessor:
     """
     Assesses the quality of audiobook search results.
@@ -141,90 +161,149 @@ class QualityAssessor:
                     "result_title": result.get('title', 'N/A'),
                 },
             )
+            query = self._build_query_features(search_title, search_author)
+            return self._score_result(result, query)
             
-            # Extract result data
-            format_str = result.get('format', 'unknown').lower()
-            bitrate = result.get('bitrate', 0)
-            seeders = result.get('seeders', 0)
-            result_title = result.get('title', '')
-            result_author = result.get('author', '')
-            
-            # Assess each component
+        except Exception as e:
+            self.logger.error(
+                "Quality assessment failed",
+                extra={"error": str(e), "search_title": search_title, "search_author": search_author},
+                exc_info=True,
+            )
+            return QualityScore(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, {})
+    
+    def _build_query_features(self, search_title: str, search_author: str) -> _QueryFeatures:
+        """Normalize, tokenize and parse the search side of a comparison once."""
+        search_title = search_title or ''
+        search_author = search_author or ''
+        matcher = self.fuzzy_matcher
+        
+        series = self._extract_series_from_title(search_title)
+        title_norm = matcher.normalize_title(search_title) if search_title else ''
+        if series['full_series']:
+            title_core = title_norm.replace(series['full_series'].lower(), '').strip(' ,:;-')
+        else:
+            title_core = title_norm
+        
+        return _QueryFeatures(
+            title=search_title,
+            author=search_author,
+            author_norm=matcher.normalize_author(search_author),
+            author_tokens=frozenset(matcher.tokenize(matcher.normalize_title(search_author))),
+            title_norm=title_norm,
+            title_core=title_core,
+            title_tokens=frozenset(matcher.tokenize(title_core)),
+            series=series,
+            numbers=self._extract_numbers(search_title),
+        )
+    
+    def _score_result(self, result: Dict[str, Any], query: _QueryFeatures,
+                      component_tables: Optional[Dict[str, Dict[Any, float]]] = None,
+                      relevance_cache: Optional[Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]]] = None) -> QualityScore:
+        """
+        Score one result against precomputed query features.
+        
+        component_tables maps format/bitrate/seeders values to scores that
+        were computed once for a whole batch; values missing from it are
+        scored directly. relevance_cache reuses relevance for results with
+        the same title/author against the same query (the same release is
+        often returned by several indexers and query variants).
+        """
+        # Extract result data
+        format_str = result.get('format', 'unknown').lower()
+        bitrate = result.get('bitrate', 0)
+        seeders = result.get('seeders', 0)
+        result_title = result.get('title', '')
+        result_author = result.get('author', '')
+        tables = component_tables or {}
+        
+        # Assess each component
+        cache_key = (result_title, result_author, query.title, query.author)
+        cached = relevance_cache.get(cache_key) if relevance_cache is not None else None
+        if cached is not None:
+            relevance_score = cached[0]
+            relevance_meta = {
+                key: dict(value) if isinstance(value, dict) else value
+                for key, value in cached[1].items()
+            }
+        else:
             relevance_score, relevance_meta = self._assess_relevance(
                 result_title,
                 result_author,
-                search_title,
-                search_author
+                query.title,
+                query.author,
+                query=query
             )
+            if relevance_cache is not None:
+                relevance_cache[cache_key] = (relevance_score, relevance_meta)
+        format_score = tables.get('format', {}).get(format_str)
+        if format_score is None:
             format_score = self._assess_format_quality(format_str)
+        bitrate_score = tables.get('bitrate', {}).get(bitrate)
+        if bitrate_score is None:
             bitrate_score = self._assess_bitrate_quality(bitrate)
-            source_score = 7.0  # Default source score
-            metadata_score = self._assess_metadata_quality(result)
+        source_score = 7.0  # Default source score
+        metadata_score = self._assess_metadata_quality(result)
+        availability_score = tables.get('availability', {}).get(seeders)
+        if availability_score is None:
             availability_score = self._assess_availability_quality(seeders)
 
-            # AudiobookBay always shows seeders as 1; don't penalize those results
-            indexer_name = (result.get('indexer') or '').lower()
-            source_tag = (result.get('_source') or '').lower()
-            if ('audiobookbay' in indexer_name or 'audiobookbay' in source_tag) and seeders <= 1:
-                availability_score = 8.0  # treat as healthy to avoid low-seeder penalties
-            
-            self.logger.debug(
-                "Quality scores computed",
-                extra={
-                    "result_title": result_title,
-                    "relevance_score": round(relevance_score, 1),
-                    "format_score": round(format_score, 1),
-                },
-            )
-            
-            # Calculate weighted total
-            total_score = (
-                relevance_score * self.weights['relevance'] +
-                format_score * self.weights['format'] +
-                bitrate_score * self.weights['bitrate'] +
-                source_score * self.weights['source'] +
-                metadata_score * self.weights['metadata'] +
-                availability_score * self.weights['availability']
-            )
-            
-            # Calculate confidence percentage (0-100)
-            confidence = self._calculate_confidence(
-                total_score=total_score,
-                format_score=format_score,
-                bitrate_score=bitrate_score,
-                metadata_score=metadata_score,
-                availability_score=availability_score,
-                result=result,
-                relevance_meta=relevance_meta
-            )
-            
-            return QualityScore(
-                total_score=total_score,
-                format_score=format_score,
-                bitrate_score=bitrate_score,
-                source_score=source_score,
-                metadata_score=metadata_score,
-                relevance_score=relevance_score,
-                confidence=confidence,
-                breakdown={
-                    'relevance_score': relevance_score,
-                    'book_number_status': relevance_meta.get('book_number_status'),
-                    'author': relevance_meta.get('author'),
-                    'title': relevance_meta.get('title'),
-                    'series': relevance_meta.get('series')
-                }
-            )
-            
-        except Exception as e:
-            self.logger.error(
-                "Quality assessment failed",
-                extra={"error": str(e), "search_title": search_title, "search_author": search_author},
-                exc_info=True,
-            )
-            return QualityScore(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, {})
+        # AudiobookBay always shows seeders as 1; don't penalize those results
+        indexer_name = (result.get('indexer') or '').lower()
+        source_tag = (result.get('_source') or '').lower()
+        if ('audiobookbay' in indexer_name or 'audiobookbay' in source_tag) and seeders <= 1:
+            availability_score = 8.0  # treat as healthy to avoid low-seeder penalties
+        
+        self.logger.debug(
+            "Quality scores computed",
+            extra={
+                "result_title": result_title,
+                "relevance_score": round(relevance_score, 1),
+                "format_score": round(format_score, 1),
+            },
+        )
+        
+        # Calculate weighted total
+        total_score = (
+            relevance_score * self.weights['relevance'] +
+            format_score * self.weights['format'] +
+            bitrate_score * self.weights['bitrate'] +
+            source_score * self.weights['source'] +
+            metadata_score * self.weights['metadata'] +
+            availability_score * self.weights['availability']
+        )
+        
+        # Calculate confidence percentage (0-100)
+        confidence = self._calculate_confidence(
+            total_score=total_score,
+            format_score=format_score,
+            bitrate_score=bitrate_score,
+            metadata_score=metadata_score,
+            availability_score=availability_score,
+            result=result,
+            relevance_meta=relevance_meta
+        )
+        
+        return QualityScore(
+            total_score=total_score,
+            format_score=format_score,
+            bitrate_score=bitrate_score,
+            source_score=source_score,
+            metadata_score=metadata_score,
+            relevance_score=relevance_score,
+            confidence=confidence,
+            breakdown={
+                'relevance_score': relevance_score,
+                'book_number_status': relevance_meta.get('book_number_status'),
+                'author': relevance_meta.get('author'),
+                'title': relevance_meta.get('title'),
+                'series': relevance_meta.get('series')
+            }
+        )
     
     def _assess_relevance(self, result_title: str, result_author: str, 
-                          search_title: str, search_author: str) -> Tuple[float, Dict[str, Any]]:
+                          search_title: str, search_author: str,
+                          query: Optional[_QueryFeatures] = None) -> Tuple[float, Dict[str, Any]]:
         """
         Assess how well the result matches the search query using multi-strategy matching.
         
@@ -248,6 +327,7 @@ class QualityAssessor:
             result_author: The author from the search result
             search_title: User's search title query
             search_author: User's search author query
+            query: Precomputed features for search_title/search_author
             
         Returns:
             Relevance score (0-10)
@@ -257,6 +337,8 @@ class QualityAssessor:
         search_author = search_author or ''
         result_title = result_title or ''
         result_author = result_author or ''
+        if query is None:
+            query = self._build_query_features(search_title, search_author)
         
         score = 0.0
         meta: Dict[str, Any] = {
@@ -279,7 +361,7 @@ class QualityAssessor:
         if search_author and result_author:
             # Strategy 1: Exact normalized match (aggressive - strips ALL punctuation/spaces)
             # This catches: "SouppatchHero" vs "Sourpatch Hero" vs "Sourpatchhero"
-            search_author_norm = self.fuzzy_matcher.normalize_author(search_author)
+            search_author_norm = query.author_norm
             result_author_norm = self.fuzzy_matcher.normalize_author(result_author)
             
             self.logger.debug(
@@ -298,10 +380,9 @@ class QualityAssessor:
             else:
                 # Strategy 2: Token set overlap (handles multiple authors)
                 # Tokenize using normalized titles first
-                search_author_cleaned = self.fuzzy_matcher.normalize_title(search_author)
                 result_author_cleaned = self.fuzzy_matcher.normalize_title(result_author)
                 
-                search_tokens = self.fuzzy_matcher.tokenize(search_author_cleaned)
+                search_tokens = query.author_tokens
                 result_tokens = self.fuzzy_matcher.tokenize(result_author_cleaned)
                 
                 if search_tokens and result_tokens:
@@ -370,7 +451,7 @@ class QualityAssessor:
         
         # Extract series information from result title
         result_series = self._extract_series_from_title(result_title)
-        search_series = self._extract_series_from_title(search_title)
+        search_series = query.series
         
         # Debug: Log what was extracted
         self.logger.debug(
@@ -389,7 +470,7 @@ class QualityAssessor:
         title_score = 0.0
         if search_title and result_title:
             # Normalize titles for comparison
-            search_title_norm = self.fuzzy_matcher.normalize_title(search_title)
+            search_title_norm = query.title_norm
             result_title_norm = self.fuzzy_matcher.normalize_title(result_title)
             
             # Remove series info to get core title
@@ -398,10 +479,7 @@ class QualityAssessor:
             else:
                 result_title_core = result_title_norm
                 
-            if search_series['full_series']:
-                search_title_core = search_title_norm.replace(search_series['full_series'].lower(), '').strip(' ,:;-')
-            else:
-                search_title_core = search_title_norm
+            search_title_core = query.title_core
             
             self.logger.debug(
                 "Title normalization",
@@ -409,7 +487,7 @@ class QualityAssessor:
             )
             
             # Strategy 1: Tokenize and check if ALL search tokens are in result
-            search_tokens = self.fuzzy_matcher.tokenize(search_title_core)
+            search_tokens = query.title_tokens
             result_tokens = self.fuzzy_matcher.tokenize(result_title_core)
             
             if search_tokens and result_tokens:
@@ -464,7 +542,7 @@ class QualityAssessor:
                         )
             
             # CRITICAL: Check book number alignment using strict matching
-            search_numbers = self._extract_numbers(search_title)
+            search_numbers = list(query.numbers)
             result_numbers = self._extract_numbers(result_title)
             meta['search_numbers'] = search_numbers
             meta['result_numbers'] = result_numbers
@@ -840,49 +918,102 @@ class QualityAssessor:
             )
             return False
     
+    def _build_component_tables(self, results: List[Dict[str, Any]]) -> Dict[str, Dict[Any, float]]:
+        """Score every distinct format, bitrate and seeder value in a batch once."""
+        formats = set()
+        bitrates = set()
+        seeders = set()
+        for result in results:
+            format_value = result.get('format', 'unknown')
+            if isinstance(format_value, str):
+                formats.add(format_value.lower())
+            # Non-numeric values are left to per-result scoring
+            bitrate = result.get('bitrate', 0)
+            if isinstance(bitrate, (int, float)):
+                bitrates.add(bitrate)
+            seeder_count = result.get('seeders', 0)
+            if isinstance(seeder_count, (int, float)):
+                seeders.add(seeder_count)
+        return {
+            'format': {value: self._assess_format_quality(value) for value in formats},
+            'bitrate': {value: self._assess_bitrate_quality(value) for value in bitrates},
+            'availability': {value: self._assess_availability_quality(value) for value in seeders},
+        }
+    
     def rank_results_by_quality(self, results: List[Dict[str, Any]], 
                                search_title: str = '', 
-                               search_author: str = '') -> List[Dict[str, Any]]:
+                               search_author: str = '',
+                               top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Rank results by quality score including relevance to search query.
         
+        Query-side features are computed once per distinct query title and
+        format/bitrate/seeder scores once per distinct value.
+        
         Args:
             results: List of search results to rank
             search_title: User's search title query
             search_author: User's search author query
+            top_k: Return only the best K results (heap selection)
             
         Returns:
             Sorted list with quality_assessment added to each result
         """
         try:
-            self.logger.info(
-                "Ranking results by quality",
-                extra={"result_count": len(results), "search_title": search_title, "search_author": search_author},
-            )
+            started = time.perf_counter()
+            query_cache: Dict[str, _QueryFeatures] = {}
+            tables = self._build_component_tables(results)
+            relevance_cache: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
             scored_results = []
             
-            for i, result in enumerate(results):
-                self.logger.info(
-                    "Assessing result",
-                    extra={"index": i + 1, "total": len(results), "result_title": result.get('title', 'NO TITLE')},
-                )
+            for index, result in enumerate(results):
                 query_title = result.get('_search_query_used') or search_title
-                quality_score = self.assess_result_quality(result, query_title, search_author)
+                query = query_cache.get(query_title)
+                if query is None:
+                    query = self._build_query_features(query_title, search_author)
+                    query_cache[query_title] = query
+                try:
+                    quality_score = self._score_result(result, query, tables, relevance_cache)
+                except Exception as e:
+                    self.logger.error(
+                        "Quality assessment failed",
+                        extra={"error": str(e), "search_title": query_title, "search_author": search_author},
+                        exc_info=True,
+                    )
+                    quality_score = QualityScore(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, {})
                 result_copy = result.copy()
                 result_copy['quality_assessment'] = quality_score
                 scored_results.append(result_copy)
-                self.logger.info(
-                    "Result scored",
-                    extra={
-                        "total_score": round(quality_score.total_score, 2),
-                        "confidence": round(quality_score.confidence, 1),
-                    },
-                )
+                if index % RANK_LOG_SAMPLE_EVERY == 0:
+                    self.logger.debug(
+                        "Result scored (sampled)",
+                        extra={
+                            "index": index + 1,
+                            "total": len(results),
+                            "result_title": result.get('title', 'NO TITLE'),
+                            "total_score": round(quality_score.total_score, 2),
+                            "confidence": round(quality_score.confidence, 1),
+                        },
+                    )
             
-            scored_results.sort(key=lambda x: x['quality_assessment'].total_score, reverse=True)
+            if top_k is not None and top_k < len(scored_results):
+                # nlargest keeps input order for ties, like the stable sort below
+                scored_results = heapq.nlargest(
+                    max(0, top_k), scored_results,
+                    key=lambda x: x['quality_assessment'].total_score
+                )
+            else:
+                scored_results.sort(key=lambda x: x['quality_assessment'].total_score, reverse=True)
             self.logger.info(
                 "Ranking complete",
-                extra={"result_count": len(scored_results)},
+                extra={
+                    "result_count": len(results),
+                    "returned": len(scored_results),
+                    "distinct_queries": len(query_cache),
+                    "search_title": search_title,
+                    "search_author": search_author,
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+                },
             )
             return scored_results
             
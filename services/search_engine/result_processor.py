@@ -2,7 +2,7 @@
 Module Name: result_processor.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Processes, deduplicates, and ranks search results for manual and automatic
     selection.
@@ -118,8 +118,7 @@ class ResultProcessor:
             
             # For now, just return the first result that meets basic criteria
             for result in raw_results:
-                if (result.get('title') and result.get('author') and 
-                    result.get('download_url')):
+                if self.is_auto_selectable(result):
                     quality_dict = self._extract_quality_dict(result)
                     confidence = 0.0
                     if quality_dict:
@@ -145,6 +144,11 @@ class ResultProcessor:
             )
             return None
 
+    @staticmethod
+    def is_auto_selectable(result: Dict[str, Any]) -> bool:
+        """Whether a result has the fields automatic selection requires."""
+        return bool(result.get('title') and result.get('author') and result.get('download_url'))
+
     def _extract_quality_dict(self, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Normalize quality_assessment to a plain dict if possible."""
         qa = result.get('quality_assessment')
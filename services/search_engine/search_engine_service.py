@@ -2,7 +2,7 @@
 Module Name: search_engine_service.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Coordinates audiobook search with fuzzy matching, quality assessment, and
     multi-indexer integration.
@@ -125,9 +125,9 @@ class SearchEngineService:
     
     # Search operation methods (delegate to search_operations)
     def search_for_audiobook(self, title: str, author: str, 
-                           manual_search: bool = True) -> Dict[str, Any]:
-        """Search for audiobook across all indexers."""
-        return self.search_operations.search_for_audiobook(title, author, manual_search)
+                           manual_search: bool = True, refresh: bool = False) -> Dict[str, Any]:
+        """Search for audiobook across all indexers (refresh bypasses cached indexer results)."""
+        return self.search_operations.search_for_audiobook(title, author, manual_search, refresh)
     
     def automatic_search_flagged_books(self) -> Dict[str, Any]:
         """Perform automatic search for all flagged books."""
@@ -152,9 +152,9 @@ class SearchEngineService:
         return self.indexer_operations.test_indexer_search(indexer_id, title, author)
     
     def search_all_indexers(self, title: str, author: str, 
-                           manual_search: bool = False) -> List[Dict[str, Any]]:
-        """Search all active indexers for audiobook results."""
-        return self.indexer_operations.search_all_indexers(title, author, manual_search)
+                           manual_search: bool = False, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Search all active indexers for audiobook results (refresh bypasses cached indexer results)."""
+        return self.indexer_operations.search_all_indexers(title, author, manual_search, refresh)
     
     # Result operation methods (delegate to result_operations)
     def process_manual_search_results(self, raw_results: List[Dict[str, Any]], 
@@ -2,7 +2,7 @@
 Module Name: search_operations.py
 Author: TheDragonShaman
 Created: Aug 26 2025
-Last Modified: Dec 24 2025
+Last Modified: Oct 16 2026
 Description:
     Core search execution, history tracking, and result coordination for the
     search engine service.
@@ -83,7 +83,7 @@ class SearchOperations:
         return variants
     
     def search_for_audiobook(self, title: str, author: str, 
-                           manual_search: bool = True) -> Dict[str, Any]:
+                           manual_search: bool = True, refresh: bool = False) -> Dict[str, Any]:
         """
         Search for audiobook across all indexers.
         
@@ -91,6 +91,7 @@ class SearchOperations:
             title: Book title to search for
             author: Author name to search for
             manual_search: Whether this is a manual search
+            refresh: Bypass cached indexer results
             
         Returns:
             Search results with metadata
@@ -150,22 +151,19 @@ class SearchOperations:
                     extra={"variant_count": len(queries)},
                 )
             else:
-                for idx, query_title in enumerate(queries or ['']):
-                    if not query_title:
-                        continue
+                variants = [query_title for query_title in queries if query_title]
+                if variants:
                     self.logger.info(
-                        "Running search variant",
-                        extra={
-                            "variant_index": idx + 1,
-                            "variant_total": len(queries),
-                            "query": query_title,
-                        },
-                    )
-                    variant_results = self.indexer_operations.search_all_indexers(
-                        query_title,
-                        search_author,
-                        manual_search
+                        "Running search variants",
+                        extra={"variant_total": len(variants), "queries": variants},
                     )
+                # Every variant x indexer request runs at once; dedupe as responses arrive
+                for query_title, variant_results in self.indexer_operations.stream_search_variants(
+                    variants,
+                    search_author,
+                    deadline=self.search_timeout,
+                    refresh=refresh
+                ):
                     for result in variant_results:
                         key = result.get('download_url') or result.get('info_hash') or (
                             result.get('indexer'), result.get('title')
@@ -179,6 +177,13 @@ class SearchOperations:
                         result_copy.setdefault('_search_query_used', query_title)
                         raw_results.append(result_copy)
             
+            # Automatic search only keeps the best selectable result, so rank
+            # just the eligible candidates and heap-select the top one
+            top_k = None
+            if not manual_search:
+                raw_results = [r for r in raw_results if self.result_processor.is_auto_selectable(r)]
+                top_k = 1
+            
             # Assess quality and rank results (adds quality_assessment with confidence to each result)
             if raw_results:
                 self.logger.info(
@@ -188,7 +193,8 @@ class SearchOperations:
                 scored_results = self.quality_assessor.rank_results_by_quality(
                     raw_results, 
                     search_title=title, 
-                    search_author=author
+                    search_author=author,
+                    top_k=top_k
                 )
                 self.logger.info(
                     "Quality assessment complete",
@@ -1102,16 +1102,30 @@
 
     const socket = typeof window.io === 'function' ? window.io() : null;
     if (socket) {
-        socket.on('download:progress', (event) => {
-            if (!event || event.download_id === undefined) {
-                return;
-            }
-            const downloadId = Number(event.download_id);
-            const existing = state.queue.find((item) => Number(item.id) === downloadId);
-            if (existing) {
-                existing.download_progress = event.progress;
-                existing.eta_seconds = event.eta_seconds;
-                existing.download_speed_bytes = event.speed_bytes;
+        socket.on('download:progress_batch', (batch) => {
+            const updates = batch && Array.isArray(batch.updates) ? batch.updates : [];
+            let changed = false;
+            updates.forEach((event) => {
+                if (!event || event.download_id === undefined) {
+                    return;
+                }
+                const downloadId = Number(event.download_id);
+                const existing = state.queue.find((item) => Number(item.id) === downloadId);
+                if (!existing) {
+                    return;
+                }
+                if (event.progress !== undefined) {
+                    existing.download_progress = event.progress;
+                }
+                if (event.eta_seconds !== undefined) {
+                    existing.eta_seconds = event.eta_seconds;
+                }
+                if (event.speed_bytes !== undefined) {
+                    existing.download_speed_bytes = event.speed_bytes;
+                }
+                changed = true;
+            });
+            if (changed) {
                 renderQueue();
                 updateStats();
             }
@@ -13,14 +13,15 @@ const LibraryState = {
         genre: '',
         sort: 'title'
     },
-    filteredIds: new Set(),
     books: [],
-    filteredBooks: []
+    nextCursor: null,
+    hasMore: false,
+    total: null,
+    requestSeq: 0
 };
 
 const LazyState = {
     batchSize: 48,
-    renderedCount: 0,
     observer: null,
     loading: false,
     cooldownMs: 100,
@@ -141,81 +142,30 @@ function initializeFilters() {
 }
 
 function applyFilters() {
-    const searchTerm = (LibraryState.currentFilters.search || '').toLowerCase();
-    const statusFilter = LibraryState.currentFilters.status || '';
-    const genreFilter = LibraryState.currentFilters.genre || '';
-    const sortBy = LibraryState.currentFilters.sort;
-
-    LibraryState.filteredIds = new Set();
-
-    const filtered = LibraryState.books.filter(book => {
-        const title = book.title_lc || '';
-        const author = book.author_lc || '';
-        const status = book.ownership_status || 'unknown';
-        const genre = book.genre || 'unknown';
-
-        const matchesSearch = !searchTerm || title.includes(searchTerm) || author.includes(searchTerm);
-        const matchesStatus = !statusFilter || status === statusFilter;
-        const matchesGenre = !genreFilter || genre === genreFilter;
-
-        if (matchesSearch && matchesStatus && matchesGenre) {
-            if (book.id !== undefined && book.id !== null) {
-                LibraryState.filteredIds.add(String(book.id));
-            }
-            return true;
-        }
-        return false;
-    });
-
-    filtered.sort((a, b) => {
-        switch (sortBy) {
-            case 'author':
-                return (a.author || '').localeCompare(b.author || '');
-            case 'rating':
-                return (parseFloat(b.rating) || 0) - (parseFloat(a.rating) || 0);
-            case 'date':
-                return 0; // keep backend order for now
-            case 'title':
-            default:
-                return (a.title || '').localeCompare(b.title || '');
-        }
-    });
-
-    LibraryState.filteredBooks = filtered;
-    LazyState.renderedCount = 0;
+    // Filters and sort run server-side; restart paging from the first page
+    LibraryState.requestSeq += 1;
+    LibraryState.books = [];
+    LibraryState.nextCursor = null;
+    LibraryState.hasMore = true;
+    LibraryState.total = null;
+    LazyState.loading = false;
 
     const grid = document.getElementById('booksGrid');
     if (grid) {
         grid.innerHTML = '';
     }
 
-    const sentinel = document.getElementById('lazySentinel');
-    if (LazyState.observer && sentinel) {
-        LazyState.observer.disconnect();
-        LazyState.observer.observe(sentinel);
-    }
-
+    observeSentinel();
     requestNextBatch(true);
 }
 
 function initializeLazyGrid() {
-    if (!Array.isArray(window.libraryBooks)) {
-        console.error('libraryBooks missing or invalid; falling back to empty array');
-        window.libraryBooks = [];
+    const initialPage = window.libraryPage || {};
+    if (!Array.isArray(initialPage.books)) {
+        console.error('libraryPage missing or invalid; falling back to empty page');
+        initialPage.books = [];
     }
 
-    LibraryState.books = window.libraryBooks.map(book => ({
-        ...book,
-        title_lc: (book.title || '').toLowerCase(),
-        author_lc: (book.author || '').toLowerCase()
-    }));
-    LibraryState.filteredBooks = LibraryState.books;
-
-    console.debug('Library init', {
-        total: LibraryState.books.length,
-        sample: LibraryState.books.slice(0, 3)
-    });
-
     const sentinel = document.getElementById('lazySentinel');
     if (sentinel) {
         LazyState.observer = new IntersectionObserver((entries) => {
@@ -225,10 +175,35 @@ function initializeLazyGrid() {
                 }
             });
         }, { root: null, rootMargin: '200px', threshold: 0 });
+    }
+
+    // First page is rendered from the server payload without a round trip
+    appendPage(initialPage);
+    console.debug('Library init', {
+        loaded: LibraryState.books.length,
+        total: LibraryState.total,
+        hasMore: LibraryState.hasMore
+    });
+
+    if (LibraryState.books.length === 0) {
+        setEmptyState(true);
+    } else {
+        observeSentinel();
+    }
+}
+
+function observeSentinel() {
+    const sentinel = document.getElementById('lazySentinel');
+    if (LazyState.observer && sentinel) {
+        LazyState.observer.disconnect();
         LazyState.observer.observe(sentinel);
     }
+}
 
-    applyFilters();
+function stopObserving() {
+    if (LazyState.observer) {
+        LazyState.observer.disconnect();
+    }
 }
 
 function requestNextBatch(immediate = false) {
@@ -236,13 +211,13 @@ function requestNextBatch(immediate = false) {
     if (LazyState.pendingTimer) return;
 
     if (immediate) {
-        renderNextBatch();
+        loadNextPage();
         return;
     }
 
     LazyState.pendingTimer = setTimeout(() => {
         LazyState.pendingTimer = null;
-        renderNextBatch();
+        loadNextPage();
     }, LazyState.cooldownMs);
 }
 
@@ -271,70 +246,91 @@ function setEmptyState(visible) {
     }
 }
 
-function renderNextBatch() {
-    if (LazyState.loading) return;
-
-    const grid = document.getElementById('booksGrid');
-    if (!grid) return;
-
-    if (!LibraryState.filteredBooks || LibraryState.filteredBooks.length === 0) {
-        setEmptyState(true);
-        hideLoader();
-        if (LazyState.observer) {
-            LazyState.observer.disconnect();
-        }
-        console.warn('No books to render; filteredBooks length is 0');
-        return;
-    }
+function buildPageQuery() {
+    const filters = LibraryState.currentFilters;
+    const params = new URLSearchParams({
+        limit: String(LazyState.batchSize),
+        sort: filters.sort || 'title'
+    });
+    if (filters.search) params.set('q', filters.search);
+    if (filters.status) params.set('status', filters.status);
+    if (filters.genre) params.set('genre', filters.genre);
+    if (LibraryState.nextCursor) params.set('cursor', LibraryState.nextCursor);
+    return params.toString();
+}
 
-    setEmptyState(false);
-
-    if (LazyState.renderedCount >= LibraryState.filteredBooks.length) {
-        hideLoader();
-        if (LazyState.observer) {
-            LazyState.observer.disconnect();
-        }
-        return;
-    }
+async function loadNextPage() {
+    if (LazyState.loading || !LibraryState.hasMore) return;
 
+    const requestSeq = LibraryState.requestSeq;
     LazyState.loading = true;
     showLoader();
 
     try {
-        const start = LazyState.renderedCount;
-        const end = Math.min(start + LazyState.batchSize, LibraryState.filteredBooks.length);
-        const frag = document.createDocumentFragment();
-
-        for (let i = start; i < end; i++) {
-            const card = createBookCard(LibraryState.filteredBooks[i]);
-            if (card) {
-                frag.appendChild(card);
-            }
+        const response = await fetch(`/library/api/books?${buildPageQuery()}`);
+        const data = await response.json();
+        if (requestSeq !== LibraryState.requestSeq) {
+            return; // filters changed while this page was in flight
+        }
+        if (!response.ok || !data.success) {
+            throw new Error(data.error || `HTTP ${response.status}`);
+        }
+        appendPage(data);
+        if (LibraryState.books.length === 0) {
+            setEmptyState(true);
+            stopObserving();
         }
-
-        grid.appendChild(frag);
-        LazyState.renderedCount = end;
     } catch (err) {
-        console.error('Library render error:', err);
-        setEmptyState(true);
-        if (LazyState.observer) {
-            LazyState.observer.disconnect();
+        if (requestSeq === LibraryState.requestSeq) {
+            console.error('Library page load error:', err);
+            LibraryState.hasMore = false;
+            stopObserving();
+            if (LibraryState.books.length === 0) {
+                setEmptyState(true);
+            }
         }
     } finally {
-        LazyState.loading = false;
-        hideLoader();
-
+        if (requestSeq === LibraryState.requestSeq) {
+            LazyState.loading = false;
+            hideLoader();
+        }
         if (LazyState.pendingTimer) {
             clearTimeout(LazyState.pendingTimer);
             LazyState.pendingTimer = null;
         }
     }
+}
 
-    if (LazyState.renderedCount >= LibraryState.filteredBooks.length) {
-        hideLoader();
-        if (LazyState.observer) {
-            LazyState.observer.disconnect();
-        }
+function appendPage(page) {
+    const grid = document.getElementById('booksGrid');
+    if (!grid) return;
+
+    const books = (page.books || []).map(book => ({
+        ...book,
+        title_lc: (book.title || '').toLowerCase(),
+        author_lc: (book.author || '').toLowerCase()
+    }));
+
+    if (books.length > 0) {
+        setEmptyState(false);
+        const frag = document.createDocumentFragment();
+        books.forEach(book => {
+            const card = createBookCard(book);
+            if (card) {
+                frag.appendChild(card);
+            }
+        });
+        grid.appendChild(frag);
+        LibraryState.books.push(...books);
+    }
+
+    if (page.total !== undefined && page.total !== null) {
+        LibraryState.total = page.total;
+    }
+    LibraryState.nextCursor = page.next_cursor || null;
+    LibraryState.hasMore = Boolean(page.has_more && page.next_cursor);
+    if (!LibraryState.hasMore) {
+        stopObserving();
     }
 }
 